@@ -0,0 +1,246 @@
+"""
+Génération de missions en lot, sans interface graphique.
+
+Lit un ensemble de parcelles (GeoJSON ou CSV) et un profil de paramètres (JSON), génère les
+waypoints et le KMZ de chaque parcelle en parallèle sur plusieurs processus, puis affiche un
+tableau récapitulatif.
+
+Usage :
+    python batch_missions.py parcelles.geojson --profile profil.json --output-dir missions/
+    python batch_missions.py parcelles.csv --workers 8
+    python batch_missions.py grande_zone.geojson --tile-size 2000
+
+Avec --tile-size (grandes zones de plusieurs km²), les parcelles sont traitées l'une après
+l'autre et les waypoints de chacune sont calculés par tuiles de tile-size mètres sur tous les
+processus (generate_waypoints_polygon_tiled), pour un résultat identique.
+
+Formats d'entrée :
+  - GeoJSON : Feature/FeatureCollection de Polygon ou MultiPolygon (seul le contour extérieur
+    est utilisé). Le nom de la parcelle est pris dans la propriété "name", sinon "id".
+  - CSV : une ligne par sommet, colonnes name,lat,lon ; les sommets d'une même parcelle se
+    suivent dans l'ordre du contour.
+
+Profil (toutes les clés sont optionnelles, valeurs par défaut des boîtes de dialogue) :
+    {"altitude": 50, "drone_speed": 2.5, "gimbal_pitch": -45, "frontal_cov": 0.8,
+     "lateral_cov": 0.8, "sensor_width": 6.17, "sensor_height": 4.55, "focal_length": 4.5,
+     "photo_mode": "waypoint", "compact": false, "sweep_angle": "auto",
+     "battery_time": 0, "battery_output": "kmz"}
+    sweep_angle : orientation des passes en degrés depuis l'est, ou "auto" pour l'orientation
+    qui minimise la durée de vol estimée (optimize_sweep_angle).
+    battery_time : autonomie utile d'une batterie en minutes (0 = un seul vol) ; la mission
+    est découpée aux changements de passe (split_mission) en un KMZ par batterie
+    (battery_output "kmz" : parcelle_1.kmz, parcelle_2.kmz, ...) ou en plusieurs waylines
+    d'un même KMZ (battery_output "waylines").
+"""
+import os
+import re
+import csv
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from mission_core import (
+    Mission,
+    estimate_flight,
+    generate_waypointmap_kmz,
+    generate_waypoints_polygon_array,
+    generate_waypoints_polygon_tiled,
+    optimize_sweep_angle,
+    split_mission,
+)
+
+DEFAULT_PROFILE = {
+    "altitude": 50,
+    "drone_speed": 2.5,
+    "gimbal_pitch": -45,
+    "frontal_cov": 0.8,
+    "lateral_cov": 0.8,
+    "sensor_width": 6.17,
+    "sensor_height": 4.55,
+    "focal_length": 4.5,
+    "photo_mode": "waypoint",
+    "compact": False,
+    "sweep_angle": "auto",
+    "battery_time": 0,
+    "battery_output": "kmz",
+}
+
+# ---------------------------
+# Lecture des parcelles
+# ---------------------------
+def _ring_to_polygon(ring):
+    """Contour GeoJSON [[lon, lat], ...] -> liste de (lat, lon) sans le point de fermeture"""
+    polygon = [(lat, lon) for lon, lat, *_ in ring]
+    if len(polygon) > 1 and polygon[0] == polygon[-1]:
+        polygon.pop()
+    return polygon
+
+def read_geojson_parcels(path):
+    """Retourne la liste des (nom, polygone) d'un fichier GeoJSON"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    features = data["features"] if data.get("type") == "FeatureCollection" else [data]
+
+    parcels = []
+    for i, feature in enumerate(features):
+        properties = feature.get("properties") or {}
+        name = str(properties.get("name", properties.get("id", f"parcelle_{i + 1}")))
+        geometry = feature["geometry"]
+        if geometry["type"] == "Polygon":
+            parcels.append((name, _ring_to_polygon(geometry["coordinates"][0])))
+        elif geometry["type"] == "MultiPolygon":
+            for k, rings in enumerate(geometry["coordinates"]):
+                parcels.append((f"{name}_{k + 1}", _ring_to_polygon(rings[0])))
+    return parcels
+
+def read_csv_parcels(path):
+    """Retourne la liste des (nom, polygone) d'un fichier CSV name,lat,lon"""
+    parcels = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            parcels.setdefault(row["name"], []).append((float(row["lat"]), float(row["lon"])))
+    return list(parcels.items())
+
+def read_parcels(path):
+    if path.lower().endswith(".csv"):
+        return read_csv_parcels(path)
+    return read_geojson_parcels(path)
+
+# ---------------------------
+# Calcul d'une parcelle (exécuté dans un processus de travail)
+# ---------------------------
+def plan_parcel(name, polygon, profile, output_dir, tile_size=None, executor=None):
+    """
+    Génère les waypoints et le KMZ d'une parcelle, retourne les statistiques.
+    Avec tile_size, les waypoints sont calculés par tuiles dans executor.
+    """
+    start = time.perf_counter()
+    endpoints_only = profile["photo_mode"] != "waypoint"
+    camera = (profile["altitude"], profile["frontal_cov"], profile["lateral_cov"],
+              profile["sensor_width"], profile["sensor_height"], profile["focal_length"])
+    sweep_angle = profile["sweep_angle"]
+    if sweep_angle == "auto":
+        sweep_angle = optimize_sweep_angle(polygon, *camera, profile["drone_speed"])[0]
+    if tile_size:
+        mission = Mission(*generate_waypoints_polygon_tiled(
+            polygon, *camera, endpoints_only, sweep_angle, tile_size=tile_size, executor=executor
+        ))
+    else:
+        mission = Mission(*generate_waypoints_polygon_array(polygon, *camera, endpoints_only, sweep_angle))
+    generation_time = time.perf_counter() - start
+
+    segments = [(0, len(mission))]
+    if profile["battery_time"] and len(mission):
+        segments, _ = split_mission(mission, profile["drone_speed"], profile["battery_time"] * 60)
+
+    kmz_files = []
+    export_time = 0.0
+    if len(mission):
+        start = time.perf_counter()
+        photo_interval = mission.fov_width * (1 - profile["frontal_cov"]) if endpoints_only else None
+        base = os.path.join(output_dir, re.sub(r"[^\w.-]+", "_", name))
+        if len(segments) > 1 and profile["battery_output"] == "kmz":
+            # Un KMZ par batterie
+            parts = [(f"{base}_{k}.kmz", mission.slice(first, stop), None)
+                     for k, (first, stop) in enumerate(segments, 1)]
+        else:
+            # Un seul KMZ, une wayline par batterie
+            parts = [(base + ".kmz", mission, segments if len(segments) > 1 else None)]
+        for kmz_file, part, wayline_segments in parts:
+            generate_waypointmap_kmz(
+                part, profile["drone_speed"], profile["gimbal_pitch"], kmz_file,
+                compact=profile["compact"], photo_interval=photo_interval,
+                photo_trigger=profile["photo_mode"], segments=wayline_segments
+            )
+            kmz_files.append(kmz_file)
+        export_time = time.perf_counter() - start
+
+    return {
+        "name": name,
+        "vertices": len(polygon),
+        "angle": sweep_angle,
+        "passes": mission.line_count,
+        "waypoints": len(mission),
+        "flight_time": estimate_flight(mission, profile["drone_speed"]).duration,
+        "batteries": len(segments),
+        "generation_time": generation_time,
+        "export_time": export_time,
+        "kmz": kmz_files,
+    }
+
+# ---------------------------
+# Récapitulatif
+# ---------------------------
+def print_summary(results, wall_time):
+    header = f"{'Parcelle':<24} {'Sommets':>8} {'Angle':>6} {'Passes':>7} {'Waypoints':>10} {'Vol (min)':>10} {'Batt.':>5} {'Calcul (s)':>11} {'Export (s)':>11}  KMZ"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        if "error" in r:
+            print(f"{r['name']:<24} ERREUR: {r['error']}")
+            continue
+        kmz = r["kmz"][0] if r["kmz"] else "-"
+        if len(r["kmz"]) > 1:
+            kmz += f" (+{len(r['kmz']) - 1})"
+        print(f"{r['name']:<24} {r['vertices']:>8} {r['angle']:>6.0f} {r['passes']:>7} {r['waypoints']:>10} "
+              f"{r['flight_time'] / 60:>10.1f} {r['batteries']:>5} {r['generation_time']:>11.3f} "
+              f"{r['export_time']:>11.3f}  {kmz}")
+    print("-" * len(header))
+    ok = [r for r in results if "error" not in r]
+    cpu_time = sum(r["generation_time"] + r["export_time"] for r in ok)
+    print(f"{len(ok)}/{len(results)} parcelles, {sum(r['waypoints'] for r in ok)} waypoints, "
+          f"{cpu_time:.2f} s de calcul en {wall_time:.2f} s")
+
+# ---------------------------
+# Point d'entrée
+# ---------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Génération de missions drone en lot")
+    parser.add_argument("parcels", help="fichier GeoJSON ou CSV (name,lat,lon) des parcelles")
+    parser.add_argument("--profile", help="profil de paramètres JSON")
+    parser.add_argument("--output-dir", default="missions", help="dossier des KMZ générés")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="nombre de processus (par défaut : nombre de cœurs)")
+    parser.add_argument("--tile-size", type=float, default=None,
+                        help="calcul de chaque parcelle par tuiles de TILE_SIZE m sur tous les processus")
+    args = parser.parse_args(argv)
+
+    profile = dict(DEFAULT_PROFILE)
+    if args.profile:
+        with open(args.profile, encoding="utf-8") as f:
+            profile.update(json.load(f))
+
+    parcels = read_parcels(args.parcels)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    results = [None] * len(parcels)
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        if args.tile_size:
+            # Grandes zones : une parcelle à la fois, ses tuiles réparties sur les processus
+            for i, (name, polygon) in enumerate(parcels):
+                try:
+                    results[i] = plan_parcel(name, polygon, profile, args.output_dir, args.tile_size, executor)
+                except Exception as e:
+                    results[i] = {"name": name, "error": str(e)}
+                print(f"[{i + 1}/{len(parcels)}] {name}", file=sys.stderr)
+        else:
+            futures = {
+                executor.submit(plan_parcel, name, polygon, profile, args.output_dir): i
+                for i, (name, polygon) in enumerate(parcels)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    results[i] = {"name": parcels[i][0], "error": str(e)}
+                print(f"[{sum(r is not None for r in results)}/{len(parcels)}] {parcels[i][0]}", file=sys.stderr)
+
+    print_summary(results, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark de l'export KMZ (generate_waypointmap_kmz) : temps d'écriture et pic mémoire
+alloué pendant l'export, pour des missions synthétiques de grande taille, données sous forme
+de Mission et de liste de (lat, lon, alt).
+
+Usage : python benchmark_kmz.py [nombre_de_waypoints ...]   (par défaut 100000 1000000)
+"""
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+
+from mission_core import Mission, generate_waypointmap_kmz
+
+POINTS_PER_LINE = 500
+
+
+def synthetic_waypoints(n, points_per_line=POINTS_PER_LINE, lat0=44.8060109, lon0=-0.6050179, altitude=50):
+    """Mission boustrophédon synthétique de n waypoints"""
+    waypoints = []
+    for i in range(n):
+        line, k = divmod(i, points_per_line)
+        if line % 2 == 1:
+            k = points_per_line - 1 - k
+        waypoints.append((lat0 + line * 0.0001, lon0 + k * 0.00005, altitude))
+    return waypoints
+
+
+def run(n):
+    waypoints = synthetic_waypoints(n)
+    mission = Mission(waypoints, [i // POINTS_PER_LINE for i in range(n)])
+    for label, data in (("Mission", mission), ("liste", waypoints)):
+        export(n, label, data)
+
+
+def export(n, label, waypoints):
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "mission_waypoints.kmz")
+        tracemalloc.start()
+        start = time.perf_counter()
+        generate_waypointmap_kmz(waypoints, 5.0, -90, output)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        size = os.path.getsize(output)
+    print(f"{n:>9} waypoints ({label:<7}) : {elapsed:7.2f} s, pic mémoire {peak / 1e6:7.2f} Mo, "
+          f"KMZ {size / 1e6:8.1f} Mo")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    for n in sizes:
+        run(n)
@@ -1,25 +1,24 @@
 import sys
-import math
-import time
-from zipfile import ZipFile
 
 from PyQt5.QtWidgets import QApplication, QInputDialog, QMessageBox
 from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import QObject, pyqtSlot
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 from PyQt5.QtWebChannel import QWebChannel
 
-from geopy.geocoders import Nominatim
-
-# ---------------------------
-# Fonction pour géolocaliser un lieu
-# ---------------------------
-def get_location_coordinates(place_name):
-    geolocator = Nominatim(user_agent="gps_simulation")
-    location = geolocator.geocode(place_name)
-    if location:
-        return location.latitude, location.longitude
-    else:
-        return None, None
+import resources_rc  # noqa: F401  (Leaflet et mission_map.js embarqués, servis en qrc:)
+from tile_scheme import install_tile_cache, register_tile_scheme
+from mission_worker import MissionTask
+from mission_core import (
+    PHOTO_MODES,
+    Mission,
+    estimate_flight,
+    format_duration,
+    generate_waypointmap_kmz,
+    generate_waypoints_array,
+    get_location_coordinates,
+    pack_coordinates,
+    validate_rectangle,
+)
 
 # ---------------------------
 # HTML de la carte
@@ -57,6 +56,9 @@ HTML_TEMPLATE = """
     #validate:disabled {{ background: #cccccc; cursor: not-allowed; }}
     #reset {{ background: #f44336; color: white; }}
     #reset:hover {{ background: #da190b; }}
+    #cancel {{ background: #FF9800; color: white; }}
+    #cancel:hover {{ background: #e68a00; }}
+    #cancel:disabled {{ background: #cccccc; cursor: not-allowed; }}
     #info {{
         position: absolute;
         bottom: 10px;
@@ -70,21 +72,27 @@ HTML_TEMPLATE = """
         font-size: 12px;
     }}
 </style>
-<link rel="stylesheet" href="https://unpkg.com/leaflet@1.7.1/dist/leaflet.css" />
-<script src="https://unpkg.com/leaflet@1.7.1/dist/leaflet.js"></script>
+<link rel="stylesheet" href="qrc:///leaflet/leaflet.css" />
+<script src="qrc:///leaflet/leaflet.js"></script>
 <script src="qrc:///qtwebchannel/qwebchannel.js"></script>
+<script src="qrc:///kael/mission_map.js"></script>
 </head>
 <body>
 <div id="map"></div>
 <div class="control-panel">
     <button id="validate" disabled>Valider Rectangle</button>
+    <button id="cancel" disabled>Annuler calcul</button>
     <button id="reset">Réinitialiser</button>
 </div>
 <div id="info">Cliquez sur 4 points pour définir le rectangle</div>
 
 <script>
 var map = L.map('map').setView([{lat}, {lon}], 15);
-L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png').addTo(map);
+// Tuiles servies par le cache local (tile_scheme.py), téléchargées seulement si absentes
+L.tileLayer('kaeltiles:{{z}}/{{x}}/{{y}}.png', {{
+    maxZoom: 19,
+    attribution: '&copy; OpenStreetMap'
+}}).addTo(map);
 
 var polygon = null;
 var markers = [];
@@ -93,6 +101,17 @@ var bridge = null;
 
 new QWebChannel(qt.webChannelTransport, function (channel) {{
     bridge = channel.objects.bridge;
+    // Waypoints de la mission calculée, transmis en binaire (voir mission_map.js)
+    bridge.waypointsReady.connect(function (data) {{ showMission(map, data); }});
+    // Calcul en arrière-plan : progression et état du bouton d'annulation
+    bridge.missionProgress.connect(function (stage, done, total) {{
+        document.getElementById('info').textContent =
+            stage + (total > 0 ? ' : ' + done + '/' + total : '');
+    }});
+    bridge.missionRunning.connect(function (running) {{
+        document.getElementById('cancel').disabled = !running;
+        document.getElementById('validate').disabled = running || pointCount !== 4;
+    }});
 }});
 
 map.on('click', function (e) {{
@@ -126,9 +145,16 @@ document.getElementById('validate').addEventListener('click', function() {{
     }}
 }});
 
+document.getElementById('cancel').addEventListener('click', function() {{
+    if (bridge) {{
+        bridge.cancelMission();
+    }}
+}});
+
 document.getElementById('reset').addEventListener('click', function() {{
     if (bridge) {{
         bridge.resetPoints();
+        clearMission(map);
         markers.forEach(function(m) {{ map.removeLayer(m); }});
         markers = [];
         if (polygon) {{ map.removeLayer(polygon); polygon = null; }}
@@ -149,289 +175,19 @@ document.getElementById('reset').addEventListener('click', function() {{
 </html>
 """
 
-# ---------------------------
-# Fonction pour générer un KMZ compatible WaypointMap
-# ---------------------------
-def generate_waypointmap_kmz(waypoints, drone_speed, gimbal_pitch, output_name="mission_waypoints.kmz"):
-    """
-    Génère un fichier KMZ compatible avec WaypointMap.com et DJI Fly.
-    Structure: wpmz/template.kml + wpmz/waylines.wpml
-    """
-    
-    timestamp = int(time.time() * 1000)
-    
-    # ========== template.kml (configuration globale) ==========
-    template_kml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:wpml="http://www.dji.com/wpmz/1.0.2">
-<Document>
-<wpml:author>fly</wpml:author>
-<wpml:createTime>{timestamp}</wpml:createTime>
-<wpml:updateTime>{timestamp}</wpml:updateTime>
-<wpml:missionConfig>
-<wpml:flyToWaylineMode>safely</wpml:flyToWaylineMode>
-<wpml:finishAction>noAction</wpml:finishAction>
-<wpml:exitOnRCLost>executeLostAction</wpml:exitOnRCLost>
-<wpml:executeRCLostAction>hover</wpml:executeRCLostAction>
-<wpml:globalTransitionalSpeed>{drone_speed}</wpml:globalTransitionalSpeed>
-<wpml:droneInfo>
-<wpml:droneEnumValue>68</wpml:droneEnumValue>
-<wpml:droneSubEnumValue>0</wpml:droneSubEnumValue>
-</wpml:droneInfo>
-</wpml:missionConfig>
-</Document>
-</kml>
-"""
-    
-    # ========== waylines.wpml (waypoints et actions) ==========
-    waylines_wpml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:wpml="http://www.dji.com/wpmz/1.0.2">
-\t<Document>
-\t\t<wpml:missionConfig>
-\t\t\t<wpml:flyToWaylineMode>safely</wpml:flyToWaylineMode>
-\t\t\t<wpml:finishAction>noAction</wpml:finishAction>
-\t\t\t<wpml:exitOnRCLost>executeLostAction</wpml:exitOnRCLost>
-\t\t\t<wpml:executeRCLostAction>hover</wpml:executeRCLostAction>
-\t\t\t<wpml:globalTransitionalSpeed>{drone_speed}</wpml:globalTransitionalSpeed>
-\t\t\t<wpml:droneInfo>
-\t\t\t\t<wpml:droneEnumValue>68</wpml:droneEnumValue>
-\t\t\t\t<wpml:droneSubEnumValue>0</wpml:droneSubEnumValue>
-\t\t\t</wpml:droneInfo>
-\t\t</wpml:missionConfig>
-\t\t<Folder>
-\t\t\t<wpml:templateId>0</wpml:templateId>
-\t\t\t<wpml:executeHeightMode>relativeToStartPoint</wpml:executeHeightMode>
-\t\t\t<wpml:waylineId>0</wpml:waylineId>
-\t\t\t<wpml:distance>0</wpml:distance>
-\t\t\t<wpml:duration>0</wpml:duration>
-\t\t\t<wpml:autoFlightSpeed>{drone_speed}</wpml:autoFlightSpeed>
-"""
-    
-    # Calculer la direction pour chaque segment
-    def get_heading(i, waypoints):
-        """Calcule l'angle de cap basé sur la direction du vol"""
-        if i == 0:
-            # Premier point : regarder vers le prochain
-            lat1, lon1, _ = waypoints[0]
-            lat2, lon2, _ = waypoints[1]
-        elif i == len(waypoints) - 1:
-            # Dernier point : même direction que l'avant-dernier segment
-            lat1, lon1, _ = waypoints[i-1]
-            lat2, lon2, _ = waypoints[i]
-        else:
-            # Points intermédiaires : direction vers le prochain point
-            lat1, lon1, _ = waypoints[i]
-            lat2, lon2, _ = waypoints[i+1]
-        
-        # Calcul de l'angle (0° = Nord, 90° = Est, -90° = Ouest, 180° = Sud)
-        dlon = lon2 - lon1
-        dlat = lat2 - lat1
-        
-        angle = math.degrees(math.atan2(dlon, dlat))
-        
-        # Déterminer si on va vers l'est (-90°) ou l'ouest (90°)
-        if abs(dlon) > abs(dlat):  # Mouvement principalement horizontal
-            return -90 if dlon > 0 else 90
-        else:  # Mouvement principalement vertical
-            return -90 if dlat < 0 else -90
-    
-    # Générer chaque waypoint
-    action_id = 1
-    for i, (lat, lon, alt) in enumerate(waypoints):
-        heading = get_heading(i, waypoints)
-        
-        # Mode de rotation au waypoint
-        if i == 0:
-            turn_mode = "toPointAndStopWithContinuityCurvature"
-            heading_enable = 1
-        else:
-            turn_mode = "toPointAndPassWithContinuityCurvature"
-            heading_enable = 0
-        
-        waylines_wpml += f"""<Placemark>
-<Point>
-<coordinates>
-{lon},{lat}
-</coordinates>
-</Point>
-<wpml:index>{i}</wpml:index>
-<wpml:executeHeight>{int(alt)}</wpml:executeHeight>
-<wpml:waypointSpeed>{drone_speed}</wpml:waypointSpeed>
-<wpml:waypointHeadingParam>
-<wpml:waypointHeadingMode>smoothTransition</wpml:waypointHeadingMode>
-<wpml:waypointHeadingAngle>{heading}</wpml:waypointHeadingAngle>
-<wpml:waypointPoiPoint>0.000000,0.000000,0.000000</wpml:waypointPoiPoint>
-<wpml:waypointHeadingAngleEnable>{heading_enable}</wpml:waypointHeadingAngleEnable>
-<wpml:waypointHeadingPathMode>followBadArc</wpml:waypointHeadingPathMode>
-</wpml:waypointHeadingParam>
-<wpml:waypointTurnParam>
-<wpml:waypointTurnMode>{turn_mode}</wpml:waypointTurnMode>
-<wpml:waypointTurnDampingDist>0</wpml:waypointTurnDampingDist>
-</wpml:waypointTurnParam>
-<wpml:useStraightLine>0</wpml:useStraightLine>
-"""
-        
-        # Action au premier point : rotation de la nacelle + gimbalEvenlyRotate
-        if i == 0:
-            waylines_wpml += f"""<wpml:actionGroup>
-<wpml:actionGroupId>1</wpml:actionGroupId>
-<wpml:actionGroupStartIndex>0</wpml:actionGroupStartIndex>
-<wpml:actionGroupEndIndex>0</wpml:actionGroupEndIndex>
-<wpml:actionGroupMode>parallel</wpml:actionGroupMode>
-<wpml:actionTrigger>
-<wpml:actionTriggerType>reachPoint</wpml:actionTriggerType>
-</wpml:actionTrigger>
-<wpml:action>
-<wpml:actionId>{action_id}</wpml:actionId>
-<wpml:actionActuatorFunc>gimbalRotate</wpml:actionActuatorFunc>
-<wpml:actionActuatorFuncParam>
-<wpml:gimbalHeadingYawBase>aircraft</wpml:gimbalHeadingYawBase>
-<wpml:gimbalRotateMode>absoluteAngle</wpml:gimbalRotateMode>
-<wpml:gimbalPitchRotateEnable>1</wpml:gimbalPitchRotateEnable>
-<wpml:gimbalPitchRotateAngle>{gimbal_pitch}</wpml:gimbalPitchRotateAngle>
-<wpml:gimbalRollRotateEnable>0</wpml:gimbalRollRotateEnable>
-<wpml:gimbalRollRotateAngle>0</wpml:gimbalRollRotateAngle>
-<wpml:gimbalYawRotateEnable>0</wpml:gimbalYawRotateEnable>
-<wpml:gimbalYawRotateAngle>0</wpml:gimbalYawRotateAngle>
-<wpml:gimbalRotateTimeEnable>0</wpml:gimbalRotateTimeEnable>
-<wpml:gimbalRotateTime>0</wpml:gimbalRotateTime>
-<wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
-</wpml:actionActuatorFuncParam>
-</wpml:action>
-</wpml:actionGroup>
-"""
-            action_id += 1
-            
-            # Deuxième action group pour gimbalEvenlyRotate
-            waylines_wpml += f"""<wpml:actionGroup>
-<wpml:actionGroupId>2</wpml:actionGroupId>
-<wpml:actionGroupStartIndex>0</wpml:actionGroupStartIndex>
-<wpml:actionGroupEndIndex>{len(waypoints)-1}</wpml:actionGroupEndIndex>
-<wpml:actionGroupMode>parallel</wpml:actionGroupMode>
-<wpml:actionTrigger>
-<wpml:actionTriggerType>reachPoint</wpml:actionTriggerType>
-</wpml:actionTrigger>
-<wpml:action>
-<wpml:actionId>{action_id}</wpml:actionId>
-<wpml:actionActuatorFunc>gimbalEvenlyRotate</wpml:actionActuatorFunc>
-<wpml:actionActuatorFuncParam>
-<wpml:gimbalPitchRotateAngle>{gimbal_pitch}</wpml:gimbalPitchRotateAngle>
-<wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
-</wpml:actionActuatorFuncParam>
-</wpml:action>
-</wpml:actionGroup>
-"""
-        else:
-            # Pour les autres points : action gimbalEvenlyRotate
-            waylines_wpml += f"""<wpml:actionGroup>
-<wpml:actionGroupId>2</wpml:actionGroupId>
-<wpml:actionGroupStartIndex>{i}</wpml:actionGroupStartIndex>
-<wpml:actionGroupEndIndex>{i}</wpml:actionGroupEndIndex>
-<wpml:actionGroupMode>parallel</wpml:actionGroupMode>
-<wpml:actionTrigger>
-<wpml:actionTriggerType>reachPoint</wpml:actionTriggerType>
-</wpml:actionTrigger>
-<wpml:action>
-<wpml:actionId>{action_id}</wpml:actionId>
-<wpml:actionActuatorFunc>gimbalEvenlyRotate</wpml:actionActuatorFunc>
-<wpml:actionActuatorFuncParam>
-<wpml:gimbalPitchRotateAngle>{gimbal_pitch}</wpml:gimbalPitchRotateAngle>
-<wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
-</wpml:actionActuatorFuncParam>
-</wpml:action>
-</wpml:actionGroup>
-"""
-        
-        action_id += 1
-        waylines_wpml += "</Placemark>"
-    
-    waylines_wpml += """
-\t\t</Folder>
-\t</Document>
-</kml>
-"""
-    
-    # Créer le fichier KMZ
-    with ZipFile(output_name, 'w') as kmz:
-        kmz.writestr("wpmz/template.kml", template_kml)
-        kmz.writestr("wpmz/waylines.wpml", waylines_wpml)
-    
-    return output_name
-
-# ---------------------------
-# Fonction pour valider le rectangle
-# ---------------------------
-def validate_rectangle(points):
-    if len(points) != 4:
-        return False, "Il faut exactement 4 points."
-    
-    distances = []
-    for i in range(4):
-        p1 = points[i]
-        p2 = points[(i + 1) % 4]
-        dist = math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
-        distances.append(dist)
-    
-    ratio1 = abs(distances[0] - distances[2]) / max(distances[0], distances[2])
-    ratio2 = abs(distances[1] - distances[3]) / max(distances[1], distances[3])
-    
-    if ratio1 > 0.2 or ratio2 > 0.2:
-        return False, "Les points ne forment pas un rectangle régulier."
-    
-    return True, "Rectangle valide."
-
-# ---------------------------
-# Fonction pour générer des waypoints
-# ---------------------------
-def generate_waypoints(rect_points, altitude, frontal_cov, lateral_cov,
-                       sensor_width, sensor_height, focal_length):
-    P0, P1, P2, P3 = rect_points
-
-    def distance_m(pA, pB):
-        lat_avg = (pA[0]+pB[0])/2
-        dx = (pB[1]-pA[1]) * 111000 * math.cos(math.radians(lat_avg))
-        dy = (pB[0]-pA[0]) * 111000
-        return math.sqrt(dx*dx + dy*dy)
-
-    fov_width  = 2 * altitude * (sensor_width / (2 * focal_length))
-    fov_height = 2 * altitude * (sensor_height / (2 * focal_length))
-    dy = fov_height * (1 - lateral_cov)
-
-    Ly_total = distance_m(P0, P3)
-    Ny = max(1, int(math.ceil(Ly_total / dy)))
-
-    waypoints = []
-
-    for iy in range(Ny + 1):
-        frac_y = iy / Ny
-        left_lat  = P0[0] + frac_y * (P3[0]-P0[0])
-        left_lon  = P0[1] + frac_y * (P3[1]-P0[1])
-        right_lat = P1[0] + frac_y * (P2[0]-P1[0])
-        right_lon = P1[1] + frac_y * (P2[1]-P1[1])
-
-        Lx_line = distance_m((left_lat,left_lon), (right_lat,right_lon))
-        dx = fov_width * (1 - frontal_cov)
-        Nx = max(1, int(math.ceil(Lx_line / dx)))
-
-        line_waypoints = []
-        for ix in range(Nx + 1):
-            frac_x = ix / Nx
-            lat = left_lat + frac_x * (right_lat - left_lat)
-            lon = left_lon + frac_x * (right_lon - left_lon)
-            line_waypoints.append((lat, lon, altitude))
-
-        if iy % 2 == 1:
-            line_waypoints.reverse()
-        
-        waypoints.extend(line_waypoints)
-
-    return waypoints, Nx + 1, Ny + 1, fov_width, fov_height
-
 # ---------------------------
 # Classe Bridge PyQt5
 # ---------------------------
 class Bridge(QObject):
+    # Coordonnées des waypoints calculés, encodées par pack_coordinates
+    waypointsReady = pyqtSignal(str)
+    # Calcul en arrière-plan : étape, fait, total / calcul en cours ou non
+    missionProgress = pyqtSignal(str, int, int)
+    missionRunning = pyqtSignal(bool)
+
     def __init__(self, view, altitude, frontal_cov, lateral_cov, 
-                 sensor_width, sensor_height, focal_length, drone_speed, gimbal_pitch):
+                 sensor_width, sensor_height, focal_length, drone_speed, gimbal_pitch,
+                 photo_mode="waypoint"):
         super().__init__()
         self.view = view
         self.points = []
@@ -443,6 +199,8 @@ class Bridge(QObject):
         self.focal_length = focal_length
         self.drone_speed = drone_speed
         self.gimbal_pitch = gimbal_pitch
+        self.photo_mode = photo_mode
+        self.task = None
 
     @pyqtSlot(float, float)
     def sendPoint(self, lat, lng):
@@ -475,44 +233,79 @@ class Bridge(QObject):
             QMessageBox.warning(self.view, "Rectangle invalide", message)
             return
         
+        if self.task is not None:
+            return
+        
         print("Validation du rectangle...")
         
-        waypoints, nx, ny, fov_w, fov_h = generate_waypoints(
-            self.points, self.altitude, self.frontal_cov, self.lateral_cov,
-            self.sensor_width, self.sensor_height, self.focal_length
+        # Génération et export dans le QThreadPool : l'interface reste réactive
+        self.task = MissionTask(self._compute_mission, [tuple(p) for p in self.points])
+        self.task.signals.progress.connect(self.missionProgress)
+        self.task.signals.finished.connect(self._on_mission_finished)
+        self.task.signals.failed.connect(self._on_mission_failed)
+        self.task.signals.cancelled.connect(self._on_mission_cancelled)
+        self.missionRunning.emit(True)
+        self.task.start()
+
+    def _compute_mission(self, progress, points):
+        """Calcul complet de la mission (exécuté dans un thread du QThreadPool)"""
+        progress("Calcul des passes")
+        
+        endpoints_only = self.photo_mode != "waypoint"
+        waypoints, pass_index, nx, ny, fov_w, fov_h = generate_waypoints_array(
+            points, self.altitude, self.frontal_cov, self.lateral_cov,
+            self.sensor_width, self.sensor_height, self.focal_length, endpoints_only
         )
+        mission = Mission(waypoints, pass_index, ny, fov_w, fov_h)
+        photo_interval = fov_w * (1 - self.frontal_cov) if endpoints_only else None
         
-        waypoints_coords = [[lat, lon] for lat, lon, _ in waypoints]
-        js_show_waypoints = f"""
-            map.eachLayer(function(layer) {{
-                if (layer instanceof L.CircleMarker && layer.options.className === 'waypoint') {{
-                    map.removeLayer(layer);
-                }}
-                if (layer instanceof L.Polyline && layer.options.className === 'trajectory') {{
-                    map.removeLayer(layer);
-                }}
-            }});
-            
-            var coords = {waypoints_coords};
-            coords.forEach(function(wp, i) {{
-                L.circleMarker(wp, {{
-                    radius: 3,
-                    color: 'red',
-                    fillColor: 'red',
-                    fillOpacity: 0.8,
-                    className: 'waypoint'
-                }}).addTo(map).bindPopup('WP' + (i+1));
-            }});
-            
-            L.polyline(coords, {{
-                color: 'red', 
-                weight: 2, 
-                dashArray: '5, 5',
-                className: 'trajectory'
-            }}).addTo(map);
-        """
-        self.view.page().runJavaScript(js_show_waypoints)
+        progress("Export KMZ", 0, len(mission))
+        kmz_file = generate_waypointmap_kmz(
+            mission,
+            self.drone_speed,
+            self.gimbal_pitch,
+            "mission_waypoints.kmz",
+            photo_interval=photo_interval,
+            photo_trigger=self.photo_mode,
+            progress=lambda done, total: progress("Export KMZ", done, total)
+        )
         
+        return {
+            "mission": mission,
+            "nx": nx,
+            "ny": ny,
+            "fov_w": fov_w,
+            "fov_h": fov_h,
+            "photo_interval": photo_interval,
+            "kmz_file": kmz_file,
+            "estimate": estimate_flight(mission, self.drone_speed),
+        }
+
+    def _end_task(self, status):
+        self.task = None
+        self.missionProgress.emit(status, 0, 0)
+        self.missionRunning.emit(False)
+
+    def _on_mission_failed(self, error):
+        self._end_task("Erreur de calcul")
+        QMessageBox.critical(self.view, "Erreur", f"Échec du calcul de la mission :\n{error}")
+
+    def _on_mission_cancelled(self):
+        self._end_task("Calcul annulé")
+        print("Calcul de la mission annulé")
+
+    def _on_mission_finished(self, result):
+        mission = result["mission"]
+        fov_w, fov_h = result["fov_w"], result["fov_h"]
+        photo_interval = result["photo_interval"]
+        self._end_task(f"Mission calculée : {len(mission)} waypoints")
+        
+        # Afficher les waypoints sur la carte (coordonnées transmises en binaire)
+        self.waypointsReady.emit(pack_coordinates(mission))
+        
+        photo_desc = self.photo_mode
+        if photo_interval is not None:
+            photo_desc += f" (tous les {photo_interval:.1f} m)"
         msg = f"""Mission calculée avec succès !
 
 Paramètres:
@@ -522,11 +315,14 @@ Paramètres:
 - Recouvrement frontal: {self.frontal_cov*100:.0f}%
 - Recouvrement latéral: {self.lateral_cov*100:.0f}%
 - FOV calculé: {fov_w:.1f}m × {fov_h:.1f}m
+- Déclenchement photo: {photo_desc}
 
 Résultats:
-- Nombre de passes: {ny}
-- Points par passe: {nx}
-- Total waypoints: {len(waypoints)}
+- Nombre de passes: {result['ny']}
+- Points par passe: {result['nx']}
+- Total waypoints: {len(mission)}
+- Distance de vol: {result['estimate'].distance:.0f} m
+- Durée estimée: {format_duration(result['estimate'].duration)}
 
 Le fichier mission_waypoints.kmz a été généré.
 Compatible avec WaypointMap et DJI Fly."""
@@ -535,76 +331,81 @@ Compatible avec WaypointMap et DJI Fly."""
         print(msg)
         print(f"{'='*50}\n")
         
-        QMessageBox.information(self.view, "Mission générée", msg)
-        
-        kmz_file = generate_waypointmap_kmz(
-            waypoints, 
-            self.drone_speed,
-            self.gimbal_pitch,
-            "mission_waypoints.kmz"
-        )
-        
-        print(f"✔ Fichier KMZ généré: {kmz_file}")
+        print(f"✔ Fichier KMZ généré: {result['kmz_file']}")
         print("\n📱 Installation dans DJI Fly:")
         print("1. Créez une mission dans DJI Fly (2-3 waypoints)")
         print("2. Connectez la télécommande en USB")
         print("3. Naviguez: Android/data/dji.go.v5/files/waypoint/")
         print("4. Remplacez le .kmz par mission_waypoints.kmz")
+        
+        QMessageBox.information(self.view, "Mission générée", msg)
+
+    @pyqtSlot()
+    def cancelMission(self):
+        """Annule le calcul en cours (pris en compte au prochain point de progression)"""
+        if self.task is not None:
+            self.task.cancel()
 
     @pyqtSlot()
     def resetPoints(self):
+        self.cancelMission()
         self.points = []
         print("Points réinitialisés")
 
 # ---------------------------
 # Lancer l'application
 # ---------------------------
-app = QApplication(sys.argv)
-
-place_name, ok_place = QInputDialog.getText(
-    None, "Lieu de la mission", 
-    "Entrez le nom du lieu (ex: ENSEIRB-MATMECA, Bordeaux) :"
-)
-if not ok_place or not place_name.strip():
-    print("Annulé par l'utilisateur")
-    sys.exit()
-
-lat, lon = get_location_coordinates(place_name)
-if lat is None:
-    print("Lieu introuvable, coordonnées par défaut (Paris)")
-    lat, lon = 48.8566, 2.3522
-
-print(f"Lieu localisé: {place_name} ({lat:.6f}, {lon:.6f})")
-
-altitude, ok1 = QInputDialog.getDouble(None, "Hauteur de vol", "Hauteur (m):", 50, 10, 500, 1)
-drone_speed, ok2 = QInputDialog.getDouble(None, "Vitesse", "Vitesse (m/s):", 2.5, 1, 15, 1)
-gimbal_pitch, ok3 = QInputDialog.getDouble(None, "Angle nacelle", "Angle (-90=bas, 0=horizontal):", -45, -90, 0, 1)
-frontal_cov, ok4 = QInputDialog.getDouble(None, "Recouvrement frontal", "Frontal (0.8 = 80%):", 0.8, 0.5, 0.95, 2)
-lateral_cov, ok5 = QInputDialog.getDouble(None, "Recouvrement latéral", "Latéral (0.8 = 80%):", 0.8, 0.5, 0.95, 2)
-sensor_width, ok6 = QInputDialog.getDouble(None, "Capteur", "Largeur (mm):", 6.17, 1.0, 50.0, 2)
-sensor_height, ok7 = QInputDialog.getDouble(None, "Capteur", "Hauteur (mm):", 4.55, 1.0, 50.0, 2)
-focal_length, ok8 = QInputDialog.getDouble(None, "Focale", "Focale (mm):", 4.5, 1.0, 100.0, 1)
-
-if not all([ok1, ok2, ok3, ok4, ok5, ok6, ok7, ok8]):
-    print("Annulé par l'utilisateur")
-    sys.exit()
-
-HTML = HTML_TEMPLATE.format(lat=lat, lon=lon)
-
-view = QWebEngineView()
-view.setWindowTitle("Générateur de mission drone - WaypointMap compatible")
-view.resize(1200, 800)
-
-channel = QWebChannel()
-bridge = Bridge(view, altitude, frontal_cov, lateral_cov, 
-                sensor_width, sensor_height, focal_length, drone_speed, gimbal_pitch)
-channel.registerObject("bridge", bridge)
-view.page().setWebChannel(channel)
-view.setHtml(HTML)
-view.show()
-
-print("\n" + "="*50)
-print("Interface lancée - Suivez les instructions")
-print("="*50 + "\n")
-
-sys.exit(app.exec_())
\ No newline at end of file
+if __name__ == "__main__":
+    register_tile_scheme()
+    app = QApplication(sys.argv)
+
+    place_name, ok_place = QInputDialog.getText(
+        None, "Lieu de la mission", 
+        "Entrez le nom du lieu (ex: ENSEIRB-MATMECA, Bordeaux) :"
+    )
+    if not ok_place or not place_name.strip():
+        print("Annulé par l'utilisateur")
+        sys.exit()
+
+    lat, lon = get_location_coordinates(place_name)
+    if lat is None:
+        print("Lieu introuvable, coordonnées par défaut (Paris)")
+        lat, lon = 48.8566, 2.3522
+
+    print(f"Lieu localisé: {place_name} ({lat:.6f}, {lon:.6f})")
+
+    altitude, ok1 = QInputDialog.getDouble(None, "Hauteur de vol", "Hauteur (m):", 50, 10, 500, 1)
+    drone_speed, ok2 = QInputDialog.getDouble(None, "Vitesse", "Vitesse (m/s):", 2.5, 1, 15, 1)
+    gimbal_pitch, ok3 = QInputDialog.getDouble(None, "Angle nacelle", "Angle (-90=bas, 0=horizontal):", -45, -90, 0, 1)
+    frontal_cov, ok4 = QInputDialog.getDouble(None, "Recouvrement frontal", "Frontal (0.8 = 80%):", 0.8, 0.5, 0.95, 2)
+    lateral_cov, ok5 = QInputDialog.getDouble(None, "Recouvrement latéral", "Latéral (0.8 = 80%):", 0.8, 0.5, 0.95, 2)
+    sensor_width, ok6 = QInputDialog.getDouble(None, "Capteur", "Largeur (mm):", 6.17, 1.0, 50.0, 2)
+    sensor_height, ok7 = QInputDialog.getDouble(None, "Capteur", "Hauteur (mm):", 4.55, 1.0, 50.0, 2)
+    focal_length, ok8 = QInputDialog.getDouble(None, "Focale", "Focale (mm):", 4.5, 1.0, 100.0, 1)
+    photo_mode, ok9 = QInputDialog.getItem(None, "Déclenchement photo", "Mode :", list(PHOTO_MODES), 0, False)
+
+    if not all([ok1, ok2, ok3, ok4, ok5, ok6, ok7, ok8, ok9]):
+        print("Annulé par l'utilisateur")
+        sys.exit()
+
+    HTML = HTML_TEMPLATE.format(lat=lat, lon=lon)
+
+    view = QWebEngineView()
+    view.setWindowTitle("Générateur de mission drone - WaypointMap compatible")
+    view.resize(1200, 800)
+    install_tile_cache(view)
+
+    channel = QWebChannel()
+    bridge = Bridge(view, altitude, frontal_cov, lateral_cov, 
+                    sensor_width, sensor_height, focal_length, drone_speed, gimbal_pitch,
+                    PHOTO_MODES[photo_mode])
+    channel.registerObject("bridge", bridge)
+    view.page().setWebChannel(channel)
+    view.setHtml(HTML)
+    view.show()
+
+    print("\n" + "="*50)
+    print("Interface lancée - Suivez les instructions")
+    print("="*50 + "\n")
+
+    sys.exit(app.exec_())
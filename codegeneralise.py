@@ -1,25 +1,25 @@
 import sys
-import math
-import time
-from zipfile import ZipFile
 
 from PyQt5.QtWidgets import QApplication, QInputDialog, QMessageBox
 from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import QObject, pyqtSlot
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtWebChannel import QWebChannel
 
-from geopy.geocoders import Nominatim
-
-# ---------------------------
-# Fonction pour géolocaliser un lieu
-# ---------------------------
-def get_location_coordinates(place_name):
-    geolocator = Nominatim(user_agent="gps_simulation")
-    location = geolocator.geocode(place_name)
-    if location:
-        return location.latitude, location.longitude
-    else:
-        return None, None
+import resources_rc  # noqa: F401  (Leaflet et mission_map.js embarqués, servis en qrc:)
+from tile_scheme import install_tile_cache, register_tile_scheme
+from mission_worker import MissionTask
+from mission_cache import default_mission_cache
+from mission_core import (
+    PHOTO_MODES,
+    PolygonSweep,
+    estimate_flight,
+    format_duration,
+    generate_waypointmap_kmz,
+    get_location_coordinates,
+    optimize_sweep_angle,
+    pack_coordinates,
+    split_mission,
+)
 
 # ---------------------------
 # HTML de la carte
@@ -60,6 +60,9 @@ HTML_TEMPLATE = """
     #close:disabled {{ background: #cccccc; cursor: not-allowed; }}
     #reset {{ background: #f44336; color: white; }}
     #reset:hover {{ background: #da190b; }}
+    #cancel {{ background: #FF9800; color: white; }}
+    #cancel:hover {{ background: #e68a00; }}
+    #cancel:disabled {{ background: #cccccc; cursor: not-allowed; }}
     #info {{
         position: absolute;
         bottom: 10px;
@@ -73,22 +76,28 @@ HTML_TEMPLATE = """
         font-size: 12px;
     }}
 </style>
-<link rel="stylesheet" href="https://unpkg.com/leaflet@1.7.1/dist/leaflet.css" />
-<script src="https://unpkg.com/leaflet@1.7.1/dist/leaflet.js"></script>
+<link rel="stylesheet" href="qrc:///leaflet/leaflet.css" />
+<script src="qrc:///leaflet/leaflet.js"></script>
 <script src="qrc:///qtwebchannel/qwebchannel.js"></script>
+<script src="qrc:///kael/mission_map.js"></script>
 </head>
 <body>
 <div id="map"></div>
 <div class="control-panel">
     <button id="close" disabled>Fermer Polygone</button>
     <button id="validate" disabled>Valider Mission</button>
+    <button id="cancel" disabled>Annuler calcul</button>
     <button id="reset">Réinitialiser</button>
 </div>
 <div id="info">Cliquez pour ajouter des points au polygone (minimum 3)</div>
 
 <script>
 var map = L.map('map').setView([{lat}, {lon}], 15);
-L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png').addTo(map);
+// Tuiles servies par le cache local (tile_scheme.py), téléchargées seulement si absentes
+L.tileLayer('kaeltiles:{{z}}/{{x}}/{{y}}.png', {{
+    maxZoom: 19,
+    attribution: '&copy; OpenStreetMap'
+}}).addTo(map);
 
 var polygon = null;
 var markers = [];
@@ -98,6 +107,22 @@ var bridge = null;
 
 new QWebChannel(qt.webChannelTransport, function (channel) {{
     bridge = channel.objects.bridge;
+    // Waypoints de la mission calculée, transmis en binaire (voir mission_map.js)
+    bridge.waypointsReady.connect(function (data) {{ showMission(map, data); }});
+    // Calcul en arrière-plan : progression et état du bouton d'annulation
+    bridge.missionProgress.connect(function (stage, done, total) {{
+        document.getElementById('info').textContent =
+            stage + (total > 0 ? ' : ' + done + '/' + total : '');
+    }});
+    // Aperçu recalculé pendant le tracé du polygone
+    bridge.previewReady.connect(function (n_lines, n_points) {{
+        document.getElementById('info').textContent =
+            'Aperçu (' + pointCount + ' sommets) : ' + n_lines + ' passes, ' + n_points + ' waypoints';
+    }});
+    bridge.missionRunning.connect(function (running) {{
+        document.getElementById('cancel').disabled = !running;
+        document.getElementById('validate').disabled = running || !polygonClosed;
+    }});
 }});
 
 map.on('click', function (e) {{
@@ -155,18 +180,47 @@ document.getElementById('close').addEventListener('click', function() {{
             weight: 2
         }}).addTo(map);
         map.fitBounds(polygon.getBounds());
+        enableVertexEditing();
     }}
 }});
 
+// Sommets déplaçables une fois le polygone fermé : l'aperçu suit le glissement
+function enableVertexEditing() {{
+    markers.forEach(function (marker, i) {{
+        marker.on('mousedown', function () {{
+            map.dragging.disable();
+            function onMove(e) {{
+                marker.setLatLng(e.latlng);
+                polygon.setLatLngs(markers.map(m => m.getLatLng()));
+                bridge.moveVertex(i, e.latlng.lat, e.latlng.lng);
+            }}
+            function onUp() {{
+                map.off('mousemove', onMove);
+                map.off('mouseup', onUp);
+                map.dragging.enable();
+            }}
+            map.on('mousemove', onMove);
+            map.on('mouseup', onUp);
+        }});
+    }});
+}}
+
 document.getElementById('validate').addEventListener('click', function() {{
     if (bridge && polygonClosed) {{
         bridge.validatePolygon();
     }}
 }});
 
+document.getElementById('cancel').addEventListener('click', function() {{
+    if (bridge) {{
+        bridge.cancelMission();
+    }}
+}});
+
 document.getElementById('reset').addEventListener('click', function() {{
     if (bridge) {{
         bridge.resetPoints();
+        clearMission(map);
         markers.forEach(function(m) {{ map.removeLayer(m); }});
         markers = [];
         if (polygon) {{ map.removeLayer(polygon); polygon = null; }}
@@ -189,329 +243,24 @@ document.getElementById('reset').addEventListener('click', function() {{
 </html>
 """
 
-# ---------------------------
-# Fonction pour générer un KMZ compatible WaypointMap
-# ---------------------------
-def generate_waypointmap_kmz(waypoints, drone_speed, gimbal_pitch, output_name="mission_waypoints.kmz"):
-    timestamp = int(time.time() * 1000)
-    
-    template_kml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:wpml="http://www.dji.com/wpmz/1.0.2">
-<Document>
-<wpml:author>fly</wpml:author>
-<wpml:createTime>{timestamp}</wpml:createTime>
-<wpml:updateTime>{timestamp}</wpml:updateTime>
-<wpml:missionConfig>
-<wpml:flyToWaylineMode>safely</wpml:flyToWaylineMode>
-<wpml:finishAction>noAction</wpml:finishAction>
-<wpml:exitOnRCLost>executeLostAction</wpml:exitOnRCLost>
-<wpml:executeRCLostAction>hover</wpml:executeRCLostAction>
-<wpml:globalTransitionalSpeed>{drone_speed}</wpml:globalTransitionalSpeed>
-<wpml:droneInfo>
-<wpml:droneEnumValue>68</wpml:droneEnumValue>
-<wpml:droneSubEnumValue>0</wpml:droneSubEnumValue>
-</wpml:droneInfo>
-</wpml:missionConfig>
-</Document>
-</kml>
-"""
-    
-    waylines_wpml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:wpml="http://www.dji.com/wpmz/1.0.2">
-\t<Document>
-\t\t<wpml:missionConfig>
-\t\t\t<wpml:flyToWaylineMode>safely</wpml:flyToWaylineMode>
-\t\t\t<wpml:finishAction>noAction</wpml:finishAction>
-\t\t\t<wpml:exitOnRCLost>executeLostAction</wpml:exitOnRCLost>
-\t\t\t<wpml:executeRCLostAction>hover</wpml:executeRCLostAction>
-\t\t\t<wpml:globalTransitionalSpeed>{drone_speed}</wpml:globalTransitionalSpeed>
-\t\t\t<wpml:droneInfo>
-\t\t\t\t<wpml:droneEnumValue>68</wpml:droneEnumValue>
-\t\t\t\t<wpml:droneSubEnumValue>0</wpml:droneSubEnumValue>
-\t\t\t</wpml:droneInfo>
-\t\t</wpml:missionConfig>
-\t\t<Folder>
-\t\t\t<wpml:templateId>0</wpml:templateId>
-\t\t\t<wpml:executeHeightMode>relativeToStartPoint</wpml:executeHeightMode>
-\t\t\t<wpml:waylineId>0</wpml:waylineId>
-\t\t\t<wpml:distance>0</wpml:distance>
-\t\t\t<wpml:duration>0</wpml:duration>
-\t\t\t<wpml:autoFlightSpeed>{drone_speed}</wpml:autoFlightSpeed>
-"""
-    
-    def get_heading(i, waypoints):
-        if i == 0:
-            lat1, lon1, _ = waypoints[0]
-            lat2, lon2, _ = waypoints[1]
-        elif i == len(waypoints) - 1:
-            lat1, lon1, _ = waypoints[i-1]
-            lat2, lon2, _ = waypoints[i]
-        else:
-            lat1, lon1, _ = waypoints[i]
-            lat2, lon2, _ = waypoints[i+1]
-        
-        dlon = lon2 - lon1
-        dlat = lat2 - lat1
-        angle = math.degrees(math.atan2(dlon, dlat))
-        
-        if abs(dlon) > abs(dlat):
-            return -90 if dlon > 0 else 90
-        else:
-            return -90 if dlat < 0 else -90
-    
-    action_id = 1
-    for i, (lat, lon, alt) in enumerate(waypoints):
-        heading = get_heading(i, waypoints)
-        
-        if i == 0:
-            turn_mode = "toPointAndStopWithContinuityCurvature"
-            heading_enable = 1
-        else:
-            turn_mode = "toPointAndPassWithContinuityCurvature"
-            heading_enable = 0
-        
-        waylines_wpml += f"""<Placemark>
-<Point>
-<coordinates>
-{lon},{lat}
-</coordinates>
-</Point>
-<wpml:index>{i}</wpml:index>
-<wpml:executeHeight>{int(alt)}</wpml:executeHeight>
-<wpml:waypointSpeed>{drone_speed}</wpml:waypointSpeed>
-<wpml:waypointHeadingParam>
-<wpml:waypointHeadingMode>smoothTransition</wpml:waypointHeadingMode>
-<wpml:waypointHeadingAngle>{heading}</wpml:waypointHeadingAngle>
-<wpml:waypointPoiPoint>0.000000,0.000000,0.000000</wpml:waypointPoiPoint>
-<wpml:waypointHeadingAngleEnable>{heading_enable}</wpml:waypointHeadingAngleEnable>
-<wpml:waypointHeadingPathMode>followBadArc</wpml:waypointHeadingPathMode>
-</wpml:waypointHeadingParam>
-<wpml:waypointTurnParam>
-<wpml:waypointTurnMode>{turn_mode}</wpml:waypointTurnMode>
-<wpml:waypointTurnDampingDist>0</wpml:waypointTurnDampingDist>
-</wpml:waypointTurnParam>
-<wpml:useStraightLine>0</wpml:useStraightLine>
-"""
-        
-        if i == 0:
-            waylines_wpml += f"""<wpml:actionGroup>
-<wpml:actionGroupId>1</wpml:actionGroupId>
-<wpml:actionGroupStartIndex>0</wpml:actionGroupStartIndex>
-<wpml:actionGroupEndIndex>0</wpml:actionGroupEndIndex>
-<wpml:actionGroupMode>parallel</wpml:actionGroupMode>
-<wpml:actionTrigger>
-<wpml:actionTriggerType>reachPoint</wpml:actionTriggerType>
-</wpml:actionTrigger>
-<wpml:action>
-<wpml:actionId>{action_id}</wpml:actionId>
-<wpml:actionActuatorFunc>gimbalRotate</wpml:actionActuatorFunc>
-<wpml:actionActuatorFuncParam>
-<wpml:gimbalHeadingYawBase>aircraft</wpml:gimbalHeadingYawBase>
-<wpml:gimbalRotateMode>absoluteAngle</wpml:gimbalRotateMode>
-<wpml:gimbalPitchRotateEnable>1</wpml:gimbalPitchRotateEnable>
-<wpml:gimbalPitchRotateAngle>{gimbal_pitch}</wpml:gimbalPitchRotateAngle>
-<wpml:gimbalRollRotateEnable>0</wpml:gimbalRollRotateEnable>
-<wpml:gimbalRollRotateAngle>0</wpml:gimbalRollRotateAngle>
-<wpml:gimbalYawRotateEnable>0</wpml:gimbalYawRotateEnable>
-<wpml:gimbalYawRotateAngle>0</wpml:gimbalYawRotateAngle>
-<wpml:gimbalRotateTimeEnable>0</wpml:gimbalRotateTimeEnable>
-<wpml:gimbalRotateTime>0</wpml:gimbalRotateTime>
-<wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
-</wpml:actionActuatorFuncParam>
-</wpml:action>
-</wpml:actionGroup>
-"""
-            action_id += 1
-            
-            waylines_wpml += f"""<wpml:actionGroup>
-<wpml:actionGroupId>2</wpml:actionGroupId>
-<wpml:actionGroupStartIndex>0</wpml:actionGroupStartIndex>
-<wpml:actionGroupEndIndex>{len(waypoints)-1}</wpml:actionGroupEndIndex>
-<wpml:actionGroupMode>parallel</wpml:actionGroupMode>
-<wpml:actionTrigger>
-<wpml:actionTriggerType>reachPoint</wpml:actionTriggerType>
-</wpml:actionTrigger>
-<wpml:action>
-<wpml:actionId>{action_id}</wpml:actionId>
-<wpml:actionActuatorFunc>gimbalEvenlyRotate</wpml:actionActuatorFunc>
-<wpml:actionActuatorFuncParam>
-<wpml:gimbalPitchRotateAngle>{gimbal_pitch}</wpml:gimbalPitchRotateAngle>
-<wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
-</wpml:actionActuatorFuncParam>
-</wpml:action>
-</wpml:actionGroup>
-"""
-        else:
-            waylines_wpml += f"""<wpml:actionGroup>
-<wpml:actionGroupId>2</wpml:actionGroupId>
-<wpml:actionGroupStartIndex>{i}</wpml:actionGroupStartIndex>
-<wpml:actionGroupEndIndex>{i}</wpml:actionGroupEndIndex>
-<wpml:actionGroupMode>parallel</wpml:actionGroupMode>
-<wpml:actionTrigger>
-<wpml:actionTriggerType>reachPoint</wpml:actionTriggerType>
-</wpml:actionTrigger>
-<wpml:action>
-<wpml:actionId>{action_id}</wpml:actionId>
-<wpml:actionActuatorFunc>gimbalEvenlyRotate</wpml:actionActuatorFunc>
-<wpml:actionActuatorFuncParam>
-<wpml:gimbalPitchRotateAngle>{gimbal_pitch}</wpml:gimbalPitchRotateAngle>
-<wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
-</wpml:actionActuatorFuncParam>
-</wpml:action>
-</wpml:actionGroup>
-"""
-        
-        action_id += 1
-        waylines_wpml += "</Placemark>"
-    
-    waylines_wpml += """
-\t\t</Folder>
-\t</Document>
-</kml>
-"""
-    
-    with ZipFile(output_name, 'w') as kmz:
-        kmz.writestr("wpmz/template.kml", template_kml)
-        kmz.writestr("wpmz/waylines.wpml", waylines_wpml)
-    
-    return output_name
-
-# ---------------------------
-# Fonctions géométriques pour polygone
-# ---------------------------
-def point_in_polygon(point, polygon):
-    """Test si un point est dans un polygone (ray casting algorithm)"""
-    x, y = point
-    n = len(polygon)
-    inside = False
-    
-    p1x, p1y = polygon[0]
-    for i in range(1, n + 1):
-        p2x, p2y = polygon[i % n]
-        if y > min(p1y, p2y):
-            if y <= max(p1y, p2y):
-                if x <= max(p1x, p2x):
-                    if p1y != p2y:
-                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                    if p1x == p2x or x <= xinters:
-                        inside = not inside
-        p1x, p1y = p2x, p2y
-    
-    return inside
-
-def get_bounding_box(polygon):
-    """Retourne le bounding box du polygone (min_lat, max_lat, min_lon, max_lon)"""
-    lats = [p[0] for p in polygon]
-    lons = [p[1] for p in polygon]
-    return (min(lats), max(lats), min(lons), max(lons))
-
-def get_main_axis_angle(polygon):
-    """Calcule l'angle principal du polygone pour l'orientation des passes"""
-    if len(polygon) < 2:
-        return 0
-    
-    p1, p2 = polygon[0], polygon[1]
-    dx = p2[1] - p1[1]
-    dy = p2[0] - p1[0]
-    angle = math.atan2(dy, dx)
-    return angle
-
-# ---------------------------
-# Fonction pour générer des waypoints dans un polygone
-# ---------------------------
-def generate_waypoints_polygon(polygon_points, altitude, frontal_cov, lateral_cov,
-                               sensor_width, sensor_height, focal_length):
-    """
-    Génère des waypoints pour couvrir un polygone quelconque avec un pattern boustrophédon.
-    Utilise un algorithme de balayage horizontal (scanlines) avec détection d'intersections.
-    """
-    def distance_m(pA, pB):
-        """Calcule la distance en mètres entre deux points GPS"""
-        lat_avg = (pA[0] + pB[0]) / 2
-        dx = (pB[1] - pA[1]) * 111000 * math.cos(math.radians(lat_avg))
-        dy = (pB[0] - pA[0]) * 111000
-        return math.sqrt(dx*dx + dy*dy)
-    
-    # Calcul du FOV (Field of View) basé sur les paramètres de la caméra
-    fov_width = 2 * altitude * (sensor_width / (2 * focal_length))
-    fov_height = 2 * altitude * (sensor_height / (2 * focal_length))
-    
-    # Calcul de l'espacement entre les passes en tenant compte du recouvrement
-    dy = fov_height * (1 - lateral_cov)
-    dx = fov_width * (1 - frontal_cov)
-    
-    # Obtenir le bounding box du polygone
-    min_lat, max_lat, min_lon, max_lon = get_bounding_box(polygon_points)
-    
-    # Convertir l'espacement en degrés de latitude
-    dy_deg = dy / 111000  # 1 degré de latitude ≈ 111km
-    
-    # Calculer le nombre de lignes de balayage nécessaires
-    height_deg = max_lat - min_lat
-    n_lines = max(1, int(math.ceil(height_deg / dy_deg))) + 1
-    
-    waypoints = []
-    line_count = 0
-    
-    # Générer les lignes de balayage horizontales
-    for i in range(n_lines):
-        current_lat = min_lat + i * dy_deg
-        
-        if current_lat > max_lat:
-            break
-        
-        # Trouver toutes les intersections de cette ligne avec le polygone
-        intersections = []
-        
-        for j in range(len(polygon_points)):
-            p1 = polygon_points[j]
-            p2 = polygon_points[(j + 1) % len(polygon_points)]
-            
-            # Vérifier si le segment du polygone traverse la ligne horizontale
-            if (p1[0] <= current_lat <= p2[0]) or (p2[0] <= current_lat <= p1[0]):
-                if p2[0] != p1[0]:  # Éviter division par zéro
-                    # Calculer la longitude du point d'intersection
-                    t = (current_lat - p1[0]) / (p2[0] - p1[0])
-                    lon_intersect = p1[1] + t * (p2[1] - p1[1])
-                    intersections.append(lon_intersect)
-        
-        # Trier les intersections par longitude
-        intersections.sort()
-        
-        # Générer les waypoints par paires d'intersections (entrée/sortie du polygone)
-        for k in range(0, len(intersections) - 1, 2):
-            lon_start = intersections[k]
-            lon_end = intersections[k + 1]
-            
-            # Calculer le nombre de points nécessaires sur cette ligne
-            line_length_m = distance_m((current_lat, lon_start), (current_lat, lon_end))
-            n_points = max(1, int(math.ceil(line_length_m / dx))) + 1
-            
-            # Générer les waypoints sur cette ligne
-            line_waypoints = []
-            for m in range(n_points):
-                frac = m / (n_points - 1) if n_points > 1 else 0
-                lon = lon_start + frac * (lon_end - lon_start)
-                
-                # Vérifier que le point est bien dans le polygone
-                if point_in_polygon((current_lat, lon), polygon_points):
-                    line_waypoints.append((current_lat, lon, altitude))
-            
-            # Pattern boustrophédon : alterner la direction des lignes
-            if line_count % 2 == 1:
-                line_waypoints.reverse()
-            
-            waypoints.extend(line_waypoints)
-            line_count += 1
-    
-    return waypoints, line_count, len(waypoints), fov_width, fov_height
-
 # ---------------------------
 # Classe Bridge PyQt5 pour communication JS ↔ Python
 # ---------------------------
 class Bridge(QObject):
+    # Coordonnées des waypoints calculés, encodées par pack_coordinates
+    waypointsReady = pyqtSignal(str)
+    # Calcul en arrière-plan : étape, fait, total / calcul en cours ou non
+    missionProgress = pyqtSignal(str, int, int)
+    missionRunning = pyqtSignal(bool)
+    # Aperçu pendant le tracé : nombre de passes, nombre de waypoints
+    previewReady = pyqtSignal(int, int)
+
+    # Délai sans nouveau sommet avant de lancer l'aperçu (ms)
+    PREVIEW_DELAY = 150
+
     def __init__(self, view, altitude, frontal_cov, lateral_cov, 
-                 sensor_width, sensor_height, focal_length, drone_speed, gimbal_pitch):
+                 sensor_width, sensor_height, focal_length, drone_speed, gimbal_pitch,
+                 photo_mode="waypoint", battery_time=None):
         super().__init__()
         self.view = view
         self.points = []
@@ -524,12 +273,108 @@ class Bridge(QObject):
         self.focal_length = focal_length
         self.drone_speed = drone_speed
         self.gimbal_pitch = gimbal_pitch
+        self.photo_mode = photo_mode
+        # Autonomie utile d'une batterie (s) ; None : mission en un seul vol
+        self.battery_time = battery_time
+        self.task = None
+        self.preview_task = None
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(self.PREVIEW_DELAY)
+        self.preview_timer.timeout.connect(self._start_preview)
+        # Balayage conservé pour l'édition des sommets, et déplacements en attente
+        self.sweep = None
+        self.pending_moves = {}
+        self.edit_timer = QTimer(self)
+        self.edit_timer.setSingleShot(True)
+        self.edit_timer.setInterval(0)
+        self.edit_timer.timeout.connect(self._apply_moves)
 
     @pyqtSlot(float, float)
     def sendPoint(self, lat, lng):
-        """Reçoit un point cliqué sur la carte"""
+        """Reçoit un point cliqué sur la carte et relance l'aperçu de la mission"""
         print(f"Point {len(self.points) + 1} enregistré: {lat:.6f}, {lng:.6f}")
         self.points.append([lat, lng])
+        self.sweep = None
+        if len(self.points) >= 3:
+            self.preview_timer.start()
+
+    @pyqtSlot(int, float, float)
+    def moveVertex(self, index, lat, lng):
+        """Reçoit le déplacement d'un sommet du polygone fermé (glissement sur la carte)"""
+        self.points[index] = [lat, lng]
+        self.pending_moves[index] = (lat, lng)
+        if self.sweep is None:
+            # Aperçu en cours sur l'ancien polygone : à relancer
+            self._cancel_preview()
+        self.edit_timer.start()
+
+    def _apply_moves(self):
+        """
+        Applique les déplacements reçus depuis le dernier passage de la boucle d'événements.
+        Seules les lignes de balayage touchées par les sommets déplacés sont recalculées.
+        """
+        moves, self.pending_moves = self.pending_moves, {}
+        if self.sweep is None or self.task is not None:
+            self.preview_timer.start()
+            return
+        for index, (lat, lng) in moves.items():
+            self.sweep.move_vertex(index, lat, lng)
+        waypoints, _, n_lines, _, _ = self.sweep.result()
+        self.waypointsReady.emit(pack_coordinates(waypoints))
+        self.previewReady.emit(n_lines, len(waypoints))
+
+    def _start_preview(self):
+        """Aperçu des passes (sans export KMZ) ; un aperçu devenu obsolète est abandonné"""
+        self._cancel_preview()
+        if self.task is not None or len(self.points) < 3:
+            return
+        task = MissionTask(self._compute_preview, [tuple(p) for p in self.points])
+        task.signals.finished.connect(lambda result, task=task: self._on_preview_finished(task, result))
+        self.preview_task = task.start()
+
+    def _camera(self):
+        return (self.altitude, self.frontal_cov, self.lateral_cov,
+                self.sensor_width, self.sensor_height, self.focal_length)
+
+    def _sweep_angle(self, points, progress=None):
+        """
+        Orientation des passes qui minimise la durée de vol estimée ; progress(étape, fait, total)
+        est appelé entre les lots d'orientations évaluées (annulation)
+        """
+        def batch_done(done, total):
+            if progress:
+                progress("Orientation des passes", done, total)
+        return optimize_sweep_angle(points, *self._camera(), self.drone_speed, progress=batch_done)[0]
+
+    def _compute_preview(self, progress, points):
+        """
+        Aperçu exécuté dans le QThreadPool. Un aperçu annulé (devenu obsolète) s'arrête au
+        prochain point de progression : entre les lots de l'optimisation de l'orientation et
+        avant le balayage.
+        """
+        sweep_angle = self._sweep_angle(points, progress)
+        progress("Aperçu")
+        # L'orientation choisie ici est conservée pendant l'édition des sommets
+        sweep = PolygonSweep(
+            points, *self._camera(), self.photo_mode != "waypoint", sweep_angle=sweep_angle
+        )
+        waypoints, _, n_lines, _, _ = sweep.result()
+        return sweep, n_lines, len(waypoints), pack_coordinates(waypoints)
+
+    def _on_preview_finished(self, task, result):
+        # Résultat d'un aperçu remplacé entre-temps (nouveau sommet, validation) : ignoré
+        if task is not self.preview_task:
+            return
+        self.preview_task = None
+        self.sweep, n_lines, n_points, coordinates = result
+        self.waypointsReady.emit(coordinates)
+        self.previewReady.emit(n_lines, n_points)
+
+    def _cancel_preview(self):
+        if self.preview_task is not None:
+            self.preview_task.cancel()
+            self.preview_task = None
 
     @pyqtSlot()
     def closePolygon(self):
@@ -540,59 +385,124 @@ class Bridge(QObject):
 
     @pyqtSlot()
     def validatePolygon(self):
-        """Valide le polygone et génère la mission de waypoints"""
+        """Valide le polygone et lance le calcul de la mission en arrière-plan"""
         if not self.polygon_closed or len(self.points) < 3:
             QMessageBox.warning(self.view, "Erreur", "Veuillez fermer le polygone d'abord.")
             return
+        if self.task is not None:
+            return
+        self.preview_timer.stop()
+        self._cancel_preview()
         
         print(f"Validation du polygone ({len(self.points)} points)...")
         
-        # Générer les waypoints
-        waypoints, n_lines, n_points, fov_w, fov_h = generate_waypoints_polygon(
-            self.points, self.altitude, self.frontal_cov, self.lateral_cov,
-            self.sensor_width, self.sensor_height, self.focal_length
-        )
+        # Génération et export dans le QThreadPool : l'interface reste réactive
+        self.task = MissionTask(self._compute_mission, [tuple(p) for p in self.points])
+        self.task.signals.progress.connect(self.missionProgress)
+        self.task.signals.finished.connect(self._on_mission_finished)
+        self.task.signals.failed.connect(self._on_mission_failed)
+        self.task.signals.cancelled.connect(self._on_mission_cancelled)
+        self.missionRunning.emit(True)
+        self.task.start()
+
+    def _compute_mission(self, progress, points):
+        """Calcul complet de la mission (exécuté dans un thread du QThreadPool)"""
+        progress("Calcul des passes")
+        
+        # Générer les waypoints (extrémités des passes seulement en déclenchement par intervalle) ;
+        # une combinaison polygone + réglages déjà calculée est resservie par le cache
+        cache = default_mission_cache()
+        camera = self._camera()
+        endpoints_only = self.photo_mode != "waypoint"
+        sweep_angle = self._sweep_angle(points, progress)
+        mission = cache.mission(points, *camera, endpoints_only, sweep_angle)
+        photo_interval = mission.fov_width * (1 - self.frontal_cov) if endpoints_only else None
         
-        if len(waypoints) == 0:
+        # Découpage aux changements de passe si la mission dépasse une batterie
+        segments, durations = [(0, len(mission))], None
+        if self.battery_time and len(mission):
+            segments, durations = split_mission(mission, self.drone_speed, self.battery_time)
+        
+        # Générer le fichier KMZ (octets déjà sérialisés si la mission est en cache),
+        # ou un KMZ par batterie
+        kmz_files = []
+        if len(segments) > 1:
+            for k, (start, stop) in enumerate(segments, 1):
+                kmz_file = f"mission_waypoints_{k}.kmz"
+                generate_waypointmap_kmz(
+                    mission.slice(start, stop), self.drone_speed, self.gimbal_pitch, kmz_file,
+                    photo_interval=photo_interval,
+                    photo_trigger=self.photo_mode,
+                    progress=lambda done, total, start=start: progress("Export KMZ", start + done, len(mission))
+                )
+                kmz_files.append(kmz_file)
+        elif len(mission):
+            progress("Export KMZ", 0, len(mission))
+            data = cache.kmz_bytes(
+                points, *camera, endpoints_only, sweep_angle,
+                drone_speed=self.drone_speed,
+                gimbal_pitch=self.gimbal_pitch,
+                photo_trigger=self.photo_mode,
+                progress=lambda done, total: progress("Export KMZ", done, total)
+            )
+            kmz_files.append("mission_waypoints.kmz")
+            with open(kmz_files[0], "wb") as f:
+                f.write(data)
+        print(f"Cache des missions : {cache.stats()}")
+        
+        return {
+            "mission": mission,
+            "n_lines": mission.line_count,
+            "n_points": len(mission),
+            "fov_w": mission.fov_width,
+            "fov_h": mission.fov_height,
+            "sweep_angle": sweep_angle,
+            "photo_interval": photo_interval,
+            "kmz_files": kmz_files,
+            "battery_durations": durations,
+            "estimate": estimate_flight(mission, self.drone_speed),
+        }
+
+    def _end_task(self, status):
+        self.task = None
+        self.missionProgress.emit(status, 0, 0)
+        self.missionRunning.emit(False)
+
+    def _on_mission_failed(self, error):
+        self._end_task("Erreur de calcul")
+        QMessageBox.critical(self.view, "Erreur", f"Échec du calcul de la mission :\n{error}")
+
+    def _on_mission_cancelled(self):
+        self._end_task("Calcul annulé")
+        print("Calcul de la mission annulé")
+
+    def _on_mission_finished(self, result):
+        mission = result["mission"]
+        fov_w, fov_h = result["fov_w"], result["fov_h"]
+        photo_interval = result["photo_interval"]
+        self._end_task(f"Mission calculée : {result['n_points']} waypoints")
+        
+        if len(mission) == 0:
             QMessageBox.warning(self.view, "Erreur", "Aucun waypoint généré. Vérifiez le polygone.")
             return
         
-        # Afficher les waypoints sur la carte
-        waypoints_coords = [[lat, lon] for lat, lon, _ in waypoints]
-        js_show_waypoints = f"""
-            // Nettoyer les waypoints précédents
-            map.eachLayer(function(layer) {{
-                if (layer instanceof L.CircleMarker && layer.options.className === 'waypoint') {{
-                    map.removeLayer(layer);
-                }}
-                if (layer instanceof L.Polyline && layer.options.className === 'trajectory') {{
-                    map.removeLayer(layer);
-                }}
-            }});
-            
-            // Afficher les nouveaux waypoints
-            var coords = {waypoints_coords};
-            coords.forEach(function(wp, i) {{
-                L.circleMarker(wp, {{
-                    radius: 3,
-                    color: 'red',
-                    fillColor: 'red',
-                    fillOpacity: 0.8,
-                    className: 'waypoint'
-                }}).addTo(map).bindPopup('WP' + (i+1));
-            }});
-            
-            // Afficher la trajectoire
-            L.polyline(coords, {{
-                color: 'red', 
-                weight: 2, 
-                dashArray: '5, 5',
-                className: 'trajectory'
-            }}).addTo(map);
-        """
-        self.view.page().runJavaScript(js_show_waypoints)
+        # Afficher les waypoints sur la carte (coordonnées transmises en binaire)
+        self.waypointsReady.emit(pack_coordinates(mission))
         
         # Préparer le message de confirmation
+        photo_desc = self.photo_mode
+        if photo_interval is not None:
+            photo_desc += f" (tous les {photo_interval:.1f} m)"
+        kmz_files = result["kmz_files"]
+        durations = result["battery_durations"]
+        batteries = ""
+        if durations is not None:
+            batteries = (f"\n- Batteries: {len(durations)} vol(s), le plus long "
+                         f"{format_duration(max(durations))} (trajets depuis le départ compris)")
+        if len(kmz_files) > 1:
+            files_desc = f"Les fichiers {kmz_files[0]} à {kmz_files[-1]} ont été générés (un par batterie)."
+        else:
+            files_desc = f"Le fichier {kmz_files[0]} a été généré."
         msg = f"""Mission calculée avec succès !
 
 Paramètres:
@@ -603,38 +513,46 @@ Paramètres:
 - Recouvrement frontal: {self.frontal_cov*100:.0f}%
 - Recouvrement latéral: {self.lateral_cov*100:.0f}%
 - FOV calculé: {fov_w:.1f}m × {fov_h:.1f}m
+- Déclenchement photo: {photo_desc}
 
 Résultats:
-- Nombre de passes: {n_lines}
-- Total waypoints: {n_points}
+- Orientation des passes: {result['sweep_angle']:.0f}° (depuis l'est, optimisée)
+- Nombre de passes: {result['n_lines']}
+- Total waypoints: {result['n_points']}
+- Distance de vol: {result['estimate'].distance:.0f} m
+- Durée estimée: {format_duration(result['estimate'].duration)}{batteries}
 
-Le fichier mission_waypoints.kmz a été généré.
+{files_desc}
 Compatible avec WaypointMap et DJI Fly."""
         
         print(f"\n{'='*50}")
         print(msg)
         print(f"{'='*50}\n")
         
-        QMessageBox.information(self.view, "Mission générée", msg)
-        
-        # Générer le fichier KMZ
-        kmz_file = generate_waypointmap_kmz(
-            waypoints, 
-            self.drone_speed,
-            self.gimbal_pitch,
-            "mission_waypoints.kmz"
-        )
-        
-        print(f"✔ Fichier KMZ généré: {kmz_file}")
+        print(f"✔ Fichier(s) KMZ généré(s): {', '.join(kmz_files)}")
         print("\n📱 Installation dans DJI Fly:")
         print("1. Créez une mission dans DJI Fly (2-3 waypoints)")
         print("2. Connectez la télécommande en USB")
         print("3. Naviguez: Android/data/dji.go.v5/files/waypoint/")
         print("4. Remplacez le .kmz par mission_waypoints.kmz")
+        
+        QMessageBox.information(self.view, "Mission générée", msg)
+
+    @pyqtSlot()
+    def cancelMission(self):
+        """Annule le calcul en cours (pris en compte au prochain point de progression)"""
+        if self.task is not None:
+            self.task.cancel()
 
     @pyqtSlot()
     def resetPoints(self):
         """Réinitialise tous les points"""
+        self.cancelMission()
+        self.preview_timer.stop()
+        self._cancel_preview()
+        self.edit_timer.stop()
+        self.pending_moves = {}
+        self.sweep = None
         self.points = []
         self.polygon_closed = False
         print("Points réinitialisés")
@@ -643,6 +561,7 @@ Compatible avec WaypointMap et DJI Fly."""
 # Lancer l'application
 # ---------------------------
 if __name__ == "__main__":
+    register_tile_scheme()
     app = QApplication(sys.argv)
 
     # Demander le lieu de la mission
@@ -687,8 +606,14 @@ if __name__ == "__main__":
     focal_length, ok8 = QInputDialog.getDouble(
         None, "Focale", "Focale (mm):", 4.5, 1.0, 100.0, 1
     )
+    photo_mode, ok9 = QInputDialog.getItem(
+        None, "Déclenchement photo", "Mode :", list(PHOTO_MODES), 0, False
+    )
+    battery_minutes, ok10 = QInputDialog.getDouble(
+        None, "Batterie", "Autonomie utile par batterie (min, 0 = un seul vol):", 0, 0, 120, 1
+    )
 
-    if not all([ok1, ok2, ok3, ok4, ok5, ok6, ok7, ok8]):
+    if not all([ok1, ok2, ok3, ok4, ok5, ok6, ok7, ok8, ok9, ok10]):
         print("Annulé par l'utilisateur")
         sys.exit()
 
@@ -699,12 +624,14 @@ if __name__ == "__main__":
     view = QWebEngineView()
     view.setWindowTitle("Générateur de mission drone - Polygone généralisé")
     view.resize(1200, 800)
+    install_tile_cache(view)
 
     # Configurer le canal de communication
     channel = QWebChannel()
     bridge = Bridge(
         view, altitude, frontal_cov, lateral_cov, 
-        sensor_width, sensor_height, focal_length, drone_speed, gimbal_pitch
+        sensor_width, sensor_height, focal_length, drone_speed, gimbal_pitch,
+        PHOTO_MODES[photo_mode], battery_minutes * 60 or None
     )
     channel.registerObject("bridge", bridge)
     view.page().setWebChannel(channel)
@@ -1,25 +1,21 @@
 import sys
-import math
 from zipfile import ZipFile
 
 from PyQt5.QtWidgets import QApplication, QInputDialog, QMessageBox
 from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import QObject, pyqtSlot
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 from PyQt5.QtWebChannel import QWebChannel
 
 import simplekml
-from geopy.geocoders import Nominatim
 
-# ---------------------------
-# Fonction pour géolocaliser un lieu
-# ---------------------------
-def get_location_coordinates(place_name):
-    geolocator = Nominatim(user_agent="gps_simulation")
-    location = geolocator.geocode(place_name)
-    if location:
-        return location.latitude, location.longitude
-    else:
-        return None, None
+import resources_rc  # noqa: F401  (Leaflet et mission_map.js embarqués, servis en qrc:)
+from tile_scheme import install_tile_cache, register_tile_scheme
+from mission_core import (
+    generate_waypoints,
+    get_location_coordinates,
+    pack_coordinates,
+    validate_rectangle,
+)
 
 # ---------------------------
 # HTML de la carte avec placeholders pour latitude et longitude
@@ -70,9 +66,10 @@ HTML_TEMPLATE = """
         font-size: 12px;
     }}
 </style>
-<link rel="stylesheet" href="https://unpkg.com/leaflet@1.7.1/dist/leaflet.css" />
-<script src="https://unpkg.com/leaflet@1.7.1/dist/leaflet.js"></script>
+<link rel="stylesheet" href="qrc:///leaflet/leaflet.css" />
+<script src="qrc:///leaflet/leaflet.js"></script>
 <script src="qrc:///qtwebchannel/qwebchannel.js"></script>
+<script src="qrc:///kael/mission_map.js"></script>
 </head>
 <body>
 <div id="map"></div>
@@ -84,7 +81,11 @@ HTML_TEMPLATE = """
 
 <script>
 var map = L.map('map').setView([{lat}, {lon}], 15);
-L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png').addTo(map);
+// Tuiles servies par le cache local (tile_scheme.py), téléchargées seulement si absentes
+L.tileLayer('kaeltiles:{{z}}/{{x}}/{{y}}.png', {{
+    maxZoom: 19,
+    attribution: '&copy; OpenStreetMap'
+}}).addTo(map);
 
 var polygon = null;
 var markers = [];
@@ -94,6 +95,8 @@ var bridge = null;
 // Initialiser le bridge
 new QWebChannel(qt.webChannelTransport, function (channel) {{
     bridge = channel.objects.bridge;
+    // Waypoints de la mission calculée, transmis en binaire (voir mission_map.js)
+    bridge.waypointsReady.connect(function (data) {{ showMission(map, data); }});
 }});
 
 // Gestion des clics sur la carte
@@ -136,6 +139,7 @@ document.getElementById('validate').addEventListener('click', function() {{
 document.getElementById('reset').addEventListener('click', function() {{
     if (bridge) {{
         bridge.resetPoints();
+        clearMission(map);
         // Nettoyer la carte
         markers.forEach(function(m) {{ map.removeLayer(m); }});
         markers = [];
@@ -157,109 +161,13 @@ document.getElementById('reset').addEventListener('click', function() {{
 </html>
 """
 
-# ---------------------------
-# Fonction pour valider le rectangle
-# ---------------------------
-def validate_rectangle(points):
-    """Vérifie si les 4 points forment approximativement un rectangle"""
-    if len(points) != 4:
-        return False, "Il faut exactement 4 points."
-    
-    # Calculer les distances entre points consécutifs
-    distances = []
-    for i in range(4):
-        p1 = points[i]
-        p2 = points[(i + 1) % 4]
-        dist = math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
-        distances.append(dist)
-    
-    # Les côtés opposés doivent être approximativement égaux (tolérance 20%)
-    ratio1 = abs(distances[0] - distances[2]) / max(distances[0], distances[2])
-    ratio2 = abs(distances[1] - distances[3]) / max(distances[1], distances[3])
-    
-    if ratio1 > 0.2 or ratio2 > 0.2:
-        return False, "Les points ne forment pas un rectangle régulier. Les côtés opposés doivent être approximativement égaux."
-    
-    return True, "Rectangle valide."
-
-# ---------------------------
-# Fonction pour générer des waypoints avec calcul FOV amélioré
-# ---------------------------
-def generate_waypoints(rect_points, altitude, frontal_cov, lateral_cov,
-                       sensor_width, sensor_height, focal_length):
-    """
-    Génère les waypoints pour un rectangle orienté.
-    
-    rect_points : liste de 4 points [(lat, lon), ...] dans l'ordre autour du rectangle
-    altitude : hauteur de vol
-    frontal_cov : recouvrement frontal (0-1)
-    lateral_cov : recouvrement latéral (0-1)
-    sensor_width/height : dimensions du capteur en mm
-    focal_length : focale de l'objectif en mm
-    """
-    """
-    Génération de waypoints avec repère local par ligne.
-    rect_points : liste des 4 coins du rectangle dans l'ordre P0,P1,P2,P3
-    P0--P1
-    |   |
-    P3--P2
-    """
-
-    import math
-
-    P0, P1, P2, P3 = rect_points
-
-    def distance_m(pA, pB):
-        lat_avg = (pA[0]+pB[0])/2
-        dx = (pB[1]-pA[1]) * 111000 * math.cos(math.radians(lat_avg))
-        dy = (pB[0]-pA[0]) * 111000
-        return math.sqrt(dx*dx + dy*dy)
-
-    # FOV caméra
-    fov_width  = 2 * altitude * (sensor_width / (2 * focal_length))
-    fov_height = 2 * altitude * (sensor_height / (2 * focal_length))
-    dy = fov_height * (1 - lateral_cov)
-
-    # nombre de lignes selon dy
-    Ly_total = distance_m(P0, P3)
-    Ny = max(1, int(math.ceil(Ly_total / dy)))
-
-    waypoints = []
-
-    for iy in range(Ny + 1):
-        frac_y = iy / Ny
-        # calcul des points gauche et droite de cette ligne
-        left_lat  = P0[0] + frac_y * (P3[0]-P0[0])
-        left_lon  = P0[1] + frac_y * (P3[1]-P0[1])
-        right_lat = P1[0] + frac_y * (P2[0]-P1[0])
-        right_lon = P1[1] + frac_y * (P2[1]-P1[1])
-
-        # longueur de la ligne
-        Lx_line = distance_m((left_lat,left_lon), (right_lat,right_lon))
-        dx = fov_width * (1 - frontal_cov)
-        Nx = max(1, int(math.ceil(Lx_line / dx)))
-
-        for ix in range(Nx + 1):
-            frac_x = ix / Nx
-            lat = left_lat + frac_x * (right_lat - left_lat)
-            lon = left_lon + frac_x * (right_lon - left_lon)
-            waypoints.append((lat, lon, altitude))
-
-        # serpentin
-        if iy % 2 == 1:
-            waypoints[-(Nx + 1):] = reversed(waypoints[-(Nx + 1):])
-
-    # retour au point de départ
-    waypoints.append((P0[0], P0[1], altitude))
-
-    return waypoints, Nx + 1, Ny + 1, fov_width, fov_height
-
-
-
 # ---------------------------
 # Classe Bridge PyQt5
 # ---------------------------
 class Bridge(QObject):
+    # Coordonnées des waypoints calculés, encodées par pack_coordinates
+    waypointsReady = pyqtSignal(str)
+
     def __init__(self, view, altitude, frontal_cov, lateral_cov, 
                  sensor_width, sensor_height, focal_length):
         super().__init__()
@@ -310,43 +218,12 @@ class Bridge(QObject):
         # Générer les waypoints
         waypoints, nx, ny, fov_w, fov_h = generate_waypoints(
             self.points, self.altitude, self.frontal_cov, self.lateral_cov,
-            self.sensor_width, self.sensor_height, self.focal_length
+            self.sensor_width, self.sensor_height, self.focal_length,
+            return_home=True
         )
         
-        # Afficher les waypoints sur la carte
-        waypoints_coords = [[lat, lon] for lat, lon, _ in waypoints]
-        js_show_waypoints = f"""
-            // Supprimer les anciens waypoints
-            map.eachLayer(function(layer) {{
-                if (layer instanceof L.CircleMarker && layer.options.className === 'waypoint') {{
-                    map.removeLayer(layer);
-                }}
-                if (layer instanceof L.Polyline && layer.options.className === 'trajectory') {{
-                    map.removeLayer(layer);
-                }}
-            }});
-            
-            // Afficher les waypoints
-            var coords = {waypoints_coords};
-            coords.forEach(function(wp, i) {{
-                L.circleMarker(wp, {{
-                    radius: 3,
-                    color: 'red',
-                    fillColor: 'red',
-                    fillOpacity: 0.8,
-                    className: 'waypoint'
-                }}).addTo(map).bindPopup('WP' + (i+1));
-            }});
-            
-            // Afficher la trajectoire
-            L.polyline(coords, {{
-                color: 'red', 
-                weight: 2, 
-                dashArray: '5, 5',
-                className: 'trajectory'
-            }}).addTo(map);
-        """
-        self.view.page().runJavaScript(js_show_waypoints)
+        # Afficher les waypoints sur la carte (coordonnées transmises en binaire)
+        self.waypointsReady.emit(pack_coordinates(waypoints))
 
 
         
@@ -413,84 +290,87 @@ Le fichier mission_waypoints.kmz a été généré."""
 # ---------------------------
 # Lancer l'application
 # ---------------------------
-app = QApplication(sys.argv)
-
-# Demander le lieu
-place_name, ok_place = QInputDialog.getText(
-    None, 
-    "Lieu de la mission", 
-    "Entrez le nom du lieu (ex: ENSEIRB-MATMECA, Bordeaux) :"
-)
-if not ok_place or not place_name.strip():
-    print("Annulé par l'utilisateur")
-    sys.exit()
-
-lat, lon = get_location_coordinates(place_name)
-if lat is None:
-    print("Lieu introuvable, utilisation des coordonnées par défaut (Paris)")
-    lat, lon = 48.8566, 2.3522
-
-print(f"Lieu localisé: {place_name} ({lat:.6f}, {lon:.6f})")
-
-# Demander les paramètres de vol
-altitude, ok1 = QInputDialog.getDouble(
-    None, "Hauteur de vol", 
-    "Entrez la hauteur de vol (m):", 
-    50, 10, 500, 1
-)
-
-frontal_cov, ok2 = QInputDialog.getDouble(
-    None, "Recouvrement frontal", 
-    "Recouvrement frontal (0.5 = 50%, 0.8 = 80%):", 
-    0.8, 0.5, 0.95, 2
-)
-
-lateral_cov, ok3 = QInputDialog.getDouble(
-    None, "Recouvrement latéral", 
-    "Recouvrement latéral (0.5 = 50%, 0.8 = 80%):", 
-    0.8, 0.5, 0.95, 2
-)
-
-# Paramètres optionnels de la caméra
-sensor_width, ok4 = QInputDialog.getDouble(
-    None, "Capteur - Largeur", 
-    "Largeur du capteur (mm):", 
-    6.17, 1.0, 50.0, 2
-)
-
-sensor_height, ok5 = QInputDialog.getDouble(
-    None, "Capteur - Hauteur", 
-    "Hauteur du capteur (mm):", 
-    4.55, 1.0, 50.0, 2
-)
-
-focal_length, ok6 = QInputDialog.getDouble(
-    None, "Objectif - Focale", 
-    "Focale de l'objectif (mm):", 
-    4.5, 1.0, 100.0, 1
-)
-
-if not all([ok1, ok2, ok3, ok4, ok5, ok6]):
-    print("Annulé par l'utilisateur")
-    sys.exit()
-
-# Préparer la carte
-HTML = HTML_TEMPLATE.format(lat=lat, lon=lon)
-
-view = QWebEngineView()
-view.setWindowTitle("Générateur de mission drone - Sélection du rectangle")
-view.resize(1200, 800)
-
-channel = QWebChannel()
-bridge = Bridge(view, altitude, frontal_cov, lateral_cov, 
-                sensor_width, sensor_height, focal_length)
-channel.registerObject("bridge", bridge)
-view.page().setWebChannel(channel)
-view.setHtml(HTML)
-view.show()
-
-print("\n" + "="*50)
-print("Interface lancée - Suivez les instructions à l'écran")
-print("="*50 + "\n")
-
-sys.exit(app.exec_())
\ No newline at end of file
+if __name__ == "__main__":
+    register_tile_scheme()
+    app = QApplication(sys.argv)
+
+    # Demander le lieu
+    place_name, ok_place = QInputDialog.getText(
+        None, 
+        "Lieu de la mission", 
+        "Entrez le nom du lieu (ex: ENSEIRB-MATMECA, Bordeaux) :"
+    )
+    if not ok_place or not place_name.strip():
+        print("Annulé par l'utilisateur")
+        sys.exit()
+
+    lat, lon = get_location_coordinates(place_name)
+    if lat is None:
+        print("Lieu introuvable, utilisation des coordonnées par défaut (Paris)")
+        lat, lon = 48.8566, 2.3522
+
+    print(f"Lieu localisé: {place_name} ({lat:.6f}, {lon:.6f})")
+
+    # Demander les paramètres de vol
+    altitude, ok1 = QInputDialog.getDouble(
+        None, "Hauteur de vol", 
+        "Entrez la hauteur de vol (m):", 
+        50, 10, 500, 1
+    )
+
+    frontal_cov, ok2 = QInputDialog.getDouble(
+        None, "Recouvrement frontal", 
+        "Recouvrement frontal (0.5 = 50%, 0.8 = 80%):", 
+        0.8, 0.5, 0.95, 2
+    )
+
+    lateral_cov, ok3 = QInputDialog.getDouble(
+        None, "Recouvrement latéral", 
+        "Recouvrement latéral (0.5 = 50%, 0.8 = 80%):", 
+        0.8, 0.5, 0.95, 2
+    )
+
+    # Paramètres optionnels de la caméra
+    sensor_width, ok4 = QInputDialog.getDouble(
+        None, "Capteur - Largeur", 
+        "Largeur du capteur (mm):", 
+        6.17, 1.0, 50.0, 2
+    )
+
+    sensor_height, ok5 = QInputDialog.getDouble(
+        None, "Capteur - Hauteur", 
+        "Hauteur du capteur (mm):", 
+        4.55, 1.0, 50.0, 2
+    )
+
+    focal_length, ok6 = QInputDialog.getDouble(
+        None, "Objectif - Focale", 
+        "Focale de l'objectif (mm):", 
+        4.5, 1.0, 100.0, 1
+    )
+
+    if not all([ok1, ok2, ok3, ok4, ok5, ok6]):
+        print("Annulé par l'utilisateur")
+        sys.exit()
+
+    # Préparer la carte
+    HTML = HTML_TEMPLATE.format(lat=lat, lon=lon)
+
+    view = QWebEngineView()
+    view.setWindowTitle("Générateur de mission drone - Sélection du rectangle")
+    view.resize(1200, 800)
+    install_tile_cache(view)
+
+    channel = QWebChannel()
+    bridge = Bridge(view, altitude, frontal_cov, lateral_cov, 
+                    sensor_width, sensor_height, focal_length)
+    channel.registerObject("bridge", bridge)
+    view.page().setWebChannel(channel)
+    view.setHtml(HTML)
+    view.show()
+
+    print("\n" + "="*50)
+    print("Interface lancée - Suivez les instructions à l'écran")
+    print("="*50 + "\n")
+
+    sys.exit(app.exec_())
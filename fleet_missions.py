@@ -0,0 +1,199 @@
+"""
+Partage de parcelles entre plusieurs drones volant en même temps.
+
+Chaque parcelle est découpée en autant de sous-zones que de drones, de durées de vol estimées
+équilibrées (partition_polygon) : les coupes suivent les passes, chaque drone survole des
+passes entières de la mission complète. Les missions des drones sont générées en parallèle
+sur plusieurs processus ; chaque drone reçoit son KMZ (parcelle_drone1.kmz, ...) et les
+sous-zones sont enregistrées dans parcelle_zones.geojson pour l'équipe au sol. Une parcelle
+comptant moins de lignes de balayage que de drones est partagée entre moins de drones
+(avertissement sur la sortie d'erreur).
+
+Usage :
+    python fleet_missions.py parcelles.geojson --drones 3 --output-dir flotte/
+    python fleet_missions.py parcelles.csv --drones 2 --profile profil.json --workers 4
+
+Formats d'entrée et profil : voir batch_missions.py. Avec battery_time, la mission de chaque
+drone est découpée en plusieurs waylines de son KMZ (une par batterie).
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from batch_missions import DEFAULT_PROFILE, read_parcels
+from mission_core import (
+    Mission,
+    estimate_flight,
+    generate_waypointmap_kmz,
+    generate_waypoints_polygon_array,
+    optimize_sweep_angle,
+    partition_polygon,
+    split_mission,
+)
+
+def _camera(profile):
+    return (profile["altitude"], profile["frontal_cov"], profile["lateral_cov"],
+            profile["sensor_width"], profile["sensor_height"], profile["focal_length"])
+
+# ---------------------------
+# Partage d'une parcelle (processus principal)
+# ---------------------------
+def partition_parcel(name, polygon, n_drones, profile, output_dir):
+    """
+    Orientation des passes et sous-zones de chaque drone ; les sous-zones sont écrites en
+    GeoJSON. Retourne (lignes de balayage de chaque drone, projection).
+    """
+    camera = _camera(profile)
+    sweep_angle = profile["sweep_angle"]
+    if sweep_angle == "auto":
+        sweep_angle = optimize_sweep_angle(polygon, *camera, profile["drone_speed"])[0]
+    sub_polygons, lines, durations, projection = partition_polygon(
+        polygon, n_drones, *camera, profile["drone_speed"], sweep_angle
+    )
+
+    features = [
+        {
+            "type": "Feature",
+            "properties": {"name": f"{name}_drone{k}", "drone": k, "estimated_time": round(duration)},
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[lon, lat] for lat, lon in sub_polygon + sub_polygon[:1]]],
+            },
+        }
+        for k, (sub_polygon, duration) in enumerate(zip(sub_polygons, durations), 1)
+    ]
+    with open(_base_path(output_dir, name) + "_zones.geojson", "w", encoding="utf-8") as f:
+        json.dump({"type": "FeatureCollection", "features": features}, f)
+    return lines, projection
+
+def _base_path(output_dir, name):
+    return os.path.join(output_dir, re.sub(r"[^\w.-]+", "_", name))
+
+# ---------------------------
+# Mission d'un drone (exécutée dans un processus de travail)
+# ---------------------------
+def plan_drone(name, drone, polygon, lines, projection, profile, output_dir):
+    """Génère les waypoints et le KMZ d'un drone (lignes de balayage lines), retourne les statistiques"""
+    start = time.perf_counter()
+    endpoints_only = profile["photo_mode"] != "waypoint"
+    mission = Mission(*generate_waypoints_polygon_array(
+        polygon, *_camera(profile), endpoints_only, projection=projection, lines=lines
+    ))
+    generation_time = time.perf_counter() - start
+
+    segments = [(0, len(mission))]
+    if profile["battery_time"] and len(mission):
+        segments, _ = split_mission(mission, profile["drone_speed"], profile["battery_time"] * 60)
+
+    kmz_file = None
+    export_time = 0.0
+    if len(mission):
+        start = time.perf_counter()
+        photo_interval = mission.fov_width * (1 - profile["frontal_cov"]) if endpoints_only else None
+        kmz_file = f"{_base_path(output_dir, name)}_drone{drone}.kmz"
+        generate_waypointmap_kmz(
+            mission, profile["drone_speed"], profile["gimbal_pitch"], kmz_file,
+            compact=profile["compact"], photo_interval=photo_interval,
+            photo_trigger=profile["photo_mode"], segments=segments if len(segments) > 1 else None
+        )
+        export_time = time.perf_counter() - start
+
+    return {
+        "name": name,
+        "drone": drone,
+        "passes": mission.line_count,
+        "waypoints": len(mission),
+        "flight_time": estimate_flight(mission, profile["drone_speed"]).duration,
+        "batteries": len(segments),
+        "generation_time": generation_time,
+        "export_time": export_time,
+        "kmz": kmz_file,
+    }
+
+# ---------------------------
+# Récapitulatif
+# ---------------------------
+def print_summary(results, wall_time):
+    header = f"{'Parcelle':<24} {'Drone':>5} {'Passes':>7} {'Waypoints':>10} {'Vol (min)':>10} {'Batt.':>5} {'Calcul (s)':>11} {'Export (s)':>11}  KMZ"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        if "error" in r:
+            print(f"{r['name']:<24} {r['drone']:>5} ERREUR: {r['error']}")
+            continue
+        print(f"{r['name']:<24} {r['drone']:>5} {r['passes']:>7} {r['waypoints']:>10} "
+              f"{r['flight_time'] / 60:>10.1f} {r['batteries']:>5} {r['generation_time']:>11.3f} "
+              f"{r['export_time']:>11.3f}  {r['kmz'] or '-'}")
+    print("-" * len(header))
+    ok = [r for r in results if "error" not in r]
+    parcels = {}
+    for r in ok:
+        parcels.setdefault(r["name"], []).append(r["flight_time"])
+    for name, times in parcels.items():
+        print(f"{name} : {max(times) / 60:.1f} min de vol avec {len(times)} drone(s) "
+              f"({sum(times) / 60:.1f} min avec un seul)")
+    cpu_time = sum(r["generation_time"] + r["export_time"] for r in ok)
+    print(f"{len(ok)}/{len(results)} missions, {sum(r['waypoints'] for r in ok)} waypoints, "
+          f"{cpu_time:.2f} s de calcul en {wall_time:.2f} s")
+
+# ---------------------------
+# Point d'entrée
+# ---------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Partage de parcelles entre plusieurs drones")
+    parser.add_argument("parcels", help="fichier GeoJSON ou CSV (name,lat,lon) des parcelles")
+    parser.add_argument("--drones", type=int, default=2, help="nombre de drones par parcelle")
+    parser.add_argument("--profile", help="profil de paramètres JSON")
+    parser.add_argument("--output-dir", default="missions", help="dossier des KMZ générés")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="nombre de processus (par défaut : nombre de cœurs)")
+    args = parser.parse_args(argv)
+    if args.drones < 1:
+        parser.error("--drones doit être au moins 1")
+
+    profile = dict(DEFAULT_PROFILE)
+    if args.profile:
+        with open(args.profile, encoding="utf-8") as f:
+            profile.update(json.load(f))
+
+    parcels = read_parcels(args.parcels)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    jobs = []
+    failures = []
+    for name, polygon in parcels:
+        try:
+            lines, projection = partition_parcel(name, polygon, args.drones, profile, args.output_dir)
+        except Exception as e:
+            failures.append({"name": name, "drone": "-", "error": str(e)})
+            continue
+        if len(lines) < args.drones:
+            print(f"{name} : seulement {len(lines)} ligne(s) de balayage, partage entre "
+                  f"{len(lines)} drone(s) au lieu de {args.drones}", file=sys.stderr)
+        jobs += [(name, k, polygon, drone_lines, projection) for k, drone_lines in enumerate(lines, 1)]
+
+    results = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(plan_drone, *job, profile, args.output_dir): i
+            for i, job in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            name, drone = jobs[i][:2]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                results[i] = {"name": name, "drone": drone, "error": str(e)}
+            print(f"[{sum(r is not None for r in results)}/{len(jobs)}] {name} drone {drone}", file=sys.stderr)
+
+    print_summary(results + failures, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
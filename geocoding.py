@@ -0,0 +1,222 @@
+"""
+Géocodage des lieux de mission avec cache persistant SQLite.
+
+Les résultats de géocodage sont conservés sur disque, indexés par une clé normalisée de la
+requête (casse, accents et espaces ignorés) : un lieu déjà recherché est résolu sans réseau.
+Le mode hors ligne n'interroge jamais le géocodeur et ne répond qu'à partir du cache.
+
+Le géocodeur est une simple fonction requête -> (lat, lon) ou (None, None) : Nominatim par
+défaut, remplaçable par une fonction locale (tests, serveur interne).
+
+batch_geocode géocode de nombreux lieux en parallèle, en respectant une limite de requêtes
+par seconde, et fournit les résultats au fur et à mesure.
+"""
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+import unicodedata
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    "KAEL_GEOCODE_CACHE", os.path.join(os.path.expanduser("~"), ".kael_geocode.sqlite")
+)
+DEFAULT_TTL = 30 * 24 * 3600  # 30 jours
+
+# ---------------------------
+# Normalisation des requêtes
+# ---------------------------
+def normalize_query(query):
+    """Clé de cache : minuscules, sans accents, ponctuation et espaces multiples réduits"""
+    text = unicodedata.normalize("NFKD", query)
+    text = "".join(c for c in text if not unicodedata.combining(c)).casefold()
+    text = re.sub(r"\s*([,;])\s*", r"\1 ", text)
+    return re.sub(r"\s+", " ", text).strip(" ,;")
+
+# ---------------------------
+# Géocodeur réseau par défaut
+# ---------------------------
+def nominatim_geocoder(query):
+    """Géocodage via OpenStreetMap/Nominatim (geopy importé à la première utilisation)"""
+    from geopy.geocoders import Nominatim
+
+    geolocator = Nominatim(user_agent="gps_simulation")
+    location = geolocator.geocode(query)
+    if location:
+        return location.latitude, location.longitude
+    return None, None
+
+def nominatim_http_geocoder(base_url="https://nominatim.openstreetmap.org", timeout=10,
+                            user_agent="gps_simulation"):
+    """
+    Géocodeur HTTP pour toute API compatible Nominatim (/search?format=json), par exemple un
+    serveur Nominatim interne ou un serveur de test local. Retourne une fonction
+    requête -> (lat, lon) ou (None, None).
+    """
+    def geocoder(query):
+        url = f"{base_url.rstrip('/')}/search?" + urllib.parse.urlencode(
+            {"q": query, "format": "json", "limit": 1}
+        )
+        request = urllib.request.Request(url, headers={"User-Agent": user_agent})
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            results = json.load(response)
+        if results:
+            return float(results[0]["lat"]), float(results[0]["lon"])
+        return None, None
+    return geocoder
+
+# ---------------------------
+# Cache SQLite
+# ---------------------------
+class GeocodeCache:
+    """
+    Cache persistant des géocodages.
+
+    path : fichier SQLite (":memory:" pour un cache non persistant)
+    ttl : durée de validité d'une entrée en secondes (None = illimitée)
+    offline : ne jamais interroger le géocodeur, répondre uniquement depuis le cache
+    geocoder : fonction requête -> (lat, lon) ou (None, None)
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL, offline=False,
+                 geocoder=nominatim_geocoder):
+        self.path = path
+        self.ttl = ttl
+        self.offline = offline
+        self.geocoder = geocoder
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            " query TEXT PRIMARY KEY, lat REAL, lon REAL, updated REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def lookup(self, query, allow_expired=False):
+        """
+        Retourne l'entrée du cache pour la requête : (lat, lon), (None, None) pour un lieu
+        connu comme introuvable, ou None si la requête n'est pas (ou plus) en cache.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT lat, lon, updated FROM geocode WHERE query = ?", (normalize_query(query),)
+            ).fetchone()
+        if row is None:
+            return None
+        lat, lon, updated = row
+        if not allow_expired and self.ttl is not None and time.time() - updated > self.ttl:
+            return None
+        return lat, lon
+
+    def store(self, query, lat, lon):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO geocode (query, lat, lon, updated) VALUES (?, ?, ?, ?)",
+                (normalize_query(query), lat, lon, time.time()),
+            )
+            self._db.commit()
+
+    def geocode(self, query):
+        """
+        Géocode une requête en passant par le cache. En mode hors ligne, ou si le géocodeur
+        échoue (pas de réseau), une entrée expirée est encore utilisée plutôt que rien.
+        """
+        cached = self.lookup(query)
+        if cached is not None:
+            return cached
+        if self.offline:
+            return self.lookup(query, allow_expired=True) or (None, None)
+
+        try:
+            lat, lon = self.geocoder(query)
+        except Exception as e:
+            print(f"Géocodage impossible ({e}), utilisation du cache")
+            return self.lookup(query, allow_expired=True) or (None, None)
+
+        self.store(query, lat, lon)
+        return lat, lon
+
+    def close(self):
+        self._db.close()
+
+
+_default_cache = None
+
+def default_cache():
+    """
+    Cache partagé du processus. KAEL_GEOCODE_CACHE choisit le fichier,
+    KAEL_GEOCODE_OFFLINE=1 active le mode hors ligne.
+    """
+    global _default_cache
+    if _default_cache is None:
+        offline = os.environ.get("KAEL_GEOCODE_OFFLINE", "") not in ("", "0")
+        _default_cache = GeocodeCache(offline=offline)
+    return _default_cache
+
+# ---------------------------
+# Géocodage en lot
+# ---------------------------
+class RateLimiter:
+    """Espace les appels d'au moins 1 / rate secondes, entre tous les threads"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def batch_geocode(queries, cache=None, max_workers=4, rate_limit=1.0):
+    """
+    Géocode une liste de lieux en parallèle et produit les couples (requête, (lat, lon)) au
+    fur et à mesure qu'ils sont résolus.
+
+    Les requêtes identiques (après normalisation) ne sont envoyées qu'une fois ; les entrées
+    déjà en cache sont produites immédiatement, sans consommer la limite de débit.
+    rate_limit : nombre maximal de requêtes par seconde vers le géocodeur (None = illimité ;
+    l'usage public de Nominatim impose 1 requête/s).
+    """
+    if cache is None:
+        cache = default_cache()
+
+    # Regrouper les requêtes par clé normalisée
+    pending = {}
+    for query in queries:
+        pending.setdefault(normalize_query(query), []).append(query)
+
+    misses = {}
+    for key, group in pending.items():
+        cached = cache.lookup(group[0])
+        if cached is None:
+            misses[key] = group
+            continue
+        for query in group:
+            yield query, cached
+
+    if not misses:
+        return
+
+    limiter = RateLimiter(rate_limit)
+
+    def resolve(query):
+        if not cache.offline:
+            limiter.wait()
+        return cache.geocode(query)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(resolve, group[0]): group for group in misses.values()}
+        for future in as_completed(futures):
+            result = future.result()
+            for query in futures[future]:
+                yield query, result
@@ -1,13 +1,9 @@
-from geopy.geocoders import Nominatim
+from mission_core import get_location_coordinates
 
-geolocator = Nominatim(user_agent="gps_simulation")
+# Adresse complète et précise (résultat mis en cache, disponible ensuite hors ligne)
+lat, lon = get_location_coordinates("enseirb-matmeca")
 
-# Adresse complète et précise
-location = geolocator.geocode("enseirb-matmeca")
-
-if location:
-    print(location.latitude, location.longitude)
+if lat is not None:
+    print(lat, lon)
 else:
     print("Adresse non trouvée ! Vérifie la saisie.")
-
-
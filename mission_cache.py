@@ -0,0 +1,325 @@
+"""
+Mémoïsation des missions calculées : waypoints et KMZ déjà sérialisé.
+
+Les opérateurs alternent souvent entre quelques réglages (altitude, recouvrements) sur une
+même zone : chaque combinaison déjà calculée est resservie sans recalcul ni réécriture du KMZ.
+La clé est une empreinte canonique du polygone (sommet de départ, sens de parcours et point de
+fermeture sans effet) et des paramètres de prise de vue.
+
+Le cache est un LRU borné en octets ; les entrées évincées de la mémoire peuvent être
+conservées sur disque (spill_dir), elles-mêmes bornées en taille, et sont rechargées au besoin.
+Les compteurs hits / misses / disk_hits / evictions mesurent son efficacité (stats()).
+Une entrée demandée par plusieurs threads à la fois n'est calculée qu'une fois
+(get_or_compute) ; les fichiers du disque sont écrits par renommage atomique.
+
+Utilisation :
+    cache = MissionCache(spill_dir="~/.kael_missions")
+    waypoints, pass_index, n_lines, fov_w, fov_h = cache.waypoints(polygon, 50, 0.8, 0.8, 6.17, 4.55, 4.5)
+    data = cache.kmz_bytes(polygon, 50, 0.8, 0.8, 6.17, 4.55, 4.5, drone_speed=2.5, gimbal_pitch=-45)
+"""
+import io
+import os
+import time
+import hashlib
+import contextlib
+import threading
+from collections import OrderedDict
+
+from mission_core import Mission, generate_waypointmap_kmz, generate_waypoints_polygon_array
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_SPILL_MAX_BYTES = 2 * 1024 * 1024 * 1024
+# Âge au-delà duquel un fichier temporaire de débordement est considéré comme abandonné (s)
+SPILL_TMP_GRACE = 3600
+
+# ---------------------------
+# Clé canonique
+# ---------------------------
+def mission_key(polygon_points, altitude, frontal_cov, lateral_cov, sensor_width, sensor_height,
+                focal_length, endpoints_only=False, sweep_angle=0.0, decimals=9):
+    """
+    Empreinte SHA-256 d'un polygone et des paramètres de prise de vue (orientation des passes
+    comprise).
+    Le polygone est normalisé : point de fermeture retiré, coordonnées arrondies à decimals
+    décimales (1e-9 ° ≈ 0,1 mm), premier sommet = plus petit (lat, lon), sens de parcours fixé.
+    Deux tracés du même polygone donnent donc la même clé (le résultat du balayage ne dépend
+    ni du sommet de départ ni du sens).
+    """
+    import numpy as np
+
+    polygon = np.round(np.asarray(polygon_points, dtype=float)[:, :2], decimals) + 0.0
+    if len(polygon) > 1 and (polygon[0] == polygon[-1]).all():
+        polygon = polygon[:-1]
+    start = np.lexsort((polygon[:, 1], polygon[:, 0]))[0]
+    polygon = np.roll(polygon, -start, axis=0)
+    if len(polygon) > 2 and tuple(polygon[-1]) < tuple(polygon[1]):
+        polygon = np.concatenate((polygon[:1], polygon[:0:-1]))
+
+    digest = hashlib.sha256(np.ascontiguousarray(polygon, dtype="<f8").tobytes())
+    camera = (altitude, frontal_cov, lateral_cov, sensor_width, sensor_height, focal_length, sweep_angle)
+    digest.update(np.array(camera, dtype="<f8").tobytes())
+    digest.update(b"endpoints" if endpoints_only else b"all")
+    return digest.hexdigest()
+
+def _export_key(key, drone_speed, gimbal_pitch, compact, precision, photo_trigger):
+    params = f"{drone_speed!r}|{gimbal_pitch!r}|{compact}|{precision}|{photo_trigger}"
+    return hashlib.sha256(f"{key}|{params}".encode()).hexdigest()
+
+# ---------------------------
+# Cache LRU
+# ---------------------------
+class MissionCache:
+    """
+    Cache LRU des missions, borné en octets.
+
+    max_bytes : taille maximale des entrées en mémoire
+    spill_dir : dossier où conserver les entrées évincées de la mémoire (None = pas de disque)
+    spill_max_bytes : taille maximale du dossier spill_dir
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, spill_dir=None,
+                 spill_max_bytes=DEFAULT_SPILL_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.spill_dir = os.path.expanduser(spill_dir) if spill_dir else None
+        self.spill_max_bytes = spill_max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self._entries = OrderedDict()   # clé -> (valeur, taille)
+        self._lock = threading.RLock()
+        self._pending = {}              # clé -> Event des calculs en cours
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+
+    # --- Accès génériques ---
+    def get(self, key):
+        """Valeur en cache (mémoire puis disque), ou None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            value = self._load_spilled(key)
+            if value is not None:
+                self.disk_hits += 1
+                self._insert(key, value)
+                return value
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+            self._insert(key, value)
+
+    def get_or_compute(self, key, compute):
+        """
+        Valeur en cache, ou compute() mémorisé. Un seul appelant calcule une clé donnée : les
+        autres attendent son résultat (aperçu et calcul de mission sur la même zone) au lieu de
+        refaire le calcul. Si le calcul échoue, l'appelant suivant le retente.
+        """
+        waited = False
+        while True:
+            with self._lock:
+                if waited:
+                    # Un seul accès compté par appel : l'échec avant l'attente est annulé
+                    self.misses -= 1
+                value = self.get(key)
+                if value is not None:
+                    return value
+                pending = self._pending.get(key)
+                if pending is None:
+                    pending = self._pending[key] = threading.Event()
+                    break
+            pending.wait()
+            waited = True
+        try:
+            value = compute()
+            self.put(key, value)
+            return value
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.set()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    # --- Missions ---
+    def waypoints(self, polygon_points, altitude, frontal_cov, lateral_cov,
+                  sensor_width, sensor_height, focal_length, endpoints_only=False, sweep_angle=0.0):
+        """
+        generate_waypoints_polygon_array mémoïsé. Les tableaux retournés sont partagés entre
+        les appels et donc en lecture seule.
+        """
+        key = mission_key(polygon_points, altitude, frontal_cov, lateral_cov,
+                          sensor_width, sensor_height, focal_length, endpoints_only, sweep_angle)
+        def compute():
+            result = generate_waypoints_polygon_array(
+                polygon_points, altitude, frontal_cov, lateral_cov,
+                sensor_width, sensor_height, focal_length, endpoints_only, sweep_angle
+            )
+            for array in result[:2]:
+                array.setflags(write=False)
+            return result
+        return self.get_or_compute(key, compute)
+
+    def mission(self, polygon_points, altitude, frontal_cov, lateral_cov,
+                sensor_width, sensor_height, focal_length, endpoints_only=False, sweep_angle=0.0):
+        """Mission (colonnes) construite sur les tableaux en cache, sans copie des waypoints"""
+        return Mission(*self.waypoints(
+            polygon_points, altitude, frontal_cov, lateral_cov,
+            sensor_width, sensor_height, focal_length, endpoints_only, sweep_angle
+        ))
+
+    def kmz_bytes(self, polygon_points, altitude, frontal_cov, lateral_cov,
+                  sensor_width, sensor_height, focal_length, endpoints_only=False,
+                  sweep_angle=0.0, drone_speed=2.5, gimbal_pitch=-45, compact=False, precision=7,
+                  photo_trigger="distance", progress=None):
+        """
+        Contenu du KMZ de la mission (generate_waypointmap_kmz), sérialisé au premier appel
+        seulement. Avec endpoints_only, le déclenchement photo se fait tous les
+        fov_w * (1 - frontal_cov) mètres, comme dans les interfaces.
+        """
+        key = mission_key(polygon_points, altitude, frontal_cov, lateral_cov,
+                          sensor_width, sensor_height, focal_length, endpoints_only, sweep_angle)
+        export_key = _export_key(key, drone_speed, gimbal_pitch, compact, precision, photo_trigger)
+        def compute():
+            mission = self.mission(
+                polygon_points, altitude, frontal_cov, lateral_cov,
+                sensor_width, sensor_height, focal_length, endpoints_only, sweep_angle
+            )
+            photo_interval = mission.fov_width * (1 - frontal_cov) if endpoints_only else None
+            buffer = io.BytesIO()
+            generate_waypointmap_kmz(
+                mission, drone_speed, gimbal_pitch, buffer, compact=compact,
+                precision=precision, photo_interval=photo_interval, photo_trigger=photo_trigger,
+                progress=progress
+            )
+            return buffer.getvalue()
+        return self.get_or_compute(export_key, compute)
+
+    # --- Éviction et disque ---
+    @staticmethod
+    def _sizeof(value):
+        if isinstance(value, bytes):
+            return len(value)
+        return sum(getattr(item, "nbytes", 8) for item in value)
+
+    def _insert(self, key, value):
+        size = self._sizeof(value)
+        self._entries[key] = (value, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes and self._entries:
+            old_key, (old_value, old_size) = self._entries.popitem(last=False)
+            self.total_bytes -= old_size
+            self.evictions += 1
+            self._spill(old_key, old_value)
+
+    def _spill_path(self, key, value=None):
+        if value is None:
+            for suffix in (".kmz", ".npz"):
+                path = os.path.join(self.spill_dir, key + suffix)
+                if os.path.exists(path):
+                    return path
+            return None
+        return os.path.join(self.spill_dir, key + (".kmz" if isinstance(value, bytes) else ".npz"))
+
+    def _spill(self, key, value):
+        if not self.spill_dir:
+            return
+        import numpy as np
+
+        # Écriture dans un fichier temporaire puis renommage atomique : une interruption en
+        # cours d'écriture ne laisse jamais de fichier tronqué à la place de l'entrée
+        path = self._spill_path(key, value)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                if isinstance(value, bytes):
+                    f.write(value)
+                else:
+                    waypoints, pass_index, line_count, fov_w, fov_h = value
+                    np.savez(f, waypoints=waypoints, pass_index=pass_index,
+                             meta=np.array([line_count, fov_w, fov_h], dtype=float))
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+        self._trim_spill()
+
+    def _load_spilled(self, key):
+        if not self.spill_dir:
+            return None
+        path = self._spill_path(key)
+        if path is None:
+            return None
+        os.utime(path)
+        if path.endswith(".kmz"):
+            with open(path, "rb") as f:
+                return f.read()
+
+        import numpy as np
+
+        with np.load(path) as data:
+            waypoints, pass_index, meta = data["waypoints"], data["pass_index"], data["meta"]
+        for array in (waypoints, pass_index):
+            array.setflags(write=False)
+        return waypoints, pass_index, int(meta[0]), float(meta[1]), float(meta[2])
+
+    def _trim_spill(self):
+        """
+        Supprime les fichiers les moins récemment utilisés au-delà de spill_max_bytes (y compris
+        les fichiers temporaires laissés par une écriture interrompue depuis plus de
+        SPILL_TMP_GRACE secondes ; les plus récents peuvent être en cours d'écriture)
+        """
+        files = []
+        now = time.time()
+        for name in os.listdir(self.spill_dir):
+            path = os.path.join(self.spill_dir, name)
+            # Fichier renommé ou supprimé entre-temps par un autre processus
+            with contextlib.suppress(FileNotFoundError):
+                stat = os.stat(path)
+                if name.endswith(".tmp") and now - stat.st_mtime < SPILL_TMP_GRACE:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.spill_max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
+
+
+_default_cache = None
+
+def default_mission_cache():
+    """
+    Cache partagé du processus (interfaces). KAEL_MISSION_CACHE désigne un dossier où
+    conserver les entrées évincées de la mémoire ; sans cette variable, cache en mémoire seule.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = MissionCache(spill_dir=os.environ.get("KAEL_MISSION_CACHE") or None)
+    return _default_cache
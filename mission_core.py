@@ -0,0 +1,1543 @@
+"""
+Cœur de calcul des missions drone, sans interface graphique : géolocalisation, génération des
+waypoints (rectangle et polygone) et export KMZ/WPML.
+Ce module n'importe ni PyQt5 ni geopy ; NumPy et le géocodage ne sont chargés qu'à la première
+utilisation des fonctions qui en ont besoin, pour un import quasi instantané (processus de
+calcul, scripts en ligne de commande).
+"""
+import io
+import os
+import math
+import time
+import contextlib
+from zipfile import ZipFile, ZIP64_LIMIT
+
+# ---------------------------
+# Fonction pour géolocaliser un lieu
+# ---------------------------
+def get_location_coordinates(place_name, cache=None):
+    """
+    Retourne (lat, lon) du lieu, ou (None, None) s'il est introuvable.
+    Passe par le cache de géocodage persistant (voir geocoding.py) : cache partagé du
+    processus par défaut, ou cache fourni (par exemple avec un géocodeur local).
+    """
+    from geocoding import default_cache
+    
+    if cache is None:
+        cache = default_cache()
+    return cache.geocode(place_name)
+
+# ---------------------------
+# Modes de déclenchement photo proposés à l'utilisateur
+# ---------------------------
+PHOTO_MODES = {
+    "Un waypoint par photo": "waypoint",
+    "Intervalle de distance": "distance",
+    "Intervalle de temps": "time",
+}
+
+# ---------------------------
+# Projection locale en mètres
+# ---------------------------
+# Ellipsoïde WGS84
+_WGS84_A = 6378137.0
+_WGS84_F = 1 / 298.257223563
+
+class LocalProjection:
+    """
+    Projection plane locale d'une mission : Mercator transverse sur l'ellipsoïde WGS84
+    (formules de Krüger, comme l'UTM), méridien central et origine au point (lat0, lon0).
+    Les coordonnées métriques sont (x, y) = (est, nord) en mètres depuis l'origine ; l'échelle
+    est exacte sur le méridien central et l'écart reste inférieur à 1e-6 à 10 km de part et
+    d'autre, quelle que soit la latitude.
+
+    rotation (degrés, depuis l'est vers le nord) tourne le repère : l'axe x suit alors cette
+    direction, ce qui oriente les passes du balayage (lignes y constant) selon rotation.
+
+    Construite une fois par mission ; to_metric / to_geographic convertissent des tableaux
+    entiers (ou des scalaires) sans boucle Python.
+    """
+
+    __slots__ = ("lat0", "lon0", "rotation", "_lon0_rad", "_cos", "_sin",
+                 "_a", "_alpha", "_beta", "_delta", "_e", "_n0")
+
+    def __init__(self, lat0, lon0, rotation=0.0):
+        self.lat0 = float(lat0)
+        self.lon0 = float(lon0)
+        self.rotation = float(rotation)
+        self._cos = math.cos(math.radians(self.rotation))
+        self._sin = math.sin(math.radians(self.rotation))
+        self._lon0_rad = math.radians(self.lon0)
+        n = _WGS84_F / (2 - _WGS84_F)
+        self._a = _WGS84_A / (1 + n) * (1 + n**2 / 4 + n**4 / 64)
+        self._alpha = (n / 2 - 2 * n**2 / 3 + 5 * n**3 / 16, 13 * n**2 / 48 - 3 * n**3 / 5, 61 * n**3 / 240)
+        self._beta = (n / 2 - 2 * n**2 / 3 + 37 * n**3 / 96, n**2 / 48 + n**3 / 15, 17 * n**3 / 480)
+        self._delta = (2 * n - 2 * n**2 / 3 - 2 * n**3, 7 * n**2 / 3 - 8 * n**3 / 5, 56 * n**3 / 15)
+        self._e = 2 * math.sqrt(n) / (1 + n)
+        self._n0 = 0.0
+        self._n0 = float(self._transverse_mercator(self.lat0, self.lon0)[1])
+
+    @classmethod
+    def for_points(cls, points, rotation=0.0):
+        """Projection centrée sur la boîte englobante des points (lat, lon)"""
+        min_lat, max_lat, min_lon, max_lon = get_bounding_box(points)
+        return cls((min_lat + max_lat) / 2, (min_lon + max_lon) / 2, rotation)
+
+    def to_metric(self, lat, lon):
+        """(lat, lon) en degrés -> (x, y) en mètres (tableaux ou scalaires)"""
+        east, north = self._transverse_mercator(lat, lon)
+        if not self.rotation:
+            return east, north
+        return east * self._cos + north * self._sin, north * self._cos - east * self._sin
+
+    def to_geographic(self, x, y):
+        """(x, y) en mètres -> (lat, lon) en degrés (tableaux ou scalaires)"""
+        import numpy as np
+        
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if self.rotation:
+            x, y = x * self._cos - y * self._sin, x * self._sin + y * self._cos
+        return self._inverse_transverse_mercator(x, y)
+
+    def _transverse_mercator(self, lat, lon):
+        import numpy as np
+        
+        phi = np.radians(lat)
+        dlon = np.radians(lon) - self._lon0_rad
+        t = np.sinh(np.arctanh(np.sin(phi)) - self._e * np.arctanh(self._e * np.sin(phi)))
+        xi = np.arctan2(t, np.cos(dlon))
+        eta = np.arctanh(np.sin(dlon) / np.sqrt(1 + t * t))
+        x, y = eta, xi
+        for j, alpha in enumerate(self._alpha, 1):
+            x = x + alpha * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+            y = y + alpha * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+        return self._a * x, self._a * y - self._n0
+
+    def _inverse_transverse_mercator(self, x, y):
+        import numpy as np
+        
+        xi = (y + self._n0) / self._a
+        eta = x / self._a
+        xi1, eta1 = xi, eta
+        for j, beta in enumerate(self._beta, 1):
+            xi1 = xi1 - beta * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+            eta1 = eta1 - beta * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+        chi = np.arcsin(np.sin(xi1) / np.cosh(eta1))
+        phi = chi
+        for j, delta in enumerate(self._delta, 1):
+            phi = phi + delta * np.sin(2 * j * chi)
+        return np.degrees(phi), self.lon0 + np.degrees(np.arctan2(np.sinh(eta1), np.cos(xi1)))
+
+# ---------------------------
+# Mission en colonnes
+# ---------------------------
+# Modes de virage WPML, indexés par Mission.turn_mode
+TURN_MODES = ("toPointAndStopWithContinuityCurvature", "toPointAndPassWithContinuityCurvature")
+TURN_STOP, TURN_PASS = 0, 1
+
+def _waypoint_block(lats, lons, altitude):
+    """
+    Tableau (N, 3) [lat, lon, alt] des générateurs, vue transposée d'un bloc (3, N) : chaque
+    colonne (lat, lon, alt) est contiguë en mémoire et Mission la reprend sans copie.
+    """
+    import numpy as np
+    
+    block = np.empty((3, len(lats)), dtype=float)
+    block[0] = lats
+    block[1] = lons
+    block[2] = altitude
+    return block.T
+
+class Mission:
+    """
+    Mission stockée en colonnes : un tableau contigu par grandeur (lat, lon, alt, cap, numéro
+    de passe, mode de virage) au lieu d'une liste de tuples (lat, lon, alt), soit environ
+    35 octets par waypoint contre 150. Elle est partagée telle quelle entre la génération,
+    l'affichage (pack_coordinates) et l'export (generate_waypointmap_kmz).
+
+    Mission(waypoints, pass_index, line_count, fov_width, fov_height) reprend directement le
+    résultat de generate_waypoints_polygon_array ; le tableau des waypoints n'est pas copié
+    quand il vient des générateurs (voir _waypoint_block).
+    """
+
+    __slots__ = ("coords", "pass_index", "heading", "turn_mode", "line_count", "fov_width", "fov_height")
+
+    def __init__(self, waypoints, pass_index=None, line_count=None, fov_width=0.0, fov_height=0.0):
+        import numpy as np
+        
+        waypoints = np.asarray(waypoints, dtype=float).reshape(-1, 3)
+        # Bloc (3, N) : lat, lon et alt sont chacune une ligne contiguë
+        self.coords = np.ascontiguousarray(waypoints.T)
+        n = self.coords.shape[1]
+        by_pass = pass_index is not None
+        if pass_index is None:
+            pass_index = np.zeros(n, dtype=np.int64)
+        self.pass_index = np.asarray(pass_index)
+        self.line_count = line_count if line_count is not None else len(np.unique(self.pass_index))
+        self.fov_width = fov_width
+        self.fov_height = fov_height
+        self._derive_navigation(by_pass)
+
+    def _derive_navigation(self, by_pass=True):
+        import numpy as np
+        
+        n = len(self)
+        # Cap : direction de déplacement retournée de 180°, comme pour les passes est-ouest
+        # d'origine (-90 vers l'est, 90 vers l'ouest), quelle que soit l'orientation des passes.
+        # Par défaut, direction du segment vers le waypoint suivant (vers le précédent pour le
+        # dernier) ; avec les numéros de passe, direction de chaque passe, de son premier à son
+        # dernier waypoint : le cap est constant sur une passe, s'inverse d'une passe à la
+        # suivante et l'emprise de la caméra reste alignée sur les passes. Une passe réduite
+        # à un waypoint garde le cap de la passe précédente.
+        if n < 2:
+            self.heading = np.full(n, -90, dtype=np.int16)
+        else:
+            origin = np.minimum(np.arange(n), n - 2)
+            self.heading = self._headings(origin, origin + 1)
+            if by_pass:
+                first = np.flatnonzero(np.r_[True, self.pass_index[1:] != self.pass_index[:-1]])
+                last = np.r_[first[1:], n] - 1
+                full = first < last
+                if full.any():
+                    pass_heading = self._headings(first[full], last[full])
+                    # Dernière passe complète jusqu'à chaque passe (la première pour les passes
+                    # d'un waypoint en tête de mission)
+                    source = np.maximum.accumulate(np.where(full, np.arange(len(first)), -1))
+                    source = np.where(source < 0, np.flatnonzero(full)[0], source)
+                    rank = np.cumsum(full) - 1
+                    self.heading = np.repeat(pass_heading[rank[source]], last - first + 1)
+        
+        # Arrêt au premier waypoint, passage fluide ensuite
+        self.turn_mode = np.full(n, TURN_PASS, dtype=np.uint8)
+        self.turn_mode[:1] = TURN_STOP
+
+    def _headings(self, origin, target):
+        """Cap WPML (degrés entiers dans ]-180, 180]) du déplacement de origin vers target"""
+        import numpy as np
+        
+        mid_lat = np.radians((self.lat[origin] + self.lat[target]) / 2)
+        bearing = np.degrees(np.arctan2(
+            (self.lon[target] - self.lon[origin]) * np.cos(mid_lat), self.lat[target] - self.lat[origin]
+        ))
+        heading = np.rint(bearing % 360 - 180).astype(np.int16)
+        heading[heading == -180] = 180
+        return heading
+
+    @property
+    def lat(self):
+        return self.coords[0]
+
+    @property
+    def lon(self):
+        return self.coords[1]
+
+    @property
+    def alt(self):
+        return self.coords[2]
+
+    @property
+    def waypoints(self):
+        """Vue (N, 3) [lat, lon, alt], sans copie"""
+        return self.coords.T
+
+    def __len__(self):
+        return self.coords.shape[1]
+
+    def slice(self, start, stop):
+        """
+        Waypoints start à stop - 1 (une batterie, voir split_mission), sous forme de Mission :
+        coordonnées, numéros de passe et caps sont des vues, sans copie ; le mode de virage est
+        recalculé (arrêt au premier waypoint du vol).
+        """
+        import numpy as np
+        
+        part = Mission.__new__(Mission)
+        part.coords = self.coords[:, start:stop]
+        part.pass_index = self.pass_index[start:stop]
+        part.line_count = int((part.pass_index[1:] != part.pass_index[:-1]).sum()) + 1 if len(part.pass_index) else 0
+        part.fov_width = self.fov_width
+        part.fov_height = self.fov_height
+        part.heading = self.heading[start:stop]
+        part.turn_mode = np.full(len(part), TURN_PASS, dtype=np.uint8)
+        part.turn_mode[:1] = TURN_STOP
+        return part
+
+# ---------------------------
+# Estimation de la distance et de la durée de vol
+# ---------------------------
+# Durée estimée d'un demi-tour en bout de passe (décélération, virage, accélération), en s
+TURN_TIME = 5.0
+# Accélération du drone (m/s²) : un arrêt complet (toPointAndStop) coûte drone_speed / ACCELERATION s
+ACCELERATION = 2.0
+
+class FlightEstimate:
+    """
+    Distance et durée de vol d'une mission, waypoint par waypoint (voir estimate_flight).
+
+    leg_distance[i] : distance (m) du waypoint i au waypoint i + 1
+    point_time[i] : temps passé au waypoint i (arrêt, demi-tour en fin de passe)
+    cumulative_distance[i] : distance parcourue en arrivant au waypoint i
+    cumulative_time[i] : temps écoulé en quittant le waypoint i
+    """
+
+    __slots__ = ("leg_distance", "point_time", "cumulative_distance", "cumulative_time")
+
+    def __init__(self, leg_distance, point_time, cumulative_distance, cumulative_time):
+        self.leg_distance = leg_distance
+        self.point_time = point_time
+        self.cumulative_distance = cumulative_distance
+        self.cumulative_time = cumulative_time
+
+    @property
+    def distance(self):
+        """Distance totale (m)"""
+        return float(self.cumulative_distance[-1]) if len(self.cumulative_distance) else 0.0
+
+    @property
+    def duration(self):
+        """Durée totale (s)"""
+        return float(self.cumulative_time[-1]) if len(self.cumulative_time) else 0.0
+
+def _ground_distance(lat1, lon1, lat2, lon2):
+    """
+    Distance horizontale (m) entre deux tableaux de points, avec les rayons de courbure de
+    l'ellipsoïde à la latitude moyenne de chaque paire : exact à mieux que 1e-9 près jusqu'au
+    kilomètre, sans projeter les points.
+    """
+    import numpy as np
+    
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    mid = (phi1 + phi2) / 2
+    e2 = _WGS84_F * (2 - _WGS84_F)
+    w2 = 1 - e2 * np.sin(mid) ** 2
+    prime_vertical = _WGS84_A / np.sqrt(w2)
+    meridional = prime_vertical * (1 - e2) / w2
+    north = (phi2 - phi1) * meridional
+    east = np.radians(np.subtract(lon2, lon1)) * prime_vertical * np.cos(mid)
+    return np.hypot(north, east)
+
+def estimate_flight(mission, drone_speed, turn_time=TURN_TIME, acceleration=ACCELERATION):
+    """
+    Estime distance et durée de vol d'une Mission (ou d'une séquence de (lat, lon, alt)) :
+    segments parcourus à drone_speed (distances 3D sur l'ellipsoïde WGS84), arrêt
+    complet aux waypoints toPointAndStop (drone_speed / acceleration s en plus) et turn_time
+    par demi-tour au dernier waypoint de chaque passe (changement de pass_index).
+    Entièrement vectorisé : quelques ms pour 100 000 waypoints.
+    """
+    import numpy as np
+    
+    if not isinstance(mission, Mission):
+        mission = Mission(mission)
+    if len(mission) == 0:
+        empty = np.zeros(0)
+        return FlightEstimate(empty, empty, empty, empty)
+    
+    ground = _ground_distance(mission.lat[:-1], mission.lon[:-1], mission.lat[1:], mission.lon[1:])
+    leg_distance = np.hypot(ground, np.diff(mission.alt))
+    
+    point_time = np.where(mission.turn_mode == TURN_STOP, drone_speed / acceleration, 0.0)
+    point_time[:-1] += np.where(np.diff(mission.pass_index) != 0, turn_time, 0.0)
+    
+    cumulative_distance = np.concatenate(([0.0], np.cumsum(leg_distance)))
+    cumulative_time = cumulative_distance / drone_speed + np.cumsum(point_time)
+    return FlightEstimate(leg_distance, point_time, cumulative_distance, cumulative_time)
+
+def _flight_totals(waypoints, start, stop, drone_speed, chunk, turn_time=TURN_TIME,
+                   acceleration=ACCELERATION):
+    """
+    (distance, durée) totales de la wayline start..stop - 1 (voir _wayline_blocks), mêmes
+    valeurs que estimate_flight, calculées par blocs de chunk waypoints : aucun tableau de la
+    taille de la mission n'est alloué (export en flux, voir _write_wayline).
+    """
+    import numpy as np
+    
+    count = stop - start
+    distance = 0.0
+    stops = 0
+    turns = 0
+    for first, block, offset in _wayline_blocks(waypoints, start, stop, chunk):
+        # Segments du bloc, jusqu'au premier waypoint du bloc suivant
+        end = offset + min(chunk + 1, count - first)
+        lat, lon = block.lat[offset:end], block.lon[offset:end]
+        ground = _ground_distance(lat[:-1], lon[:-1], lat[1:], lon[1:])
+        distance += float(np.hypot(ground, np.diff(block.alt[offset:end])).sum())
+        turns += int(np.count_nonzero(np.diff(block.pass_index[offset:end])))
+        stops += int(np.count_nonzero(block.turn_mode[offset:offset + chunk] == TURN_STOP))
+    return distance, distance / drone_speed + stops * drone_speed / acceleration + turns * turn_time
+
+def split_mission(mission, drone_speed, battery_time, home=None, turn_time=TURN_TIME,
+                  acceleration=ACCELERATION):
+    """
+    Découpe une mission en vols d'une batterie d'au plus battery_time secondes, uniquement
+    aux changements de passe. Chaque vol compte le trajet depuis home (décollage et montée à
+    l'altitude du premier waypoint), les passes elles-mêmes (estimate_flight) et le retour à
+    home ; home est par défaut le premier waypoint de la mission.
+    Les durées des passes sont lues dans les sommes cumulées de estimate_flight : une passe
+    candidate s'évalue en temps constant et la découpe est linéaire en nombre de passes.
+    Retourne (segments, durations) : liste des (début, fin) d'index de waypoints de chaque
+    vol (Mission.slice, segments de write_waylines_wpml) et durée estimée de chaque vol.
+    Lève ValueError si une passe seule dépasse battery_time.
+    """
+    import numpy as np
+    
+    if not isinstance(mission, Mission):
+        mission = Mission(mission)
+    n = len(mission)
+    if n == 0:
+        return [], []
+    estimate = estimate_flight(mission, drone_speed, turn_time, acceleration)
+    
+    # Premier et dernier waypoint de chaque passe
+    first = np.flatnonzero(np.r_[True, mission.pass_index[1:] != mission.pass_index[:-1]])
+    last = np.r_[first[1:], n] - 1
+    
+    # Trajets home -> début de passe et fin de passe -> home, avec arrêt à l'arrivée
+    home_lat, home_lon = (mission.lat[0], mission.lon[0]) if home is None else home
+    stop = drone_speed / acceleration
+    def transit(index):
+        ground = _ground_distance(home_lat, home_lon, mission.lat[index], mission.lon[index])
+        return np.hypot(ground, mission.alt[index]) / drone_speed + stop
+    outbound = transit(first)
+    inbound = transit(last)
+    
+    # Temps des passes first[s]..last[e] : le demi-tour en fin de dernière passe est remplacé
+    # par le retour
+    leave = estimate.cumulative_time[first]
+    arrive = estimate.cumulative_time[last] - estimate.point_time[last]
+    def flight_time(s, e):
+        return outbound[s] + arrive[e] - leave[s] + inbound[e]
+    
+    segments = []
+    durations = []
+    s = 0
+    while s < len(first):
+        if flight_time(s, s) > battery_time:
+            raise ValueError(f"La passe {s + 1} seule dépasse l'autonomie d'une batterie "
+                             f"({flight_time(s, s):.0f} s > {battery_time:.0f} s)")
+        e = s
+        while e + 1 < len(first) and flight_time(s, e + 1) <= battery_time:
+            e += 1
+        segments.append((int(first[s]), int(last[e]) + 1))
+        durations.append(float(flight_time(s, e)))
+        s = e + 1
+    return segments, durations
+
+def format_duration(seconds):
+    """Durée lisible : '42 s', '12 min 05 s' ou '1 h 07 min'"""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds} s"
+    if seconds < 3600:
+        return f"{seconds // 60} min {seconds % 60:02d} s"
+    return f"{seconds // 3600} h {seconds % 3600 // 60:02d} min"
+
+# ---------------------------
+# Fonction pour valider le rectangle
+# ---------------------------
+def validate_rectangle(points):
+    """Vérifie si les 4 points forment approximativement un rectangle"""
+    if len(points) != 4:
+        return False, "Il faut exactement 4 points."
+    
+    import numpy as np
+    
+    # Longueurs des côtés en mètres (en degrés, les côtés est-ouest seraient sous-estimés)
+    projection = LocalProjection.for_points(points)
+    x, y = projection.to_metric([p[0] for p in points], [p[1] for p in points])
+    distances = np.hypot(np.roll(x, -1) - x, np.roll(y, -1) - y).tolist()
+    
+    # Les côtés opposés doivent être approximativement égaux (tolérance 20%)
+    ratio1 = abs(distances[0] - distances[2]) / max(distances[0], distances[2])
+    ratio2 = abs(distances[1] - distances[3]) / max(distances[1], distances[3])
+    
+    if ratio1 > 0.2 or ratio2 > 0.2:
+        return False, "Les points ne forment pas un rectangle régulier. Les côtés opposés doivent être approximativement égaux."
+    
+    return True, "Rectangle valide."
+
+# ---------------------------
+# Fonction pour générer des waypoints dans un rectangle
+# ---------------------------
+def generate_waypoints_array(rect_points, altitude, frontal_cov, lateral_cov,
+                             sensor_width, sensor_height, focal_length, endpoints_only=False,
+                             return_home=False):
+    """
+    Génère les waypoints pour un rectangle orienté, avec repère local par ligne.
+    Retourne (waypoints, pass_index, nx, ny, fov_width, fov_height) où waypoints est un
+    tableau (N, 3) [lat, lon, alt] (voir Mission) et pass_index le numéro de passe de chaque
+    waypoint ; le point de retour éventuel porte le numéro ny.
+    
+    rect_points : liste des 4 coins du rectangle dans l'ordre P0,P1,P2,P3
+        P0--P1
+        |   |
+        P3--P2
+    altitude : hauteur de vol
+    frontal_cov : recouvrement frontal (0-1)
+    lateral_cov : recouvrement latéral (0-1)
+    sensor_width/height : dimensions du capteur en mm
+    focal_length : focale de l'objectif en mm
+    endpoints_only : ne produire que les deux extrémités de chaque passe
+    return_home : ajouter un dernier waypoint de retour sur P0
+    Le calcul se fait dans le plan métrique local de la mission (LocalProjection).
+    """
+    import numpy as np
+    
+    projection = LocalProjection.for_points(rect_points)
+    xs, ys = projection.to_metric([p[0] for p in rect_points], [p[1] for p in rect_points])
+    P0, P1, P2, P3 = zip(xs.tolist(), ys.tolist())
+
+    fov_width  = 2 * altitude * (sensor_width / (2 * focal_length))
+    fov_height = 2 * altitude * (sensor_height / (2 * focal_length))
+    dy = fov_height * (1 - lateral_cov)
+
+    Ly_total = math.hypot(P3[0]-P0[0], P3[1]-P0[1])
+    Ny = max(1, int(math.ceil(Ly_total / dy)))
+
+    points_x = []
+    points_y = []
+    pass_index = []
+
+    for iy in range(Ny + 1):
+        frac_y = iy / Ny
+        left_x  = P0[0] + frac_y * (P3[0]-P0[0])
+        left_y  = P0[1] + frac_y * (P3[1]-P0[1])
+        right_x = P1[0] + frac_y * (P2[0]-P1[0])
+        right_y = P1[1] + frac_y * (P2[1]-P1[1])
+
+        Lx_line = math.hypot(right_x - left_x, right_y - left_y)
+        dx = fov_width * (1 - frontal_cov)
+        Nx = max(1, int(math.ceil(Lx_line / dx)))
+
+        steps = (0, Nx) if endpoints_only else range(Nx + 1)
+        if iy % 2 == 1:
+            steps = reversed(steps)
+        for ix in steps:
+            frac_x = ix / Nx
+            points_x.append(left_x + frac_x * (right_x - left_x))
+            points_y.append(left_y + frac_x * (right_y - left_y))
+            pass_index.append(iy)
+
+    # Retour en coordonnées géographiques, en une seule conversion
+    lats, lons = projection.to_geographic(points_x, points_y)
+    if return_home:
+        lats = np.append(lats, rect_points[0][0])
+        lons = np.append(lons, rect_points[0][1])
+        pass_index.append(Ny + 1)
+
+    waypoints = _waypoint_block(lats, lons, altitude)
+    return waypoints, np.array(pass_index, dtype=np.int64), Nx + 1, Ny + 1, fov_width, fov_height
+
+def generate_waypoints(rect_points, altitude, frontal_cov, lateral_cov,
+                       sensor_width, sensor_height, focal_length, endpoints_only=False,
+                       return_home=False):
+    """
+    Génère les waypoints pour un rectangle orienté (voir generate_waypoints_array).
+    Retourne (waypoints, nx, ny, fov_width, fov_height) avec une liste de tuples (lat, lon, alt).
+    """
+    waypoints, _, nx, ny, fov_width, fov_height = generate_waypoints_array(
+        rect_points, altitude, frontal_cov, lateral_cov,
+        sensor_width, sensor_height, focal_length, endpoints_only, return_home
+    )
+    return list(zip(*(column.tolist() for column in waypoints.T))), nx, ny, fov_width, fov_height
+
+# ---------------------------
+# Fonction pour générer un KMZ compatible WaypointMap
+# ---------------------------
+# Borne haute de la taille d'un Placemark, pour décider du format ZIP64 avant l'écriture en flux
+_PLACEMARK_MAX_BYTES = 4096
+# Nombre de Placemark écrits entre deux appels de progress
+_PROGRESS_STEP = 1000
+
+def generate_waypointmap_kmz(waypoints, drone_speed, gimbal_pitch, output_name="mission_waypoints.kmz",
+                             compact=False, precision=7, photo_interval=None, photo_trigger="distance",
+                             progress=None, segments=None):
+    """
+    Génère un fichier KMZ compatible avec WaypointMap.com et DJI Fly.
+    waypoints est une Mission (exportée sans copie) ou une séquence de (lat, lon, alt).
+    compact=True produit un waylines.wpml réduit (voir write_waylines_wpml), avec des
+    coordonnées arrondies à precision décimales (7 décimales ≈ 1 cm).
+    photo_interval (en m) active le déclenchement photo par intervalle : waypoints ne contient
+    alors que les extrémités des passes (voir endpoints_only des générateurs).
+    progress(fait, total) est appelé au fil de l'écriture des Placemark ; une exception levée
+    par progress interrompt l'export (annulation) et le fichier incomplet est supprimé.
+    segments (voir split_mission) écrit une wayline par vol dans le même waylines.wpml.
+    output_name peut aussi être un fichier binaire ouvert (io.BytesIO pour un KMZ en mémoire).
+    """
+    timestamp = int(time.time() * 1000)
+    
+    template_kml = f"""<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:wpml="http://www.dji.com/wpmz/1.0.2">
+<Document>
+<wpml:author>fly</wpml:author>
+<wpml:createTime>{timestamp}</wpml:createTime>
+<wpml:updateTime>{timestamp}</wpml:updateTime>
+<wpml:missionConfig>
+<wpml:flyToWaylineMode>safely</wpml:flyToWaylineMode>
+<wpml:finishAction>noAction</wpml:finishAction>
+<wpml:exitOnRCLost>executeLostAction</wpml:exitOnRCLost>
+<wpml:executeRCLostAction>hover</wpml:executeRCLostAction>
+<wpml:globalTransitionalSpeed>{drone_speed}</wpml:globalTransitionalSpeed>
+<wpml:droneInfo>
+<wpml:droneEnumValue>68</wpml:droneEnumValue>
+<wpml:droneSubEnumValue>0</wpml:droneSubEnumValue>
+</wpml:droneInfo>
+</wpml:missionConfig>
+</Document>
+</kml>
+"""
+    
+    # Le waylines.wpml est écrit en flux directement dans l'archive : la mémoire utilisée
+    # ne dépend pas du nombre de waypoints, qu'ils soient une Mission ou une liste
+    force_zip64 = len(waypoints) * _PLACEMARK_MAX_BYTES >= ZIP64_LIMIT
+    try:
+        with ZipFile(output_name, 'w') as kmz:
+            kmz.writestr("wpmz/template.kml", template_kml)
+            with io.TextIOWrapper(kmz.open("wpmz/waylines.wpml", 'w', force_zip64=force_zip64),
+                                  encoding="utf-8") as out:
+                write_waylines_wpml(out, waypoints, drone_speed, gimbal_pitch, compact, precision,
+                                    photo_interval, photo_trigger, progress, segments)
+    except BaseException:
+        # Archive incomplète supprimée ; l'erreur d'origine est relevée même si le fichier
+        # n'a pas pu être créé
+        if isinstance(output_name, (str, os.PathLike)):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(output_name)
+        raise
+    
+    return output_name
+
+def write_waylines_wpml(out, waypoints, drone_speed, gimbal_pitch, compact=False, precision=7,
+                        photo_interval=None, photo_trigger="distance", progress=None, segments=None):
+    """
+    Écrit le document waylines.wpml dans le flux texte out, un Placemark à la fois.
+    waypoints est une Mission, lue par vues, ou une séquence de (lat, lon, alt), convertie
+    bloc par bloc (voir _wayline_blocks) : la mémoire utilisée reste bornée dans les deux cas.
+    Cap et mode de virage sont ceux de la Mission (heading, turn_mode).
+    En mode compact : un seul actionGroup gimbalEvenlyRotate couvre toute la mission, les
+    coordonnées sont écrites avec precision décimales et les éléments à valeur par défaut
+    (waypointPoiPoint, waypointTurnDampingDist) sont omis.
+    Avec photo_interval, les waypoints sont lus par paires (début, fin de passe) et chaque passe
+    reçoit une action takePhoto répétée tous les photo_interval mètres (photo_trigger="distance")
+    ou toutes les photo_interval / drone_speed secondes (photo_trigger="time").
+    segments (voir split_mission) : une wayline (Folder, waylineId 0, 1, ...) par segment
+    (début, fin) d'index, les index des waypoints repartant de 0 dans chacune.
+    wpml:distance et wpml:duration sont ceux de estimate_flight, cumulés par blocs.
+    progress(fait, total) est appelé tous les _PROGRESS_STEP Placemark et à la fin.
+    """
+    trigger = None
+    if photo_interval is not None:
+        if photo_trigger == "distance":
+            trigger = ("multipleDistance", photo_interval)
+        elif photo_trigger == "time":
+            trigger = ("multipleTiming", photo_interval / drone_speed)
+        else:
+            raise ValueError(f"Déclenchement photo inconnu: {photo_trigger}")
+    
+    count = len(waypoints)
+    
+    out.write(f"""<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:wpml="http://www.dji.com/wpmz/1.0.2">
+\t<Document>
+\t\t<wpml:missionConfig>
+\t\t\t<wpml:flyToWaylineMode>safely</wpml:flyToWaylineMode>
+\t\t\t<wpml:finishAction>noAction</wpml:finishAction>
+\t\t\t<wpml:exitOnRCLost>executeLostAction</wpml:exitOnRCLost>
+\t\t\t<wpml:executeRCLostAction>hover</wpml:executeRCLostAction>
+\t\t\t<wpml:globalTransitionalSpeed>{drone_speed}</wpml:globalTransitionalSpeed>
+\t\t\t<wpml:droneInfo>
+\t\t\t\t<wpml:droneEnumValue>68</wpml:droneEnumValue>
+\t\t\t\t<wpml:droneSubEnumValue>0</wpml:droneSubEnumValue>
+\t\t\t</wpml:droneInfo>
+\t\t</wpml:missionConfig>
+""")
+    
+    done = 0
+    for wayline_id, (start, stop) in enumerate(segments or [(0, count)]):
+        _write_wayline(out, waypoints, start, stop, wayline_id, drone_speed, gimbal_pitch, compact,
+                       precision, trigger, progress, done, count)
+        done += stop - start
+    
+    if progress is not None:
+        progress(count, count)
+    out.write("""\t</Document>
+</kml>
+""")
+
+def _write_wayline(out, waypoints, start, stop, wayline_id, drone_speed, gimbal_pitch, compact,
+                   precision, trigger, progress, done, total):
+    """
+    Écrit le Folder de la wayline des waypoints start à stop - 1 et ses Placemark (voir
+    write_waylines_wpml).
+    trigger : (type, paramètre) du déclenchement photo par intervalle, ou None.
+    """
+    distance, duration = _flight_totals(waypoints, start, stop, drone_speed, _PROGRESS_STEP)
+    count = stop - start
+    if trigger is not None:
+        trigger_type, trigger_param = trigger
+    
+    out.write(f"""\t\t<Folder>
+\t\t\t<wpml:templateId>0</wpml:templateId>
+\t\t\t<wpml:executeHeightMode>relativeToStartPoint</wpml:executeHeightMode>
+\t\t\t<wpml:waylineId>{wayline_id}</wpml:waylineId>
+\t\t\t<wpml:distance>{distance:.1f}</wpml:distance>
+\t\t\t<wpml:duration>{duration:.1f}</wpml:duration>
+\t\t\t<wpml:autoFlightSpeed>{drone_speed}</wpml:autoFlightSpeed>
+""")
+    
+    # Éléments omis en mode compact (valeurs par défaut, ignorés par le contrôleur)
+    poi_point = "" if compact else "<wpml:waypointPoiPoint>0.000000,0.000000,0.000000</wpml:waypointPoiPoint>\n"
+    damping_dist = "" if compact else "<wpml:waypointTurnDampingDist>0</wpml:waypointTurnDampingDist>\n"
+    
+    # Les colonnes sont converties en flottants Python par blocs de _PROGRESS_STEP waypoints
+    action_id = 1
+    previous_heading = None
+    for i, lat, lon, alt, heading, turn in _iter_columns(waypoints, start, stop, _PROGRESS_STEP):
+        if compact:
+            coordinates = f"{lon:.{precision}f},{lat:.{precision}f}"
+        else:
+            coordinates = f"{lon},{lat}"
+        
+        turn_mode = TURN_MODES[turn]
+        # Cap imposé au départ et à chaque changement (premier waypoint de chaque passe)
+        heading_enable = 1 if heading != previous_heading else 0
+        previous_heading = heading
+        
+        out.write(f"""<Placemark>
+<Point>
+<coordinates>
+{coordinates}
+</coordinates>
+</Point>
+<wpml:index>{i}</wpml:index>
+<wpml:executeHeight>{int(alt)}</wpml:executeHeight>
+<wpml:waypointSpeed>{drone_speed}</wpml:waypointSpeed>
+<wpml:waypointHeadingParam>
+<wpml:waypointHeadingMode>smoothTransition</wpml:waypointHeadingMode>
+<wpml:waypointHeadingAngle>{heading}</wpml:waypointHeadingAngle>
+{poi_point}<wpml:waypointHeadingAngleEnable>{heading_enable}</wpml:waypointHeadingAngleEnable>
+<wpml:waypointHeadingPathMode>followBadArc</wpml:waypointHeadingPathMode>
+</wpml:waypointHeadingParam>
+<wpml:waypointTurnParam>
+<wpml:waypointTurnMode>{turn_mode}</wpml:waypointTurnMode>
+{damping_dist}</wpml:waypointTurnParam>
+<wpml:useStraightLine>0</wpml:useStraightLine>
+""")
+        
+        if i == 0:
+            out.write(f"""<wpml:actionGroup>
+<wpml:actionGroupId>1</wpml:actionGroupId>
+<wpml:actionGroupStartIndex>0</wpml:actionGroupStartIndex>
+<wpml:actionGroupEndIndex>0</wpml:actionGroupEndIndex>
+<wpml:actionGroupMode>parallel</wpml:actionGroupMode>
+<wpml:actionTrigger>
+<wpml:actionTriggerType>reachPoint</wpml:actionTriggerType>
+</wpml:actionTrigger>
+<wpml:action>
+<wpml:actionId>{action_id}</wpml:actionId>
+<wpml:actionActuatorFunc>gimbalRotate</wpml:actionActuatorFunc>
+<wpml:actionActuatorFuncParam>
+<wpml:gimbalHeadingYawBase>aircraft</wpml:gimbalHeadingYawBase>
+<wpml:gimbalRotateMode>absoluteAngle</wpml:gimbalRotateMode>
+<wpml:gimbalPitchRotateEnable>1</wpml:gimbalPitchRotateEnable>
+<wpml:gimbalPitchRotateAngle>{gimbal_pitch}</wpml:gimbalPitchRotateAngle>
+<wpml:gimbalRollRotateEnable>0</wpml:gimbalRollRotateEnable>
+<wpml:gimbalRollRotateAngle>0</wpml:gimbalRollRotateAngle>
+<wpml:gimbalYawRotateEnable>0</wpml:gimbalYawRotateEnable>
+<wpml:gimbalYawRotateAngle>0</wpml:gimbalYawRotateAngle>
+<wpml:gimbalRotateTimeEnable>0</wpml:gimbalRotateTimeEnable>
+<wpml:gimbalRotateTime>0</wpml:gimbalRotateTime>
+<wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
+</wpml:actionActuatorFuncParam>
+</wpml:action>
+</wpml:actionGroup>
+""")
+            action_id += 1
+            
+            out.write(f"""<wpml:actionGroup>
+<wpml:actionGroupId>2</wpml:actionGroupId>
+<wpml:actionGroupStartIndex>0</wpml:actionGroupStartIndex>
+<wpml:actionGroupEndIndex>{count - 1}</wpml:actionGroupEndIndex>
+<wpml:actionGroupMode>parallel</wpml:actionGroupMode>
+<wpml:actionTrigger>
+<wpml:actionTriggerType>reachPoint</wpml:actionTriggerType>
+</wpml:actionTrigger>
+<wpml:action>
+<wpml:actionId>{action_id}</wpml:actionId>
+<wpml:actionActuatorFunc>gimbalEvenlyRotate</wpml:actionActuatorFunc>
+<wpml:actionActuatorFuncParam>
+<wpml:gimbalPitchRotateAngle>{gimbal_pitch}</wpml:gimbalPitchRotateAngle>
+<wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
+</wpml:actionActuatorFuncParam>
+</wpml:action>
+</wpml:actionGroup>
+""")
+        elif not compact and trigger is None:
+            # En mode compact ou par intervalle, l'actionGroup du premier point couvre déjà tous les index
+            out.write(f"""<wpml:actionGroup>
+<wpml:actionGroupId>2</wpml:actionGroupId>
+<wpml:actionGroupStartIndex>{i}</wpml:actionGroupStartIndex>
+<wpml:actionGroupEndIndex>{i}</wpml:actionGroupEndIndex>
+<wpml:actionGroupMode>parallel</wpml:actionGroupMode>
+<wpml:actionTrigger>
+<wpml:actionTriggerType>reachPoint</wpml:actionTriggerType>
+</wpml:actionTrigger>
+<wpml:action>
+<wpml:actionId>{action_id}</wpml:actionId>
+<wpml:actionActuatorFunc>gimbalEvenlyRotate</wpml:actionActuatorFunc>
+<wpml:actionActuatorFuncParam>
+<wpml:gimbalPitchRotateAngle>{gimbal_pitch}</wpml:gimbalPitchRotateAngle>
+<wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
+</wpml:actionActuatorFuncParam>
+</wpml:action>
+</wpml:actionGroup>
+""")
+        
+        # Début de passe : photos à intervalle régulier jusqu'au waypoint de fin de passe
+        if trigger is not None and i % 2 == 0 and i + 1 < count:
+            action_id += 1
+            out.write(f"""<wpml:actionGroup>
+<wpml:actionGroupId>{3 + i // 2}</wpml:actionGroupId>
+<wpml:actionGroupStartIndex>{i}</wpml:actionGroupStartIndex>
+<wpml:actionGroupEndIndex>{i + 1}</wpml:actionGroupEndIndex>
+<wpml:actionGroupMode>sequence</wpml:actionGroupMode>
+<wpml:actionTrigger>
+<wpml:actionTriggerType>{trigger_type}</wpml:actionTriggerType>
+<wpml:actionTriggerParam>{trigger_param:.2f}</wpml:actionTriggerParam>
+</wpml:actionTrigger>
+<wpml:action>
+<wpml:actionId>{action_id}</wpml:actionId>
+<wpml:actionActuatorFunc>takePhoto</wpml:actionActuatorFunc>
+<wpml:actionActuatorFuncParam>
+<wpml:payloadPositionIndex>0</wpml:payloadPositionIndex>
+</wpml:actionActuatorFuncParam>
+</wpml:action>
+</wpml:actionGroup>
+""")
+        
+        action_id += 1
+        out.write("</Placemark>")
+        
+        if progress is not None and (i + 1) % _PROGRESS_STEP == 0:
+            progress(done + i + 1, total)
+    
+    out.write("""
+\t\t</Folder>
+""")
+
+def _wayline_blocks(waypoints, start, stop, chunk):
+    """
+    Waypoints start à stop - 1 d'une wayline par blocs d'au plus chunk waypoints : tuples
+    (index du bloc dans la wayline, Mission, index du bloc dans cette Mission), la Mission
+    contenant aussi le waypoint qui suit le bloc.
+    Une Mission est lue par vues (Mission.slice). Une séquence de (lat, lon, alt) est
+    convertie bloc par bloc, avec un waypoint de part et d'autre pour les caps des
+    extrémités : mêmes valeurs que Mission(waypoints).slice(start, stop), sans jamais
+    convertir toute la séquence.
+    """
+    if isinstance(waypoints, Mission):
+        wayline = waypoints if (start, stop) == (0, len(waypoints)) else waypoints.slice(start, stop)
+        for first in range(0, stop - start, chunk):
+            yield first, wayline, first
+        return
+    for first in range(start, stop, chunk):
+        origin = max(first - 1, 0)
+        block = Mission(waypoints[origin:min(first + chunk, stop) + 1])
+        # Arrêt au premier waypoint de la wayline seulement
+        block.turn_mode[:] = TURN_PASS
+        if first == start:
+            block.turn_mode[first - origin] = TURN_STOP
+        yield first - start, block, first - origin
+
+def _iter_columns(waypoints, start, stop, chunk):
+    """
+    (index, lat, lon, alt, cap, mode de virage) de chaque waypoint de la wayline start..stop - 1,
+    en flottants Python (voir _wayline_blocks)
+    """
+    count = stop - start
+    for first, block, offset in _wayline_blocks(waypoints, start, stop, chunk):
+        end = offset + min(chunk, count - first)
+        yield from zip(
+            range(first, first + end - offset),
+            block.lat[offset:end].tolist(), block.lon[offset:end].tolist(),
+            block.alt[offset:end].tolist(), block.heading[offset:end].tolist(),
+            block.turn_mode[offset:end].tolist(),
+        )
+
+# ---------------------------
+# Fonctions géométriques pour polygone
+# ---------------------------
+def point_in_polygon(point, polygon):
+    """
+    Test si un point est dans un polygone (ray casting algorithm).
+    Accepte aussi un tableau (N, 2) de points : retourne alors un masque booléen de taille N,
+    calculé en un seul passage sur les arêtes.
+    """
+    import numpy as np
+    
+    if np.ndim(point) == 2:
+        return _points_in_polygon(np.asarray(point, dtype=float), polygon)
+    
+    x, y = point
+    n = len(polygon)
+    inside = False
+    
+    p1x, p1y = polygon[0]
+    for i in range(1, n + 1):
+        p2x, p2y = polygon[i % n]
+        if y > min(p1y, p2y):
+            if y <= max(p1y, p2y):
+                if x <= max(p1x, p2x):
+                    if p1y != p2y:
+                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                    if p1x == p2x or x <= xinters:
+                        inside = not inside
+        p1x, p1y = p2x, p2y
+    
+    return inside
+
+def get_bounding_box(polygon):
+    """Retourne le bounding box du polygone (min_lat, max_lat, min_lon, max_lon)"""
+    lats = [p[0] for p in polygon]
+    lons = [p[1] for p in polygon]
+    return (min(lats), max(lats), min(lons), max(lons))
+
+def get_main_axis_angle(polygon):
+    """
+    Calcule l'angle principal du polygone pour l'orientation des passes : direction (radians,
+    depuis l'est vers le nord) de sa plus longue arête, mesurée en mètres.
+    """
+    import numpy as np
+    
+    if len(polygon) < 2:
+        return 0
+    
+    projection = LocalProjection.for_points(polygon)
+    x, y = projection.to_metric([p[0] for p in polygon], [p[1] for p in polygon])
+    dx = np.roll(x, -1) - x
+    dy = np.roll(y, -1) - y
+    longest = np.argmax(np.hypot(dx, dy))
+    return math.atan2(dy[longest], dx[longest])
+
+def _points_in_polygon(points, polygon):
+    """
+    Forme vectorisée de point_in_polygon pour un tableau (N, 2).
+    Les points sont triés selon y : chaque arête ne teste que la plage de points comprise
+    dans son intervalle ]y_min, y_max], en une seule passe sur toutes les arêtes.
+    """
+    import numpy as np
+    
+    polygon = np.asarray(polygon, dtype=float)
+    x, y = points[:, 0], points[:, 1]
+    p1x, p1y = polygon[:, 0], polygon[:, 1]
+    p2x, p2y = np.roll(p1x, -1), np.roll(p1y, -1)
+    
+    order = np.argsort(y, kind='stable')
+    first_point = np.searchsorted(y[order], np.minimum(p1y, p2y), side='right')
+    last_point = np.searchsorted(y[order], np.maximum(p1y, p2y), side='right')
+    n_tested = np.maximum(last_point - first_point, 0)
+    
+    # Paires (arête, point) dont le point est dans l'intervalle y de l'arête
+    edge = np.repeat(np.arange(len(polygon)), n_tested)
+    offsets = np.cumsum(n_tested) - n_tested
+    point = order[first_point[edge] + np.arange(len(edge)) - offsets[edge]]
+    px, py = x[point], y[point]
+    
+    crossing = px <= np.maximum(p1x, p2x)[edge]
+    xinters = (py - p1y[edge]) * (p2x[edge] - p1x[edge]) / (p2y[edge] - p1y[edge]) + p1x[edge]
+    crossing &= (p1x[edge] == p2x[edge]) | (px <= xinters)
+    
+    return np.bincount(point[crossing], minlength=len(points)) % 2 == 1
+
+def _scanline_intersections(polygon, scan_lats):
+    """
+    Intersections des lignes de balayage avec les arêtes du polygone (algorithme de remplissage
+    par table des arêtes). Chaque arête n'est active que sur les lignes comprises dans
+    [lat_min, lat_max[ de l'arête : seules les paires (ligne, arête) qui se croisent réellement
+    sont calculées, soit O(E log L + K log K) au lieu de O(L × E) (K = nombre de croisements).
+    scan_lats doit être trié par ordre croissant. Le polygone est [lat, lon] ou, pour le
+    balayage métrique, [y, x] : la première colonne est celle des lignes de balayage.
+    Retourne (line_idx, lon) triés par ligne puis par longitude (ou abscisse).
+    """
+    import numpy as np
+    
+    lat1, lon1 = polygon[:, 0], polygon[:, 1]
+    return _edge_intersections(lat1, lon1, np.roll(lat1, -1), np.roll(lon1, -1), scan_lats)
+
+def _edge_intersections(lat1, lon1, lat2, lon2, scan_lats):
+    """_scanline_intersections pour une liste d'arêtes quelconque (plusieurs contours)"""
+    import numpy as np
+    
+    # Table des arêtes : plage de lignes [first_line, last_line[ sur laquelle chaque arête est active
+    edge_min = np.minimum(lat1, lat2)
+    edge_max = np.maximum(lat1, lat2)
+    first_line = np.searchsorted(scan_lats, edge_min, side='left')
+    last_line = np.searchsorted(scan_lats, edge_max, side='left')
+    n_active = np.maximum(last_line - first_line, 0)
+    
+    # Énumérer les paires (ligne, arête) actives
+    edge_idx = np.repeat(np.arange(len(lat1)), n_active)
+    offsets = np.cumsum(n_active) - n_active
+    line_idx = first_line[edge_idx] + np.arange(len(edge_idx)) - offsets[edge_idx]
+    
+    current_lat = scan_lats[line_idx]
+    t = (current_lat - lat1[edge_idx]) / (lat2[edge_idx] - lat1[edge_idx])
+    lon = lon1[edge_idx] + t * (lon2[edge_idx] - lon1[edge_idx])
+    
+    order = np.lexsort((lon, line_idx))
+    return line_idx[order], lon[order]
+
+def _footprint(altitude, frontal_cov, lateral_cov, sensor_width, sensor_height, focal_length):
+    """Emprise au sol d'une photo et espacements (m) : (fov_width, fov_height, dx, dy)"""
+    fov_width = 2 * altitude * (sensor_width / (2 * focal_length))
+    fov_height = 2 * altitude * (sensor_height / (2 * focal_length))
+    return fov_width, fov_height, fov_width * (1 - frontal_cov), fov_height * (1 - lateral_cov)
+
+def _sweep_grid(polygon, altitude, frontal_cov, lateral_cov, sensor_width, sensor_height, focal_length):
+    """
+    FOV, espacement des waypoints le long des passes et ordonnées des lignes de balayage, en
+    mètres (grille ancrée sur l'ordonnée minimale du polygone métrique (N, 2) [y nord, x est]).
+    """
+    import numpy as np
+    
+    fov_width, fov_height, dx, dy = _footprint(
+        altitude, frontal_cov, lateral_cov, sensor_width, sensor_height, focal_length
+    )
+    min_y, max_y = polygon[:, 0].min(), polygon[:, 0].max()
+    n_lines = max(1, int(math.ceil((max_y - min_y) / dy))) + 1
+    
+    scan_ys = min_y + np.arange(n_lines) * dy
+    return fov_width, fov_height, dx, scan_ys[scan_ys <= max_y]
+
+def _metric_polygon(polygon, projection):
+    """Polygone (N, 2) [lat, lon] -> (N, 2) [y nord, x est] en mètres"""
+    import numpy as np
+    
+    x, y = projection.to_metric(polygon[:, 0], polygon[:, 1])
+    return np.column_stack((y, x))
+
+def _polygon_spans(polygon, scan_ys, line_offset=0):
+    """
+    Segments de passe (paires d'intersections entrée/sortie) des lignes scan_ys, pour un
+    polygone métrique [y, x].
+    Retourne (span_line, x_start, x_end, start_inside, end_inside) triés par ligne puis
+    abscisse ; span_line est décalé de line_offset (calcul d'une partie des lignes seulement).
+    Les extrémités, sur le contour, sont vérifiées par ray casting ; les points strictement
+    entre l'entrée et la sortie d'un segment sont dans le polygone par construction.
+    """
+    import numpy as np
+    
+    # Intersections lignes/arêtes via la table des arêtes, triées par ligne puis abscisse
+    line_idx, x_intersect = _scanline_intersections(polygon, scan_ys)
+    
+    # Paires d'intersections (entrée/sortie) -> segments, dans l'ordre ligne par ligne
+    counts = np.bincount(line_idx, minlength=len(scan_ys))
+    first = np.cumsum(counts) - counts
+    pos = np.arange(len(line_idx)) - first[line_idx]
+    is_start = (pos % 2 == 0) & (pos + 1 < counts[line_idx])
+    starts = np.flatnonzero(is_start)
+    span_line = line_idx[starts]
+    x_start = x_intersect[starts]
+    x_end = x_intersect[starts + 1]
+    
+    # Extrémités telles que les produit l'interpolation (frac = 0 et frac = 1)
+    span_y = scan_ys[span_line]
+    ends = np.column_stack((np.r_[span_y, span_y], np.r_[x_start, x_start + (x_end - x_start)]))
+    inside = point_in_polygon(ends, polygon)
+    n_spans = len(starts)
+    return span_line + line_offset, x_start, x_end, inside[:n_spans], inside[n_spans:]
+
+def _assemble_spans(span_y, x_start, x_end, start_inside, end_inside, dx, altitude, projection,
+                    endpoints_only=False):
+    """
+    Waypoints de tous les segments en une seule opération, direction alternée (boustrophédon).
+    L'interpolation se fait en mètres ; les points sont ramenés en (lat, lon) en une seule
+    conversion par projection.
+    Retourne (waypoints (N, 3), pass_index).
+    """
+    import numpy as np
+    
+    line_count = len(span_y)
+    
+    # Nombre de points par segment
+    n_points = np.maximum(1, np.ceil(np.abs(x_end - x_start) / dx).astype(np.int64)) + 1
+    
+    span = np.repeat(np.arange(line_count), n_points)
+    offsets = np.cumsum(n_points) - n_points
+    m = np.arange(len(span)) - np.repeat(offsets, n_points)
+    m = np.where(span % 2 == 1, n_points[span] - 1 - m, m)
+    frac = m / (n_points[span] - 1)
+    ys = span_y[span]
+    xs = x_start[span] + frac * (x_end[span] - x_start[span])
+    
+    inside = np.ones(len(span), dtype=bool)
+    at_start = m == 0
+    at_end = m == n_points[span] - 1
+    inside[at_start] = start_inside[span[at_start]]
+    inside[at_end] = end_inside[span[at_end]]
+    
+    if endpoints_only:
+        kept_span = span[inside]
+        is_first = np.r_[True, kept_span[1:] != kept_span[:-1]]
+        is_last = np.r_[kept_span[1:] != kept_span[:-1], True]
+        inside[inside] = is_first ^ is_last
+    
+    lats, lons = projection.to_geographic(xs[inside], ys[inside])
+    return _waypoint_block(lats, lons, altitude), span[inside]
+
+# ---------------------------
+# Fonction pour générer des waypoints dans un polygone
+# ---------------------------
+def generate_waypoints_polygon_array(polygon_points, altitude, frontal_cov, lateral_cov,
+                                     sensor_width, sensor_height, focal_length, endpoints_only=False,
+                                     sweep_angle=0.0, projection=None, lines=None):
+    """
+    Moteur vectorisé (NumPy) de generate_waypoints_polygon.
+    Retourne (waypoints, pass_index, line_count, fov_width, fov_height) où waypoints est un
+    tableau (N, 3) [lat, lon, alt] et pass_index le numéro de passe de chaque waypoint.
+    endpoints_only=True ne garde que le premier et le dernier waypoint de chaque passe
+    (déclenchement photo par intervalle) ; les passes réduites à un seul point sont ignorées.
+    Le balayage se fait dans le plan métrique de projection (par défaut
+    LocalProjection.for_points(polygon_points, sweep_angle)) : passes espacées d'exactement
+    dy mètres et orientées selon sweep_angle (degrés depuis l'est vers le nord, 0 = passes
+    est-ouest ; voir optimize_sweep_angle).
+    lines = (début, fin) limite la génération aux lignes de balayage début à fin - 1 de la
+    grille du polygone entier (sous-zone d'un drone, voir partition_polygon) : les passes sont
+    exactement celles de la mission complète, le sens alterné repartant de la première.
+    """
+    import numpy as np
+    
+    polygon = np.asarray(polygon_points, dtype=float)
+    if projection is None:
+        projection = LocalProjection.for_points(polygon, sweep_angle)
+    metric = _metric_polygon(polygon, projection)
+    fov_width, fov_height, dx, scan_ys = _sweep_grid(
+        metric, altitude, frontal_cov, lateral_cov, sensor_width, sensor_height, focal_length
+    )
+    if lines is not None:
+        scan_ys = scan_ys[lines[0]:lines[1]]
+    span_line, x_start, x_end, start_inside, end_inside = _polygon_spans(metric, scan_ys)
+    waypoints, pass_index = _assemble_spans(
+        scan_ys[span_line], x_start, x_end, start_inside, end_inside, dx, altitude, projection,
+        endpoints_only
+    )
+    return waypoints, pass_index, len(span_line), fov_width, fov_height
+
+class PolygonSweep:
+    """
+    Balayage d'un polygone modifiable sommet par sommet (édition sur la carte).
+
+    Les segments de passe de chaque ligne de balayage sont conservés : move_vertex ne
+    recalcule que les lignes dont l'ordonnée est comprise dans la plage couverte par les deux
+    arêtes touchant le sommet déplacé, avant et après le déplacement ; les segments des autres
+    lignes sont réutilisés tels quels. Si l'ordonnée minimale du polygone change, la grille
+    des lignes se décale et tout est recalculé.
+    La projection (orientée selon sweep_angle) est fixée à la création (polygone initial) pour
+    que les lignes conservées restent valides ; result() retourne le même résultat que
+    generate_waypoints_polygon_array appelé avec cette projection.
+    """
+
+    def __init__(self, polygon_points, altitude, frontal_cov, lateral_cov,
+                 sensor_width, sensor_height, focal_length, endpoints_only=False,
+                 sweep_angle=0.0, projection=None):
+        import numpy as np
+        
+        self.polygon = np.array(polygon_points, dtype=float)
+        self.projection = projection or LocalProjection.for_points(self.polygon, sweep_angle)
+        self._metric = _metric_polygon(self.polygon, self.projection)
+        self.altitude = altitude
+        self.endpoints_only = endpoints_only
+        self._camera = (altitude, frontal_cov, lateral_cov, sensor_width, sensor_height, focal_length)
+        self._full_update()
+
+    def _full_update(self):
+        self.fov_width, self.fov_height, self.dx, self.scan_ys = _sweep_grid(self._metric, *self._camera)
+        self._spans = _polygon_spans(self._metric, self.scan_ys)
+        self.recomputed_lines = len(self.scan_ys)
+
+    def move_vertex(self, index, lat, lon):
+        """Déplace le sommet index et met à jour les seules lignes de balayage concernées"""
+        import numpy as np
+        
+        n = len(self.polygon)
+        old_y = self._metric[index, 0]
+        x, y = self.projection.to_metric(lat, lon)
+        self.polygon[index] = (lat, lon)
+        self._metric[index] = (y, x)
+        if self._metric[:, 0].min() != self.scan_ys[0]:
+            self._full_update()
+            return
+        
+        neighbours = self._metric[[(index - 1) % n, (index + 1) % n], 0]
+        low = min(old_y, y, neighbours.min())
+        high = max(old_y, y, neighbours.max())
+        _, _, _, scan_ys = _sweep_grid(self._metric, *self._camera)
+        first = np.searchsorted(scan_ys, low, side='left')
+        last = np.searchsorted(scan_ys, high, side='right')
+        
+        span_line = self._spans[0]
+        before = span_line < first
+        after = (span_line >= last) & (span_line < len(scan_ys))
+        updated = _polygon_spans(self._metric, scan_ys[first:last], line_offset=first)
+        self._spans = tuple(
+            np.concatenate((column[before], new_column, column[after]))
+            for column, new_column in zip(self._spans, updated)
+        )
+        self.scan_ys = scan_ys
+        self.recomputed_lines = last - first
+
+    def result(self):
+        """(waypoints, pass_index, line_count, fov_width, fov_height) du polygone courant"""
+        span_line, x_start, x_end, start_inside, end_inside = self._spans
+        waypoints, pass_index = _assemble_spans(
+            self.scan_ys[span_line], x_start, x_end, start_inside, end_inside,
+            self.dx, self.altitude, self.projection, self.endpoints_only
+        )
+        return waypoints, pass_index, len(span_line), self.fov_width, self.fov_height
+
+def generate_waypoints_polygon(polygon_points, altitude, frontal_cov, lateral_cov,
+                               sensor_width, sensor_height, focal_length, endpoints_only=False,
+                               sweep_angle=0.0):
+    """
+    Génère des waypoints pour couvrir un polygone quelconque avec un pattern boustrophédon.
+    Utilise un algorithme de balayage (scanlines) avec détection d'intersections, passes
+    orientées selon sweep_angle (degrés depuis l'est).
+    endpoints_only=True ne produit que les deux extrémités de chaque passe.
+    """
+    waypoints, _, line_count, fov_width, fov_height = generate_waypoints_polygon_array(
+        polygon_points, altitude, frontal_cov, lateral_cov,
+        sensor_width, sensor_height, focal_length, endpoints_only, sweep_angle
+    )
+    waypoints = list(zip(*(column.tolist() for column in waypoints.T)))
+    return waypoints, line_count, len(waypoints), fov_width, fov_height
+
+# ---------------------------
+# Orientation optimale des passes
+# ---------------------------
+# Orientations évaluées par défaut (degrés), en plus de l'axe principal du polygone
+_SWEEP_ANGLE_STEP = 5.0
+# Orientations évaluées par opération vectorisée (entre deux appels de progress)
+_SWEEP_ANGLE_BATCH = 8
+
+def optimize_sweep_angle(polygon_points, altitude, frontal_cov, lateral_cov,
+                         sensor_width, sensor_height, focal_length, drone_speed,
+                         angles=None, turn_time=TURN_TIME, progress=None):
+    """
+    Cherche l'orientation des passes qui minimise la durée de vol estimée : longueur des
+    passes et des transitions entre passes à drone_speed, plus turn_time par demi-tour.
+    Les orientations candidates (par défaut tous les 5° sur [0, 180[ et l'axe principal du
+    polygone, get_main_axis_angle) sont évaluées par lots de _SWEEP_ANGLE_BATCH, chaque lot en
+    une seule opération vectorisée (_sweep_durations), sans générer les waypoints.
+    progress(fait, total) est appelé après chaque lot ; une exception levée par progress
+    (annulation) interrompt la recherche.
+    Retourne (meilleur angle, angles, demi-tours, durées en s) ; à durée égale, l'angle qui
+    demande le moins de demi-tours l'emporte.
+    """
+    import numpy as np
+    
+    polygon = np.asarray(polygon_points, dtype=float)
+    if angles is None:
+        main_axis = math.degrees(get_main_axis_angle(polygon)) % 180
+        angles = np.unique(np.r_[np.arange(0, 180, _SWEEP_ANGLE_STEP), main_axis])
+    angles = np.atleast_1d(np.asarray(angles, dtype=float))
+    _, _, _, dy = _footprint(altitude, frontal_cov, lateral_cov, sensor_width, sensor_height, focal_length)
+    
+    east, north = LocalProjection.for_points(polygon).to_metric(polygon[:, 0], polygon[:, 1])
+    turns = np.zeros(len(angles), dtype=np.int64)
+    durations = np.zeros(len(angles))
+    for start in range(0, len(angles), _SWEEP_ANGLE_BATCH):
+        batch = slice(start, start + _SWEEP_ANGLE_BATCH)
+        turns[batch], durations[batch] = _sweep_durations(
+            east, north, angles[batch], dy, drone_speed, turn_time
+        )
+        if progress:
+            progress(min(start + _SWEEP_ANGLE_BATCH, len(angles)), len(angles))
+    
+    best = np.lexsort((turns, durations))[0]
+    return float(angles[best]), angles, turns, durations
+
+def _sweep_durations(east, north, angles, dy, drone_speed, turn_time):
+    """
+    Demi-tours et durées de vol estimées du balayage d'un polygone métrique (east, north) pour
+    chaque orientation de angles : le polygone est tourné pour chaque angle et les copies sont
+    empilées en bandes disjointes d'un même balayage (_edge_intersections).
+    """
+    import numpy as np
+    
+    # Polygone dans le repère de chaque angle (k, n) : les passes y sont horizontales
+    theta = np.radians(angles)[:, None]
+    x = east * np.cos(theta) + north * np.sin(theta)
+    y = north * np.cos(theta) - east * np.sin(theta)
+    
+    # Bandes : chaque copie est décalée pour que sa grille (ancrée sur son y minimal, comme
+    # _sweep_grid) tombe sur la grille commune des lignes k * lines_per_band + i
+    min_y = y.min(axis=1, keepdims=True)
+    n_lines = np.floor((y.max(axis=1) - min_y[:, 0]) / dy).astype(np.int64) + 1
+    lines_per_band = int(n_lines.max()) + 1
+    y = y - min_y + (np.arange(len(angles)) * lines_per_band * dy)[:, None]
+    scan_ys = np.arange(len(angles) * lines_per_band) * dy
+    line_idx, x_intersect = _edge_intersections(
+        y.ravel(), x.ravel(), np.roll(y, -1, axis=1).ravel(), np.roll(x, -1, axis=1).ravel(), scan_ys
+    )
+    
+    # Segments de passe (paires entrée/sortie), comme _polygon_spans
+    counts = np.bincount(line_idx, minlength=len(scan_ys))
+    first = np.cumsum(counts) - counts
+    pos = np.arange(len(line_idx)) - first[line_idx]
+    starts = np.flatnonzero((pos % 2 == 0) & (pos + 1 < counts[line_idx]))
+    span_line = line_idx[starts]
+    x_start = x_intersect[starts]
+    x_end = x_intersect[starts + 1]
+    band = span_line // lines_per_band
+    
+    # Sens alterné par segment dans chaque bande, comme _assemble_spans : sortie d'un
+    # segment et entrée du suivant
+    n_spans = np.bincount(band, minlength=len(angles))
+    local = np.arange(len(band)) - (np.cumsum(n_spans) - n_spans)[band]
+    exit_x = np.where(local % 2 == 0, x_end, x_start)
+    entry_x = np.where(local % 2 == 0, x_start, x_end)
+    same_band = band[1:] == band[:-1]
+    transition = np.hypot(entry_x[1:] - exit_x[:-1], (span_line[1:] - span_line[:-1]) * dy)
+    
+    length = np.bincount(band, weights=np.abs(x_end - x_start), minlength=len(angles))
+    length += np.bincount(band[1:][same_band], weights=transition[same_band], minlength=len(angles))
+    turns = np.maximum(n_spans - 1, 0)
+    return turns, length / drone_speed + turns * turn_time
+
+# ---------------------------
+# Partage d'une zone entre plusieurs drones
+# ---------------------------
+def _clip_half_plane(polygon, level, keep_above):
+    """
+    Découpe (Sutherland-Hodgman) d'un polygone métrique [y, x] par le demi-plan y >= level
+    (keep_above) ou y <= level. Un polygone concave coupé en plusieurs morceaux reste d'un seul
+    tenant, les morceaux étant reliés par des arêtes posées sur la droite y = level.
+    Retourne (polygone découpé, source) où source est l'index du sommet d'origine de chaque
+    point, -1 pour les points d'intersection.
+    """
+    import numpy as np
+    
+    side = polygon[:, 0] - level if keep_above else level - polygon[:, 0]
+    inside = side >= 0
+    following = np.roll(np.arange(len(polygon)), -1)
+    crossing = inside != inside[following]
+    
+    # Chaque sommet intérieur, suivi de l'intersection de son arête sortante si elle traverse
+    t = side / np.where(crossing, side - side[following], 1.0)
+    intersections = polygon + t[:, None] * (polygon[following] - polygon)
+    intersections[:, 0] = level
+    points = np.stack((polygon, intersections), axis=1).reshape(-1, 2)
+    source = np.column_stack((np.arange(len(polygon)), np.full(len(polygon), -1))).ravel()
+    kept = np.column_stack((inside, crossing)).ravel()
+    return points[kept], source[kept]
+
+def partition_polygon(polygon_points, n_parts, altitude, frontal_cov, lateral_cov,
+                      sensor_width, sensor_height, focal_length, drone_speed, sweep_angle=0.0,
+                      turn_time=TURN_TIME):
+    """
+    Partage un polygone en n_parts sous-zones de durées de vol estimées équilibrées, une par
+    drone. Les coupes sont parallèles aux passes, à mi-distance entre deux lignes de balayage :
+    chaque sous-zone couvre des lignes entières de la zone, sans trou ni recouvrement
+    supplémentaire entre drones.
+    La durée de chaque ligne (passes, transitions et demi-tours, comme optimize_sweep_angle)
+    est calculée sur les segments de passe, sans générer les waypoints ; les coupes sont
+    placées sur les sommes cumulées. Il y a au plus une sous-zone par ligne de balayage : une
+    zone comptant moins de lignes que n_parts est partagée en autant de sous-zones que de
+    lignes, les listes retournées sont alors plus courtes que n_parts.
+    Retourne (sous-polygones [(lat, lon), ...], lignes, durées estimées en s, projection) :
+    la mission du drone k est generate_waypoints_polygon_array(polygon_points, ...,
+    projection=projection, lines=lignes[k]), soit exactement les passes correspondantes de la
+    mission complète.
+    """
+    import numpy as np
+    
+    polygon = np.asarray(polygon_points, dtype=float)
+    projection = LocalProjection.for_points(polygon, sweep_angle)
+    metric = _metric_polygon(polygon, projection)
+    _, _, _, dy = _footprint(altitude, frontal_cov, lateral_cov, sensor_width, sensor_height, focal_length)
+    _, _, _, scan_ys = _sweep_grid(
+        metric, altitude, frontal_cov, lateral_cov, sensor_width, sensor_height, focal_length
+    )
+    span_line, x_start, x_end, _, _ = _polygon_spans(metric, scan_ys)
+    
+    # Durée de chaque segment, transition vers le segment suivant (sens alterné) comprise
+    forward = np.arange(len(span_line)) % 2 == 0
+    exit_x = np.where(forward, x_end, x_start)
+    entry_x = np.where(forward, x_start, x_end)
+    transition = np.hypot(entry_x[1:] - exit_x[:-1], (span_line[1:] - span_line[:-1]) * dy)
+    link_time = transition / drone_speed + turn_time
+    span_time = np.abs(x_end - x_start) / drone_speed
+    span_time[:-1] += link_time
+    
+    # Coupes : première ligne de chaque sous-zone, au plus près des multiples de la durée / n
+    n_lines = len(scan_ys)
+    n_parts = max(1, min(int(n_parts), n_lines))
+    elapsed = np.r_[0.0, np.cumsum(np.bincount(span_line, weights=span_time, minlength=n_lines))]
+    targets = elapsed[-1] * np.arange(1, n_parts) / n_parts
+    after = np.clip(np.searchsorted(elapsed, targets), 1, n_lines)
+    nearest = np.where(targets - elapsed[after - 1] < elapsed[after] - targets, after - 1, after)
+    cuts = [0]
+    for k, line in enumerate(nearest, 1):
+        cuts.append(min(max(int(line), cuts[-1] + 1), n_lines - (n_parts - k)))
+    cuts.append(n_lines)
+    
+    # Sous-polygones (affichage, export des zones) : les sommets d'origine sont repris tels
+    # quels, seuls les points de coupe sont reprojetés
+    sub_polygons = []
+    durations = []
+    for start, stop in zip(cuts[:-1], cuts[1:]):
+        part = metric
+        source = np.arange(len(metric))
+        for line, keep_above in ((start, True), (stop, False)):
+            if 0 < line < n_lines:
+                part, kept = _clip_half_plane(part, scan_ys[line] - dy / 2, keep_above)
+                source = np.where(kept >= 0, source[kept], -1)
+        lats, lons = projection.to_geographic(part[:, 1], part[:, 0])
+        geographic = np.column_stack((lats, lons))
+        geographic[source >= 0] = polygon[source[source >= 0], :2]
+        sub_polygons.append([tuple(point) for point in geographic.tolist()])
+        # Sans la transition vers la sous-zone suivante : chaque drone s'arrête à sa dernière passe
+        duration = elapsed[stop] - elapsed[start]
+        last = np.searchsorted(span_line, stop) - 1
+        if stop < n_lines and last >= 0:
+            duration -= link_time[last]
+        durations.append(float(duration))
+    return sub_polygons, list(zip(cuts[:-1], cuts[1:])), durations, projection
+
+# ---------------------------
+# Génération par tuiles des grandes zones
+# ---------------------------
+# Côté des tuiles (m) de generate_waypoints_polygon_tiled
+TILE_SIZE = 2000.0
+
+def _tile_waypoints(span_y, x_start, x_end, start_inside, end_inside, reverse, first_position,
+                    x_min, x_max, dx, projection):
+    """
+    Waypoints d'une tuile : points des segments de passe d'abscisse comprise dans
+    [x_min, x_max[ (bornes propres à chaque segment), placés comme dans _assemble_spans sur
+    toute la longueur du segment pour se raccorder exactement aux tuiles voisines.
+    Exécuté dans un processus de travail de generate_waypoints_polygon_tiled.
+    Retourne (position dans la mission complète, lat, lon) des waypoints retenus.
+    """
+    import numpy as np
+    
+    n_points = np.maximum(1, np.ceil(np.abs(x_end - x_start) / dx).astype(np.int64)) + 1
+    
+    # Rangs (depuis x_start) des points de la tuile, avec un point de marge de chaque côté ;
+    # le filtre sur l'abscisse calculée tranche ensuite exactement
+    step = (x_end - x_start) / (n_points - 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        low = np.where(step > 0, np.floor((x_min - x_start) / step) - 1, 0)
+        high = np.where(step > 0, np.floor((x_max - x_start) / step) + 2, n_points)
+    low = np.clip(low, 0, n_points).astype(np.int64)
+    high = np.clip(high, 0, n_points).astype(np.int64)
+    count = high - low
+    
+    span = np.repeat(np.arange(len(span_y)), count)
+    m = np.arange(len(span)) - np.repeat(np.cumsum(count) - count, count) + low[span]
+    frac = m / (n_points[span] - 1)
+    xs = x_start[span] + frac * (x_end[span] - x_start[span])
+    
+    kept = (xs >= x_min[span]) & (xs < x_max[span])
+    at_start = m == 0
+    at_end = m == n_points[span] - 1
+    kept[at_start] &= start_inside[span[at_start]]
+    kept[at_end] &= end_inside[span[at_end]]
+    
+    position = first_position[span] + np.where(reverse[span], n_points[span] - 1 - m, m)
+    lats, lons = projection.to_geographic(xs[kept], span_y[span[kept]])
+    return position[kept], lats, lons
+
+def generate_waypoints_polygon_tiled(polygon_points, altitude, frontal_cov, lateral_cov,
+                                     sensor_width, sensor_height, focal_length, endpoints_only=False,
+                                     sweep_angle=0.0, projection=None, tile_size=TILE_SIZE,
+                                     executor=None):
+    """
+    generate_waypoints_polygon_array pour les grandes zones (plusieurs km²), calculée par
+    tuiles en parallèle. Le plan métrique est découpé en une grille de tuiles de tile_size
+    mètres (rangées de lignes de balayage entières, colonnes en abscisse) ; l'essentiel du
+    calcul, placement des waypoints le long des passes et conversion en (lat, lon), est fait
+    tuile par tuile dans executor (concurrent.futures, par exemple le ProcessPoolExecutor de
+    batch_missions.py ; None = dans le processus courant).
+    Les segments de passe (intersections avec le contour) sont calculés une seule fois pour
+    toute la zone : chaque tuile place ses points sur la même subdivision des segments que la
+    mission complète et connaît leur rang dans le boustrophédon. Les passes se raccordent donc
+    exactement d'une tuile à l'autre et l'assemblage se réduit à recopier chaque point à sa
+    position : le résultat est identique à generate_waypoints_polygon_array.
+    Avec endpoints_only (deux points par passe), la génération directe suffit.
+    """
+    import numpy as np
+    
+    polygon = np.asarray(polygon_points, dtype=float)
+    if projection is None:
+        projection = LocalProjection.for_points(polygon, sweep_angle)
+    camera = (altitude, frontal_cov, lateral_cov, sensor_width, sensor_height, focal_length)
+    if endpoints_only:
+        return generate_waypoints_polygon_array(polygon, *camera, True, projection=projection)
+    
+    metric = _metric_polygon(polygon, projection)
+    fov_width, fov_height, dx, scan_ys = _sweep_grid(metric, *camera)
+    span_line, x_start, x_end, start_inside, end_inside = _polygon_spans(metric, scan_ys)
+    n_spans = len(span_line)
+    n_points = np.maximum(1, np.ceil(np.abs(x_end - x_start) / dx).astype(np.int64)) + 1
+    first_position = np.cumsum(n_points) - n_points
+    reverse = np.arange(n_spans) % 2 == 1
+    span_y = scan_ys[span_line]
+    
+    # Tuiles traversées par chaque segment ; les bornes d'un segment dans ses tuiles extrêmes
+    # sont ouvertes, pour ne perdre aucun point arrondi au-delà de x_start ou x_end
+    origin_x = metric[:, 1].min()
+    row = ((span_y - scan_ys[0]) // tile_size).astype(np.int64)
+    first_column = ((x_start - origin_x) // tile_size).astype(np.int64)
+    last_column = ((x_end - origin_x) // tile_size).astype(np.int64)
+    n_tiles = last_column - first_column + 1
+    piece = np.repeat(np.arange(n_spans), n_tiles)
+    column = first_column[piece] + np.arange(len(piece)) - np.repeat(np.cumsum(n_tiles) - n_tiles, n_tiles)
+    x_min = np.where(column == first_column[piece], -np.inf, origin_x + column * tile_size)
+    x_max = np.where(column == last_column[piece], np.inf, origin_x + (column + 1) * tile_size)
+    
+    tile = row[piece] * (int(last_column.max()) + 1 if n_spans else 1) + column
+    order = np.argsort(tile, kind='stable')
+    bounds = np.flatnonzero(np.r_[True, tile[order][1:] != tile[order][:-1], True])
+    jobs = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        pieces = order[start:stop]
+        spans = piece[pieces]
+        jobs.append((span_y[spans], x_start[spans], x_end[spans], start_inside[spans],
+                     end_inside[spans], reverse[spans], first_position[spans],
+                     x_min[pieces], x_max[pieces], dx, projection))
+    
+    # Assemblage : chaque point à sa position dans le boustrophédon de la mission complète
+    total = int(n_points.sum())
+    lats = np.empty(total)
+    lons = np.empty(total)
+    kept = np.zeros(total, dtype=bool)
+    if jobs:
+        run = map if executor is None else executor.map
+        for position, tile_lats, tile_lons in run(_tile_waypoints, *zip(*jobs)):
+            lats[position] = tile_lats
+            lons[position] = tile_lons
+            kept[position] = True
+    pass_index = np.repeat(np.arange(n_spans), n_points)[kept]
+    return _waypoint_block(lats[kept], lons[kept], altitude), pass_index, n_spans, fov_width, fov_height
+
+# ---------------------------
+# Transfert des waypoints vers la carte
+# ---------------------------
+def pack_coordinates(waypoints):
+    """
+    Encode les (lat, lon) des waypoints pour la carte : flottants 64 bits little-endian
+    entrelacés [lat0, lon0, lat1, lon1, ...], en base64. La page les décode directement en
+    Float64Array (web/mission_map.js), sans générer ni analyser de code JavaScript.
+    waypoints est une Mission ou un tableau / une séquence de (lat, lon, alt).
+    """
+    import base64
+    import numpy as np
+
+    if len(waypoints) == 0:
+        return ""
+    if isinstance(waypoints, Mission):
+        waypoints = waypoints.waypoints
+    coords = np.asarray(waypoints, dtype=float)[:, :2]
+    return base64.b64encode(np.ascontiguousarray(coords, dtype="<f8").tobytes()).decode("ascii")
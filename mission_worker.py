@@ -0,0 +1,85 @@
+"""
+Exécution des calculs de mission hors du thread de l'interface Qt.
+
+Une MissionTask exécute une fonction de calcul dans le QThreadPool global et communique avec
+l'interface uniquement par signaux (livrés dans le thread de l'interface) : progression,
+résultat, erreur ou annulation. La fonction reçoit un callback progress(étape, fait, total)
+qui lève MissionCancelled dès que cancel() a été demandé ; l'annulation est donc prise en
+compte au prochain point de progression (par exemple tous les 1000 Placemark à l'export).
+
+Utilisation :
+    task = MissionTask(compute, polygon, altitude)   # compute(progress, polygon, altitude)
+    task.signals.finished.connect(on_result)
+    task.start()
+    ...
+    task.cancel()
+"""
+import threading
+import traceback
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class MissionCancelled(Exception):
+    """Levée par le callback de progression d'une tâche annulée"""
+
+
+class MissionSignals(QObject):
+    progress = pyqtSignal(str, int, int)    # étape, fait, total
+    finished = pyqtSignal(object)           # valeur retournée par la fonction
+    failed = pyqtSignal(str)                # message d'erreur
+    cancelled = pyqtSignal()
+
+
+class MissionTask(QRunnable):
+    """Tâche de calcul annulable, exécutée dans QThreadPool.globalInstance()"""
+
+    # Tâches lancées et pas encore terminées : elles restent référencées côté Python même si
+    # l'appelant les abandonne (aperçu remplacé par un plus récent)
+    _active = set()
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = MissionSignals()
+        self._cancel = threading.Event()
+        # La durée de vie est gérée côté Python (_active), pas par le QThreadPool
+        self.setAutoDelete(False)
+        for signal in (self.signals.finished, self.signals.failed, self.signals.cancelled):
+            signal.connect(self._release)
+
+    def start(self):
+        MissionTask._active.add(self)
+        QThreadPool.globalInstance().start(self)
+        return self
+
+    def _release(self, *_):
+        MissionTask._active.discard(self)
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def is_cancelled(self):
+        return self._cancel.is_set()
+
+    def progress(self, stage, done=0, total=0):
+        if self._cancel.is_set():
+            raise MissionCancelled()
+        self.signals.progress.emit(stage, done, total)
+
+    def run(self):
+        try:
+            result = self.fn(self.progress, *self.args, **self.kwargs)
+        except MissionCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+        else:
+            if self._cancel.is_set():
+                self.signals.cancelled.emit()
+            else:
+                self.signals.finished.emit(result)
@@ -0,0 +1,3842 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x05\x51\
+\x43\
+\x6f\x70\x79\x72\x69\x67\x68\x74\x20\x28\x63\x29\x20\x32\x30\x31\
+\x30\x2d\x32\x30\x31\x39\x2c\x20\x56\x6c\x61\x64\x69\x6d\x69\x72\
+\x20\x41\x67\x61\x66\x6f\x6e\x6b\x69\x6e\x0a\x43\x6f\x70\x79\x72\
+\x69\x67\x68\x74\x20\x28\x63\x29\x20\x32\x30\x31\x30\x2d\x32\x30\
+\x31\x31\x2c\x20\x43\x6c\x6f\x75\x64\x4d\x61\x64\x65\x0a\x41\x6c\
+\x6c\x20\x72\x69\x67\x68\x74\x73\x20\x72\x65\x73\x65\x72\x76\x65\
+\x64\x2e\x0a\x0a\x52\x65\x64\x69\x73\x74\x72\x69\x62\x75\x74\x69\
+\x6f\x6e\x20\x61\x6e\x64\x20\x75\x73\x65\x20\x69\x6e\x20\x73\x6f\
+\x75\x72\x63\x65\x20\x61\x6e\x64\x20\x62\x69\x6e\x61\x72\x79\x20\
+\x66\x6f\x72\x6d\x73\x2c\x20\x77\x69\x74\x68\x20\x6f\x72\x20\x77\
+\x69\x74\x68\x6f\x75\x74\x20\x6d\x6f\x64\x69\x66\x69\x63\x61\x74\
+\x69\x6f\x6e\x2c\x20\x61\x72\x65\x0a\x70\x65\x72\x6d\x69\x74\x74\
+\x65\x64\x20\x70\x72\x6f\x76\x69\x64\x65\x64\x20\x74\x68\x61\x74\
+\x20\x74\x68\x65\x20\x66\x6f\x6c\x6c\x6f\x77\x69\x6e\x67\x20\x63\
+\x6f\x6e\x64\x69\x74\x69\x6f\x6e\x73\x20\x61\x72\x65\x20\x6d\x65\
+\x74\x3a\x0a\x0a\x20\x20\x20\x31\x2e\x20\x52\x65\x64\x69\x73\x74\
+\x72\x69\x62\x75\x74\x69\x6f\x6e\x73\x20\x6f\x66\x20\x73\x6f\x75\
+\x72\x63\x65\x20\x63\x6f\x64\x65\x20\x6d\x75\x73\x74\x20\x72\x65\
+\x74\x61\x69\x6e\x20\x74\x68\x65\x20\x61\x62\x6f\x76\x65\x20\x63\
+\x6f\x70\x79\x72\x69\x67\x68\x74\x20\x6e\x6f\x74\x69\x63\x65\x2c\
+\x20\x74\x68\x69\x73\x20\x6c\x69\x73\x74\x20\x6f\x66\x0a\x20\x20\
+\x20\x20\x20\x20\x63\x6f\x6e\x64\x69\x74\x69\x6f\x6e\x73\x20\x61\
+\x6e\x64\x20\x74\x68\x65\x20\x66\x6f\x6c\x6c\x6f\x77\x69\x6e\x67\
+\x20\x64\x69\x73\x63\x6c\x61\x69\x6d\x65\x72\x2e\x0a\x0a\x20\x20\
+\x20\x32\x2e\x20\x52\x65\x64\x69\x73\x74\x72\x69\x62\x75\x74\x69\
+\x6f\x6e\x73\x20\x69\x6e\x20\x62\x69\x6e\x61\x72\x79\x20\x66\x6f\
+\x72\x6d\x20\x6d\x75\x73\x74\x20\x72\x65\x70\x72\x6f\x64\x75\x63\
+\x65\x20\x74\x68\x65\x20\x61\x62\x6f\x76\x65\x20\x63\x6f\x70\x79\
+\x72\x69\x67\x68\x74\x20\x6e\x6f\x74\x69\x63\x65\x2c\x20\x74\x68\
+\x69\x73\x20\x6c\x69\x73\x74\x0a\x20\x20\x20\x20\x20\x20\x6f\x66\
+\x20\x63\x6f\x6e\x64\x69\x74\x69\x6f\x6e\x73\x20\x61\x6e\x64\x20\
+\x74\x68\x65\x20\x66\x6f\x6c\x6c\x6f\x77\x69\x6e\x67\x20\x64\x69\
+\x73\x63\x6c\x61\x69\x6d\x65\x72\x20\x69\x6e\x20\x74\x68\x65\x20\
+\x64\x6f\x63\x75\x6d\x65\x6e\x74\x61\x74\x69\x6f\x6e\x20\x61\x6e\
+\x64\x2f\x6f\x72\x20\x6f\x74\x68\x65\x72\x20\x6d\x61\x74\x65\x72\
+\x69\x61\x6c\x73\x0a\x20\x20\x20\x20\x20\x20\x70\x72\x6f\x76\x69\
+\x64\x65\x64\x20\x77\x69\x74\x68\x20\x74\x68\x65\x20\x64\x69\x73\
+\x74\x72\x69\x62\x75\x74\x69\x6f\x6e\x2e\x0a\x0a\x54\x48\x49\x53\
+\x20\x53\x4f\x46\x54\x57\x41\x52\x45\x20\x49\x53\x20\x50\x52\x4f\
+\x56\x49\x44\x45\x44\x20\x42\x59\x20\x54\x48\x45\x20\x43\x4f\x50\
+\x59\x52\x49\x47\x48\x54\x20\x48\x4f\x4c\x44\x45\x52\x53\x20\x41\
+\x4e\x44\x20\x43\x4f\x4e\x54\x52\x49\x42\x55\x54\x4f\x52\x53\x20\
+\x22\x41\x53\x20\x49\x53\x22\x20\x41\x4e\x44\x20\x41\x4e\x59\x0a\
+\x45\x58\x50\x52\x45\x53\x53\x20\x4f\x52\x20\x49\x4d\x50\x4c\x49\
+\x45\x44\x20\x57\x41\x52\x52\x41\x4e\x54\x49\x45\x53\x2c\x20\x49\
+\x4e\x43\x4c\x55\x44\x49\x4e\x47\x2c\x20\x42\x55\x54\x20\x4e\x4f\
+\x54\x20\x4c\x49\x4d\x49\x54\x45\x44\x20\x54\x4f\x2c\x20\x54\x48\
+\x45\x20\x49\x4d\x50\x4c\x49\x45\x44\x20\x57\x41\x52\x52\x41\x4e\
+\x54\x49\x45\x53\x20\x4f\x46\x0a\x4d\x45\x52\x43\x48\x41\x4e\x54\
+\x41\x42\x49\x4c\x49\x54\x59\x20\x41\x4e\x44\x20\x46\x49\x54\x4e\
+\x45\x53\x53\x20\x46\x4f\x52\x20\x41\x20\x50\x41\x52\x54\x49\x43\
+\x55\x4c\x41\x52\x20\x50\x55\x52\x50\x4f\x53\x45\x20\x41\x52\x45\
+\x20\x44\x49\x53\x43\x4c\x41\x49\x4d\x45\x44\x2e\x20\x49\x4e\x20\
+\x4e\x4f\x20\x45\x56\x45\x4e\x54\x20\x53\x48\x41\x4c\x4c\x20\x54\
+\x48\x45\x0a\x43\x4f\x50\x59\x52\x49\x47\x48\x54\x20\x48\x4f\x4c\
+\x44\x45\x52\x20\x4f\x52\x20\x43\x4f\x4e\x54\x52\x49\x42\x55\x54\
+\x4f\x52\x53\x20\x42\x45\x20\x4c\x49\x41\x42\x4c\x45\x20\x46\x4f\
+\x52\x20\x41\x4e\x59\x20\x44\x49\x52\x45\x43\x54\x2c\x20\x49\x4e\
+\x44\x49\x52\x45\x43\x54\x2c\x20\x49\x4e\x43\x49\x44\x45\x4e\x54\
+\x41\x4c\x2c\x0a\x53\x50\x45\x43\x49\x41\x4c\x2c\x20\x45\x58\x45\
+\x4d\x50\x4c\x41\x52\x59\x2c\x20\x4f\x52\x20\x43\x4f\x4e\x53\x45\
+\x51\x55\x45\x4e\x54\x49\x41\x4c\x20\x44\x41\x4d\x41\x47\x45\x53\
+\x20\x28\x49\x4e\x43\x4c\x55\x44\x49\x4e\x47\x2c\x20\x42\x55\x54\
+\x20\x4e\x4f\x54\x20\x4c\x49\x4d\x49\x54\x45\x44\x20\x54\x4f\x2c\
+\x20\x50\x52\x4f\x43\x55\x52\x45\x4d\x45\x4e\x54\x0a\x4f\x46\x20\
+\x53\x55\x42\x53\x54\x49\x54\x55\x54\x45\x20\x47\x4f\x4f\x44\x53\
+\x20\x4f\x52\x20\x53\x45\x52\x56\x49\x43\x45\x53\x3b\x20\x4c\x4f\
+\x53\x53\x20\x4f\x46\x20\x55\x53\x45\x2c\x20\x44\x41\x54\x41\x2c\
+\x20\x4f\x52\x20\x50\x52\x4f\x46\x49\x54\x53\x3b\x20\x4f\x52\x20\
+\x42\x55\x53\x49\x4e\x45\x53\x53\x20\x49\x4e\x54\x45\x52\x52\x55\
+\x50\x54\x49\x4f\x4e\x29\x0a\x48\x4f\x57\x45\x56\x45\x52\x20\x43\
+\x41\x55\x53\x45\x44\x20\x41\x4e\x44\x20\x4f\x4e\x20\x41\x4e\x59\
+\x20\x54\x48\x45\x4f\x52\x59\x20\x4f\x46\x20\x4c\x49\x41\x42\x49\
+\x4c\x49\x54\x59\x2c\x20\x57\x48\x45\x54\x48\x45\x52\x20\x49\x4e\
+\x20\x43\x4f\x4e\x54\x52\x41\x43\x54\x2c\x20\x53\x54\x52\x49\x43\
+\x54\x20\x4c\x49\x41\x42\x49\x4c\x49\x54\x59\x2c\x20\x4f\x52\x0a\
+\x54\x4f\x52\x54\x20\x28\x49\x4e\x43\x4c\x55\x44\x49\x4e\x47\x20\
+\x4e\x45\x47\x4c\x49\x47\x45\x4e\x43\x45\x20\x4f\x52\x20\x4f\x54\
+\x48\x45\x52\x57\x49\x53\x45\x29\x20\x41\x52\x49\x53\x49\x4e\x47\
+\x20\x49\x4e\x20\x41\x4e\x59\x20\x57\x41\x59\x20\x4f\x55\x54\x20\
+\x4f\x46\x20\x54\x48\x45\x20\x55\x53\x45\x20\x4f\x46\x20\x54\x48\
+\x49\x53\x0a\x53\x4f\x46\x54\x57\x41\x52\x45\x2c\x20\x45\x56\x45\
+\x4e\x20\x49\x46\x20\x41\x44\x56\x49\x53\x45\x44\x20\x4f\x46\x20\
+\x54\x48\x45\x20\x50\x4f\x53\x53\x49\x42\x49\x4c\x49\x54\x59\x20\
+\x4f\x46\x20\x53\x55\x43\x48\x20\x44\x41\x4d\x41\x47\x45\x2e\x0a\
+\
+\x00\x00\x0c\xdc\
+\x00\
+\x00\x37\xc0\x78\x9c\xbd\x1b\x6b\x6f\xe4\xb6\xf1\x73\x03\xe4\x3f\
+\x30\x36\xd2\xd8\xc1\x6a\xbd\x0f\xaf\x1f\x6b\xa4\x45\x9a\x07\x9a\
+\x22\x57\x04\x6d\x1a\xf4\x5b\x41\x49\xdc\x15\x6b\xad\xa8\x4a\x5c\
+\xef\xda\xc1\xfd\xf7\x0e\x5f\x12\x49\x51\x8f\xbb\x14\xbd\x83\x7d\
+\xbb\xe4\x70\x38\x33\x9c\x37\x79\x37\x5f\xa2\x8a\xfc\xe7\x48\x2b\
+\x92\xa2\x9a\xbf\xe6\xa4\x46\x5f\xde\x7c\xfa\xc9\xa7\x9f\xcc\x73\
+\x82\x77\x39\xe1\x51\x89\x0b\x32\xb3\xbe\x73\x9a\x3b\xdf\x0f\xb8\
+\x7a\x26\x55\x44\x13\x56\x04\x86\xeb\x0c\xa7\xec\xe4\xaf\x8f\x00\
+\x98\x63\x5a\x90\x6a\xe6\xed\x84\xfe\x80\xea\x97\x7d\x60\x34\xc1\
+\xc5\x0b\xae\xed\x89\x37\xc6\x0e\x51\xcc\xce\xf6\x18\x3d\xe0\x3d\
+\x89\x72\xfc\xea\x62\x96\x03\xe8\xd7\x4f\x3f\xf9\x5d\xc9\x6a\xca\
+\x29\x2b\xb6\x08\xc7\x35\xcb\x8f\x9c\x3c\xc1\x68\x4e\x76\x7c\x8b\
+\x16\xe2\x23\x67\xa5\xfe\xf4\xde\x42\xd0\xd0\x2b\x91\xb0\x17\x52\
+\xed\x72\x76\xda\xa2\x8c\xa6\x29\x29\x7c\xe8\x8f\x11\x91\x44\x1c\
+\x9d\x48\xfc\x4c\x79\x74\xac\xc5\x38\xc9\x49\x02\x64\x15\xac\x90\
+\x44\x22\x84\xa2\x03\x7b\xeb\x9d\x94\x7f\x7a\x26\x1d\xc4\x69\x85\
+\xf7\xed\x24\x10\x7e\xf3\x25\xfa\xa9\x22\x2f\xa4\xe0\x35\xfa\xe1\
+\xbb\xe5\x12\xed\x2a\x76\x00\xde\xf6\x59\x0e\x3f\x9c\x16\x7b\x24\
+\x58\xaa\x11\x2d\x50\x9c\x1f\x89\x54\x11\x87\xdb\xed\x56\xed\x09\
+\x92\x95\x8c\xc4\x38\x79\xde\x57\xec\x58\xa4\x5b\xc4\x2b\x5c\xd4\
+\x25\xae\x00\x3d\xec\xa7\xb6\xfb\x3b\xde\xe1\x8a\x82\xea\x15\x29\
+\xa9\x6a\x41\x4b\x54\x11\xd8\x08\xcb\x8d\x10\x60\xd1\x5f\x63\xc2\
+\x39\x48\xfd\x44\x79\x86\x78\x46\xeb\x19\x8a\x8f\x1c\x7d\x93\x01\
+\x81\x04\xd1\x1a\x9d\x58\x55\x7b\xf4\xd4\x0a\xb7\x43\x9f\x24\x4a\
+\x29\x87\xda\x13\x78\xda\x36\x52\x61\x25\xa7\x07\xfa\xa6\xd4\xb2\
+\xc2\x35\x6f\xe5\x92\x01\x23\xb0\x31\xe6\xa8\x34\x12\xca\x4e\x48\
+\xea\x53\x8d\x2e\x6a\x0e\x64\x26\x19\x20\xbb\x40\xa7\x8c\x14\x28\
+\x67\x38\x15\xe2\x2a\xc8\x49\x8b\x6c\x94\x34\x4f\xb7\x4e\x34\xe5\
+\xd9\x16\x2d\xef\x16\x8b\xf2\x2c\xe8\xc8\x88\x38\x03\x7b\xc4\x90\
+\x2d\x05\xbb\x63\xd5\x21\x62\x15\xdd\x53\xd0\xe9\x45\x57\x73\x27\
+\xeb\x5e\x4a\xeb\x12\xf8\xda\xc2\x09\xb3\xe4\xb9\x95\x40\xc0\x06\
+\xc0\x42\xb7\x70\x40\x35\xe1\xe2\x23\x3a\xe0\x73\x24\xc9\x46\x29\
+\x49\x72\x52\x61\xa9\x06\x75\x46\xcb\x12\xbc\x0a\xe8\xcc\x5f\xc0\
+\x52\x73\xfc\x19\xba\xfa\xb7\xfc\x30\x67\xd5\xfe\x1a\xad\xe7\x67\
+\x29\x9c\xf0\x16\xf4\x00\x5b\x1c\x70\x29\xce\x38\xae\xd8\x33\xc8\
+\x16\x10\x7d\xff\x3d\xa2\x3b\xf4\xca\x8e\x70\x2e\x2f\xa4\xdd\x18\
+\xa4\xb3\x58\x7c\x2e\xd4\x26\x20\xf4\x16\x69\x33\x24\x0c\x18\x78\
+\x55\xbe\xc5\xf3\x37\x01\x70\x2d\x2c\x09\x0d\x84\x8d\x40\x2b\x99\
+\x4e\x85\x96\x2a\x30\x0c\x0b\x13\x63\x0e\xae\x07\xb1\x3c\x58\x4b\
+\x4a\xc2\xe6\xd1\x67\xf4\x50\xb2\x8a\x63\x69\x8e\x72\xd6\xa8\x58\
+\x60\xfa\xbd\x13\x0b\x9a\x6d\xda\x5d\xd8\x31\xc9\xa4\x2b\x56\x0e\
+\xec\x50\xeb\x21\x9c\x28\x37\x0b\xac\x45\x67\xf9\xfb\x55\xb9\xd7\
+\x81\xc9\xa0\xc7\xf5\xb6\x12\xce\xab\x6f\x2b\x5a\x68\x5a\x04\x32\
+\xd0\xab\xef\x71\x9e\x0b\x4f\x84\xc0\x48\x84\xee\x9c\x32\x9a\x80\
+\x92\x32\x52\x17\x5f\x80\xea\x1e\x4b\xc1\xa8\xb5\x4c\xea\x8d\x47\
+\xa2\x71\x93\x03\x5b\x4d\x25\x7b\xba\xd0\xc2\x9b\xea\xd1\xfe\xb8\
+\xd4\x38\x06\x5c\x46\x8d\xf7\x06\x98\x9c\x55\x01\x37\x1c\x40\x82\
+\xc7\xd1\x54\xfb\x18\x5f\x6d\x96\x33\xb4\x7c\x80\x5f\xab\xd5\xe3\
+\x0c\x2d\xe6\xb7\xd7\x1e\xca\x46\xf9\x76\x34\x07\xff\xbd\x05\xe3\
+\xcd\xc0\xe9\x4a\x95\x7a\xa1\x35\x8d\x69\x4e\xf9\xeb\x50\xfc\x8c\
+\x84\x2b\x05\xf7\xf1\xab\xb7\xc2\x42\xf4\x3e\x90\x0c\xd8\x3e\x74\
+\x61\xbb\x4f\xf9\x45\xc6\x4f\x80\x8a\x6a\xfa\x26\x23\x40\xcc\x2a\
+\x08\x06\x62\xa8\x09\xa2\xfd\xd3\x6f\x11\x85\xd0\x71\xde\xa2\x87\
+\xc5\xa2\xf5\x8f\x10\x81\x9e\xb1\x0c\x75\x52\xcd\x32\xce\xcb\x7a\
+\x7b\x73\x13\x1f\xf7\x6f\x34\x07\x67\x07\x5b\xca\x7f\xc1\xe9\xdd\
+\xd4\x19\x3b\xfd\x0b\x66\xe6\xc9\x9e\xfe\x91\xa6\x5f\x3d\x3c\x3c\
+\xac\x97\x8f\xae\xbb\xf2\x7d\x93\x56\x91\xbe\xc0\xff\xbe\x93\xac\
+\x99\x54\x00\xfd\x8a\x1a\x8a\x6f\x81\x62\xe4\x82\xb6\x8e\xc7\x05\
+\x5d\x69\xd0\x30\x41\x01\x9c\x41\xc7\x67\x03\x6e\x7c\x40\xdb\x9f\
+\xda\x80\x77\x3e\x20\x67\x2c\xe7\xb4\x34\x64\xda\xa0\x1b\x0f\xb4\
+\x64\xe5\x31\x04\x78\xdf\xe5\x1c\xc2\x8a\x02\x54\x39\xa5\x0d\xbd\
+\xec\x92\x5a\xb6\x27\x11\x16\x94\x05\xfd\x72\xc8\x85\x14\x4a\xe2\
+\x84\x72\x2f\x8e\xab\xaf\x72\x13\x80\x57\xe9\x12\x81\x78\x46\x85\
+\x79\x1d\xab\xfc\xea\x32\x25\x3b\x7c\xcc\xf9\xe5\x2f\xef\x7e\x14\
+\x86\xd5\x86\x66\x5a\xe4\x60\xa7\x51\x13\xa1\xc3\xd9\xac\xa4\x49\
+\xea\xa6\xcc\x67\x58\x8e\x0c\x9c\x48\x4d\xbc\xf4\xde\x80\xb8\xc9\
+\x71\x45\x72\x88\xe2\x2f\x24\xa4\xf6\x25\xa3\x05\xd8\x74\xa4\xd2\
+\xa1\x2d\x92\xd6\x99\x93\x9f\xb0\x18\x4e\x9f\x10\xec\xfb\xc3\x77\
+\xe8\x31\x5a\x2e\x1a\x57\x2b\xa3\x35\x3e\x72\xa6\x3c\xac\x8f\x41\
+\xcc\x74\x7c\x00\x2b\xed\x00\x17\x33\xce\xb5\xbb\x0c\x33\x6d\x1f\
+\x61\x90\x4c\xcb\x60\xec\x4d\x24\xca\x70\xd2\x5f\x89\x03\x93\xf3\
+\x95\xe5\x43\xde\x87\xa9\x52\x1f\x03\x30\xa2\xb6\x90\x10\x56\x91\
+\xe1\x7b\x5f\x73\x00\x50\x54\x60\x80\x11\x90\x02\x0c\x92\x29\x5c\
+\x09\x2f\xc4\xb3\x30\x6d\x43\x48\x24\x44\x88\xe1\xe0\x22\x30\x49\
+\xc8\x20\x23\x29\x88\xe5\xc2\x52\x51\x97\xd3\xa1\xb5\x46\x02\xa1\
+\xe5\x52\x08\x43\x8b\x95\x70\x42\x4b\x07\x38\xd5\x6b\xf5\xe9\x58\
+\x8b\xb5\xfa\xcb\x08\x8b\x85\x63\x86\x50\x02\x1f\x20\x79\x12\x8a\
+\xd3\x29\x71\xc5\x74\x24\xa6\x03\xd9\xd3\x09\x9c\x77\x94\x64\xb8\
+\xd8\x93\x2d\x62\x25\x4e\x20\x0a\xf9\x24\x06\xd6\x4b\x77\xa4\x8a\
+\x45\xb5\xc6\x44\x20\x3b\x77\xd7\x6a\xac\x21\x20\x8e\xae\x6a\x24\
+\x0c\x1c\x57\x76\xbd\x37\x0d\x54\xfe\x99\x00\x3a\x42\x77\xe3\xef\
+\x86\x38\x59\x06\xa3\xaf\x92\xaf\x0e\xd9\xa3\x35\x0a\x92\xec\xd5\
+\xc3\x00\x0d\x4f\x63\x55\x4e\x43\x00\x1a\xa0\xc9\x39\xca\x06\xed\
+\x47\xa1\x0a\x1d\x63\x87\x65\x21\xfa\x4d\x8d\x92\x63\x4c\x93\x28\
+\x26\x6f\x94\x54\x57\x8b\x19\xfc\x85\xe1\xd9\xf2\xba\xef\x8c\x9d\
+\xb1\xe9\x78\x3a\x0a\xd0\x11\xe0\x04\x3c\x23\x82\xf0\x1b\x1b\x22\
+\x73\xef\xb1\x9b\x90\x84\xfc\x4e\x46\xcf\x5c\x87\x93\x70\xae\xd3\
+\x77\x50\x90\x53\x92\x4e\xda\xe8\x24\x9a\x26\x3a\x1e\xab\x9a\x55\
+\x1d\x6f\x20\xc3\x86\xc8\xb9\x5f\x14\x1a\x05\x06\x39\xbf\x0a\x28\
+\xbe\x98\xf6\x15\x8e\x1d\x38\xc3\xb9\x98\x78\xb2\xc6\x0d\xd7\x81\
+\x71\xf9\xc7\x8c\x3b\xc1\xa1\x62\x35\x24\x14\xd4\x2d\xf6\xcc\x20\
+\x1a\xa5\xb9\x01\xf5\x11\xb7\xe9\x92\x5f\x46\x1a\xe7\x6a\x50\x84\
+\x82\xb3\xa8\x66\xf6\x22\x99\x70\xa4\x30\x1b\x85\x08\x12\x3c\xbc\
+\x4c\xe7\x8a\x72\x02\xc7\xb9\xcb\xde\x81\xa9\x14\x25\x24\xfa\x18\
+\xd0\xf4\x89\x3f\x30\xd7\x1c\x81\x99\x7b\xaf\xb5\x44\x11\x80\x7e\
+\x8f\x74\x1e\x2c\xba\x60\x86\x76\xe1\x5f\x9d\xe4\xfd\x43\x9b\xa1\
+\x3d\xe5\x7c\xdb\x09\x85\xe2\x98\x67\xfd\xed\x53\x9d\x10\xf5\x66\
+\x3a\x61\xd2\xc6\x4e\xc1\xa2\x6a\x0c\xd4\xa3\xb4\x07\x1c\xa6\xa7\
+\x22\x97\x68\x82\x6c\xfd\x4f\xf3\x4c\x79\xb4\x80\xf1\x88\x73\xc4\
+\x4f\x04\x3f\x77\xdc\x80\x2b\x63\xbb\xa1\x79\x99\xa6\xa9\x40\xc3\
+\x8e\x5c\xc4\xd5\xc1\x76\xb1\xaa\xa8\x75\xed\x7c\xb9\x58\xdc\x3f\
+\x7c\xfd\x30\x00\xdd\x8c\x59\xb6\xdc\x6c\xb3\x2a\xcf\x08\x12\x5e\
+\x9a\x22\x56\x89\x20\x36\x58\x03\xab\xd2\x55\x2d\x4a\x21\x33\x83\
+\xc0\x75\xb9\x7e\xd8\x3d\x79\xbc\xc8\x72\x7e\xb5\xd9\xcc\xcc\xcf\
+\x62\xbe\xb9\x76\xdd\xe4\x9e\x00\x69\x42\x4c\xaf\x25\x03\x03\x29\
+\xb3\xd7\xbe\xfe\x9a\xcc\x3e\xe1\x1b\x64\x08\xb0\xed\xcd\x72\xbe\
+\x41\x17\x7f\x26\xf9\x0b\xe1\x34\xc1\xe8\xaf\xe4\x48\x2e\x66\xe8\
+\xeb\x8a\xe2\x7c\x86\x9a\xf1\x19\xaa\xc1\xd3\x43\x5d\x5b\xd1\x5d\
+\xcf\xc6\x50\x05\xc6\xb8\xea\xb9\x9f\x10\x33\x8a\xe1\xb3\x36\x30\
+\x91\x21\x40\x95\x85\x36\xf0\x23\xf9\x93\x41\x0e\x38\xbb\x53\xac\
+\xe9\xaa\xbe\xc2\x29\x3d\x82\x56\xdc\x06\xb2\x5d\xc0\x89\x67\xfe\
+\xc0\x36\x13\x2e\xc0\x53\x07\xd3\x17\xb9\xdc\xed\x76\x16\xf2\x26\
+\x19\x6e\xce\xec\x32\x49\x92\xa7\xb6\x2a\x5c\xdd\xb9\x65\xa1\xf9\
+\x2e\x0b\x3c\x7f\xb0\xdb\x9b\xe5\xe4\x0c\x4a\x92\xd3\x3d\x84\xc7\
+\x84\x98\xb8\x24\x47\x53\x92\x30\xd5\x83\x6d\x5d\x81\x26\x32\xce\
+\x71\xd3\xda\xed\x67\x56\x47\x01\x65\xa3\xa2\x35\xb5\xdf\x6b\xbf\
+\x6b\xb1\xdd\x56\x61\x9b\xc5\xe7\xe2\xc7\xd5\xac\xa8\x22\x25\xc1\
+\xb2\x4f\xa1\x3f\x86\xf9\xe8\x10\x32\x22\xe4\x5b\xf1\x37\xbc\x70\
+\x47\xab\x1a\x88\xcf\x68\x9e\x5a\x16\x20\x4a\x1a\x59\x5d\xf8\xe7\
+\x6d\x4d\xcb\x02\x62\x54\x1f\xb6\x39\x0e\xe1\x57\x27\x3d\xb4\x85\
+\x86\x08\xee\xe2\xa9\x4b\xa8\x48\x95\x9b\xb7\x11\x92\xd6\x22\x0c\
+\xa6\x4e\x1c\xd4\x0d\x83\xa7\x31\xa1\x99\x91\x38\x8e\x1b\x53\x73\
+\xbb\x92\xc8\xdd\xd6\xee\x63\xac\xbd\x0b\x09\xf3\xdd\xd1\xd8\x75\
+\xa0\x82\x0b\x21\x9e\x7c\x5a\xab\x91\xd3\x5a\x4d\xdc\x6f\xfa\xe1\
+\xad\xc6\x0f\x6f\x65\x55\x9a\xa6\xce\x34\xb9\x53\xb8\xbf\xa2\x9c\
+\x33\x2d\x42\x76\x26\xa7\xc0\xcb\x5b\xfe\x33\x66\x40\xe7\xf2\x01\
+\x9c\xc7\x17\x3f\x1e\x13\x9a\x62\xf4\x0d\xd4\xad\x2c\x27\x5f\xcc\
+\xd0\x3b\x56\xe0\x84\xcd\x20\xf9\x29\x58\x0d\x25\x19\x69\x2c\x5f\
+\x74\x40\x0a\xa7\xc5\xd4\x2f\x15\x9f\x2e\x34\x09\x50\x50\xd9\x90\
+\x29\xda\xa4\x22\x2c\xad\xfc\xba\x5b\x5f\x8f\x8d\x48\x44\x43\x4d\
+\xf4\xdd\xb7\xd7\x7e\xe8\xf2\x3c\xae\x39\x9b\x4d\x57\x21\x26\x39\
+\x34\x99\x97\xa8\x06\x9c\xfc\x58\xdf\x28\xf0\x79\x59\xec\xaf\x2d\
+\xc7\xbd\xf6\x1c\xb7\xf9\xee\xf4\x2c\xd4\xe5\xe5\xff\x86\x80\x68\
+\x75\x6e\x68\xb0\xc0\xb5\xf0\x61\xf7\x26\x4c\x0c\x18\x41\x3f\x05\
+\x9a\xad\xdb\x5b\x97\xad\xdb\x80\x1b\xf4\x4e\xae\x0f\x79\x4e\x6b\
+\x3e\x10\x4f\xc8\x19\x92\x46\xd1\xda\x9f\x40\x5c\x13\x30\x42\x8e\
+\xf1\x43\xf1\x0a\xba\x7a\xae\x3a\xc3\x9d\xcf\x29\x9b\xc9\x4c\x15\
+\xa7\xa9\xbc\x2f\x10\x87\x21\xda\x50\xf2\x83\x3e\x14\xe3\x73\xd7\
+\xeb\x75\x9f\x06\x0f\xec\x53\x43\x05\x97\xe7\x26\xc7\x31\x0f\x0f\
+\x22\xa0\x5d\xcd\x3c\xd9\xa3\x67\xbb\xce\xd5\x44\x99\xee\xd8\xb8\
+\x59\xa8\x9b\x05\x56\x75\xfa\x81\xda\xbe\xc3\x32\x52\x1d\xc3\x51\
+\x5d\xc9\x71\x4c\xf2\xfe\x7b\xe6\x7e\x9a\x4a\x0c\xb9\x8c\x26\xca\
+\xb9\xcb\x69\x23\x82\x93\x65\xe9\xdc\x5c\xd1\x2f\xd9\x46\x91\x3c\
+\x12\xf9\xe9\xce\x75\xdc\xdf\xaa\xb8\x89\x44\x51\x84\xfe\xf1\xb7\
+\x1f\xbd\x9b\x63\x1d\x56\x65\xcd\x14\x35\x75\xc9\xa0\xc9\xda\x55\
+\x96\x31\xda\xd6\x31\x62\xce\x2b\x1a\x1f\xe5\xfd\xb8\xe8\x4b\xd6\
+\x09\x06\x45\xd7\x3c\x0f\x54\x20\x1d\xf1\xd8\x88\x3a\xe5\x89\xf1\
+\x8b\xa1\x34\x1f\xb5\xbf\x16\xf3\xfb\x6b\x5b\x54\x7d\x9d\x69\x7b\
+\xb3\x90\x59\x4b\x26\x22\x91\x05\xb8\xc6\xb0\x30\x3a\xe7\x59\xc0\
+\xc8\x16\x3a\xe9\xe8\x4d\x65\x47\x97\x5b\x19\x64\x07\xc9\x51\xbc\
+\xfd\x10\xa4\xf6\xd7\x60\x1f\xc2\x7e\xcf\x0a\x75\xac\x5e\x98\x5c\
+\x06\x8c\x24\xd8\x16\xb7\x96\x3b\xcd\xf1\x80\x05\xf7\x74\xe5\xbb\
+\x18\x4c\x7e\x39\xe0\x05\xbc\x63\xb4\xeb\x47\x6d\x5a\xf7\xf7\xf7\
+\xbe\xe1\x99\x43\x71\x72\xc0\xe5\x7c\xf9\x64\x2b\xc2\x4a\x5b\x9f\
+\x16\x40\x40\x26\xa7\x8c\x72\x12\xc9\x64\x46\xe0\x3c\x41\x95\x69\
+\x3b\x36\xdb\xad\xfd\xa6\x2b\xdc\x8f\xb6\x94\x4d\xa7\x3b\xda\x15\
+\xdb\xb6\x60\xfc\xca\xce\x6b\xaf\xbd\xc4\x76\x40\x98\x7e\xfe\x6f\
+\xbb\xdf\x28\x90\xe2\x4e\xd9\x5d\x8d\xb4\x79\xef\x75\x37\xf1\x0d\
+\x51\x34\x29\x6b\xec\xb1\x89\xc1\xa4\x63\x00\x30\x54\xc3\x87\xef\
+\xeb\x7e\x2b\x7e\x5f\xa9\x9d\x1c\x73\xe5\xe7\x58\x49\x4e\x4b\xf1\
+\x4a\x45\x45\x52\xad\x62\xad\x3b\x57\x57\x23\xfe\x7b\xc9\xe6\xbe\
+\x24\x7c\x51\x19\xae\xdc\x3d\x3b\x5d\x05\xca\x28\xd5\xb2\x15\x3c\
+\xc3\xaa\x48\xd8\x48\x69\x1a\x80\xc6\xd2\xb4\x39\xd9\x5b\x98\xbb\
+\x44\x2f\x4b\x5e\x06\x94\xca\xd9\xc0\xf2\x1e\x00\xbd\x16\xe6\xfb\
+\x18\xa8\xf7\x96\xf3\x4e\x35\xee\xa2\x29\x5d\x44\xa2\xa4\xe9\x04\
+\x1a\xb5\x42\x5c\xf4\x07\xdf\xc2\xdd\x7a\x85\xa7\x11\xce\xd0\x5b\
+\x4e\xdd\x90\x70\x1c\x68\x64\x16\x86\xfc\xca\x94\xeb\xe2\x86\x4e\
+\xe7\x7a\xff\xde\xbb\xdf\xd7\xdf\xbd\x43\xb1\x84\xa0\xf2\x11\xd9\
+\xa6\x5c\xa8\x99\xce\xd5\x11\xf8\x21\xc6\x31\x27\x57\xb7\x9b\x94\
+\xec\xbb\x57\x45\xfd\x30\xee\xa5\x5a\x0f\x8c\x73\x2d\x14\x80\x19\
+\x55\xbb\x59\xaf\x54\x6c\x5f\x2a\xdd\x7a\x28\x07\x76\xca\x3d\xa9\
+\x5b\xb7\xe1\x7a\x6f\xac\x4d\xaa\x89\xcb\x59\x4d\x22\x70\x47\x5c\
+\xa7\x43\x3d\x96\xd7\xdc\xf2\xdb\xf7\xf9\xcd\x39\x09\x12\xc4\xcf\
+\xc2\xce\x2f\xad\xb7\x58\x41\xbb\x35\x4a\xf0\xe0\x29\xc1\x6d\x1b\
+\xeb\xc4\xd3\x4d\xd1\x0d\x15\xb8\x7f\xc6\x19\x3b\xe0\x19\xfa\x85\
+\x54\x29\x2e\x3a\xbd\x4f\x23\xa7\x64\x2d\xfe\x36\xbb\x86\xd2\x20\
+\x19\x45\x4f\x7a\x3b\xd1\x2e\xf0\x03\x99\xfb\xde\xeb\x23\x24\x69\
+\xe5\x51\x86\xae\xc7\xc7\xc7\xb0\x7a\xa8\x62\x44\x97\x43\xad\x79\
+\x99\x86\x7b\x7f\x53\x54\xa7\xeb\xc3\xc9\xbc\x1b\x92\x80\x57\xea\
+\xdf\x4f\x07\xdd\xa2\xb0\x04\xd1\xb5\x08\x5c\x58\x07\x71\x78\x86\
+\xbd\xd2\x67\xd8\xe4\xc7\x86\x1d\x8d\xda\x3c\x6d\xbb\x28\x2b\xb6\
+\xa7\xe9\xf6\xdb\x7f\xfe\x20\x6a\x80\x9f\x8d\x5d\xcd\xdf\x51\x71\
+\xfd\xc6\x76\x7c\xfe\x0e\x43\xb8\x3c\x5f\xbd\x5b\x2e\xbf\x82\xac\
+\x7b\x71\xbf\x5c\xdc\xdd\x3f\xcc\xd0\xbb\xe5\xca\xfd\xbe\x5a\x7e\
+\x15\xb9\x03\x36\xc0\xf5\x85\x3c\x78\xbd\xed\xff\x6d\xd7\xa9\xb2\
+\xf3\x9c\xb7\x93\xc2\x04\x3b\x52\x1e\x22\xbb\xd1\x34\x1b\x07\xeb\
+\x06\xfd\x29\x8a\x31\x0a\xdf\xf8\x31\x6d\xfe\x96\x36\xb6\xda\xaf\
+\xe3\x7f\x4a\x5f\x54\xe9\xe8\xa5\x00\x30\x2e\x2b\xc0\xfe\xd2\xac\
+\x8b\xfc\xee\xee\xce\x45\xfe\xb3\x7a\xfb\x66\xde\x48\xff\x09\xd7\
+\xc4\xdc\x80\x88\x77\x86\x3c\x23\x08\x0a\xf6\x83\x88\xb1\xf2\x7d\
+\x7a\x86\x6b\x28\x9d\xb8\xb5\xca\xca\x86\xd4\x60\xbf\x6b\xb4\x3b\
+\x18\x7e\x0e\x14\xba\xdf\x70\x48\x0f\xf7\xe1\xd6\x6e\xf1\xb7\x5a\
+\xad\x06\x32\xfd\xc1\xff\xf8\xd0\xff\xf8\x51\x98\x61\x70\x22\x38\
+\xd8\x17\xe2\xbb\xdd\xc7\xf5\x78\x34\xd2\x32\x6d\xd5\x32\xa7\xc9\
+\x73\xe7\x82\xda\x7a\x33\x30\xed\xd1\x9b\x7a\xef\x28\x8c\x26\x26\
+\x70\xcc\xee\xff\xbc\xd1\xb3\xda\x8d\xf6\x03\xc8\x74\xa7\x7f\x5a\
+\x45\x3f\x35\x3f\xa4\x13\xbd\xe2\x52\x1a\x70\xd7\x68\x80\x17\x6a\
+\x06\xa2\x90\xb6\x46\x70\x9a\x17\x8d\xb6\x8b\x3e\x0c\xad\xd4\x7f\
+\x1e\xe9\xf4\x40\x5c\x9e\x3b\x8e\x45\xa9\x6b\x8f\x08\xbb\x6e\xa8\
+\x1f\x7c\x54\xa6\xed\x91\x58\x8f\xf9\x82\x59\x66\xb0\x19\x1b\x44\
+\xe2\xbc\x19\xf4\x2a\x80\x68\xd9\xbd\xf9\xf0\x4c\x71\x94\x0f\xef\
+\x6d\xa3\xeb\x91\x57\x76\x74\xf3\x68\x77\xef\x3e\x26\x6c\xdb\x3c\
+\x72\x0c\xa1\x0b\x2d\x68\xdf\x56\x3a\x2b\xfa\x17\x7c\xa8\x4e\x4b\
+\x2e\xdd\xf3\xb1\x75\xa0\x97\x0b\x1b\x87\x9d\x26\xba\x6f\x0d\xfd\
+\xd3\x91\x17\x48\x13\xe4\xd4\x21\xd3\x7a\x14\xea\x8a\xce\xdb\xa0\
+\xb2\xdf\xe0\x5b\x3b\xfc\x17\x2e\x0e\xd1\xc4\
+\x00\x00\xa0\x0a\
+\x00\
+\x02\x2a\x52\x78\x9c\xc4\xbd\x79\x7f\xdb\x46\xb2\x28\xfa\xff\xfd\
+\x14\x14\x4e\x9e\x06\x10\x9b\x9b\x1c\x27\x0e\x28\x84\xcf\x6b\xa2\
+\x8c\x65\x79\x24\x67\xd5\xe8\xea\x07\x91\x2d\xb1\x63\x0a\x60\x00\
+\xd0\x16\x2d\xe9\xbb\xbf\xaa\xea\x1d\x00\x25\x65\xce\xb9\xef\x9e\
+\x39\xb1\x88\xde\x97\xea\xda\xba\xaa\x7a\xb0\xd3\xf9\x7f\x97\x05\
+\x2f\x79\xf1\x89\xff\xaf\xce\x4e\xe7\x2d\x4f\x2f\x16\xbc\xea\x8c\
+\xfa\xdf\xf6\x47\xac\x93\x76\x7e\x3a\xee\x2c\xc4\x79\x91\x16\xeb\
+\xce\x45\x5e\x74\x44\x56\xf1\x22\x9d\x56\xe2\x13\xef\x5c\xa5\xcb\
+\xb2\xdf\x99\x57\xd5\x32\x1e\x0c\x16\xb2\xe2\x9f\x65\x7f\x9a\x5f\
+\x61\x4b\xe1\x34\xea\xec\x0e\x47\xc3\x1e\xfc\xf3\x5d\xe7\x97\x45\
+\x3a\x13\x57\xa2\xe8\x3c\xbf\x4c\x2f\xf2\xec\xa3\xc8\x98\x57\x62\
+\xd4\x79\xb9\xc8\x57\xb3\x83\x74\x86\xc3\x18\xfc\xaf\xad\x8b\x55\
+\x06\xbd\xe4\x59\x58\x31\x11\xdd\x04\xf9\xf9\x9f\x7c\x5a\x05\x49\
+\x52\xad\x97\x3c\xbf\xe8\xf0\xeb\x65\x5e\x54\xe5\xf6\x76\xb0\xca\
+\x66\xfc\x42\x64\x7c\x16\x6c\xe9\xcc\xab\x7c\xb6\x5a\xf0\x89\x08\
+\x55\xa9\x28\x0e\x74\x73\xb6\x05\x59\x6b\x7b\x5b\xfe\xed\xa7\x57\
+\xb3\x89\xfc\x19\x9e\x04\xaa\x5e\x70\x0a\x7d\xc7\x22\xac\xfa\x6f\
+\x93\x9b\xbb\xe8\x2e\xac\xe6\xa2\x64\x76\x64\x30\xae\x55\xc9\x3b\
+\x65\x55\x08\x18\xdb\x58\x67\x74\xe6\x98\x05\xab\x15\x7e\x4a\x61\
+\xc5\x18\x67\x59\x32\x62\x79\x92\x16\x97\xab\x2b\x9e\x55\x65\x7f\
+\xc1\xb3\xcb\x6a\x3e\xce\xf6\xf2\x71\xd6\xed\x46\x58\x54\xc0\xd2\
+\x76\xb8\x2d\x73\x92\x9d\x46\xd5\x89\x38\x4d\x38\xfc\x33\x2e\x78\
+\xb5\x2a\xb2\x4e\x75\x87\x2d\x96\xc9\x21\xad\x46\x7f\x5a\xf0\xb4\
+\xe2\xb7\xb7\xee\x88\x54\x49\xd1\x5f\x16\x79\x95\xe3\x5c\x93\x8a\
+\x65\xfc\x73\x47\xdc\xd9\x01\x8a\x30\xba\xb9\x33\x5f\x4b\xb9\xc6\
+\xd8\x34\x4f\x9e\x17\x45\xba\xb6\x95\xfb\xe5\x42\x4c\xf9\x58\x5c\
+\xc0\x22\x9c\x8b\x6c\x16\xe9\x91\xd0\x57\x3f\x5d\x2e\x17\x6b\xa8\
+\xce\xfb\xd3\x74\xb1\x08\xcd\xe8\xd9\x28\x8a\xc6\xd8\x60\x96\x34\
+\xb2\x76\x23\x3d\x1d\x33\x6e\x33\xec\x4a\xb5\x28\x58\xa6\x16\x69\
+\x92\x01\x40\x65\xd3\xb4\x0a\xeb\x0d\x45\x51\x6c\x7f\xdf\xdd\xc9\
+\xe1\x0f\xed\x24\xaf\x9c\xe5\xa8\xfa\x67\x0a\x40\xcf\xc4\x2c\xf1\
+\xbe\x6e\x6f\xbb\x5d\xce\xbc\x24\xbb\x34\x04\x7e\x8c\xcb\xc5\xc9\
+\x58\xce\xca\xc4\x19\x74\x96\x6c\xc1\xbe\x6e\x6f\x87\x85\x1a\x36\
+\x67\x79\x04\x1b\xbd\x35\x8a\xee\x58\xe1\x95\x9c\x38\xdb\x1f\x87\
+\x95\x29\x6f\x67\xc0\x4a\x5e\x7d\x10\x57\x3c\x5f\x55\x61\x09\xfb\
+\x01\x40\xb3\x35\x8c\xee\xf4\x5a\x15\x76\x50\xb9\x37\xa8\x44\x9c\
+\x8c\x4e\xa1\x53\x71\x32\x3c\x85\xe1\x65\xbd\xdc\x40\x4b\x92\x24\
+\xd9\xf6\x36\x9f\x54\x71\x18\x56\xbd\x3c\xfa\x7f\xca\x6e\x89\xff\
+\xe4\xb6\xad\xd4\xac\xfd\xd6\xc8\xa6\x16\x2e\x44\x1c\xa4\xd5\xbc\
+\xbf\xcc\x3f\x87\xa3\x21\xfb\x94\x8b\x59\x67\x08\xed\x8a\xc9\x37\
+\xb1\x30\x1b\x49\x45\x8a\x1c\x8e\x62\x58\xed\xf0\x68\xc0\x6d\x53\
+\x2b\x6f\x17\xe0\xa4\x5c\x4d\xe4\x9f\x30\x8a\xab\x7e\xc1\x97\x8b\
+\x74\xca\xc3\xc1\xff\xfe\x77\xd9\xbd\x85\xff\xbe\x1a\x5c\xb2\x20\
+\x88\x6c\xfd\x85\x53\x1f\xdb\xea\x97\xcb\x85\xa8\xc2\x01\x94\x1d\
+\x38\xc5\xa6\x72\xc4\xfa\xd0\x71\x3c\x4d\xea\x94\x58\x58\x9e\xa7\
+\xe5\xe1\xe7\xec\x7d\x91\x2f\x79\x51\xad\x25\x38\x55\x2c\xc8\x97\
+\xd8\x44\x19\x44\xb7\xb7\xb0\x33\xea\x2b\x31\xbf\x26\xa5\x4d\x8d\
+\x62\xc0\x03\xd0\x91\x49\x38\xe1\xa7\xb0\xf2\xdc\x9e\x50\x9d\x61\
+\x87\x76\xe6\x6f\xd7\xc9\xe9\x58\x8f\x32\xc7\x51\x56\x51\xd6\x5f\
+\xae\xca\x79\xc8\xb3\x69\x3e\xe3\x3f\x1f\xed\xbf\xcc\xaf\x96\x79\
+\x06\x40\x11\xf2\x49\xde\xaf\xf2\x9f\x97\x30\xde\x97\x69\xc9\x61\
+\xc9\xf2\xa8\x1b\x24\x41\xb7\xa5\x6c\x75\x92\x9f\x46\x7a\x47\x42\
+\xb1\xbd\xdd\x1b\x6d\xc1\x3e\xf5\xe1\x98\xf2\xeb\xc3\x8b\x30\x98\
+\x04\xd1\x24\xd8\x0e\x62\xfc\xd1\xcd\xfa\x7f\xe6\x22\x0b\xe1\x3b\
+\xa2\x93\x33\x4b\x06\xff\xbe\xe9\xec\x84\x27\xff\xfe\x7c\xd6\x3b\
+\xed\x46\x9d\x9d\x7f\xdf\x0d\x2e\xed\x61\x82\xf3\xcf\x32\x67\x23\
+\xf5\xc6\xcd\x98\x8f\xa8\x25\xc8\x64\x88\xb3\x00\x67\x18\x70\xe1\
+\x51\x35\x2f\xf2\xcf\x1d\x44\x44\xaf\x8b\x02\xe6\x1f\xbc\xcb\x3b\
+\x9f\xd2\xc5\x8a\x77\x60\x7f\x3e\x89\x19\x9f\x11\x7d\x81\xfa\x22\
+\x3d\x5f\xf0\x4e\xd0\xad\xf4\x64\x5a\x90\x37\xe0\xed\x90\x27\x3c\
+\xcc\xa2\x88\xf1\x3b\x39\x85\x4b\x85\xbb\x44\x49\x7f\xdb\xd0\x62\
+\x70\x22\xe9\x48\x87\x4a\x9c\x42\x7b\x49\x03\x48\xaa\xfc\x18\xc0\
+\x33\xbb\x54\xe0\x11\x39\x68\xf3\x53\x0d\xc8\x00\xdb\xf0\xbd\x4a\
+\x63\x73\x0e\x98\x1c\xf1\x24\x82\x04\x2c\xbc\xc6\x94\x5c\xcd\xa2\
+\x37\xa2\x51\xae\x93\x60\x96\x56\x69\x2c\xae\xd2\x4b\x3e\xb8\x14\
+\x17\xe3\x73\xd8\xd9\x6f\xbe\x66\x47\xc3\xc5\x0f\x87\xaf\x16\xf3\
+\xe7\xff\x7a\xfe\xe2\xf9\xf3\x57\x83\xe7\x2f\x3f\x3f\xa7\xff\xa3\
+\xef\xe7\x2f\x9f\xbf\x2a\x13\x87\xc6\x5c\x3b\xe7\xe2\x33\xec\x71\
+\xfe\xf9\x24\xf8\xcc\xcf\x3f\x8a\x0a\x56\xee\xf4\xf6\x56\xa7\x5d\
+\xe5\x5f\x6a\x09\x25\x7e\xd3\x58\x3e\xbb\xe8\xf2\x3d\x36\x48\x04\
+\x2b\xe9\xe2\x36\xbd\x02\xd2\xc2\xd4\xe9\xbf\x4a\xaf\xc3\x21\x1b\
+\x7d\xd3\x0b\x45\xef\xb3\x01\x32\xa8\x2f\x00\x75\xca\x86\xfb\x0e\
+\xfa\x02\x7a\x20\xb7\xe4\x3c\x51\x99\x05\xff\x6b\xc5\xcb\xea\x79\
+\x06\xd3\xc6\xde\xde\x14\xe9\x15\x10\xae\xeb\x30\x38\x6a\xcb\xc1\
+\xa3\xf8\x9e\x7d\xd0\xb5\xa7\x69\x36\xe5\x8b\x96\xca\x2f\x5b\x32\
+\xb0\xae\xc9\xda\xd8\xba\x0b\x1b\xba\x17\x20\x00\x85\x99\x82\xbb\
+\xef\x07\xfa\x04\xc3\xf6\x6e\x41\xcf\xe7\x70\xb0\xde\xeb\xfd\x3d\
+\x97\x80\x22\x1b\x61\x92\x96\x46\xe3\x4a\xa6\x0a\x07\x45\x7d\xc1\
+\xbe\xaa\xed\xed\x0f\x5e\x85\x4a\xae\xd4\xcb\xe4\x86\x5f\x57\x3c\
+\x9b\xc5\x73\x26\xc9\x7a\x5c\x32\x24\xb1\xf1\x92\x2d\xd2\xb2\xda\
+\x9f\xc5\x9c\x95\x55\x7a\xb5\x8c\xaf\x18\x9e\xa5\xaa\x5a\xf0\x38\
+\x63\x9f\x8b\x74\xf9\x6e\x75\x15\xe7\xec\x22\x5d\x94\xfc\x4d\x16\
+\xa7\x0c\xe0\x13\x66\x8b\xa9\x05\x43\x4c\x1b\xaf\x18\x21\xcd\x5f\
+\xf3\x62\x56\xc6\x0b\x24\x34\x87\x12\x49\xc5\x53\x76\xc9\xab\xf7\
+\x29\xac\x8a\x04\xfa\xf8\x8c\x55\xfc\x0a\x8e\x36\xf4\x7f\xc1\xd4\
+\x49\x8a\x2f\x99\x42\x22\xf1\x27\x06\xb9\xd5\x7a\x1f\x81\xf7\xe7\
+\x62\x11\xaf\x99\xda\x59\xe8\xf8\x9c\xc9\x7d\x82\x9f\x1f\x98\xb3\
+\xe1\xb4\xe6\xf1\x01\xb3\xbb\x28\x53\xbe\x38\x2b\x7c\x8c\x0c\xc9\
+\x71\x5f\x2e\x41\xe2\x6e\x8e\xc7\xb3\x20\xff\x05\x08\x4d\x54\x22\
+\x5d\x88\x2f\x80\x04\x6a\x09\x9a\x1f\x41\x36\xcd\xa1\xac\x54\x0a\
+\x17\x7d\x1f\x4a\xfe\x98\xe7\x1f\xcb\x30\x52\xfc\x82\xe8\x9f\x9d\
+\x95\x2b\xc0\xaf\x67\x67\x09\x15\x33\x88\x00\xe8\x6f\x19\xf2\xc8\
+\x43\xd6\x21\x31\x23\xc0\xef\xad\xa6\x55\x5e\xc0\x19\x77\xb8\xac\
+\x8c\xba\x89\x1e\x47\x74\x70\x80\x79\x04\xdc\xab\x29\x07\xdc\x6b\
+\x02\xac\x44\x60\x86\xa3\x12\x42\x01\x78\x9d\x86\x86\xf8\xdd\x92\
+\x19\x80\x85\x4a\x4c\x81\x01\x0e\xe7\xc0\x2d\x99\xef\x88\xcd\x38\
+\x30\x31\xbc\xe3\xa4\x54\xb0\x42\xd3\xc5\x6a\xc6\xb1\xb4\xbb\xb6\
+\x00\xce\x0e\xfb\x6c\x90\xeb\xdb\xdb\xdb\x2d\xfa\xaf\x7f\x20\xae\
+\x45\xa6\x00\x7d\x5c\x25\x97\x50\x09\x98\x89\x93\xca\x92\x30\x01\
+\x28\x44\x58\x1c\x28\x00\x07\x12\xd7\x9a\x24\xaa\x76\xff\xf5\x27\
+\xdc\x84\xed\x6d\x5c\xb8\x7c\xc1\xfb\x9f\x53\x20\x4f\xc1\x2b\x0e\
+\x52\x07\x70\x75\x80\xf6\xd5\xe0\x3a\xd8\xb3\x57\x27\xee\xe0\xb4\
+\x91\x3e\xd0\xd2\x01\x9a\x5b\x2c\x3a\xe7\xbc\x53\xf0\xab\xfc\x13\
+\x55\x04\x0e\x12\x86\x86\x29\x70\x76\x4b\x5e\xb2\xce\x92\x7e\x40\
+\xd6\x9c\x17\xa2\xea\x5c\x14\xf9\x15\xb4\x4a\xed\x51\x8d\xb2\xe2\
+\xe9\xac\x1f\xb0\xd0\x50\xa2\x08\x17\x6a\xfa\x11\xb9\x7b\xb3\x4e\
+\x11\x9b\x2b\x50\xca\x56\x8b\x05\x03\x5e\x5c\x33\xa1\x4e\x19\x67\
+\xa9\x6d\xbd\x4c\xd3\x7f\x58\x6a\xcb\x4b\xcc\xc3\x32\x34\x39\xb8\
+\x21\xfa\x27\x74\x14\x02\xe0\x60\xbd\x33\xa1\x81\x13\x58\x04\xf8\
+\xf6\xe0\xd5\xe5\x25\x11\x09\x11\xa8\xda\x1a\x2f\xa1\x2c\x9f\x45\
+\x37\xdc\xaf\x05\xbc\x9f\x9f\x60\xa1\x4f\x1d\x8a\x7a\x13\xc0\x72\
+\x9a\xad\xad\x92\x21\x13\x89\x3b\x30\xbd\xcb\xd5\x9e\x18\x57\xb0\
+\xd3\x6e\x1e\x00\x85\xd3\xfa\xdd\x1d\x13\x77\xec\x58\x2f\x4c\xd2\
+\x22\xa1\xcc\xc3\xda\x79\xab\xe4\x98\xb0\xda\x15\x2f\x2e\xb9\xc2\
+\x51\x8f\xa9\xab\xd7\xd3\x6d\x23\x9d\xcd\xf4\xbc\xbd\x26\x24\xd4\
+\xb6\x8a\x39\x4d\x21\x06\x08\x60\x0b\xf7\x51\xc1\x21\x70\x36\x84\
+\x0e\x27\x4c\xdf\x41\x3e\xc2\x32\xee\xb5\x91\x3a\xdb\xbc\x31\xe7\
+\xf6\x16\x20\x60\x63\xae\xe2\x16\xd5\x4c\x49\xca\xfa\x23\xb9\xc9\
+\xb3\xd8\xe5\xc4\x14\xb5\x6a\xc8\xcd\x55\xa4\xb7\x37\x93\xcc\xa7\
+\x04\x03\xa8\x04\x60\x08\x70\x0e\x23\x1f\x73\x20\x24\x1d\x83\xf6\
+\x00\x0a\xca\x24\xac\x12\xe4\x85\x22\x0d\x01\xf9\x5e\x39\xce\xf1\
+\xac\xeb\xda\xc8\x7d\x52\xaf\xee\xb4\xef\x58\x7e\x71\xd1\x36\xac\
+\x2a\xfa\x3b\x63\xbb\xb8\xf8\x6f\x0d\xee\xe2\xc2\x19\x1d\x55\xd7\
+\xe7\x96\xf2\x39\xe1\x1a\x7f\xd8\x67\x2d\xab\xe9\x96\x4e\xdc\x8f\
+\xdb\xdb\x9b\x3b\x25\xeb\xba\xc9\x88\x25\x33\x90\x28\x90\xe3\x67\
+\xb5\x8c\x24\x43\xc8\x4a\xa8\x3c\x71\xb2\x92\x51\x76\x88\x4d\x72\
+\x73\x91\xc5\x82\x4d\xab\xeb\x98\xdf\xa1\x58\x07\xf2\xe4\x90\xa5\
+\x89\x39\x83\xc5\x5e\x3a\x2e\x24\xc7\x59\x9e\x14\xa7\xfd\x8b\x0c\
+\x99\xce\xed\x6d\xfa\x80\x6a\xc4\x74\x2b\xcc\xad\x40\x26\x8f\x70\
+\x66\x2d\x3b\x62\x84\x5b\x92\xf3\x9d\xa1\xc2\xd8\x1a\x93\x8a\xb0\
+\x4b\x41\xdb\xd8\x36\x05\x90\x12\x70\x12\x72\x67\xb2\xfa\x96\x50\
+\x57\x05\xc8\x07\x39\xc9\x07\x85\x1e\xe9\xf6\x76\xa1\x66\xa0\xd9\
+\x2a\xfa\x4e\xd5\xc2\x5d\x08\x64\x4e\x5e\x82\x80\x59\x21\x5e\xad\
+\x2f\x26\xf4\x43\xe7\x37\x04\x7c\x4a\xc3\xc8\x48\x4a\x84\x84\x1c\
+\xce\xf0\xdd\x1d\x6e\xfa\xcd\x3d\xa3\xc2\xe1\x50\x77\xe3\x16\xc8\
+\x80\x1e\x00\x9b\xc1\x08\x78\x1b\x24\x4b\x4c\xbc\x10\x40\x57\xb2\
+\x92\x18\xdf\xc8\x81\x24\x05\x16\xf3\xf0\x06\xf0\x21\xbb\x41\x38\
+\x8f\x2b\x56\x01\x86\xe1\x55\x4c\x88\xa2\xcc\x57\xc5\x94\x7f\x90\
+\x29\xb0\x7d\xa2\xef\xa6\xdc\xde\x12\x3c\x46\xf5\x7d\x91\xeb\x98\
+\x37\xe0\x0d\x8a\xe5\x1a\x52\x9d\x35\x4b\x1a\x29\xdd\xd1\xed\xed\
+\xc8\x40\x5b\x09\xcb\x52\x24\xb9\x5e\x96\x72\xaf\x18\x97\x7a\xb3\
+\xd2\x24\x3f\x29\x4f\xc7\x29\xac\x8f\x42\x8f\xb8\x67\x72\x60\xb0\
+\xd7\x77\x8d\xa6\x7b\xbd\xbb\x3b\x2d\xfa\x28\x06\xed\x0c\x49\x78\
+\x7a\x09\xd4\x9e\x08\x31\x48\x6d\x0a\x4b\xab\x75\x8b\xdb\x64\x48\
+\x1f\x0e\x5b\x66\xca\x91\xbc\xc9\x21\xab\x35\x07\xe2\x45\xb0\xe9\
+\xa3\x11\x5b\x13\x18\x5d\x5a\x3d\x7f\x35\x55\x2a\x12\x79\xbb\x8f\
+\x22\xb2\x6d\x1a\xfd\x08\x03\x1e\xa0\x15\x0a\x5a\x50\xd9\x4d\x1b\
+\x2e\xc3\xfa\x0e\x2e\x73\x71\x8e\xdc\xd0\x65\x58\xa3\x2b\x7d\x42\
+\x5f\xd4\x91\xfa\x99\xa3\x70\x25\x79\x4d\x8f\xc4\x98\x01\xc9\x5f\
+\xb2\x18\x10\xc1\xd7\x76\x8e\x71\x0b\x29\x6d\x2e\x44\xd2\x4c\x42\
+\x14\xc7\x5a\x96\x0c\x55\x6c\xc0\x9c\xaa\xdd\x94\x7c\xd9\xdf\xee\
+\x0f\x55\xb0\xf5\x53\xe7\x75\xa0\x9a\xaf\x41\x91\xd7\xb8\x61\x47\
+\x37\xec\x78\x4b\xd3\x02\x8e\x3c\x1c\x6a\xe0\xd2\x88\xfb\x80\x33\
+\xba\x48\xd7\xbc\x88\xe1\x9b\xce\x1e\x33\xdd\xcd\xde\x00\x17\x69\
+\xd2\xef\x90\xc9\x40\xcd\xdc\xdd\xf8\x8f\xbe\x5e\xdf\xb7\x04\x38\
+\xbc\x48\xfe\x80\xd5\x67\x7f\xf4\x9d\xa5\x70\xb2\x48\xc2\x7c\xbe\
+\x58\x78\xe9\x25\xd6\xb9\xb8\x60\xd4\xd8\x61\xc6\x51\x02\x6d\xb6\
+\x39\xe5\x50\x00\xc7\x4b\x59\x89\xfc\x0d\x49\x20\x5d\x34\x5a\x53\
+\x50\x4c\xc8\xe7\x75\xa2\xa5\xaa\xf0\x8f\xc8\xca\x5b\x1f\x3d\xaa\
+\x76\x9d\xf0\x89\xab\xc2\x8b\x62\xb9\xa5\xfd\xb5\x9f\x81\xca\x70\
+\x02\xd4\x17\x52\x2d\x00\x72\x50\x36\x6d\x55\x3f\x0f\xf7\x2a\x59\
+\xf1\x62\x91\xc3\xd6\x40\x8b\xf4\x35\xe5\xa2\xa6\x52\x79\xae\x07\
+\xa2\xc1\x83\x78\x74\x94\x14\xe1\x14\x7d\x04\x3e\x8b\x64\x0e\x64\
+\xd6\x61\xc8\xa8\xe1\xac\x4e\x46\xa7\x51\x8c\x6c\x39\x1c\x36\xc8\
+\x6f\x1e\x3d\x10\xa2\xae\x03\x04\x03\xf8\xb1\xa6\x1f\xba\x7e\xff\
+\x1a\x58\xef\x35\xd4\x96\x9f\xd4\xb1\x95\xcf\xf7\x25\xf6\x21\xf6\
+\xc4\xaa\x78\xc4\xe4\x04\x92\x4f\x61\x45\x32\xc0\x92\x79\xc2\xeb\
+\xca\x7b\x5a\x28\xb5\xc4\x1c\xb5\xf6\xb6\xc5\x43\xd9\xa2\xc2\x1f\
+\x88\xcd\xdd\xd9\xed\xc3\xe8\x71\x24\xb2\x5f\x5b\xeb\xe8\x7f\x7c\
+\x1c\xef\xdc\x71\xf8\x4b\x7c\xa4\x06\x71\x54\x1b\xc4\x2b\x07\xbb\
+\x89\xf2\x5d\x0a\x4d\x44\xb7\xb7\xf2\x17\xe0\xc6\x86\x36\x6f\x3f\
+\xfb\x04\x12\xf8\xac\xf3\x36\xad\xde\x66\x97\x1d\xb9\x29\x71\x27\
+\x0c\xba\x55\x37\x60\x9d\xa0\x2b\xba\x41\x14\x44\x63\x49\x2e\xd3\
+\x2a\xe9\x2a\x10\x5b\x64\x97\x49\x57\x28\xc5\xf2\x16\xb1\x02\x12\
+\x39\xa7\x0b\x28\xe4\xee\xcf\x9f\xf7\x81\xca\x2b\x05\x2a\xb0\xe7\
+\x0a\x20\xcc\x6d\x10\x82\xcd\xe4\x09\xb2\x2a\xe6\x4a\x01\xd5\x5b\
+\x16\x9c\xe0\x9f\x5d\x80\xa9\xdd\x7b\x8a\x48\x88\x7b\x08\xec\x60\
+\x5e\x16\xde\xa0\x36\x4e\x94\x05\x30\x43\x99\x5a\xe1\x64\x01\x8f\
+\x2c\x00\x45\x54\x38\xbf\x28\x76\xf4\xe9\xb2\x03\x59\x51\x42\xe6\
+\x47\x47\xbb\x70\x33\x85\x5a\xdc\x95\x3a\xd4\x2a\x28\x58\xa6\x63\
+\xac\x0e\xad\xc4\xfb\x1b\x91\x2f\xb5\x14\x46\xfd\x33\x28\x14\x3e\
+\x47\xc6\x19\x70\xeb\x7d\x15\xae\xbb\x49\x65\x1a\xc7\xdf\x6b\x85\
+\x91\xcb\xd5\x79\x85\x97\x81\x0f\x77\xa5\x4b\x9a\xfe\x1e\xac\x7a\
+\xdd\x73\x3a\xed\x39\x9d\xce\x04\x6a\x8b\x5f\xac\x1f\xee\x54\x97\
+\x44\x8c\xc3\xce\x1e\xac\x77\x3d\x48\x34\xda\x1b\x18\x9a\x76\xb5\
+\x5a\x54\x02\xc4\xba\xc7\xf4\x67\xcb\xca\x1e\x1f\x51\xf7\x7a\xc7\
+\xf4\xb9\x63\xfa\x2c\x81\xcf\xda\x30\x50\x77\xb7\x77\xec\xfa\xec\
+\x54\xb4\xeb\xab\xec\x91\x55\x07\xb6\xea\x40\x56\x25\x04\xdf\x02\
+\x5e\xfe\x0c\x25\x19\xc0\xb9\xdd\x5b\xfe\x3a\x71\xa9\x09\xa5\x44\
+\x9a\xa0\xd4\x73\xd6\x9a\x17\x24\x4a\xf1\xe0\x08\x24\x3d\xc1\x11\
+\xdc\x5b\x5e\x8d\x40\x51\x9f\x96\x11\x38\x39\x66\x04\x48\x9d\x1e\
+\x1c\x00\x91\x30\xec\xff\xbe\xd2\xaa\x7b\x49\xee\x5a\x7a\xb7\x19\
+\xa6\x73\xa2\xa5\x0f\xf6\x4e\xa5\xa8\xfb\x7b\xcb\x5f\x27\x2f\xea\
+\xfd\xbe\xa8\xf5\x37\x13\x12\x77\x7e\xc8\x3d\x60\x91\xda\x11\x90\
+\xa8\xe9\xa0\xc2\x29\x54\x98\x85\xe3\x09\x94\x1f\x6b\xef\xd6\xaf\
+\xfc\xab\xa8\x42\xb1\x23\xba\x7c\x07\x19\x4e\xfe\xd7\x2a\x5d\x94\
+\x2d\xf0\x67\x9b\x54\x42\x63\xff\x1a\xb8\x7a\x18\x98\xfa\x5a\xc3\
+\xfa\xe7\x59\x95\x8a\xac\xad\x76\x47\xd6\x66\xd4\x65\x7a\x8e\x37\
+\x72\xd7\xd1\x5e\x62\x3f\xe5\x64\xb7\xb7\x9d\x02\xeb\x46\x01\x04\
+\x74\x7d\xbd\xd3\x5c\xba\xe0\x7d\x2e\x40\x38\x09\xba\x06\x62\x24\
+\xe5\x32\x60\x82\x14\x0c\x44\xc1\x7d\x17\x2d\x2b\xa5\xfd\xe6\x11\
+\x53\xdd\x2b\x91\x49\x89\x09\x6f\x52\x26\xa1\x4e\xd3\x70\x02\x3f\
+\x43\x73\x22\x29\x5d\xd7\x4b\xaf\x4d\x99\xf4\xda\x29\x83\xe9\xb6\
+\x6d\x0d\x56\xb2\x9d\xb5\x93\xee\xb4\xb3\x76\xdb\x59\x3b\xe9\x51\
+\x14\x9b\x11\xc1\x2e\x2b\x58\x33\x05\x6c\x92\x06\x1d\x60\x82\x5f\
+\xa2\x3e\xb5\xd8\x8c\x66\x9c\x29\x76\x9d\x11\x0f\x76\x99\xcd\x59\
+\x77\x9d\x31\x40\x0e\xe2\x4c\x68\xfa\x45\x5e\x55\xf9\xd5\x5b\x7e\
+\x51\xdd\x4f\xed\xa8\x71\x77\x1a\x54\xfb\x43\xbe\x3c\x12\x97\xf3\
+\x87\xea\xe2\x68\xdc\x65\xd2\x75\x37\x74\xab\x4b\x3a\x03\xdc\xd4\
+\x8b\x6e\x9f\x8a\x1e\x8b\x2f\x6d\x34\xdb\x8c\xc1\x90\x45\xdd\x41\
+\xb4\xe1\x14\x28\x43\x92\xb1\x39\x4b\x61\x90\xad\xae\xce\x79\xe1\
+\x30\x20\xc0\xab\xd4\x38\xcc\x8f\x93\xe7\xf1\x61\x84\xa7\xce\x63\
+\x3b\x43\x01\x7b\x0a\x9d\xd1\xa1\x86\x61\x00\x57\x9f\xa0\x95\x88\
+\xe8\x5f\x7f\x9f\xd8\xb5\x45\xf1\xfa\x7a\x2f\xb1\x0b\x86\xda\x89\
+\xb5\x53\x62\x8d\x25\xd6\x4e\x09\x38\xc3\x64\x1f\x54\x02\x67\xe4\
+\x8f\xbf\x4a\x80\x17\x96\x16\x21\xc2\x34\xc0\xb8\xa9\xca\x32\x35\
+\xa4\x5c\x0e\x89\x95\x49\x8e\xa3\x11\xd8\x6b\x86\xc3\x80\xb1\x90\
+\x8e\x62\x8d\x89\x6b\x4c\x5c\x63\xa2\x41\x46\x20\x46\x16\x20\xa0\
+\x7f\xe2\xc5\x22\x5d\xfe\x8f\x74\x6e\xfa\xb6\x5d\x9b\x9e\x1b\x1d\
+\x8b\xf2\x17\xe4\x7f\x9b\x9b\xbd\xa5\x54\x44\x84\x02\xb6\x74\x97\
+\xa8\x20\x3f\x7a\x00\x8f\x58\xe3\x21\x29\xbd\x96\xf9\xaa\x9a\xff\
+\xca\xcb\x8a\x69\xc5\x4f\x96\x17\xd5\xfc\x75\x5a\x56\xa4\x1f\xf2\
+\xd8\xe1\x08\x24\x86\xa4\x22\x75\x27\xa9\xa9\xfc\xec\x23\xab\xa5\
+\x9a\xb8\x72\xc3\x9f\xc4\xe5\x23\xaf\x1f\x91\x7a\x8a\xd4\x29\x68\
+\x2e\x63\xfb\x46\x98\xb1\x1d\xb3\x2d\x01\xb3\xe2\xae\xce\x4b\x2b\
+\x7f\x60\xba\xf9\x24\xcc\x88\xd9\x37\xd8\x49\x10\x4b\x4c\x89\x78\
+\xe7\x81\xcc\xbf\x9b\x97\x5d\xca\xc4\x88\xe5\x4e\x3d\xc0\x58\x9c\
+\xea\xe5\xb2\x5e\xee\xd4\x93\x79\x50\x8f\x12\x0d\x2a\xb3\x03\x4e\
+\x24\x4b\x2d\x3b\x16\xb2\xf1\xda\xea\xa9\x22\xb2\x0f\x2e\xdb\x51\
+\xa8\x6e\x99\xb6\xec\x49\x63\x3f\x78\x7d\x3f\x60\xcf\x0c\xe5\xa1\
+\x9e\x7b\xd4\x78\xb4\x83\x7b\xe7\xe6\x64\x97\x3d\xd9\xe1\x4e\x35\
+\x76\xd0\xd4\x51\xe8\x8c\xba\x97\xc9\x71\xf7\xf2\x88\x39\x23\xed\
+\x66\x72\xac\xdd\x3c\x8a\x5a\x71\xb2\x87\xf8\x5e\x85\xf5\x85\xa1\
+\x36\x6a\xe3\xa6\x41\x1a\x24\xed\x96\x85\x7e\x1a\x65\x61\xd8\x83\
+\x5d\xd9\xf7\xb1\x2e\xb9\x09\xdb\xd9\xb6\xa8\xfc\x3b\xdd\xca\xc6\
+\xf2\xa6\x1f\x5b\x7e\x43\xfb\x4a\x66\xc2\x5a\xba\xa4\x26\x5f\xf0\
+\x8d\x95\xc2\xc8\x19\xe5\x86\x5e\xfd\x56\xa8\xa4\xd3\x0a\x56\xd2\
+\xad\x3c\x6e\x9a\xb8\x3c\xb6\xd3\xc7\x94\x4f\xe5\x54\x1f\xb7\x2a\
+\xa6\x79\x9a\xef\x63\xca\x63\xf3\xad\xb4\xe5\x91\xc4\xe4\xd5\xed\
+\xad\x15\x70\xff\x8c\xdf\x45\x06\xa7\x3e\x12\x47\xb5\xab\x1f\x08\
+\xbf\xb8\x10\x14\x46\x84\x63\x5c\x20\x81\x95\x37\x24\x0a\x86\xf0\
+\x7d\x42\x08\x84\xd4\xbf\x69\xb5\x97\xe4\xf2\x8b\x0e\x09\xe5\x65\
+\x97\x94\x97\x5d\x52\x1e\x2e\xd4\x46\xb2\xf4\xae\x46\x19\x1e\x38\
+\xd5\x8d\xa1\xe6\x8d\xa1\x12\xf5\xa0\x51\x0a\x39\xae\x4c\x8e\x52\
+\xa2\x97\x42\x8e\x88\x32\x71\x98\x99\x1c\x26\x8d\xf6\x51\xa4\xec\
+\xff\xe0\x80\xbd\xf1\xfa\xc3\xf5\x46\xdb\x32\xd8\x2a\x7f\xf1\x22\
+\xbf\xde\xc4\x59\x9f\xf8\x87\x91\xdd\x7f\xca\x58\xed\x28\x9f\x2a\
+\x53\x35\x16\xb4\xc9\x17\x8e\x82\x6d\x8b\x2e\x87\x68\x85\x58\xfd\
+\x74\xc9\x7a\x61\x63\x39\x44\xa4\xef\x16\xec\x51\x71\xcb\xba\xeb\
+\x24\x10\x01\x3c\x48\xe8\x6d\xa7\x9a\xde\xdb\xa6\x51\x69\x8c\x7b\
+\xf7\x2b\xfb\x31\xb9\x59\x90\xaa\xec\x43\x4e\x62\xc7\xe6\x2b\x10\
+\x60\x12\x50\xd3\x04\x59\xfa\x27\xce\x4f\x1d\x38\x92\xf7\x43\xff\
+\x2a\xa1\x0f\x2c\x65\x56\x4a\x23\x20\xac\x75\x66\xbe\x43\x8e\x37\
+\x36\x6c\x89\x1d\x7e\xc8\xa5\xaa\x6e\x73\xc7\xba\x6d\xdd\x57\xad\
+\xd9\x55\x66\xdb\xad\x6a\x17\xbf\xee\xa0\x57\x99\x1e\x36\xf5\x2d\
+\x7f\x6f\x54\x88\xb4\xce\x16\x35\x1b\x7f\xa3\xa2\xed\x11\xab\xd2\
+\x34\xda\xaa\xed\x3e\xfd\x66\xc7\xd8\xb6\x4a\xf1\xe3\x4b\x9e\x5f\
+\xb5\x15\xa5\x62\x8b\xfc\x32\xac\x06\x50\x2b\x1a\xd0\xf7\xdb\x77\
+\xbb\x84\x81\xdf\xcb\xce\xf8\xec\x05\x6a\x35\xfc\xf3\xaa\x6f\x9a\
+\x44\x76\x81\xf7\xf7\x86\x51\x42\x65\x9f\x7b\x8a\x9d\xd1\x9f\x53\
+\x2b\xcc\xdb\x04\x63\x0a\xd9\x51\x0a\xe3\x96\xfd\xb0\xbb\x21\x24\
+\x7f\xab\x0e\xc1\x7d\xc5\x80\xd7\xe5\x04\xd4\x6a\x78\xf1\x56\xf8\
+\xca\xe3\x4a\x1f\x3e\x6d\x7f\x1a\xb1\x1c\x79\x31\x5f\xde\x46\xe6\
+\x45\xf2\x14\xac\x96\x01\xdc\x8c\x64\x20\x40\x46\x0f\x1d\x25\xe8\
+\x88\xf7\xbe\x8b\xe9\x9c\x35\xe5\x74\x6b\xc5\x29\x21\xd7\x4a\xea\
+\x88\xa9\x2a\x5f\x5a\x47\x96\xb0\x92\x12\xfb\x26\x55\x87\x5a\xd1\
+\x37\x7d\x9d\x2f\x4d\x37\xfe\x94\x1a\x4a\x34\xac\x6b\x21\xab\x6f\
+\xfa\x98\xa1\x06\x80\xe5\x69\xa8\x2d\x3b\x2f\x37\x77\xf4\x6c\xb8\
+\x53\x0d\xbe\x1e\x0e\xbf\x7d\x3a\x1c\x7d\x0b\x9b\x2a\x24\xec\x4c\
+\xf3\x52\xae\xd5\xfb\xfd\x01\x95\x51\xd3\x30\xfb\xfc\x2e\x3c\x31\
+\x4b\x28\x8c\xa6\xbc\xc7\x4f\x99\x49\xef\xda\xf4\x2e\x3f\x45\xc9\
+\xf1\x1e\x15\xf1\x2b\x67\xa5\xcc\xfa\xe0\x0f\x54\x43\xdf\xdd\x45\
+\xcc\x4e\x6b\x13\xc3\x4b\x25\xb2\xcb\x49\x1e\x56\xb6\xba\x4a\xc4\
+\x0b\xb1\xb8\x72\xe9\x82\xd3\xa9\x6a\x5a\x56\xd4\x03\x50\x89\xba\
+\x22\x32\xe7\x4a\x29\x7e\xe7\x8c\x65\xe3\xc2\x12\x72\x96\x1c\xaf\
+\x64\x18\x9c\x36\x71\x6b\x08\x6d\x39\xac\x37\x1a\xc8\x5b\x76\x1b\
+\xe5\x9a\x21\x19\xc7\xc3\xbf\xb9\x91\x5e\xc6\xf2\x32\xbc\x41\x24\
+\x8a\x06\xcd\x6c\x63\xd6\x4b\xc5\xac\x97\x3e\xb3\x5e\xa8\xe4\x42\
+\x25\xa3\xe8\xf7\x46\x9a\x04\xfc\xc8\x6e\xd4\xfa\xc5\x27\x3d\x00\
+\x03\x06\xff\x9d\xb2\xa3\xf8\x9b\x27\xdf\x8e\xf8\x13\x03\xb7\xad\
+\x28\xda\x81\x1e\x22\xf3\xd0\xc9\x0e\x97\xb3\xa4\x5f\xa5\x2c\x51\
+\x02\xe5\x54\x62\x84\x3c\x89\x3b\x1c\x78\x76\x98\x91\x97\x6b\x8e\
+\xa3\xcc\x4d\x93\x72\xa7\xec\x1a\x40\xcd\xa2\x1d\xf3\x3b\x8f\x76\
+\x8a\x9d\x82\xcd\x93\x5d\x99\x96\xc2\x08\x77\x43\xab\x09\x4c\xd5\
+\x51\xa7\x8f\x51\x2f\x8d\x7c\xba\x70\xb4\x33\x47\x60\xfb\x39\x81\
+\x29\x3e\x1b\x3d\xf9\x96\xfd\x92\xdc\x1c\xc5\x3f\xb3\x83\xe7\xbf\
+\x9d\xbd\x7d\xfe\x61\xff\xc3\xcf\xaf\x5e\xc7\xcf\x9e\xf6\x87\x4f\
+\x47\xa3\xdd\x67\xdf\x7e\xfb\xdd\xb3\x56\x8a\x21\x61\xc0\x5d\x02\
+\x05\x01\x6e\x3b\x5a\x08\x33\x78\x09\x85\x4c\xf4\xf4\x20\x84\xd4\
+\xe3\x91\x96\xc5\x70\x15\xb2\x1d\xe1\x6d\xaa\x52\x14\x1d\xed\xd0\
+\xba\xec\xa8\xa3\x76\xb4\x63\x28\x41\x38\x02\xc1\x6b\x00\x53\x84\
+\x1d\x25\x29\xa8\x9d\x44\x19\x34\x30\x50\xa3\xf5\xcf\x47\xe8\x2c\
+\xa3\x1c\x24\xbf\x5e\xa2\x7e\x6e\x20\xfb\x8b\xa2\x9e\x9e\xe5\x6e\
+\x84\xa3\xe8\x5f\xef\x08\x9d\x77\xc7\x24\xad\x50\xb7\x88\x27\xbd\
+\xf0\xd7\xe4\xe7\x1d\x55\x1e\x66\xf8\x2b\x20\x8b\x5f\xd9\xaf\xa7\
+\xee\x7d\xeb\x5f\xf2\x72\x09\x6d\xf9\xe1\x0c\xe0\x8d\x59\xe4\x09\
+\x0c\x69\x22\xef\xbc\xe8\xe3\x3c\x91\xd7\x63\xf4\x31\x4d\xf0\x9a\
+\x8c\x2e\xea\x94\x78\x38\x83\x94\x27\xa7\xea\x4e\x0f\x6b\x9a\x6a\
+\xc2\xd4\xe1\x4c\x97\xcd\xec\x4d\xde\x0f\x76\x10\xce\x6a\xd8\xa1\
+\xdd\xfd\xe5\x12\x21\x43\xb1\x5a\xe9\x90\x1a\xb7\xc3\x8b\x18\x0d\
+\xa6\x90\x7a\xf2\x7b\x6b\x8b\x44\xdc\xde\x8e\x70\x5d\x13\xb1\xa3\
+\xe6\x95\xe2\xcd\x8a\x12\x77\xcf\xd1\x5a\x73\x6d\xf3\xa6\x78\xd5\
+\xa2\xf2\x66\x90\x87\xfb\xfe\xb8\x2e\xb4\x62\xb4\x7f\x3d\x10\x3d\
+\xdd\xf8\x40\xf5\xc8\x68\xcf\x75\xfa\x4c\xa7\x4f\x35\xc3\xf8\x4f\
+\xf6\xbb\x44\x19\x6f\xd8\x0d\x7a\x7e\xc4\xc1\xeb\xf7\xc7\x3f\xc4\
+\x4f\x9e\x3d\xfd\x36\x60\x96\x79\x88\x7f\x61\x3e\xb9\x8f\x7f\x08\
+\xff\x99\xf4\x9f\x0e\x34\xb1\xd9\xf9\x05\xe0\x86\xf5\x9f\xb2\xde\
+\x3f\xe1\xdf\x08\x8e\xe2\x6f\xb2\xdd\xdf\xbd\x76\xbf\x1b\x0e\xbf\
+\x1b\x3d\x09\xee\x1c\x8b\x81\x9f\x1c\x92\x39\xcb\xa7\x64\x21\xa9\
+\x1c\xd0\x5e\x2f\x38\x7e\xbd\x3b\x0e\x03\xe5\x0c\xf8\xf9\xf3\xe7\
+\xfe\xe7\x27\xfd\xbc\xb8\x1c\xec\x0e\x87\xc3\x41\xf9\xe9\x32\x40\
+\x06\xcb\xb4\xf6\x55\xcd\x93\x82\x91\xf9\x19\xa0\xa5\x20\x00\xec\
+\x33\x04\xfc\x62\x4c\x8a\xd3\x3d\xf8\x0f\xad\x91\xb0\x30\x4f\x10\
+\xdb\x85\x20\xc4\x9c\xa4\xa7\xc6\xe0\x8f\xef\x65\xe4\x7d\x51\x74\
+\x93\x90\x4f\x82\xb7\x41\x1c\x1c\x04\x51\x37\x04\xc1\xe6\x04\x28\
+\x23\x6c\x66\x00\x9c\x01\xdd\x5c\x74\x81\xc9\xf8\xa3\x9a\x04\x5f\
+\xa0\xcc\x35\xfc\x17\x68\x75\x55\x01\xe2\xed\xc1\xb0\x33\x0c\xc8\
+\xc0\xe1\x5f\x89\x99\xa3\xfe\xa1\x66\xd9\x2f\xab\xf5\x02\xa0\xba\
+\x4a\x82\xe7\x53\x74\x83\xfc\x4d\x5a\x7c\xa3\x5c\xac\x4c\xfa\x45\
+\x95\x54\xc0\x1c\x6d\x99\x26\xea\x56\x22\x8c\x43\xed\xab\xf2\x6d\
+\x0a\xcb\x31\xff\xb9\x10\x58\x37\x4b\x3f\x89\xcb\xb4\xca\x0b\xa8\
+\x18\x06\xba\xea\x01\xec\x09\xe6\xea\x6f\x20\x2a\x55\xf2\xb1\x0a\
+\xb5\xab\x07\xe0\x30\xf9\x9d\x66\xb3\x02\x4e\x26\x24\x94\x5e\x42\
+\x67\x17\xbd\x1d\xdc\x84\x27\x50\xa6\xa8\x92\x65\x0a\xf2\xf0\x7e\
+\x56\x85\x83\x5f\xf9\xf9\x3f\x45\xf5\xef\x41\x78\x32\xec\x7d\x77\
+\xda\x8d\x6e\xbf\x1a\x00\x16\xe2\xd3\xd0\x0c\xa9\xbf\x2a\x79\xf1\
+\xfc\x12\xfb\x47\x7c\x30\x1a\x02\x89\xa8\x92\x1c\xe6\x88\x0d\xff\
+\x90\xe7\x97\x0b\x1e\x80\x20\x55\x54\x7b\x4f\x9f\x7c\x4b\x13\x78\
+\xbe\x9a\x89\xfc\x9d\x1a\xbd\x5c\x97\x88\xcd\xab\x64\x6b\x4b\x79\
+\x5b\xa0\x4d\x77\xca\x56\x90\xc2\x55\x3b\xd3\x79\x91\xa3\x73\x06\
+\x5b\xc8\x19\x5c\xf2\xe9\xc7\x1c\x9b\xdd\x42\xab\xbf\xad\x39\xfe\
+\x53\x55\x6c\x0a\x55\x56\xaa\x4a\x99\x5e\xa4\xb0\x7c\x11\x1c\x73\
+\xaa\xb2\x9c\xa7\x59\x95\x5f\x41\xc2\x0c\x56\xf8\xf0\x03\x9e\x05\
+\x41\xb6\xbb\x30\x8a\x7f\xb1\x65\x95\x20\x9b\x69\xe7\x85\x8e\x0e\
+\x78\x56\xac\x93\xd4\xaf\x22\x83\xda\x57\x72\x07\x83\xaa\xd6\xc0\
+\x05\xb4\x2a\x97\xeb\xe5\xf1\x31\x1c\xa9\x42\x5c\xdb\xf9\x41\xf9\
+\xab\xd1\x88\xf6\x12\x8e\xba\x9a\x66\xad\x34\x4c\x01\xc4\xf2\x4b\
+\x68\xe6\x20\xff\xf2\x9e\x17\xe5\x92\x13\x10\xc9\xe6\x3f\xc1\xd4\
+\x54\xbd\xb7\x67\xaf\xf6\x8f\x9f\xbf\x78\xfb\xfa\xec\xc9\x2b\xe0\
+\xb3\xaf\x40\x98\xbc\x80\xff\x2e\xd1\xc2\x61\x6b\x86\x4b\x71\x56\
+\xb1\x35\xb4\xd3\xe2\xfe\x9a\x17\x02\xb6\x8a\xce\xbf\xdc\xfa\xab\
+\xfc\x5c\xe0\x0e\xb1\xeb\x2a\x59\xa3\x84\x5f\xb1\xcf\xf2\xd7\x45\
+\xc5\xde\xdb\x4e\x49\x12\xe5\x05\xc1\xea\xf6\xb6\x4a\x3c\x38\x76\
+\x93\xd9\x5b\x28\x1e\xb6\x57\xd8\x7a\x0f\xf0\x79\xee\xce\xe1\xdd\
+\xe1\xd9\x87\xc3\x9f\x5f\xfe\x08\x33\x78\x0b\xa3\x0f\x72\xd8\x9d\
+\xd5\x74\x0e\x6c\x4d\xe1\x1c\x18\xed\x9b\xd4\x7f\xa5\xa0\xfc\x03\
+\x16\xda\xde\xd6\x40\xef\x2a\x8c\xda\x4a\x46\xec\x83\x9c\xcd\xbc\
+\x62\x07\xf2\xd7\xa2\x62\x5f\xaa\x64\xb4\xa7\xbc\x6c\xfa\x33\xfe\
+\x49\x4c\xf9\x7b\x71\xcd\x17\x47\xb8\x30\xa6\xcb\x12\x50\x18\xcf\
+\x54\xfe\x6f\xaf\x80\xce\xfa\x19\x40\xea\x05\x88\x60\x98\x13\xb1\
+\x97\x95\x6b\x87\x2f\x6d\xe4\xb7\x46\xe3\xaa\x58\x2b\x3a\xaf\x9c\
+\x3f\xe4\x8e\x68\x97\x0f\x44\xaf\xc1\x32\x2d\x4b\xdc\x67\x76\x83\
+\x86\x9e\xae\x91\x5f\xb2\x35\x04\x96\x68\xac\xba\xad\xa3\x8a\x30\
+\xa8\x80\x07\x7d\x2f\x6b\x53\xce\xf1\x6a\x89\xce\xc9\x80\x27\xd1\
+\x49\xd4\xf8\x57\x35\xec\xcd\x1e\xa8\x79\x37\x4d\xab\x29\x39\x2a\
+\x6b\x0c\x58\xdd\x01\xcd\x3c\xc6\x23\xda\x8e\xdf\xe1\x84\xa6\xd9\
+\xa7\xb4\x0c\x22\xe2\xbd\x61\x2f\xf9\x75\xc5\xfe\x20\x78\xd8\x44\
+\x11\x6e\x6f\xb7\x7e\x82\x63\x0a\xe8\x3f\x52\x59\xc7\xbf\xfc\x70\
+\x04\x6b\x14\xb1\xd7\x50\xf1\x0f\x04\x41\x67\x2d\xd4\x42\x56\xc9\
+\xa6\x11\xcc\xc4\x27\x34\x22\x82\xf3\x0a\x33\xfc\xf1\xc3\xc1\xdb\
+\xe4\x1f\x7b\x9f\xe2\x72\x9e\x2e\x79\x27\x9d\xfd\x99\x04\xa3\x60\
+\xf0\xfd\x3f\xb4\x64\x8d\x46\x72\x65\xf5\x72\x2e\x16\x33\xcd\x76\
+\x09\x89\xbf\xfb\xe7\x7c\x0e\x58\x20\x07\x82\xb3\x2a\x16\xe1\x7f\
+\xc1\x8e\xa5\xab\x45\xf5\x5f\xbf\x1c\xbc\x8d\x02\x26\xac\x15\x91\
+\xd1\x88\x0a\xd8\x9a\x3f\xed\xa2\x19\x9b\x50\x58\x34\xc7\xac\xae\
+\xf2\x6c\xe0\x92\x16\x0c\xda\xaf\xf2\xb7\xf9\x67\xed\xcf\x69\x10\
+\x8f\x72\x03\x7b\x51\x25\x37\x82\xc7\x80\xe6\x04\x5f\x54\x20\x0a\
+\x57\x8c\xcf\x2e\x79\xcc\xe1\xc4\x12\xc6\x8f\xe1\x08\x2a\x4c\x1e\
+\xe7\xe6\xe7\xee\x93\xb8\x34\x1f\xc7\x55\x3e\xfd\x18\xa3\xc8\x83\
+\x28\x36\x86\x43\x21\x31\x6b\xbc\x02\xcc\x83\x38\x35\x86\xd3\x21\
+\x31\x67\x3c\xad\x98\xc2\x99\xf1\x99\xaa\x30\xda\x8d\x67\x15\xc2\
+\x55\xbc\xc4\x51\x3c\x99\xc5\x57\xba\x73\xf8\x7d\xa1\xda\x80\x9f\
+\x97\xd8\xe3\x1a\x7e\x7c\xaa\x98\xc4\x30\xf1\x5a\xff\xfa\x55\x0e\
+\xf6\xda\xff\x86\xb2\x9f\x21\xa5\x54\x68\x23\x7e\x5f\x49\x5d\x14\
+\xfc\x7c\x0b\xcc\x23\x9e\xe5\xf8\x5c\x57\x39\xa4\xd1\x7f\xd0\x9f\
+\x3f\xd0\xc8\x0f\x2a\x06\xab\x2b\xb2\x34\xfe\x02\x75\x1d\xd8\x2e\
+\xe3\x97\x15\x93\xf0\x19\x1f\xc3\xf4\x3e\x5d\xc6\x7f\x54\xec\xd3\
+\xd5\x22\x7e\x0d\x3c\xda\xf3\x2a\x79\x0f\x44\xdf\xa0\xb2\x57\xf9\
+\xe7\x0c\x88\xbf\xea\x7c\x86\x5f\x6c\xbf\x56\xe6\x00\x0e\x94\x2d\
+\x83\xc7\x2b\x60\x87\xb5\x32\x3f\x2f\x6d\x89\xd5\x32\x60\x47\xb5\
+\x7c\xe9\x84\x68\xcb\x48\x17\xb8\x80\xbd\x83\x6d\xbe\x63\xaf\x08\
+\x7b\x58\xfb\xb6\xca\xb2\xc5\xae\xaf\x77\x74\xf3\x33\xe6\x14\x12\
+\x42\x80\x49\x82\xf3\x3b\x67\x2b\xb6\x60\x53\x76\x66\xab\xcf\x48\
+\x3f\xdc\x57\x3d\x7d\x40\xd6\x39\x49\x80\xad\x84\xc1\x1c\xee\xbf\
+\xfb\xf0\xfa\xe8\xec\xc3\xef\xef\x5f\x9f\x1d\x1c\xfe\x7c\xfc\x1a\
+\x50\xf1\x55\x0e\x20\x89\xd4\x75\x48\x66\x6f\xe7\xab\xaa\xca\xb3\
+\xf2\xf6\x96\xfa\x9a\x47\x0a\x29\x04\x0e\xbe\x26\x05\x4d\xb8\x02\
+\x36\x7f\x01\x6c\xfd\x34\xc9\xd8\x99\x6b\xaf\x4c\xbd\xd7\x3a\x53\
+\xc8\xbf\x3e\xaa\x4d\xe5\x8e\x04\x2a\x93\x68\x04\x0b\xe4\x4d\x57\
+\x27\x81\xf1\xca\x77\x06\xd2\x9d\x9e\x26\x67\x6c\xd5\xc4\x95\xcf\
+\x2b\x76\xc6\xb6\x46\x11\xac\xec\xed\x6d\xb8\x91\xfd\xc2\x72\xbf\
+\x92\xe6\x81\x6d\x2e\xb3\x5f\xb1\x1f\x1f\x2a\x73\x58\xb1\x37\x0f\
+\x95\x39\x32\x65\x70\xbb\x87\x51\x14\xcb\x35\x25\x80\x92\x4b\x3a\
+\x87\xe5\x0c\x41\x7c\x8a\xea\xd3\xa5\x32\xdd\xec\x34\x99\xb1\xb4\
+\x75\x84\x33\x9c\xad\x6e\x91\x67\xb3\x40\xfa\x80\x84\x05\xb6\x58\
+\xb6\xb4\x88\x65\xb0\x41\x60\xb6\x5b\xa7\x93\xd3\xf2\xb5\xe4\x1d\
+\xa9\x3c\x75\x31\x6a\xa0\xee\x57\xc2\x78\xef\xaa\x13\xb3\xc7\xfb\
+\xb3\xd3\xa4\xb2\x05\x7e\x6c\x2b\x00\x43\x6c\x54\x71\xa4\x83\x37\
+\x54\x47\x59\x85\xd7\x0a\xda\x52\x04\x27\x75\x9f\x7f\xc4\xaf\x38\
+\x4f\x72\xa2\x7b\x57\x45\xe6\x5b\xba\xc0\xbc\x43\xef\x6c\xf2\xce\
+\x05\xac\x77\xc9\x67\x1f\x74\xe1\xea\x94\x09\x8d\x84\x7f\x69\xc5\
+\x16\x6f\x21\xc9\x45\x18\xb1\x7b\x36\xd8\x5f\x2d\x98\xc1\xa9\xb1\
+\x5a\x06\xce\x2e\xb1\x1f\x80\x71\x33\x1b\x13\x48\x09\xaf\x62\xbf\
+\x57\xec\xb7\x8a\xfd\x54\xb1\xaf\x2a\xf6\x2f\xc0\x87\x22\xb9\x10\
+\xe1\x49\x60\x24\xba\x80\x29\xb6\xff\x83\x93\x72\xe8\x7e\x00\x53\
+\xe9\x7e\x5e\x95\xf6\xeb\x14\xe4\x61\xd5\xa0\xd3\x88\xe4\x6d\x99\
+\xcb\xe8\x32\x8f\x6f\xb6\x6d\xea\x6f\xd5\xa8\xfc\x84\x56\xb9\x48\
+\x9a\x2d\x22\x1c\x82\xd4\xeb\x35\x45\x69\x13\x21\xba\xc1\x6b\x58\
+\x83\xd8\xe9\x13\xd7\xc4\x22\xb2\x4c\x38\xaa\xde\x92\x94\xc0\xae\
+\xeb\x9d\x39\x6a\x78\x61\x24\xf9\x82\x17\xeb\x7d\x69\xb5\xee\xc4\
+\xc8\x10\x8e\xb2\x8c\x14\x64\x44\xf7\x4f\x04\x5e\x6b\xf6\xa7\xab\
+\x02\x9d\x00\x8e\x31\x09\xd1\x93\xfb\xed\x84\x5b\xc9\x80\x0f\x48\
+\x57\x55\x8e\xae\xb8\x68\xbd\x61\x65\x42\xc9\x2e\xfc\x22\xf8\x67\
+\xf2\xf0\x02\xb9\xb4\x2d\x4f\xf2\x49\x57\xcb\x55\xc5\x67\xd4\x36\
+\x06\x51\x58\x2d\x16\x51\x34\xc1\x6e\xc8\x9c\x38\x62\xb2\x0b\x94\
+\x4b\x94\x0d\xb0\x9d\x45\x29\xfc\xd8\x11\x1b\xd8\x22\xe7\x7a\xa0\
+\x3f\x5d\x00\x55\x7c\x97\x5e\x71\xd4\x3a\x80\x34\x4d\x5e\x32\xe9\
+\x72\x09\x6b\x4c\x8c\x10\x3a\xdf\x38\x3d\x14\xc2\xd5\xa9\x2e\xc9\
+\x37\x02\xc5\xb6\x31\xf9\x22\x49\xb6\x52\xd6\x73\x0f\x68\x2a\xb4\
+\xd3\xc5\xd8\x63\xb2\xa2\xca\xaf\xe2\xe4\x39\xb5\xe7\xf7\xf6\x89\
+\xde\xee\x54\x03\x16\x9d\x6e\x75\xdd\xc1\xbb\x83\x58\xdd\xdb\x8c\
+\xed\x59\xb7\x03\x52\x04\xb0\xe3\x2f\x38\x0c\x1b\x37\x42\xb4\x0f\
+\x6e\x21\x8c\xf9\xbd\xb1\x49\xaf\xe4\xaa\x22\x32\xb4\xf1\x6f\x4c\
+\x52\x5f\xdf\xaa\xe3\x3d\x9c\x54\xce\x2e\x85\xb3\x27\xc3\x3d\x6d\
+\xab\x0f\x92\x17\xea\x8b\xf9\xe5\xeb\xeb\x65\x18\x84\xff\xfb\xf6\
+\xdf\xff\x2e\x23\x32\x8d\x0f\xe1\xd7\xed\x57\x11\x70\xc9\xc8\xb4\
+\x87\xae\xd9\xfb\xd4\x85\xe4\xf1\xa6\x61\x19\x6f\xa3\x04\x83\x0e\
+\xb0\x0d\x8e\x6e\xee\xa8\xd1\xfa\x3b\x23\x9f\x72\xf2\x89\x54\xf3\
+\xbe\xbd\x9d\xe1\x8f\x30\x54\x93\x00\x48\x45\xe5\x49\x1c\x04\x51\
+\xd7\xf5\x0f\x38\xd3\xa3\x6a\x19\xcc\xc4\xed\x46\xc2\x03\xba\x8e\
+\x50\xc3\xab\x30\x44\x5d\x0c\xb5\x8d\x0d\x47\x26\x92\x48\x20\x9d\
+\x04\x3a\x80\x62\x20\x39\x72\xfa\x9a\x79\x7d\x25\xa6\x2f\x84\xf2\
+\x3e\x46\xcf\xf8\x25\x5d\x4c\x2a\x17\xf2\xe3\x96\x12\x89\x70\x22\
+\x1e\x39\x28\x06\xb7\x32\x87\xe3\x5f\x2e\xf3\x6c\x06\xb8\x46\x1d\
+\x2a\xba\xdc\x6a\xcf\x8a\xd8\x63\x47\xd2\x36\x0e\x3b\x8a\x2b\xa1\
+\x83\x5b\x2d\xd3\xa9\xa8\xa4\xaf\x8a\xc4\x53\x13\xf5\xb7\xaf\xb2\
+\x60\x4a\xc1\x85\x58\x00\x25\x71\x0a\x39\xb2\x93\x73\x31\xb0\x35\
+\x02\x74\x17\xbc\xfa\x8d\x62\x34\x18\xfc\xdf\x3f\x10\xd3\x22\x2f\
+\xf3\x8b\xaa\xff\x7c\x01\x2c\x7f\x40\x52\x2b\x27\x19\x09\x9b\x2d\
+\xfb\xa2\xe2\x57\x78\x45\x6b\x44\x1c\x00\xb5\x91\xe3\x91\x79\x27\
+\x5c\xdb\xed\xd1\x70\xb8\x03\x70\xc6\x27\x21\xef\xbf\xce\x30\x62\
+\xcb\x2c\x81\x34\x8c\x38\xc3\x78\xff\x50\x8f\x1a\xef\x76\xe4\x44\
+\x64\x37\xdd\x24\x40\x7f\xfe\x4b\x90\x5e\x80\x0f\x01\xb8\xd7\xf3\
+\x53\x0e\x22\x77\x35\x37\x94\x0b\x83\x68\xe4\x39\x7f\x40\x2b\xb7\
+\x39\x22\x0b\xac\x9a\x71\x2d\xad\x6c\xbc\x1e\x37\xe8\xd1\x65\x0d\
+\xd9\x02\xfe\x94\x3a\xdb\x21\x1b\x22\xcb\x20\x09\x48\x25\x4e\x93\
+\xf0\x0a\x28\x3b\x91\x2f\x0c\x94\x11\xc2\x4c\x50\xc5\xb8\xbc\x66\
+\xf8\x6b\x8d\xbf\x22\x4d\xdf\xb0\xc0\x93\x59\x5b\x11\x68\x14\x75\
+\x94\x7c\x12\x74\xe4\x25\x6f\xd0\xe5\xb8\x04\xb1\x17\xfe\xe8\x93\
+\x82\x11\x27\x3e\xd5\x32\x2f\x61\x91\x3f\x55\x13\x39\x60\x34\x79\
+\x53\x6b\xbc\xe0\x17\x15\x9a\x4c\x62\xf3\x01\xd3\xa9\x55\xbe\x44\
+\x93\x49\x4a\x74\x5a\x5e\xfb\x67\xc0\x6d\xde\x9d\xb8\xad\x70\x8d\
+\x11\x38\xbe\x08\x1d\xb8\x24\x98\x15\xe9\xa5\xe2\x7e\x8e\xdc\x3d\
+\xfb\x8c\xe5\x8e\x1f\x2e\xf7\xde\x12\x91\xde\x88\xce\x52\x95\x9e\
+\xef\xa3\x3c\x0c\x74\xc4\xc7\xe8\x06\xe0\xc3\xb7\xd0\x38\x30\x47\
+\x49\xf8\x15\x14\x89\xf4\x21\x59\x55\x0b\x91\x71\x33\x63\xf5\x9d\
+\x04\x19\xf0\x16\x01\x73\xc6\xfc\x91\xaf\xa5\xb4\xf7\x56\xb8\x18\
+\x06\x5b\xbd\xf9\x0a\xcf\xfc\x57\xf5\x36\xfe\x85\xbc\x58\x02\xbd\
+\xc9\x33\xcf\x8e\x1f\x6c\xec\xdc\xce\x6b\x2b\x0c\xfd\x99\x90\x13\
+\x67\xc9\xab\x5f\xc5\x0c\xc9\x41\xa5\x3e\x7f\xe4\x68\x4d\x0c\x9c\
+\x09\x2c\x83\x01\xf1\xf3\x7c\xb6\x8e\xc6\xf6\xfe\xcc\xf6\xf0\xc1\
+\xa3\x7c\x64\x92\xbc\x22\x04\xf5\x72\x81\x9a\x3f\xd4\xaf\x98\x2b\
+\xca\x9b\xeb\x58\xf4\x3f\x63\x77\x83\xca\xed\x1c\xaf\x24\xd6\x90\
+\x35\xa7\xae\x07\xf5\x91\x8c\xe4\xdd\x92\xd7\x66\x2c\xee\xee\x7e\
+\x02\xce\x15\xe4\x44\x60\xcd\xa7\x95\x51\xe3\xe9\x21\x4f\xc2\xdf\
+\x3c\x0d\x99\xb3\xf0\x6e\x0d\x02\x03\xe6\x94\x3b\xbe\xa7\x1c\x80\
+\xf7\xef\x95\xe4\x5b\x51\x87\x72\x4c\xf9\x40\x23\xa4\x46\xe1\x67\
+\x37\xe9\xd0\xfb\x02\xbe\xd5\xfb\xbe\x2a\x9d\x4f\xe0\x5b\x7f\x6b\
+\x2a\xf3\xc6\xbf\x4b\xb4\xff\x00\x96\xf9\x27\xec\xe9\xc9\xef\x15\
+\x7a\x86\xc1\xbf\x0a\xca\xfc\x19\x51\x43\xf7\x37\x43\x75\x81\xeb\
+\xff\xa7\x06\x2d\x98\x2b\xb1\x0f\x07\x22\xb9\xf9\x70\xf4\xfc\xdd\
+\xf1\x9b\xc3\xa3\x83\xb8\x12\x8c\x3e\xf6\x3f\xec\x1f\xbe\x8b\x85\
+\xfb\x75\xf6\xfa\xdd\xab\x98\x0b\xb4\x41\x89\x33\xfa\x43\x4c\x66\
+\x9c\x0b\x13\x42\x48\x28\xa7\xdc\xb8\x10\x32\x72\x4f\x9c\x0a\x56\
+\xe5\x6f\x0a\x60\x59\xe2\x39\xfe\x7c\x91\x4e\x3f\xc6\x2b\xc1\xe6\
+\x69\xf9\x12\x49\x55\xbc\x10\xe8\x3d\x26\x7f\x4f\x75\x7d\xf9\x79\
+\x26\x30\x76\x90\xfc\x3d\xa3\x0e\xe5\xef\xa5\x90\x31\x85\x08\x95\
+\xc7\x57\xd0\x2c\x6a\x1e\x8b\x7c\x19\x5f\x50\x8e\xa1\x42\xf1\x25\
+\x7d\xbf\xcf\x25\xdf\x1f\x7f\xa2\x46\xcc\xe7\x5a\xe0\x9d\x37\x12\
+\x93\x0f\xfc\xba\x92\x5b\x85\xe9\x20\x15\xf1\xac\x99\x0c\x92\x92\
+\x2a\x4e\xb4\xee\x15\xe0\x99\xf8\x5a\xa8\xa2\x36\xe9\xb3\x60\xcb\
+\x82\x5c\x7f\x0f\xe5\x99\x8e\xdf\xe3\xb4\xca\x0a\xf8\x40\x9d\xf2\
+\x56\x68\x73\xfd\xd9\x7b\x73\x58\xe3\x73\x99\x4a\x06\x44\x1f\xdc\
+\xf8\x89\x5f\x84\x77\x8d\xda\x54\x16\x1a\x7e\x8c\x42\xbc\x89\xe8\
+\xa3\x20\x97\x6c\x8c\xe5\x63\xa2\x50\xf8\xde\xf7\xa1\x20\xce\x2d\
+\xaa\x3b\xe1\x53\x4d\x71\x52\x9e\x52\x6f\x0d\x97\xf1\x97\xc2\x91\
+\x24\xa5\x7b\xbc\x23\x4a\x1d\xff\xdd\x71\xbe\x68\x19\xa7\xe7\x52\
+\x7f\xff\x60\x5f\xf8\x83\x35\x71\x17\x28\x90\x00\x89\xe7\x27\x2f\
+\xc5\xa9\x2c\x96\x32\xfa\xc0\x7b\x3c\x13\x76\x01\x13\xee\xdc\x29\
+\x9a\x99\xfc\x21\xac\x3d\xcb\x5b\x3c\x5c\x74\x6d\xb4\x35\x55\x22\
+\xfb\x6b\x38\x33\xa4\xd1\x92\x36\xd0\x52\xbb\x85\x16\x94\x01\xa3\
+\x9f\xb0\x42\x70\x08\x54\xf2\x0a\xd0\xc1\xe7\x39\xe7\x8b\x78\x0b\
+\x96\x24\xa3\x9f\xce\x35\x15\xde\xe3\x60\x39\x99\xee\xec\x3a\x6c\
+\x05\x80\xb6\x5c\x4d\x15\x7f\xa1\x7b\x05\xbc\x7a\x37\xcc\x26\xc1\
+\x59\xd0\x45\xf6\x09\xa9\x37\x59\xcd\xe3\x54\x40\xea\xa0\x29\x02\
+\x93\x5d\x0f\x0a\xe1\xa9\xf1\xda\x42\xdc\xa8\x60\x34\x20\x76\x42\
+\x9f\xe6\xba\x82\x76\x18\xaf\xb5\x93\x69\x4d\xf3\x07\x7d\xbe\xad\
+\x54\x48\x8a\xbe\x28\xdf\x17\xe2\x2a\x2d\xd6\x3a\x02\x08\x6e\xbe\
+\xd4\xf8\x11\xa1\x75\xd4\x71\x9a\xbb\xd3\x5b\x3d\xda\xb3\x2a\x13\
+\x2f\xb8\x82\x52\xaa\x63\x58\xb8\x7e\x96\x7f\x26\xab\x1b\xd1\x0b\
+\x81\x90\x80\xd8\xb3\x4a\x4c\xad\x89\xf9\x75\x32\x44\x77\xe5\x45\
+\x02\x02\x10\x08\xa1\x7b\xc9\xee\x53\xbc\xd8\x75\xd9\x70\x35\xf0\
+\x05\xec\xe4\x4a\x45\x79\x7b\xb1\x3a\x87\xd3\xeb\xce\xe7\xfe\x81\
+\x3b\x26\xc8\x37\x77\x14\xd1\x82\xf4\x40\xab\x48\x24\x2b\xe0\xf3\
+\x58\x46\x11\x1a\x51\xfe\xc3\x68\x6a\x13\xf9\x27\x5c\x45\xb1\x80\
+\x41\x67\x77\x2b\xf2\xfe\x4f\x82\xd9\xf9\x62\xba\x10\xd3\x8f\x01\
+\x5b\x29\x5d\x28\x02\x3a\x94\x83\x11\xa3\x54\x7e\x77\x87\x50\x27\
+\x59\x7e\x73\x59\x48\xf3\x0c\xa2\xc9\x9f\x15\x01\xc6\x94\xe5\x51\
+\x7c\x8e\xf7\x86\xa6\xb5\x84\x64\xcf\x2d\x84\xde\x49\x58\x24\x53\
+\x58\x0d\xe0\xcf\x43\x60\xe0\xa2\x93\x1f\xaa\xee\x2f\x55\x37\x4c\
+\x93\x3c\x42\x0d\x5f\x89\x09\x7f\x55\xdd\xf4\x34\x59\xca\x0f\xdb\
+\x0c\x26\x16\x6d\x6a\xb9\x5f\x48\x07\xb8\xf5\x12\x3a\xb9\x51\xea\
+\xf0\x18\x78\xda\x56\x15\xde\x5f\x15\x5b\x3e\xb6\xac\xb3\x1e\x85\
+\xd2\x31\xd6\xcb\xe0\x89\x11\x93\x9a\x82\x18\x2f\xf9\x3c\xf5\x26\
+\x26\xc8\x83\xa4\x3e\x9c\xa3\x85\x29\x13\xd1\xec\xfc\xb5\x38\xc1\
+\x80\x85\xb8\xa0\x2d\xc3\x55\xa7\x98\x0e\xba\xd7\x28\x9d\x71\xd9\
+\x68\xe8\x1f\xa9\x2a\xa9\x9d\x20\xf6\x0b\x1d\x65\x38\xea\x67\x64\
+\x23\xba\x69\x10\x38\x02\x9c\x7c\x4b\xbe\x52\x35\xc3\xba\x54\x55\
+\x3a\x9d\x53\x26\x2d\x09\xa9\x2c\x6c\x1a\x62\x98\xa0\x0b\x73\x89\
+\x18\x21\x83\x84\xfe\xa5\x80\x1a\x1a\x39\x24\x53\x7b\x24\x5e\x38\
+\x18\x9b\x70\x0c\xab\x29\xfc\x13\xd1\x8a\x73\x18\x1a\xe3\x10\xca\
+\x91\x58\xf5\x8c\x42\xa4\x6c\xcd\x3c\xc4\xa3\x41\x58\x34\x41\x18\
+\x56\x0c\x55\xfb\xae\xc2\x38\xe8\x86\x20\x34\x47\xdd\xb3\x53\x56\
+\xdb\xe5\xc5\x64\xd5\x7a\xe3\xf8\xbc\x92\x0b\x56\x53\x71\x6f\x2a\
+\xbe\xef\x17\x57\xfa\x6b\x40\x06\x61\x7b\xf9\x43\x55\x9e\xb5\x67\
+\x1f\xa9\xec\xa8\xe5\x10\x0a\xe7\x10\xa2\xf5\x88\x39\x7d\x65\x72\
+\x16\x9d\x32\x0c\x72\x23\x4f\x1f\x90\xae\xb9\xfc\x70\x4e\x1f\x24\
+\xe6\xad\x5d\xc2\xf1\x2b\x5a\x8f\x54\x7b\xf1\xbf\x90\xea\x3d\xbe\
+\xb8\x73\x08\xe7\xea\x10\xb6\x14\xd3\xb1\x05\xda\x5a\x00\x20\x46\
+\x58\x13\xf2\xa2\x20\x0e\x66\xdc\x83\xd5\x0a\x25\x10\x27\x4d\xc2\
+\x2a\x94\x8e\x98\x86\x22\x89\xfc\x0c\x78\x3e\xf7\x85\x46\xe0\xa1\
+\x96\xef\x55\x98\x14\xc8\x9e\x34\x52\x28\xc8\x6f\x5e\x88\x4b\x91\
+\xa5\x32\xec\xc9\xa4\xf6\xdd\x3f\xc3\x2a\x4b\x0a\x3d\x87\xea\x12\
+\x87\x08\x40\x0a\xfb\x59\x68\x6b\x7e\x27\x50\x87\x3b\x08\xe2\x8f\
+\x14\x8a\x61\xcf\x45\xbd\xec\xa1\x5b\x96\xd8\x36\x89\x2c\x50\x70\
+\xeb\x58\xa8\xee\xd8\xa5\xc6\x36\x64\xa3\x2a\xe1\x4d\xa3\xd1\x23\
+\x7f\x15\x14\x77\xf9\x4a\x2a\x7e\x27\xf5\x04\x15\xe8\x18\x0b\xff\
+\x82\x01\x6f\x91\x02\xf8\xed\xbd\x73\xdb\x93\x97\x60\xcf\x5b\xe6\
+\xfd\xca\xaa\x26\xb7\x8c\x32\x43\x87\x36\x99\x92\x98\xf6\x1b\xd3\
+\xbf\x7e\xd7\xba\x48\x10\x16\xc9\x18\x96\xf7\x9b\x12\x9d\x6f\xf1\
+\x68\x5b\xe9\x65\xa4\x4b\x88\x06\xbc\x7f\xdd\x13\x2a\x15\x7d\x63\
+\x99\x29\xf3\x3b\x94\x81\x8d\xc3\x22\x6b\x53\xe4\x03\x24\x10\x3f\
+\xf6\xa7\x48\x96\x00\x5d\xab\x6a\xb2\xbb\xb3\xc1\x04\x23\x86\xa5\
+\xda\x94\xe5\xdc\x8a\xfe\xea\xae\x0d\xc7\xd5\xa5\xbd\x7e\xc5\x17\
+\x55\xfa\xfb\x60\x37\x46\x00\xc6\x9f\x9a\x38\xd3\x17\x9a\x4d\x4d\
+\x7a\x3a\x6b\xf0\xa7\x70\x8a\x8d\x6a\xc5\x76\x87\x3b\xa6\xa4\x53\
+\x6c\xb7\x56\xec\x9b\x96\x62\xbf\xe1\x5d\x02\xfd\xfa\x63\x82\xc0\
+\x6b\x47\x36\x09\xbd\x71\x62\x39\xfb\x19\xa9\x61\x57\xa9\x58\x78\
+\x1e\xeb\x32\x29\xda\x7b\xb2\xfb\xed\x37\x4f\xcd\xc0\x30\xcd\x94\
+\x9f\xe8\x1f\x83\x1e\x95\xda\xf9\x66\x18\x0f\x69\xc9\x7f\x14\xc4\
+\x00\x99\x3b\x34\x5a\xb7\x1f\x81\x8a\x11\x87\x73\x8a\x66\x26\xf6\
+\xea\xcc\x51\x20\xd8\x22\x1a\x1a\xdc\x4a\x23\xe6\xf0\x6b\xbf\xb8\
+\xaa\xe8\x04\xaf\x07\x50\xbd\x35\x93\xb1\xca\x88\xde\x70\x1b\x35\
+\x0b\xf5\x8b\xa4\x04\x41\xe6\x0f\x15\xc4\xe3\x88\x03\x10\x5a\x5d\
+\x48\x8b\x31\x85\xde\x66\x2c\x4e\x93\xfa\x4b\x50\x64\xc3\x2f\x82\
+\x22\x09\x1e\x83\xf4\xe8\xe3\x97\xf8\xb9\x11\x19\x8f\xa7\x45\xbe\
+\x58\xb8\x79\xfb\x26\xef\x25\x9e\x64\x37\xeb\xd0\xc8\x84\xea\x90\
+\xc6\x47\xb2\xed\xf8\x1d\xc9\x7c\x07\x88\x23\x8c\x5c\xfa\x8a\xd2\
+\x7e\x35\x1b\x18\xff\x2a\xd8\x45\xfa\x91\x1f\x63\x85\x37\x50\xf1\
+\xa3\x40\x0c\x16\xff\x2c\x98\x28\x5f\x5f\x03\x63\x02\xd8\x4d\xc5\
+\x74\xfb\x85\xc4\x69\x8d\x91\x71\x26\x12\x51\x9b\x94\x63\x71\xc7\
+\x7e\x10\xc9\x6b\xed\x83\x7b\x53\xac\xea\xc1\x07\x91\x19\x90\xde\
+\x20\xd0\xa1\x76\x90\x3a\xe3\x0b\x63\x71\x2b\x30\xbe\xec\x25\xc8\
+\xb4\x25\xe2\x4c\x65\x44\xba\x2a\x68\xae\x09\xbf\xbd\xed\xef\x3e\
+\xd5\x95\xd2\x12\x85\xde\xf7\x68\x82\x92\x8c\x06\xc6\x40\x1a\xe4\
+\x8c\xfe\x53\xd6\xdf\x35\x9e\x53\x88\x15\x61\x01\x92\xb5\x41\x44\
+\x14\x4a\x11\xa4\x77\xd8\x78\xdf\x6f\xdd\x14\xf6\x2a\x63\x1c\x2b\
+\x27\x92\x34\xe5\x50\xc0\xad\x40\xf2\x11\xba\x70\x4a\xb1\x99\x39\
+\x06\xb5\xa0\x0d\x70\xed\x81\x6a\x93\x33\xb1\xff\x60\xe9\x96\x21\
+\xde\xa9\x2b\x33\xd9\xfc\x6a\x89\x02\x64\x28\x43\xd9\xc8\x06\x9b\
+\x0d\x61\xc6\xfe\x2c\x39\x08\xbd\x8e\x65\x28\x35\xe6\x34\x4c\xf1\
+\x69\xe0\x47\x8b\x21\xb7\x9e\x4e\xaf\x36\x51\x90\x85\x46\xfc\xc9\
+\x8e\xbf\xf2\x63\xb1\xc7\xa5\x7b\xf5\x19\xec\x29\x05\x3d\x0e\xbd\
+\x5d\x08\xc5\x00\xbd\x74\x8c\xd3\xb2\x29\x35\x6a\x9f\x99\xce\xbf\
+\x27\x5e\x9e\xde\x0a\xba\xde\x71\x77\xad\xef\x45\xa7\x89\xf0\x92\
+\x8c\x9b\x80\x2e\x0c\xd5\xcc\x0a\xa8\x8c\xe3\x90\xde\x2c\xbe\x0c\
+\x28\xde\x89\x1a\x8a\xbb\xae\x5f\x42\x77\x65\xa3\x16\x68\x1c\xb9\
+\x6d\x21\x87\x87\x4d\xa9\xe9\xb7\x79\xe3\x8c\x7a\xf6\xb9\x81\x5e\
+\xd5\x02\xb4\xe4\xac\xf2\x4f\xf7\xbc\xa8\xd8\xaf\xf1\xcd\xb4\x28\
+\xe3\xdf\xd9\x54\xaa\x00\x94\xba\x96\x3c\xba\xd4\xef\x2b\x91\xfd\
+\xe1\x7e\xa6\xd7\xee\x27\x45\x7f\x2b\xe3\x93\x53\xcc\x50\x7e\x27\
+\x2a\x0b\x30\xd6\x8c\x17\x7e\xa3\x26\xa4\x78\xbc\x55\x4b\xf8\x30\
+\x87\xa9\xcf\xf3\xc5\x2c\xfe\x1a\xb0\xc4\x8c\x7b\x25\x41\x28\xff\
+\xc8\x8b\x3f\xea\x0d\x98\x3b\xfe\x27\xaf\xde\x8a\x2b\x51\xc5\xcf\
+\x9e\x3c\x7b\xf6\xcd\xf0\x19\xb5\x7c\x9c\xa5\xcb\x78\x44\x3f\x25\
+\xfa\x19\x61\xf9\xe9\xc7\x23\x5e\x62\x7c\x09\x40\xec\xcc\x86\xc0\
+\xae\xc1\x86\x48\xa6\x3a\x22\xad\x5a\xcc\x79\x9a\xcd\x16\x18\x28\
+\xce\x84\x25\x95\x33\x4f\x4c\x88\x3f\xec\x88\x16\xe0\x6d\x2d\x03\
+\xbb\x7b\x29\x0d\x27\x2c\x9e\xc1\xae\x5f\xca\x1b\x50\x14\x8b\xdc\
+\xc0\xc2\x50\x1f\x63\xa9\x1b\xf4\x91\xc9\x11\x27\xcb\xd0\x4f\xf0\
+\x8e\x20\x56\x94\x26\x5d\x68\xc2\xdf\x37\x9b\xa1\xfc\x34\x01\x94\
+\x0f\x74\x52\xe8\x64\x47\x36\x84\x98\xe8\xe3\x0c\x0c\xb2\xc0\x0f\
+\x75\x3a\x16\xb8\xb6\xb8\xf8\xa1\x2c\x13\x61\x0f\x12\x60\xb6\xb7\
+\x1b\xf5\x75\x7f\x78\x95\x1f\xfe\x19\xea\x92\x58\x07\x0b\xb0\x1b\
+\x7c\x37\xa7\xc2\xf5\x6f\x0f\x31\xee\x2c\xa7\xdc\x6c\x58\x36\x01\
+\xe7\xee\x13\xaa\x04\x3e\x54\xaa\x03\x05\xbe\x7d\x0f\x86\x5a\xaa\
+\x9a\xf9\x48\xdd\x2e\x26\xc3\x31\xbb\x5e\x43\x3f\x5f\xf4\xe9\x5d\
+\x62\x02\xe3\xc6\xfd\x02\x09\xac\xb5\xc0\x78\x9d\xcd\xe4\x4a\x1b\
+\xd4\x3b\x53\x5b\x1c\x7a\x23\x91\xf0\x80\xf8\x58\xce\xbd\x2d\xe2\
+\x65\x28\x12\xc7\x6d\xcf\x8e\x36\x6e\x2c\x34\x74\xe6\xae\xbe\xf2\
+\xd9\x22\xb7\x41\x35\x4e\xdd\xaf\xb3\x97\x1c\xa9\x96\x85\x3b\x97\
+\xec\x2d\x72\x38\x53\xb0\x1a\x5b\xbc\x4f\xeb\x0f\xbf\x28\x6e\x1c\
+\x08\xf3\xf6\x6a\x9c\xf7\x15\x76\xc7\xd0\xb4\xb4\xb4\xe8\xe6\xa0\
+\x29\x83\xc9\xbd\x63\x32\x13\x3a\x04\xc6\x24\x6b\x2d\xc3\x34\x3a\
+\x87\x24\xfd\xf3\x4e\x96\x8f\xdc\x2d\xde\xb2\x0b\x01\xac\x8f\xde\
+\xb5\x3f\x2c\x24\xd5\x93\xe5\x6a\xca\xfe\xe3\x46\x89\xf7\x69\x46\
+\xef\xea\x50\x37\x9a\xd9\xf7\x9f\x28\x30\x67\x12\x53\x0a\x39\x16\
+\xcf\xdb\xea\x8c\x16\x88\xc0\xb7\xd2\x08\x80\x76\xf5\x0f\xdf\xcf\
+\xb5\xe1\x4d\x23\xd7\x78\xe2\x1d\x00\xfa\x70\x9d\xee\x2a\x76\x43\
+\x3b\x2e\xee\x0c\x01\x93\x47\x8d\x29\xbf\x48\xfc\xda\xcf\x36\xf4\
+\x83\x2a\x99\xf0\x93\x0a\x3f\xe2\x9e\x01\x85\xe2\xd4\xd2\xaa\xc1\
+\x3a\xed\x77\xe9\x86\x98\x1a\xf7\x69\xc8\xff\x48\xeb\x3d\xd9\xba\
+\xca\x78\x5e\x0b\x73\xe6\xdd\x0f\xeb\x05\xc1\x82\xc7\xda\x57\x3a\
+\x37\xc9\x78\x99\x10\x46\x7d\x13\x84\x6e\x37\xa2\x50\xd5\xf5\xf8\
+\x96\xda\x2d\x93\x5c\xc1\x0d\x1e\x95\xa1\xa8\x30\x5c\x96\x61\xb5\
+\xf2\xc8\x25\xe1\xa3\xde\x68\x90\x91\x67\x22\x21\x1e\xaf\x9e\x76\
+\xed\x0e\x73\xe2\x02\xca\x9a\x0f\x9e\xde\xd0\x02\x43\x12\xd3\x0e\
+\xe2\x0b\x2a\xec\x4c\xdf\x23\x96\x72\x87\x5b\x60\x84\x3c\x99\xf0\
+\x54\x3a\xb7\x8e\xa8\xef\x35\xbf\x41\xd4\x35\xf1\x09\x78\xf2\x1c\
+\x50\xe6\x12\x46\x20\x70\x6a\x14\x5a\xe9\xf6\xd6\xa4\xdc\xde\x9e\
+\x0c\xd9\xf0\x14\x25\x53\xa7\x9c\x13\x5b\xa9\xad\xac\x5d\x5d\xd9\
+\x9f\x3a\x46\xc0\x65\x70\x69\xcf\x12\x91\xf2\x3d\xcc\x93\x46\x44\
+\x0b\x22\x15\x58\x7e\xe2\x04\x9c\x51\x49\xa8\xb7\xcd\x23\xc0\x64\
+\xa3\xc1\x50\x1d\xb5\x1b\xc5\x46\xf8\x7e\xa6\xb4\x5a\xf9\x9d\xf2\
+\x13\xcd\xec\xe6\x70\x7f\xa3\x0b\xcf\xab\xbb\x19\x75\x20\x47\x1f\
+\xcb\x66\x11\x37\xd8\x40\x6e\x2e\x70\xf5\x48\xb0\xb8\x75\x6d\x2f\
+\x68\xc2\xa9\xd7\xaf\xda\x6e\x6c\x5e\x8d\x14\x03\x57\x57\x0d\x27\
+\x5a\xad\x44\x50\xc1\x12\xa2\xbe\x0a\x6a\x10\xb6\x04\xf6\x94\x95\
+\x3b\x20\xb5\x75\xb2\xbc\xea\x50\x94\xcf\x7e\xa0\xb7\x58\x1e\x9c\
+\x16\xc8\xa1\x4e\x5a\xc1\x8e\x2b\x32\xaa\x50\x1f\x1d\xb7\x0b\x7a\
+\x9c\x64\xb1\x39\x04\xa5\x99\x45\x78\x72\xd2\xfb\x6e\xc8\x7a\xe4\
+\x29\x7b\xf2\x9d\x74\x99\x3d\x25\xe7\x7d\xc0\x94\x9e\x87\x77\x1d\
+\xab\x59\x54\x68\x8f\x3b\xbb\x81\x5a\x88\xc1\xa8\xba\x17\x38\xb1\
+\xee\xc1\x07\x70\xaf\x62\xd8\x29\x13\x18\x8c\x65\x87\x82\xfd\x7a\
+\x02\xa2\x08\x69\x55\x15\xc5\x50\xa1\xde\x2c\x0e\x30\x06\x62\x55\
+\x34\xd1\x94\x3a\xcd\x10\xd3\xe3\x8b\x53\xee\x37\x09\x18\x3f\x68\
+\xfa\xad\x12\x31\xa0\xf3\x0d\x09\x24\x9a\x6d\x02\xe2\x60\xc9\xfa\
+\x31\xe4\x30\x0c\x1e\xd5\x9a\x0b\x44\xff\x4e\x53\x7d\xd1\xcf\x72\
+\x34\x6b\x3f\x46\x21\x41\x8d\x52\x72\xe6\x28\x91\x6a\xb1\x6c\x4b\
+\xbe\x1b\xa5\x26\x33\x09\xa7\x9a\xbb\xb8\x4a\x97\xd0\x34\x67\x81\
+\xd2\x10\xf7\x60\x7c\x3d\x2c\x16\x18\x0f\x6c\x04\x85\x03\x59\x0c\
+\x84\x90\xd0\x41\x5f\x76\xd9\x6a\x93\x03\xa1\xa6\xd6\x3e\x87\x81\
+\x6a\x4a\x2b\x65\x57\xd1\x47\x11\xe0\x2d\x60\xb8\xb4\x10\x95\x8d\
+\x58\x77\x56\xa4\x9f\xdf\xe3\xbe\x19\xbe\xd3\x4e\x27\x88\x9c\x0f\
+\x92\x3c\x22\x4d\x66\x1d\xb2\xe8\x1f\x2a\xff\x48\xd6\x08\x9e\x3c\
+\x5e\x95\x26\xfa\x0a\xf3\xeb\xb0\x78\xaa\xed\x5a\x97\xf2\x98\x60\
+\x70\xcb\xb5\x0b\x9b\xa8\xd3\x57\x97\x75\x23\xb2\xd2\x47\x7a\x75\
+\x73\x17\x59\x08\xda\xfa\x54\x45\x6d\xc0\x2b\x6b\x8e\x5d\xbe\x68\
+\x2c\xc3\xb4\xdf\x3f\x76\xf4\xa8\x74\x0b\x00\x96\x10\x35\x52\xc5\
+\x56\x89\x3d\x18\xe3\x32\xf9\x13\x0b\x15\x96\xcd\x2b\x26\xab\xb8\
+\xa0\xce\x16\xd6\xb1\x5a\xf4\xaf\x61\x77\xd6\x88\xc6\x17\x3b\x4d\
+\x8a\xb8\x62\xc0\x97\x4c\x93\x79\xdf\xc6\x60\x00\x9c\x85\xe6\x25\
+\x67\xc9\xa8\xff\xf5\x2e\x60\xf4\xb3\x1d\xc7\x89\x81\x3b\x31\x28\
+\xb3\x9d\xac\xb7\xd8\x59\x74\xc3\x6a\xd2\x1b\x01\xc9\xde\xc9\xe1\
+\x7f\xd3\x9d\x69\x34\x08\x77\x77\x20\x31\x8b\x17\x98\x36\x8d\xf4\
+\x2b\x55\x26\x14\xe5\x28\xea\x09\x8d\x7b\xf8\x1e\xc6\x94\x80\x16\
+\x9e\xc5\xc6\x77\xdb\x35\xaf\x9c\x39\x21\x2a\xad\x03\xb6\x72\xbb\
+\xc6\xdf\xbd\x0a\x1d\xbc\x6b\x97\x96\xcd\x0a\xdd\x7a\x05\x9c\xc5\
+\x55\xc2\xc3\x61\xe4\xbd\xa2\x66\x90\xca\x62\x27\x5c\x86\x57\xd1\
+\x4e\x38\x03\x5e\xfa\xaa\x7b\xb6\x53\x45\x83\x25\x5e\xaa\xf7\x66\
+\x90\x1c\x0d\x72\x79\xb3\xa9\x9e\x36\x73\xae\x5d\x3f\x25\x21\x6a\
+\x08\x7a\x57\xd1\xe0\x8c\xad\x51\x49\xa9\xce\xca\x84\x54\x10\xe6\
+\x33\xc6\xcf\x4f\x3b\xfd\x67\x3e\x4f\x78\xa5\x11\x40\x88\x22\x9c\
+\x8b\x11\x22\x63\xc1\xd2\xa9\x42\x37\xfe\x5c\x68\x7b\xef\x5d\x46\
+\x83\x35\xec\x1a\x8c\x39\x63\xa1\x27\xad\x0b\x36\xea\x3f\x8d\xa2\
+\x9d\x4f\xd1\x38\xdb\x4b\x46\x1a\xd3\x11\xe8\x93\xda\x02\x35\x2f\
+\x9e\xa8\x47\x96\xa1\xb5\x23\x48\x8e\x0e\xe1\xdc\x22\x8e\xd4\xe3\
+\x7b\xf0\x81\x83\xc1\x14\xe0\x79\xe5\x84\x11\x42\x50\xa3\xb3\xb8\
+\x18\x84\x3c\xc9\x99\x5a\x5a\x58\x4e\x5c\x57\x1e\xc9\xe2\x37\xf2\
+\x10\xa2\xb8\xa6\x11\x01\x0d\x00\x8e\x54\x24\x7f\x02\xae\x44\xad\
+\xd2\x5d\xfd\x99\x1c\x75\x7e\x5b\xe9\xe8\xdf\xa6\x83\xd4\x54\x2b\
+\x15\x74\x45\xdb\xf6\x08\xaa\x35\x6a\x3d\xf1\xe5\xb6\xba\xa8\x8c\
+\xef\x05\x18\x54\x64\xb1\xee\x3e\x50\x86\x19\x3f\xb0\xc2\x56\x7b\
+\x23\x46\xb9\xa8\x05\xae\x4d\x0d\x68\x8c\x0e\x63\x7d\x44\x6f\x1a\
+\x75\x37\xfb\xa3\xa7\x96\xfe\xce\xc0\xd5\x92\x29\xad\xce\x86\xa8\
+\x25\xa6\x1f\x59\xcc\x7f\x32\xc1\xcf\x6b\xcc\x58\x48\xd3\xf1\xd0\
+\xc1\xec\xb8\x59\x0b\xfe\x89\x2f\x4a\xe9\x41\x12\xd4\xa9\xc1\x5e\
+\x5b\xcb\x91\x11\xa5\x24\x4c\x48\xf8\xd3\x3b\xfe\xa8\xe1\xcb\x62\
+\xed\xc3\x97\x79\xff\x23\xc3\xff\xbe\xad\xe5\x4d\xc3\x37\x7b\xd2\
+\x7a\x32\xe4\x60\x78\x76\x91\x17\x53\xa1\x43\xb9\xe0\x03\x53\xce\
+\x91\x71\x99\xeb\xac\x45\x4d\xc0\x5d\x5e\x8d\xa0\xdf\xe0\x75\x1d\
+\xa6\x2b\x8b\x14\x27\x43\xfc\x5f\x98\x59\x4d\x57\xa3\xeb\x11\xab\
+\x8d\xbb\xed\x2c\x63\x28\x02\x60\xf3\x42\xc5\xf4\x45\x8f\x10\x61\
+\xca\xbf\x21\xc2\x14\xcd\x89\xd7\x68\x77\xd1\x20\xd6\x95\xa1\xcd\
+\x68\x2d\x87\xd7\x64\xe6\xe4\x2d\x92\xd5\x06\x61\x73\x9a\x1c\x86\
+\x27\x2b\x0a\xd4\x8a\x18\x35\xc7\x6b\x73\x2f\xe6\x6c\x19\xd9\xf7\
+\xe4\xa6\x96\x47\x9d\x47\x86\x29\x6d\xee\x1d\x90\xda\xd4\xb6\x30\
+\x97\xd2\xdb\xbc\x7f\xdd\xc5\x18\xa9\xf3\xfe\x1a\xfe\x02\x2f\x80\
+\x29\x7b\x53\x19\x45\xf6\xf6\x16\x3e\xbe\x9f\xaa\x00\xc0\xf8\xa0\
+\x50\xff\x1a\xda\xb8\xee\x61\x0d\x74\x8d\xb8\x9e\xa0\x69\x74\xb2\
+\x80\xa4\xbc\x7f\x1d\x67\x18\xf9\x1d\x3f\x28\x78\x35\xb4\xb4\x56\
+\x2d\xad\xb1\xa5\xb5\x6a\x69\x2d\x5b\x5a\x43\x4b\x6b\x68\x69\x4d\
+\x2d\xad\x27\x68\x5a\x0d\x95\xd7\xd0\xd2\x1a\x5a\x5a\xf7\xe8\xc3\
+\x44\xbd\x56\x20\x52\xa3\x38\x59\x74\x1f\xc8\x68\x0a\x20\xe4\x03\
+\x07\xe8\xc1\xec\x6b\x59\xdd\x07\xd9\xe4\xc9\xf3\x6c\x2e\x2a\x57\
+\xa9\x04\x10\x88\xf2\x06\x6a\x6c\x49\x64\xa8\x26\x36\x6b\x78\x17\
+\xfb\x91\xfd\xcc\xb6\x6a\x6e\xaf\x4d\xfb\x4a\xde\x32\x04\x48\x89\
+\x89\x29\xc6\xeb\x8c\x1d\x46\x42\x72\xc5\x44\xcd\x88\xe3\x2b\x12\
+\x6d\xe9\x9e\x68\x6b\x04\xd1\x4e\x89\xbb\x59\xa2\xbc\x53\x59\xf5\
+\x1a\x5a\x37\x67\x13\xbd\xba\xd0\x4e\x49\x06\xe9\xf0\x5b\x53\x0c\
+\xc3\xa3\x97\x2d\x3c\x3a\xc3\xfb\x4c\xbc\x98\x9e\xf2\x03\x89\xf0\
+\x41\xe0\x78\x50\xcb\xe5\x24\x24\xce\xbb\xa3\x4b\x8b\xea\xa8\x18\
+\xb3\x8c\x38\xdb\x1d\x0e\xa3\x76\x1e\xdd\x1b\x55\x41\x0a\xe9\x80\
+\xdd\xe4\x8b\x19\x6d\xb4\xc0\xc0\x2d\xf4\x8b\x6b\xbe\xa1\x79\x51\
+\x55\xe3\xd4\x1d\x9d\x92\x55\x84\x5a\x44\x16\xd5\x48\xae\xd6\xf1\
+\x7b\x12\xd9\x27\xe0\xf6\x49\x4e\x31\x17\x65\x92\xdb\xbf\x63\x8b\
+\x7c\xea\x5d\x6f\xa9\x30\x73\x1a\x7b\x52\xee\xa1\x79\x78\xf0\xa6\
+\x92\x8b\x03\xdc\xe0\xd7\xec\x33\x2a\x84\xd1\xe4\x84\xde\xb0\xc1\
+\x10\x1b\x39\x95\x17\x32\xc0\x85\x71\x57\xaf\x05\x05\x92\x57\x06\
+\x3f\xd8\xc2\x52\x37\x20\x23\xc6\x0c\xd9\x15\x2f\xcb\xf4\x92\xc7\
+\x81\x53\x82\x94\x05\xa5\x0c\x38\xc0\x67\xfd\x40\xa9\xc8\x15\x7c\
+\xeb\x0b\x80\x46\xc3\x47\xe4\x6b\x53\xea\x1b\x01\xbe\xb9\x24\x0d\
+\x41\x16\x33\x44\xb1\x4f\xf3\x9b\x38\x0b\x01\x05\x7f\xc5\xb4\xfd\
+\x99\xe3\x8b\xef\xcc\x5a\xd6\xd0\x17\xbd\x21\xb2\xbb\x40\xdd\xda\
+\x8b\x22\xca\x96\x7e\x82\xb5\xf2\xcc\x02\xc5\xdb\xda\xde\xd8\x00\
+\x47\x6d\x4d\x6e\x6f\xb7\xf7\x44\x07\x80\xc6\xfd\x70\x89\xb0\x75\
+\xb6\x56\x59\xee\x40\x83\xb9\x41\xf0\x52\xb5\x68\xe9\xe0\xba\x0d\
+\xab\xdd\x1a\x86\x0d\x61\x40\x06\x12\x97\x50\x00\xc4\x83\xbc\x86\
+\x26\xc1\x92\x17\x57\xa2\x2c\x49\xc8\xe2\x99\xe0\xb3\x80\x9e\x58\
+\xc1\x1c\xb5\x7e\x9d\x15\xcc\x2e\x15\x0b\xbc\xa2\x47\x87\x19\x09\
+\xa9\xfa\x95\x98\xf6\x61\x62\x10\x98\x26\x5b\xaa\x15\x48\xa1\x77\
+\x98\xf5\xe8\x39\x8e\x3e\x50\x11\x8e\x44\x3b\xbc\x52\x99\xb8\x43\
+\x4e\x38\x08\xae\x6d\xab\xa0\xa1\xb3\x2d\x4c\x77\xa2\xdf\x7c\x99\
+\xe6\xf8\xcc\x2e\xaa\x74\x45\xb5\x9a\xa1\x53\x8a\x4e\xc9\xb3\x4b\
+\x4a\x92\xd6\x38\x3a\x6a\x20\x08\xb3\xa6\x48\x3a\x9d\x82\xf0\x36\
+\x5d\x1b\x4d\xa7\xbf\x06\xe3\xdc\xae\x42\x28\xda\x74\xa1\x99\x55\
+\x6c\x4b\x65\x1b\xcb\x5b\xf4\x9e\x36\x31\xc2\x60\x8b\x4a\x9d\x89\
+\x01\x49\xf1\x81\x1a\x6e\xc2\x8a\x31\xdc\x11\xf9\xe8\x70\xd5\x37\
+\xbf\xef\xcc\xbb\x71\x85\xf4\xb8\x96\x83\x8f\x9a\x41\x84\x55\xce\
+\x49\x81\x0e\xdf\xf8\x27\x71\x92\xd4\x2e\xfb\x3b\x75\x81\x3d\x07\
+\xac\x94\x4f\xd8\xfc\x28\xaf\x2a\x5b\x34\x97\xa2\x61\x50\x2d\x89\
+\x1e\x3d\x07\x08\x1b\x21\x55\x56\xbe\xe0\x65\x6e\x3e\xbd\x07\x34\
+\xcd\x43\xee\xd5\x29\xde\x88\x4b\xe7\x81\x50\x9f\x04\xe5\x3d\xe1\
+\x9c\x67\xf3\x76\x9c\x73\x4f\x69\x2c\x11\xfe\x96\xc4\x75\x66\xb4\
+\xf6\xfb\xe4\xa3\xea\xa7\x59\x87\x2c\x31\x6b\x6a\x65\x0f\xd2\x65\
+\xc7\x14\xed\x88\xb2\x73\xce\x81\x69\xe9\x14\x1c\x4d\xdb\x3a\xe7\
+\xeb\x4e\x0a\xf8\x77\x8e\x59\xea\xb6\x01\x0f\x55\xb1\xbe\xf1\x5e\
+\x5a\x6b\xed\x8b\xb5\x17\xd9\x9f\x59\x73\x9d\x7b\x6a\x6b\x2f\xa9\
+\x46\x6d\x95\x71\x27\xfd\x6c\x10\x80\xf0\x26\xa4\x63\xdd\x47\xdb\
+\xb0\x98\xbe\x82\x35\x88\x35\xf4\x69\x21\x2b\x6a\xaa\x49\xb3\xb2\
+\x88\x1e\xf1\x32\xa5\xc8\x17\x80\xac\x35\x27\x52\x4b\x36\xad\x49\
+\xa2\xaf\xde\x0a\x07\x50\xd5\x66\x0d\x5e\x7a\x6b\xe1\x44\xba\x70\
+\x3b\xcd\x2b\x98\x2d\x1b\xf7\x95\x0e\xb4\xaf\x32\x4c\x34\x84\x5d\
+\xdd\xb7\xba\x1f\xf8\x9c\xac\xf2\x9c\x8d\xec\x6a\x19\x80\xe2\x65\
+\x64\xa6\x4e\x9f\xf8\x2e\xa7\x0f\xec\xea\x52\xdf\x5c\xf2\x53\x31\
+\xfc\xf4\xf6\x57\xab\x5c\xbd\x44\x6d\xee\xa0\xce\x80\xbc\x6f\xc6\
+\x62\xad\xaa\x8f\x52\xc8\xb0\x3c\x9e\x5a\x98\x07\xa8\xb6\x0b\x3a\
+\x3a\x29\xe8\x56\xd6\xd1\x17\x9b\x82\xe2\x41\xd4\x0d\x64\x59\x32\
+\x60\x16\x8a\xfd\x31\x7b\x69\xe6\x63\xe8\x96\x9e\x6a\x02\x1b\xcd\
+\xef\x8f\x79\xaf\x76\x64\xce\xa7\x1f\xf7\x2f\xde\xd2\x16\xd8\x1d\
+\x31\x3c\xb3\x21\x26\xf4\xa0\x74\x18\x4d\xea\x05\xf4\xf5\xdc\xba\
+\x7e\xb5\x26\x0b\x9a\x11\xbc\x35\x25\x74\x94\x78\x5f\xa8\xaf\x8d\
+\x0b\x39\x3e\xf5\x96\x88\x2f\x38\xeb\xa8\x52\xad\xc2\x9e\x1f\x74\
+\xb4\x26\xc5\xa8\x5b\x38\xfd\x76\x8a\x56\x4b\xd7\x4b\xe8\xf7\x51\
+\xc2\x48\x8d\xb3\xa1\x3e\x31\x43\xb5\x4e\xce\x2d\x1a\x8d\x89\x0b\
+\x65\xaa\x8d\xdb\xdb\x61\xdc\x56\x56\xf6\x53\xd7\x73\x3c\xd4\x8f\
+\xa2\x5a\x7e\xae\xee\x50\x65\x8e\x06\xc3\xb8\x25\x3d\x6e\x6b\xc9\
+\x59\xef\xc6\xd5\x26\xbd\x84\x28\x03\x87\xe3\xb5\x25\xd7\xd2\xfa\
+\xb8\x79\xd3\x1b\x82\x78\x3c\x74\x2e\x22\xd5\xdc\x49\x6a\x32\x69\
+\xb2\xc7\x5a\xe4\x58\x75\xf7\x97\x3a\xf1\x65\xd5\x5d\xdf\xbc\x7e\
+\x69\xec\xdc\x2b\x82\xe4\x7f\xe8\xdf\x4b\xa4\x4c\x53\x79\xa3\x31\
+\x80\x94\xc8\x91\xf7\x16\x49\xdb\xd5\xb7\x32\x23\x42\x6d\xfc\xf5\
+\x60\x05\xd2\xf7\x19\xfc\x5a\xc3\xaf\x35\x9b\x01\x57\x66\x54\xfa\
+\x53\x76\xa6\x9e\x6b\x44\x66\x01\xbf\x98\x5d\x02\xab\x6b\x9d\x39\
+\xee\x68\x0b\x7a\x28\xd8\x71\x0f\xcf\x06\xe1\x62\x30\x42\x91\x6b\
+\x47\xfd\x40\x21\x74\x62\x1f\xbf\xca\x06\x8b\x68\x67\x11\x3b\x6f\
+\x71\xc9\x14\x27\x96\x74\xce\xcc\x20\xf0\xa5\xd9\xe8\xc1\x17\x75\
+\x48\x28\x34\x47\xda\x11\x97\x8d\x42\x83\xac\x8f\x9c\xf0\xae\x0e\
+\x11\x93\x06\xcc\xca\x35\xb6\x41\xc0\x54\xb6\xf6\x8e\x1d\xba\x62\
+\xa8\x91\xc9\x47\x6e\xaa\x8e\x42\x2a\x43\x84\xdb\x63\x7c\xbf\xfa\
+\x58\x29\x99\xd4\xf5\x3f\x13\xb5\xb8\xdf\x5c\xdd\x73\xfb\xe0\x12\
+\x39\x9d\x1c\x92\x6d\xfd\xdf\x44\x88\x4b\x5b\xd3\xb6\x44\xfc\xf4\
+\x46\x65\xb4\xaf\x81\x9c\x16\x12\x5b\xf9\x91\xd0\x6d\x60\x6f\x05\
+\x8d\xe6\x08\xc5\xea\xad\xa7\x1a\x51\xb9\x27\xea\x8b\x4f\x00\xe2\
+\xca\x54\x2f\x37\xce\x95\x0a\x4b\x2a\xa1\xb7\x71\xf3\xba\xe8\x12\
+\x06\x77\x1f\xd7\xc2\xc6\xd7\x36\xcb\x99\xb9\x09\x2d\xb7\xc1\x22\
+\x0a\x8d\x7c\x74\x18\xf7\x01\x37\x61\xf5\xef\x98\x7b\x9c\x1e\xd7\
+\xd3\xc6\x2e\x14\xa2\x92\x97\x09\x61\xb5\x63\xbb\x31\x10\x24\xdf\
+\xee\xcc\x22\x42\x9a\x59\x5b\x24\x7e\xef\xc6\x7b\xd3\x5c\x1a\xfb\
+\xee\x3d\x63\xa0\xec\xba\x36\x84\x43\xfe\xcf\x3a\xf0\x9e\x2b\xa0\
+\x07\x24\xa9\x83\x26\x51\x6e\x91\x4f\xe9\xba\xde\x3d\x31\xce\x21\
+\x09\x6b\x76\x31\x96\x52\xca\xe6\xe5\xb4\x2c\x65\x7f\xe8\xe9\x01\
+\x9a\xbb\x7d\x24\xd1\x79\xf4\xb2\xbd\xf3\xbb\x4d\x31\xd7\x37\x9d\
+\x30\x27\xbc\xb9\x13\xa4\x7e\x63\xa0\xf4\x87\x9b\x51\xc7\xf4\x9d\
+\x6c\x6c\x43\xb8\xf1\x4d\xcd\x98\xa8\xf9\xb4\xe5\x7f\x86\x14\xb5\
+\xbf\x69\x88\x74\xdf\xea\xd1\xee\xd4\x6c\xc9\x6b\x06\x04\xb5\x8d\
+\xf6\x0d\xa4\x36\xb6\x69\x8d\x9f\x9b\xcd\xb5\xdb\x4a\x6d\xba\x7f\
+\xd9\x3c\x21\xf9\x94\xa9\x07\x41\x2d\x7c\xa2\x0b\x4a\x0f\x0f\xbe\
+\xd1\x4a\xdd\x20\x4c\xe6\xd7\x21\x53\x82\x03\xf4\x44\xae\x4d\x24\
+\x94\x3e\xa6\x37\xf2\x27\xaa\xe1\xbf\x5a\x23\x8f\x80\xfe\x7b\x56\
+\x88\xf2\x37\x8f\x49\x82\x9d\xdf\xdd\xbd\x87\x61\x13\x1f\xde\x3e\
+\x62\xd9\xbc\x6f\x9f\xbc\xf1\x31\x2f\x33\x8b\x84\xc2\x8f\x8d\xa5\
+\x92\xe1\x01\xb9\x1b\x75\x9c\xa4\xb1\xe8\x2b\xa7\xef\xbf\x29\xb4\
+\xa7\x0b\x10\xad\x66\xeb\x8e\xb5\xde\xa6\x96\xbe\xa0\x73\x6a\x50\
+\x92\x3f\x8b\xd6\x22\xe4\x99\xf4\x6f\xf1\xee\xcf\x5d\xf9\xfa\x8a\
+\x40\xcd\x31\xbb\xde\x20\x54\xd8\x4a\x4a\xcb\x66\x4d\xd4\x81\x87\
+\xf1\x4e\xb9\x67\xbc\x8e\x66\xcb\x8c\x62\x51\x19\x39\xcf\xb4\x04\
+\xc2\xde\xb9\x2b\xed\x49\xa7\x52\x8a\x19\x15\x7e\x71\x33\x64\xec\
+\x4e\x95\x23\xdc\x9c\x7c\x31\x13\x5c\x65\x4c\xdd\x0c\x15\xe2\x59\
+\xe6\x34\x47\xec\x94\xc4\x64\x69\x8e\x84\x85\xf5\x55\x0a\x05\x82\
+\x33\x1a\x47\x58\xdd\x20\x3d\x2f\xf3\xc5\xaa\xe2\x18\xd5\x0d\x23\
+\xbd\x92\x17\x13\xc6\xe6\x55\xdf\x17\x80\xa5\x67\xea\xc3\x84\xd6\
+\xd1\x0d\x24\xb6\xb8\x6b\xb0\x4e\x9c\x48\xe8\xa6\x34\xb5\x0f\x7e\
+\x6a\xa8\x77\xab\xc1\xc4\xb8\x9b\x25\xa5\xf6\x9b\xbb\xb1\xfd\x3c\
+\x52\xd2\xb9\x63\x97\xaf\x24\x66\x85\xb1\x8c\xb8\x1e\x06\x2a\x23\
+\x68\x9c\x72\xeb\xf0\xa1\x35\x00\x36\xe2\x8f\x36\x66\x77\xda\xa9\
+\xc4\x82\x7e\x05\x2d\x79\xe5\x3c\x9d\xe5\x9f\x37\xe5\xca\x57\xac\
+\xd6\x9b\xb2\xa5\x3b\xc4\xa6\xdc\x2a\xcf\xd1\xf0\x63\x53\xf6\x32\
+\x5f\xae\xbc\x4c\x2b\xf1\x35\x9c\x2c\x40\x04\x40\xe0\xed\xdb\x0e\
+\x2d\x1c\x93\xdd\xef\x5c\xcc\xb0\x1d\x2a\x64\xa7\xd4\x5a\x88\x5c\
+\x71\x78\x9b\x71\x3c\x6c\xde\x3d\xeb\xaa\xf4\x94\x9e\xfe\x7a\xec\
+\x7e\xe0\xb5\x9e\x70\x6f\xc1\x8d\x05\xbd\xd5\x1d\xe1\xbd\xd0\x12\
+\xb6\x5f\x5e\x0d\xb9\x02\xaa\xb1\x42\x1f\x5b\x9d\x86\x34\xf4\xc9\
+\xd0\xfb\x57\x9b\xdb\xc0\x28\xad\xb5\x4b\xd6\x68\x5b\xdf\x39\x71\
+\x4f\x63\x25\xf5\x55\xf8\xa6\xb5\x6e\x74\x03\x97\xe0\xd5\xc2\x01\
+\x69\xab\x42\xb1\xd1\xde\x50\x6a\x99\xce\x7c\x45\xab\xb6\xb4\x36\
+\x4c\xa2\xd5\x78\xcb\x3b\xb4\xf6\x99\x37\xb4\x2c\xe6\x29\x0a\xe7\
+\xa2\xb4\x6a\x8a\x3d\x56\x02\x7b\xc7\x3f\xbb\x6c\x1a\xb0\x36\xe8\
+\x1b\x47\x51\x14\x97\x22\x9b\xce\xa3\xc6\x0c\x83\x9a\xc7\x94\x0c\
+\x15\xcc\xf5\x6a\xbd\xde\xf0\x3c\x70\xa3\x1d\x79\x4f\x59\x6b\x48\
+\xbb\x4c\x6d\xb8\x71\xd4\x9a\x4a\x6b\x64\x55\x33\xaf\x74\xcc\x76\
+\xc8\xda\xd2\x71\xa5\x40\x28\x56\x57\xb3\x3e\x59\xac\x83\x70\x2b\
+\x27\xe5\x5a\x76\x2a\xeb\x71\x12\x9b\xf0\x7e\x7b\x83\x94\xe5\x6a\
+\x46\x7a\x0d\xfd\x09\xb4\xd1\x54\x95\x37\x9d\xf8\x6a\x37\xf4\xd6\
+\xf6\xc3\xb5\x44\xd9\x60\x62\x44\x6e\x6c\xae\x04\x5c\x53\xec\xfb\
+\xb7\xf8\x0d\xfa\x7d\xcc\xab\xce\x15\xd2\x70\x02\xa3\x4e\x9a\xcd\
+\x3a\xb8\x6f\x1d\x8a\x23\xd9\x0f\x34\x42\x57\xf1\xa8\xbd\x00\x14\
+\xd4\x6e\x45\x1e\xa1\x84\xce\x15\xeb\x31\x39\x16\xf1\x17\x31\x16\
+\xfa\x71\x4e\x55\xe2\xe4\xaa\xae\x9e\x88\x4e\x09\x42\x23\x27\x49\
+\xf9\xa7\x1b\xcf\xf5\x8e\xf5\x6b\xa7\x5f\xab\x65\xc7\x44\xc1\xe9\
+\xe8\xc0\x37\xf2\x07\x02\x16\x71\x22\xfc\xba\x02\xb0\x5b\x75\x3e\
+\xf2\xf5\x12\xfd\xf5\x3a\x2a\xa4\x19\xfe\xc5\x78\xd6\x72\x14\xf2\
+\xde\xe4\xd5\xe1\x81\x7c\x01\xc0\xe1\x40\xf4\x0a\x3b\xee\x68\xdb\
+\xdb\x36\x98\x97\xbe\x4c\xd7\x2c\x8c\xe7\xed\xf5\xa9\xee\x00\x55\
+\xf7\x81\x43\xea\xab\xb4\x58\x17\x17\x4a\xa5\x97\x45\xd6\x36\x8f\
+\xd5\x6f\x5a\xf2\xec\x40\x9e\x37\xdc\x09\xdd\x5b\x9b\xbb\xe2\x23\
+\xf4\xfa\x07\x61\x1d\xf2\x7c\x03\x90\xf0\xa6\x66\xb6\x40\x76\x85\
+\x77\xda\xf5\xc5\xf0\x6b\x4d\x00\xb6\x3a\x25\xc9\xe1\x7d\xc8\x97\
+\x49\x53\xdf\x24\xf3\x50\x17\x94\x0c\xa9\xb9\x83\x3a\x2a\xf1\x19\
+\x85\xda\xe9\x1c\xb7\xbc\xc8\x86\xf6\x34\xde\xf3\xe8\xd1\xf7\xc9\
+\x03\x1b\x60\x56\x66\xa3\x0f\x90\xa7\xd6\xc1\x89\x5f\xc0\xde\x4b\
+\x56\x5c\xc2\x72\x8d\x4e\x38\x2f\xbe\xe0\x65\x44\x9e\xd8\x98\x4c\
+\x88\xe5\x75\x2c\x17\x0a\xdd\x84\x09\xa8\x55\xed\xcb\x63\x81\xb6\
+\xf6\x65\x31\x55\x41\xd4\x58\x81\xc1\xd3\xcb\xb1\xf4\x46\xd3\x2a\
+\x34\x7b\x80\xd0\xba\x09\x20\x28\xb0\x21\x40\xa0\x6d\x00\x72\xfb\
+\x8d\x2f\x69\x60\xf8\x09\x71\xb5\x5a\x48\x07\x3b\xd9\x06\xc6\x2b\
+\xbc\xc4\x5b\xc0\x03\xba\x14\xe0\x11\x60\x31\x34\x5b\x3b\x07\xd6\
+\xe3\xe3\x1d\xf4\x46\xc4\x60\x41\xfe\xdb\x25\x70\xea\x18\xd4\x1b\
+\x07\x91\x43\x7b\xbf\x88\xb0\x64\x80\x10\xa9\x2c\x8a\x04\x99\xb9\
+\x6c\xcc\x23\xd3\x40\x99\x34\xae\xfb\x54\x8d\x32\x29\x5d\x0f\x79\
+\x13\xd5\x57\x46\x62\xba\xbd\x2d\x6e\x6f\xf3\xdb\x5b\xdd\x0d\xc5\
+\x1e\xa6\xf7\xe0\xd0\x8f\xc6\xdc\x58\xeb\x93\xda\x14\x76\x3c\x6e\
+\x03\x86\x4b\x71\x00\x70\x95\x0c\xee\x40\xbe\x97\x9e\x64\x45\xcd\
+\x1b\x86\xc2\xd2\xa8\x41\x73\xc7\x12\x33\xd8\x0f\x5d\x09\x96\x17\
+\x03\x3a\xb6\xee\x95\x3e\x62\x48\xd6\xf4\xe0\x08\x1c\x24\x8d\xd4\
+\xc2\x5b\x19\x9f\xe8\x98\x1b\x4e\xe8\x13\x37\x96\x97\x13\xc0\x2b\
+\x70\xf0\x57\x70\xca\xbc\xb6\xdb\x1d\xb6\x28\x08\x96\x0d\xcb\x44\
+\x33\x84\xb9\x87\x99\x7c\x01\x09\x75\x37\x32\x16\x94\x81\x92\xb6\
+\x61\x67\x2c\xa3\x62\xf8\x70\x22\xdb\xb2\xe1\x4b\xd0\xd1\x30\xa1\
+\x9b\x83\x53\x72\xf8\x98\xa6\x5a\xa3\x51\x3f\x11\x72\xe6\x3a\x76\
+\x9a\x0e\x25\xc6\x4f\x86\xa7\x63\x6f\x52\x92\xeb\xc9\x7d\x48\x53\
+\x41\xf2\x75\x0c\xb1\xe4\xc6\x0b\xa6\x12\x57\x77\x63\x6f\xc7\xf4\
+\x2c\xdd\x9d\x72\xd3\xe4\x56\x9a\xb5\xc0\x97\x60\x61\x88\x52\xb6\
+\xc6\x20\x6b\x39\x9a\x6f\xcd\xc4\x0a\xe8\xac\xf9\xb9\x97\xe0\x03\
+\x40\x45\x4d\xf0\x4f\xca\x89\xa7\x9d\xa8\x89\xfa\x4e\xbb\xa1\xb6\
+\xc3\xba\x57\x33\x80\xef\xe5\x19\x51\xfe\x41\x5d\x4c\x7d\x34\xb2\
+\x3a\x9a\x33\xc0\xb8\xbc\xbe\x37\xde\xe8\xb9\xfd\x45\x91\xb1\x71\
+\x48\x93\xe1\x38\x35\x11\x9c\xe9\x25\x2a\x44\x01\x27\xe9\xa9\xe4\
+\xd2\x04\x46\x00\xa2\xf5\x68\x0f\x6b\x03\xa7\x15\xed\x61\xa8\x82\
+\x46\xb4\xe7\x18\xde\x06\x58\x98\x03\x0b\xfa\xdb\xdb\x3d\x74\xbb\
+\xf9\xa4\x59\x2f\x9b\x83\xc0\xa2\x62\xb4\xc1\x69\xf1\x91\x53\xbb\
+\x95\x78\xd5\xa7\x52\x02\xb7\xd0\xfe\x56\xa6\x0d\x74\xcb\x19\x4b\
+\x66\xa2\xb5\x98\xba\x0a\x55\x8c\xd5\x79\x7e\xed\xb8\xb0\xaa\x2f\
+\x5d\x06\xd9\x29\xf7\xce\xdb\x25\x4e\x7a\xfd\x80\x7e\x19\x99\xc6\
+\x18\x60\xa8\xc5\xac\xf6\x00\x23\x61\x58\x6a\x2f\x17\xef\xbe\x55\
+\xdc\x0e\xec\xe2\xf3\x9c\x03\x29\x4f\x67\x1b\x7c\xb3\x5c\x8c\x86\
+\xa1\x97\x91\x3b\x50\xb2\x06\xbb\x91\xc8\x48\x1a\xed\x45\x9a\x85\
+\x50\xd2\x0c\x73\x5c\x62\x7d\xf2\xd9\xc2\xbf\xae\xeb\x86\x06\x5e\
+\x88\x5c\xc9\xe8\x3f\x9a\x36\x5b\x09\x60\xcb\x3c\x36\x2c\xef\x1b\
+\xe5\x48\xdc\x4b\xa0\xd6\x49\x87\x95\xeb\xad\x3e\xd9\x28\xbb\x60\
+\x70\xe0\x76\xdd\xf3\xc3\x5a\xd7\x66\x7b\x9b\xaf\x28\xec\xc5\xe5\
+\x99\x63\x4e\xda\xf6\x20\xb0\x12\x3f\x5d\xbf\xc9\xb3\xcd\xca\x5a\
+\xa3\x4b\x87\xe1\x68\xbc\x02\x63\x6a\x55\x4a\x36\x3c\x73\x5b\x16\
+\x84\xd7\x7d\x31\x36\x8c\x2a\xb3\x1d\x4a\xc1\xc1\x76\xdb\x72\x89\
+\xf7\xf7\xfa\x3d\x54\x0f\xbb\x6e\xf4\x0d\xad\x8d\x84\x35\x4b\xbb\
+\xb7\xc9\x0f\x97\x76\x2f\x9a\x1f\xd9\x76\x7b\x69\x0d\x9e\x75\x8b\
+\x87\x4d\xe2\xde\x43\x8a\xe1\x76\xa8\xf1\x3a\x39\xa4\xd0\x25\xf7\
+\xe8\x83\x1b\x9a\xf0\xd6\x0b\x85\x56\x1b\x0d\xd7\xcf\xa0\x2d\xc2\
+\x81\x89\x65\xa4\xde\x85\xcd\x92\x06\xc8\x3c\xe4\xed\x2d\x2f\x6d\
+\x3d\x5b\x6a\xa6\xad\xf1\x8d\x27\x80\xf5\x1a\x92\xb3\x05\xce\xce\
+\x85\x97\x42\x5b\x65\xfb\x98\x42\x7b\x8e\x3b\x66\xec\xd4\x70\xa1\
+\x9e\xbd\xa4\xc9\x35\x96\xaf\x69\x3e\x57\x33\x18\xf7\x9d\x0b\x32\
+\x35\x03\x6e\xbc\x08\xd0\x40\x82\x0c\xf0\x95\x2b\xa4\x35\xbd\xf5\
+\x4e\xb1\x37\x9f\x4c\x31\x7a\xb5\xf4\x0d\x67\xa8\x66\xec\x20\xea\
+\x40\xc9\x6b\x50\x2b\xea\xe7\x07\xf9\xb2\x3c\xc9\x68\xc8\x16\x14\
+\xf0\x53\x1a\xb6\x7b\x3e\x10\xa8\x10\xbc\x6e\x7b\xf8\x15\x84\x1e\
+\xb2\x82\x04\xc6\xe5\x9a\x49\x5f\x84\x7a\xfa\x9a\x91\x67\x81\xd4\
+\x06\x9e\x37\x02\x05\x38\xef\x80\x55\x5d\x65\xfa\x20\xb7\xb2\xea\
+\x09\x0c\x01\x66\x44\xb4\x21\xb3\x76\x11\x95\x7e\xf1\xd5\xc9\x90\
+\xf6\x11\xc2\x02\xed\x7d\x0e\x43\x9e\x49\x8a\xdd\x58\x6b\x92\x92\
+\xdd\x63\x1c\xe2\x3c\x7c\x02\x7c\x84\x3b\xe4\x41\x16\xed\x64\x8e\
+\x71\x86\xb0\xc6\x19\x68\x02\x2d\x45\xde\x86\x5b\x72\x43\xfa\x75\
+\x4d\xff\x9b\x55\x6a\xf2\xed\xd9\x63\x1c\x8f\x37\xe8\xcb\xfc\x48\
+\x1a\xf7\x1b\x5d\xb8\xb8\x06\x11\x08\x54\x86\xe2\x86\x50\x6f\x85\
+\x14\x60\x24\x94\x91\x3d\x65\xa3\x91\x36\x33\x69\x71\xf2\x06\x00\
+\xd4\x16\x6b\xd2\x23\x02\x8f\x33\xf2\x88\xc8\x2e\xf9\xb1\x5b\x36\
+\xaa\xfd\x31\xb3\xcd\xb2\x0e\xd3\x3b\x9e\x4a\x5a\x0d\x68\x66\xac\
+\xa6\xe9\xca\xa0\xaf\x96\xac\xf6\x78\x8a\x75\xd4\xc3\xba\xb4\x82\
+\xac\x05\x8e\x84\x71\xe7\xa6\x0e\xcd\xd3\x39\xe3\x4b\x3f\xd0\x4c\
+\x8d\x7c\x28\x8f\xc6\x4a\x85\x54\x71\x75\x03\xd2\x1b\x58\xe6\x30\
+\x7c\x45\x8a\x1b\x11\xd8\xef\x42\x0b\xe1\x72\x5a\xc0\x8f\xba\x01\
+\x54\x72\x82\x6b\x0f\x5e\x42\xad\x73\xb1\x53\x43\xee\xae\x53\x53\
+\x0d\x61\x73\x4a\x83\xe2\xdd\xa0\x61\x79\x65\x8d\xa9\x52\x66\x80\
+\x45\x8a\x7c\x6d\xb6\xc8\x68\x74\xea\x19\x1e\xd9\xf3\xd6\xc5\x35\
+\x06\x7e\xdc\x60\x3c\xf3\x4b\x6a\x43\xc5\x31\xbb\x5f\xeb\xe3\x6a\
+\x62\xec\xf1\x97\xe7\xfc\xfe\xbd\x32\x1e\x4f\x7e\xfc\x12\xdc\x1a\
+\x84\xd2\x46\xdc\xa0\x16\x6d\x66\x6d\x87\x86\x7b\x18\x9e\x59\x3d\
+\x79\x49\xef\x9d\xd8\x18\xb3\xe6\x11\xaa\xe8\x81\x9d\x3c\x43\xab\
+\x65\xf2\xb5\x7b\xde\x0c\xe2\xa6\x4e\x63\x5d\x53\x76\x69\x9e\x81\
+\x2a\x5f\xac\x5f\xea\xd7\x56\xc2\x60\xc3\x29\x51\xb2\x87\x8f\x22\
+\x5a\x0d\x02\x8d\xa5\xb7\x37\x53\x1b\xe0\x10\xc5\x40\x15\xa6\x48\
+\x0d\xca\x0d\xd7\xa4\xe5\xbe\x5a\x50\x88\xc6\x0c\x51\xd2\x32\x5a\
+\x39\xfd\x00\x34\x1d\x20\xdf\x15\xd3\x0b\x0f\x65\x42\x8c\xe9\xd1\
+\x8c\x5a\x2c\x15\xeb\x31\x69\x5a\x51\x9d\x61\x58\x64\x40\x19\x1f\
+\xe5\x39\x51\x94\x36\x62\xbb\x9c\xb0\x5d\x53\x5d\xea\xfb\x99\xd3\
+\xfd\x93\x6a\xcc\xc4\x3e\x22\x94\x28\x0f\x80\xc4\x8e\x4e\x81\x4d\
+\x11\x10\x35\x2d\x40\x75\x8b\xb1\x0b\xf6\x36\xc8\xfa\xc6\xa9\xe6\
+\x3e\xe4\xb5\x7b\x1f\x93\xfe\x87\xbc\x20\xda\x1c\xe0\xc2\xc0\x4e\
+\xcd\x4b\xcc\x62\x4f\x13\x9d\x85\x29\xf3\xa5\x2c\xff\x79\x89\x4a\
+\xe2\x38\xc3\xc8\xda\x0d\xdf\xb4\x36\xc8\x57\x6b\xb0\xfb\x74\xa8\
+\xe8\x68\xa3\x44\x7b\x2c\x43\xe7\xf4\x85\xb5\xc5\xd9\x4c\x3a\x9d\
+\x29\xb1\xd6\xd5\x1b\x35\x9c\xf3\xeb\x0b\xd9\xb6\x8c\xc0\x1a\xb4\
+\x83\x80\xf6\xa9\x97\x93\xc4\xe8\x7d\x36\x1c\xc2\xef\x6e\x6c\x57\
+\x64\xbe\x7e\x33\x6f\xf0\xfd\x26\x92\xe3\x66\x84\x3f\x7d\x0b\x8f\
+\x11\xa3\x97\x05\xda\x62\x06\x1b\x62\xdf\x45\x37\x2a\xee\x9d\xb6\
+\x34\xd4\x35\x37\x08\x2b\xfa\x98\xe9\x1e\xee\xbc\x77\x2a\x36\x59\
+\x8d\xc0\xea\x1a\xf3\x3a\xe7\xbd\x34\x79\xc9\xef\x04\x10\x68\x34\
+\x0f\xb0\x28\xd9\x89\xd9\xac\x59\xfa\xef\xdb\x2c\x42\x33\x5e\xe8\
+\x1b\xb5\x01\xda\x83\xc0\x9a\x09\x24\xd5\xb8\xdd\xea\x45\x51\xcf\
+\xe7\x8a\xc7\xb7\x02\x81\x76\x75\x23\x23\x60\x59\x03\x46\xfb\x32\
+\x2f\x32\x54\xd5\xd8\xa0\xb1\x53\x32\x5a\x71\x4d\x43\xa0\x18\xc0\
+\x18\xa9\xb5\x1c\x62\x70\x4e\x26\xea\x41\x34\xc9\xfc\x07\xd9\xe0\
+\xe4\xb8\x0f\xb2\xc5\x99\xc7\xba\x08\x67\x0e\xfd\x06\xd1\x96\xf3\
+\x64\xee\x0a\x36\x1d\x77\xfc\x20\x18\xe9\x12\x9f\xc9\x14\x8d\x7b\
+\x36\xcd\x46\x1c\x51\x7d\x7d\x43\xa5\x3e\xed\x99\xf2\x86\x83\x74\
+\xfe\xfe\xf1\xc8\xb5\xb7\xbe\x22\x24\x32\x5c\xe4\xd3\x55\x79\x98\
+\x1d\xa4\xcb\x16\xea\x4a\x03\xc4\x70\xed\x7b\x95\x7a\x8a\xfa\x37\
+\xf7\xe3\x77\x4d\x48\x71\x00\x2e\xb4\x00\x6a\xa6\x76\x43\x3a\x69\
+\xff\xc4\x48\xef\xd3\xc5\x6a\xc6\xc3\x1b\x0b\x6a\xad\xf2\x74\x9f\
+\x60\x28\x6c\xae\xe1\xbd\x95\x3c\x08\x73\x8c\xad\xa4\x8d\x4b\x9d\
+\x6d\xc9\x1c\xb0\xb3\x40\x84\x76\x2c\x79\x62\x40\x27\xd0\x86\xf4\
+\xb6\x98\x06\x52\xc3\x10\xe7\xdd\x40\x65\x3a\x46\x48\x0d\x23\x17\
+\x8b\x68\x2a\x97\xef\xcf\xbb\x15\x3e\x33\xd7\xcd\xbb\x62\x9c\x9d\
+\x80\x6c\x76\x6a\x1b\xe6\xe8\x7a\x56\xa1\xe5\xc9\x92\xd8\xee\x0b\
+\x32\x50\xd0\xdf\x12\xe3\x50\x82\x02\x63\xb7\x8c\x49\x52\xc5\xb4\
+\x76\xb4\x7d\x3d\x8c\x7e\xd4\x3a\xf6\xf8\xcb\x12\x79\xd0\xe9\x9c\
+\x39\x72\xf5\x69\xe4\x19\x00\x6e\xf8\x6f\xd9\xaa\x1b\xf2\x34\x1a\
+\x51\xef\x0f\xfd\x24\x92\xdf\x44\x4b\x74\xd5\x7c\xb1\x48\x97\x25\
+\xc7\x9b\x4e\xd6\x82\x88\x19\x3e\x63\xf9\x07\xbd\xdf\x85\x25\xd0\
+\x54\xe6\x18\x88\xca\x82\xbf\x48\x4b\xf2\x7c\x2f\x41\x8a\x97\xe1\
+\x26\xf5\xd7\x1b\xb5\x1c\x2d\xc4\xde\x44\xef\xc9\x30\xf8\x4f\xb6\
+\xc7\x27\xa3\x78\x78\xb7\x31\xd0\x29\xf2\x6b\xe6\x09\x44\x5c\x51\
+\x85\xfd\x8d\x39\x04\xe9\xf6\xd5\x4e\xec\x67\xcb\x55\xd5\x8c\x7f\
+\xea\x7c\x97\x95\x9c\x88\xb9\x98\x25\xdd\xb4\x0c\x9d\x3e\xfd\x48\
+\x34\x52\x29\xad\x75\x08\xcd\xb0\x3a\xc9\x4e\xd1\x23\x02\x47\x91\
+\xc9\xc7\x74\x6a\x25\x04\x95\x90\xac\x0e\x61\xda\x96\x63\xdf\x12\
+\x35\x75\x45\xec\x04\x7c\x5a\xec\x83\x2f\x9f\x69\x21\xce\x91\x2b\
+\xc8\xb4\xe1\x95\xd4\x9c\xab\xc0\x9e\xca\x41\xda\x3e\xa0\x07\x6c\
+\xeb\x9e\x3b\x6b\xad\x8a\x17\x46\x0d\xaf\x1c\xd0\xc4\xa9\xbc\x0f\
+\xa1\x8e\x60\x0e\x1d\x79\xd4\xed\x5d\x3b\x75\x20\x7d\x1f\x6a\x6e\
+\xd8\x0f\x53\x27\x55\x12\xc0\x0c\x24\x86\x2a\xc7\xdb\x27\x89\x7f\
+\x9c\xdb\x7d\x73\x6b\xc8\xaf\x41\xa4\x9d\xed\x5f\xbc\xcb\x01\xb5\
+\x28\x18\x0c\x69\x0d\x8f\x1a\x48\xbe\x86\x95\xff\xf6\x02\x55\xb0\
+\x40\x55\xeb\x02\x55\xf5\x05\xaa\xcc\x02\x61\x4f\x8f\x5a\x21\x5a\
+\x0a\x3c\x0e\x94\x73\xdf\x7d\x86\x05\x2b\xe6\x92\xbe\x89\x0f\x12\
+\x2a\x1a\x01\x14\x3e\x94\x66\x76\x8f\x6d\x92\xd9\xd8\xd9\x1b\x5b\
+\x55\x61\xca\x6b\x23\xc5\x97\x08\x1f\x3f\x61\x8f\xd9\xa0\x4b\x38\
+\x1c\xc0\x95\xab\x39\x14\x9a\x92\xa9\xe5\x2e\x97\x70\xc4\x34\xa5\
+\x55\x69\x9a\x79\x80\xa5\x18\x3d\x38\x6e\x09\x2e\x2e\x50\x4c\x1b\
+\x64\xbe\xc1\xa8\xf4\x64\x4f\x3d\x59\x99\x5b\xdf\xcc\x52\xbe\x35\
+\xa6\xac\x40\xe5\x63\x79\x36\xd2\x46\x65\xf9\x40\x47\x36\x5a\xf7\
+\x1a\xde\x45\x32\x06\xf7\x87\x7c\xd9\x05\x26\xdf\x1c\x94\x3d\xbf\
+\x0f\xd7\xc7\xc8\x09\xbb\xa7\xb2\x37\x8e\x59\x9a\x8a\x9c\xa7\xc5\
+\xfd\x83\xae\xe4\x03\x90\xf1\xd9\x7f\xde\x6e\xcb\xf9\x31\xa4\x5f\
+\x93\x87\x16\x96\xeb\xec\x3f\x5e\xff\x07\x0c\x9a\x37\xb4\x12\xb0\
+\x26\x7f\x6b\x28\xbc\xe5\x6e\x8d\x33\x83\x46\x2a\x63\x81\x7e\xf3\
+\xcf\xab\xaa\x10\xe7\x2b\x7c\xd7\x33\x2d\x44\xda\x9b\xa7\x25\x19\
+\x9a\x06\x74\x68\x0e\xe9\x35\x8d\x7d\xa1\xdf\xfa\xd5\x2c\x8d\x5a\
+\x4c\xea\x47\xfd\x86\xbe\xba\x41\x0f\x6f\xef\x83\x68\xcc\x5d\x19\
+\x8d\x70\xaa\x6b\x62\xa0\x87\xa0\x58\xc6\xbc\xba\xbd\x25\x23\x70\
+\xf7\x4d\x33\x2a\x28\xd7\xc7\x7d\xd3\xcc\xab\xaf\xa5\xac\xb1\x7a\
+\x9e\xcc\x39\x44\x6f\x45\xf6\x91\x46\x97\xca\x71\x55\xf9\x25\xd0\
+\xe6\x00\x6f\x1a\xf2\xfe\x1c\xb8\xd1\x24\xf8\x2f\x60\xac\xfa\x95\
+\xa8\x16\x3c\x09\xde\xaa\x95\x3c\x07\x48\x84\xa1\xe4\xe6\x35\x94\
+\x77\x82\xe2\x4d\xdb\x04\x77\x5c\xb2\xf7\x58\xe6\x13\x1f\xda\x92\
+\xcf\xb4\x2e\x44\x26\x1a\x42\x77\xae\x11\x23\x3d\x1c\xec\xec\x18\
+\x8c\x16\xf3\x02\xe3\xf7\x08\xab\xbd\x4c\x0b\x0c\x8a\xe1\x97\x32\
+\xc9\x4e\x51\x65\x80\xdc\xd2\xa6\xce\xa1\xc2\xa2\xf6\x46\xb6\xbc\
+\xaf\x68\x62\xbf\xc7\x51\x52\xa3\x3a\x32\xc4\x74\x7b\xfb\xaa\x9e\
+\x24\xc9\x07\x86\x9d\xf5\x43\x3d\xda\x12\xa8\x12\x51\x58\xbb\xe9\
+\xae\xea\x88\x09\x8f\xa7\xd1\x1e\xc7\x23\x4d\x93\x6e\xe8\x23\xae\
+\x58\x86\x2f\x0b\x08\xa6\x96\x05\xc3\xdd\xf8\xb2\xab\xe5\xdf\xea\
+\x28\x1b\x32\xc2\x65\xb8\x99\xf6\xb8\x2d\xbc\x31\xa5\xe4\xfc\x99\
+\x50\x7f\xab\x3e\x0e\x00\x63\x94\xa2\x15\xab\x89\x59\xea\x35\x60\
+\x59\x4c\x9c\x35\x46\xda\x51\x1f\x66\x6d\x35\xe7\xd6\xed\x32\xa7\
+\x40\x23\x3b\x7a\x88\xb9\x50\x54\xa5\xdd\x40\xd4\x8a\x18\x6e\x14\
+\x8a\x54\xa3\x39\x1f\x90\x23\x66\x32\x5c\x58\xbc\x97\x31\xb5\xfc\
+\x88\xe4\x87\x13\xf4\x38\x1e\x8e\xf3\x56\x80\xc3\x87\xbd\xb9\x77\
+\xd6\xf1\xf5\x46\x43\xf4\xf7\xf1\x5d\x67\x8e\x0a\x62\x71\x7b\xcb\
+\xfb\x6a\x0c\x8c\x42\x8e\x6e\xd9\xef\xac\x9b\x98\x8f\xc9\xd0\x5e\
+\x05\x79\xeb\xef\x33\xf5\xf2\x89\xec\xed\xed\xd1\x5e\xd6\x7a\x84\
+\x15\xfd\x99\x09\xa0\xe9\xe9\x3a\xa9\x26\x41\x10\xab\xc7\x52\xeb\
+\xe7\xb8\x56\x14\x99\x02\x5b\x5a\x93\x02\x0f\x9e\x5b\x98\x67\x8f\
+\x49\xd7\xfa\x56\xcd\x1d\x6c\x64\x45\x94\xc5\x1a\xdd\x49\x08\xb3\
+\x02\x78\x9c\xac\x99\xd8\x44\xfb\x31\x60\x6a\xac\x3f\xd4\x69\x8b\
+\xeb\x65\x71\x15\x68\x23\x54\x8c\xbd\x98\xf8\x05\xee\x8a\xec\xa4\
+\x46\xe4\xf2\xaa\x56\xde\x09\x1d\xa5\x33\x91\x2b\x45\x76\xeb\x75\
+\xd5\x3f\xf6\x04\x82\x47\x47\xda\xa8\xa1\x29\x56\x1e\x74\xe8\x75\
+\xf1\x4d\x74\xb0\x27\x1f\xd3\x05\x74\xd8\xc1\x33\x95\x04\xff\x00\
+\xc9\xf7\x1f\xf0\x6f\x28\x26\xff\xe8\x10\x31\xe7\xb3\x24\x50\x3f\
+\x82\x7f\x90\x8f\x4d\x30\xf8\x1e\x10\xa2\x7d\x02\x57\x8e\x4e\x0d\
+\x4c\x62\x4f\x7b\x5f\x0a\x9c\x19\x9c\x82\x1f\x3f\x1c\xbc\x4d\xb8\
+\xa7\xbf\x91\x98\x0b\x41\xaf\x35\x56\xce\xa6\xd6\x17\xe9\x39\x47\
+\xa5\x51\xe6\xf0\x55\x40\x7f\x15\xdf\xaa\x10\xe6\xb8\x32\xbb\x84\
+\x51\xfa\x36\xb5\x45\xab\x15\x18\xa3\x3e\x9a\xe5\x79\x7e\x1d\xe0\
+\x8b\x0f\xe6\xa5\xf8\x07\x57\x0e\x43\x11\xcb\x17\x82\x5e\xaa\xf5\
+\xca\xa2\xd8\xb0\x17\x8d\x9d\xb3\xd7\x0e\x08\x04\xaa\x35\x7a\xa6\
+\x4f\xa2\xdf\x6c\xf3\xb1\x97\xd8\x58\x44\x1a\x21\x92\x4f\x97\x9e\
+\x33\x93\x3e\x61\x9e\x59\x62\x9e\x51\x45\x82\x76\x87\xdd\xce\x37\
+\xae\x48\x09\xa8\x2e\x40\x72\x6f\x77\x0d\xf5\x20\x12\xf1\xaa\x20\
+\x40\x8f\xda\x77\xff\x5a\xb1\xa4\x17\x24\x7d\x65\x9d\x9f\x90\xa3\
+\xf0\x6a\x36\xad\x89\x0b\xe3\x56\xbc\xe9\x35\xc1\xef\xe7\x41\x39\
+\xa1\x07\xbb\x1e\x0d\x5e\x91\xd9\x3b\xcd\xe6\xd2\x6b\x5b\x64\x40\
+\xbc\xad\xe2\xfe\x70\x6c\x9f\xbf\xd5\x96\x80\xbd\xd1\x78\xb8\x97\
+\x94\xe3\xb2\xd7\x8b\xaa\x84\xe3\x9b\xb7\x0d\xec\x52\xe9\x9d\x8c\
+\x0c\x8d\x53\x87\x6d\x92\xe9\xed\x8e\x4d\x1a\x9a\x58\xaa\x44\xea\
+\xaf\x04\x8c\x5f\xee\xe5\xe6\x8d\x5d\x23\x80\x7a\xa7\x22\x87\x9e\
+\x23\x17\xb5\x38\x72\x9b\xcc\x74\x1a\xcb\x1e\x68\x2c\xc3\xf2\x4e\
+\x1c\x96\xbe\x11\x1a\x29\xa7\x7d\x75\xf4\x85\x81\xab\xd1\x0c\x8d\
+\xab\x85\xbf\x55\xad\x1a\xb0\x87\xf6\xc6\x93\xb1\x94\x15\x43\x5e\
+\xdb\x88\x7c\x9c\xab\x8d\xc8\x1f\xb7\x11\xca\xc2\x50\x07\x26\xa2\
+\x90\xe7\xb5\xb8\x25\xdb\xdb\xd9\x5e\x23\xf1\xf6\xb6\xad\x42\xaa\
+\xac\x24\xb3\xef\x1b\x89\xf8\xde\x51\x0b\x93\x71\xbf\x6a\x7a\xab\
+\x5d\x42\x51\xfb\xec\x31\xce\xa6\xfd\x4d\x2d\xea\xd2\xf4\x86\xd3\
+\x46\x21\xcd\x93\x23\x48\x7b\xcc\xbe\x6a\x57\x04\x7a\xba\x3f\x52\
+\x7f\xaa\x97\x3e\xf0\x75\xee\x38\xe8\x9a\x4f\x94\x24\xe2\x00\xd7\
+\xa0\x23\xb2\x40\xbf\xd8\x21\x4b\x6d\xff\xd7\xf5\xee\xee\x68\x77\
+\x6c\x93\x9d\xd2\x68\xe0\xdd\xa6\x23\x93\x24\xbc\x81\xb3\x95\x13\
+\x96\xe5\xee\x45\xd7\x7a\x85\x4a\xf9\x35\xf3\x44\xbe\xa6\x9b\xd8\
+\x7e\xf6\x42\x3e\xfa\xeb\x22\x76\x99\x14\x66\x7d\x3b\x3d\x66\x3e\
+\x70\xb8\xd8\x51\x0f\xa7\xe6\x86\xa9\xdd\x37\x38\x5e\xcd\xec\xa1\
+\x96\xd5\x9a\x30\xfb\x65\xda\x26\x4b\x77\xee\x37\xe7\xeb\x05\xf5\
+\xf1\x42\x60\x70\x75\x82\x9d\x46\xa4\xdf\xd6\x6a\x5a\x22\x6b\xd3\
+\xa6\x59\x5d\xcf\x7f\xd2\xe6\x9d\x7e\x7b\x6f\x23\xa0\x9b\x13\x68\
+\x2e\x6c\x9b\x53\x92\x1a\x9d\xec\x91\xed\x8c\xee\x6f\x47\x6d\x8f\
+\x37\xc3\x2d\xbf\x0d\x17\x91\x52\xf1\x3d\x0f\xf9\x18\x2b\x2a\xb7\
+\x9c\x6c\xd5\x95\xee\xeb\xef\xcd\xec\x90\x4f\xa9\xb8\xa8\xfe\xc9\
+\xd7\x93\x27\xb1\x34\xb2\x50\xdb\xf9\xb7\x46\xf3\xbd\x3f\x1a\x6d\
+\xe7\x55\x1f\xcd\xa1\x89\x9b\xfa\xf8\xe1\xb8\x80\xd9\xd0\xc7\xb3\
+\x5c\x1e\xbe\x52\x6b\x10\xdc\xb7\xe8\x4b\x87\x9f\xa8\x80\xf2\x1b\
+\x65\x42\xa9\x94\x09\x82\x95\x35\xc5\x0a\x9c\x5a\x8c\x00\x26\x1f\
+\xda\x0e\xa2\x46\x3e\x29\x5e\x24\x33\x88\xfa\xcf\x43\x81\x4c\xc6\
+\x17\x74\x7a\xa9\xa9\x21\x6c\x42\xae\x40\xd9\x4b\x6c\x12\x26\x55\
+\xaa\x34\x12\x9e\x86\x92\x4d\xa6\x58\xb0\x82\xcc\xc1\x39\x7a\x6b\
+\x82\xb1\xd1\x6a\xb9\xf8\x03\x47\xeb\x65\x98\xf3\x4f\x36\x60\x8d\
+\xed\x35\xae\xab\x95\xb7\xa1\xb7\xb7\xd3\xff\xbc\x11\x0d\xa3\xb5\
+\x46\x9c\x21\xaa\xab\xc1\x2b\x0e\x82\x8f\x0a\x2d\x19\xd2\x4b\x40\
+\xfa\xae\x8f\x9e\x34\xfb\x27\x5d\x4f\xeb\xf7\xcc\x1a\xb7\xfb\x2e\
+\x58\xa9\x7a\x5a\x0e\x77\x92\xc8\x82\xf4\x2b\xe5\x84\x5b\xbb\xed\
+\x76\xcb\x01\x0c\x4a\xf6\xf5\x5f\x0f\x11\x1d\x79\xcd\x26\xe9\x0e\
+\x90\x58\x8a\xd8\x14\x8f\x86\x18\x86\x16\xe0\x67\x8a\x77\x4f\xe2\
+\x6a\xc9\x01\x82\x68\x1e\x8f\x27\x23\x14\x31\xc7\xa7\x23\xf7\x13\
+\x0e\x98\x0e\xd9\xd8\x94\x68\xe2\x4a\xaa\xbe\x8c\x4b\x67\xe0\x3e\
+\x21\x77\x09\x60\xbf\xce\x79\xb6\x3f\x5b\x80\x5c\xa8\xcd\xc0\xe2\
+\xc0\xd5\xd2\xc8\x52\x5a\x3d\xd3\x37\xee\x0e\x61\x4b\xf6\xfd\x78\
+\xda\xdb\x96\xbf\xdf\xb9\x94\xd9\xe4\x8c\x9a\xea\xa6\xbe\x5c\x5e\
+\xab\xc6\xa4\x82\xce\x5a\x91\xe1\x6d\xd5\xd7\x6b\x6f\x0a\x8a\xb6\
+\x82\xad\x0a\x96\xe6\xb1\xab\x5c\xad\xfa\x60\x97\xe2\xcc\x9a\xb8\
+\x33\xd5\xa6\x67\xaf\x4e\x00\x02\x4e\x23\xb6\x39\xdf\x5b\x28\x0d\
+\x43\x58\x47\x73\xb8\x72\x6c\x6a\x73\xb9\x1d\x6d\x63\x71\x6a\x67\
+\x41\xaf\x91\x71\x9d\x94\xd5\x0e\x28\xd9\xda\x5f\xaa\xd2\x76\xa9\
+\x6a\xe5\xf7\x55\x06\xbd\x4d\xef\xb5\xb1\xd1\x12\x05\xd6\xe9\x08\
+\x2d\x75\xdf\xad\xae\xa4\x01\x87\xd8\x1b\xf1\x27\x13\xe4\x84\xae\
+\x82\x58\x0c\xe0\x03\x7e\x7e\xbc\x0a\x9a\x33\xf4\x36\x14\x6d\xcf\
+\x07\x4e\xb7\x7a\x28\x6d\x62\x3c\x45\xca\x7f\xd2\xdf\x7d\x36\x7c\
+\xf6\xe4\xbb\xef\x76\xaa\xf1\x53\xf8\xb9\x97\x4f\x40\x28\xcf\x07\
+\xf8\xdb\x7d\x15\xc8\x8c\x4e\xf8\x0c\x8c\x3b\x04\xa1\x86\x80\x83\
+\x16\x70\x92\x06\x02\x9f\x8b\xc8\x5a\x1a\xc9\x1f\x6c\x24\x83\x46\
+\x10\x45\x64\x83\x3c\xaa\x6d\x60\x0b\x70\x4b\xf5\xd3\x67\x84\x03\
+\xcf\xec\xb9\x0d\x50\x76\x78\x44\x57\x29\x08\xec\x86\xf0\x09\xa9\
+\x30\xd6\x03\x6c\xd9\x27\xfb\x52\xca\x90\x85\x8e\x5d\x77\x05\xad\
+\x19\xb3\xc4\xde\x88\xae\x27\x06\x26\x92\x81\xd8\x09\x79\x32\x02\
+\x01\x87\x4f\x46\xc3\xf8\x29\xfe\x7d\x1a\x3f\xc1\x3f\x4f\xe2\x5d\
+\xfc\xb3\x0b\xf4\x1b\x99\xf5\x8a\x3f\x0a\x6f\xaa\xbb\xfa\x25\xd0\
+\x44\x71\x1d\xff\x63\x2f\xed\x48\x72\x3d\xaf\xaa\x65\x19\x0f\x06\
+\x0a\x29\xfe\x89\xb2\xc0\x55\xd0\x51\xb7\x01\xcf\x3b\x3f\x1d\x77\
+\x16\xe2\xbc\x48\x8b\x75\x07\xe4\x36\xe0\xe7\x2b\x8e\x06\xf4\xe2\
+\x13\x47\x97\xf8\x32\xf8\xfe\xad\xac\xb8\x37\x48\xbf\xff\xc7\xc3\
+\x36\x59\x5a\x3d\xa9\x48\x3e\x8e\x35\xb9\xb9\x6b\x43\xd6\x46\xe1\
+\xde\x41\x8f\xa6\xbe\x53\x43\x53\x18\x42\x5e\xad\x77\x3d\x0d\x14\
+\xef\xd4\x0e\x88\xad\xa8\xeb\x73\x61\x4f\x4d\x38\x56\x57\x55\x7f\
+\x69\xd9\x13\x91\xeb\xc8\xf6\x80\x2d\x9d\xc4\xf0\x9e\x0a\xf5\x50\
+\x63\xf6\x52\xbf\x36\x00\x69\x76\x26\x37\xe7\xa1\x58\x5e\x72\x0f\
+\x8d\x55\xa3\xd7\x24\x5d\x0a\x3b\x03\xd8\x10\x81\x22\x6c\x6e\xc3\
+\x49\x75\x6a\xc2\x25\xd6\xd2\x93\x61\xdb\xbe\x41\x06\x2a\xdb\xbd\
+\x31\xf8\x16\x44\x0f\x8f\xa3\xb5\xd5\x4d\xc3\xeb\xf5\x36\xf4\xd6\
+\xae\xb3\x37\xf4\x44\x13\x18\x47\xbd\x2e\xac\xf1\x8d\xdb\x49\xd4\
+\xd2\x2f\x99\xa6\x1b\xfd\x8c\x54\xc9\x6a\x7d\x91\xbf\x23\x14\x2a\
+\x04\xcb\xb5\xe4\x21\x80\xc9\x93\x6e\x4b\xf5\xff\x04\xea\x14\x06\
+\xac\x63\x8c\x4c\x9d\x8b\x63\x47\xc1\xaa\xca\x75\x6e\xa1\xe0\x5d\
+\x2b\x0b\xd7\x3c\x1c\x7f\x8b\x93\x6b\x56\xc7\xb0\x9e\xc0\xbf\x55\
+\x3c\x72\xcd\xc3\xa0\x6b\x40\x35\x52\xa1\x93\xfc\x24\x18\x7c\x90\
+\xe9\xe8\x57\xf4\x53\x92\xfb\x7f\xd1\x6f\x67\xe7\x13\x60\x33\x7e\
+\x57\xaa\xcd\x32\xa9\x63\x60\xc7\x06\xf4\x27\xa1\x12\xef\xb0\x3c\
+\xc5\x70\x69\x01\x1a\xc9\x56\x12\x81\x84\x52\xc4\xba\x6d\x2a\xf6\
+\x2f\x53\xcc\x99\xe0\xa6\xc2\x15\x46\x69\x54\xf1\x39\xb8\x63\x82\
+\xba\x01\xa1\x19\xe0\x4a\xaa\x07\xe5\x54\xe5\x7f\xeb\xbc\xae\xe2\
+\x8b\xbf\x18\xf0\x5c\x3e\x1c\xac\x01\xfa\x21\x09\x5a\xb5\x60\x0e\
+\x8a\x69\x71\xe4\xda\x21\xd6\x1a\x55\x85\x5a\x2c\xeb\xb7\xbc\x56\
+\x10\xc2\x84\x32\xcb\xf1\xf6\xcb\xb7\x19\x54\xbe\xbf\xa1\x70\xcd\
+\x2f\xe5\xf9\xc0\xe0\x47\xc9\x8d\x72\xed\xff\x03\x90\x3b\x4f\x30\
+\x4c\x18\x45\x07\xa3\xe0\x3f\x36\x64\x09\xb1\xa5\xfa\x37\xe0\xc0\
+\xe4\xc6\x7c\xaa\x1c\x0a\x47\x62\x6a\xc6\xb2\x15\xb2\xed\xa1\xf8\
+\x90\xbc\x90\x65\x6d\xf2\xc1\xf1\x7b\x99\xf1\xca\xcf\x40\xac\xd4\
+\x6c\x5e\x31\xc5\xf5\x0e\x64\x72\xb3\x07\x99\xde\xd6\x05\xe5\x00\
+\xfa\xe5\xad\x2f\x94\xa3\x58\xfa\x01\x84\xdf\x82\x02\x2d\x3e\xb9\
+\xc7\x9e\x0d\x8d\xe0\x14\xb9\x34\x0a\x25\x2e\xb5\xf1\x06\xe5\xa3\
+\xcf\x36\x99\xd8\xcb\xc8\x02\x78\xc1\x67\x62\x1b\x15\x1c\xd7\x1d\
+\x24\x47\x94\x4a\x12\xde\x06\x9d\x75\xb0\x34\xcf\x48\xd7\xda\x85\
+\x8d\x33\x57\x0e\x38\x53\xef\x2a\xd9\x42\x71\xbb\xca\xa7\x0e\xa9\
+\x29\x57\x11\x36\x44\x76\xa9\x7c\x80\x4c\x24\xa4\x4c\x94\xf3\x57\
+\x90\x07\x44\xec\xf8\xbf\x35\x16\xd7\x86\x9d\x02\xf3\xd2\xf5\x00\
+\xed\x52\x0b\x1f\x3b\x6e\x0d\x03\x52\x3f\x5c\xba\x2d\xb6\xd0\x43\
+\x53\xdb\xd1\x6a\x5b\x7f\x7b\xeb\x4e\x94\xc2\x61\x28\x8d\xcb\xed\
+\xed\x88\x44\xf5\xcf\x73\x81\xef\x7b\xc8\x0f\xa9\x09\x21\x87\x70\
+\x09\xa8\x25\xec\x87\xbf\x56\x8a\xcd\xf1\x37\x76\x7b\xfb\x7d\x6d\
+\x34\x11\xbb\x16\xb0\x7e\xbf\x59\x03\x42\x18\x38\x0d\xc1\x7d\x07\
+\x8c\xce\x19\x39\x0d\xe9\xfe\x26\xe6\xd7\xc9\xf0\x34\xae\x80\x0b\
+\x3d\x6f\xb4\x2c\x3f\xe9\x7c\xc8\xb0\x0c\xd2\x61\x52\x28\xcb\xa5\
+\xdf\x98\xfe\xf5\xbb\x8d\x42\x85\xb1\x4c\x24\x49\xf8\x20\xf0\x16\
+\x07\x80\x4c\xdf\x31\xc1\x41\x3c\x91\x77\xa6\xa7\x66\x4f\x0f\xac\
+\xe1\xb4\x5b\xb2\x6c\x96\xfc\x59\xe9\x72\x22\xe5\x34\x71\x50\x17\
+\x8a\x1f\xbb\xbb\x7a\xde\x78\x91\x6d\x3e\x14\x95\x9e\x78\x7b\x3f\
+\x8c\x31\xd2\x8c\x9c\x74\xe8\xac\x1d\xd4\x94\xd7\xbf\xb5\xba\xde\
+\x8a\x46\x2d\xab\x54\x8f\x11\xeb\xac\xad\x7c\x5d\x96\xcb\x97\xae\
+\x8c\x83\x10\xef\x5f\xab\x97\x26\xe5\xd7\xba\xf6\xde\x9c\x8f\x60\
+\x60\xcf\xa1\xc2\x20\x69\xec\x45\xff\x9a\x41\xdd\xb6\x8c\x35\xa3\
+\xf8\x22\xee\xf9\xa9\x41\x0e\xc0\xa3\x1b\xb9\xcd\x2e\x8e\x0f\x1e\
+\x65\xb2\xae\xc3\x8f\x17\xd6\x7c\x6a\x77\xb7\x7f\x9e\xcf\xd6\xf6\
+\x14\x69\x88\x77\xde\x47\x28\x35\x86\xdb\x10\x0b\x48\x06\x9c\xea\
+\x1f\xff\xf2\x83\x4a\xd9\x57\xcf\x5e\x58\x4b\x15\xdd\x84\xfb\xfe\
+\xf6\x3d\xd5\xc2\x66\xd7\xb5\x04\x10\x90\x8a\x82\x1e\x84\xc1\xf7\
+\xdd\x7e\x2e\xb9\x09\x76\x63\xd4\x6e\xb6\xb0\x3f\xbb\x9e\x9c\x84\
+\xe5\xf7\x00\xa4\x70\xc5\xfc\x05\x24\x97\x6a\xee\x9f\x62\x5c\x66\
+\x1d\xc5\x0a\x11\x4d\x2d\x86\x15\x76\x48\xf4\xd6\xf3\x75\xb2\x31\
+\xad\x5c\xbe\x59\x7b\x76\x50\x41\x0a\x62\xe4\xc8\xc9\x6d\xee\x32\
+\x92\x7b\xae\x07\x9c\xf1\xfb\xbd\x73\x1f\x75\x01\x54\x85\xb3\x25\
+\x9b\xbb\x4f\x75\xa4\xe9\x4e\xdc\xf3\xad\xd2\x55\xe8\x50\xff\xbc\
+\xac\xe9\xc7\xef\x3b\xca\x0d\x2a\x82\x0f\x4b\xeb\xaf\x8d\xb6\xf7\
+\x67\xff\x09\x20\x02\x80\x9c\x3d\x7a\x97\x9b\x60\x2c\x3d\x41\x0a\
+\x1e\x1d\xd7\xb0\x61\x2b\x22\x3c\xae\x21\xc2\x26\x0e\x1c\x7f\x46\
+\x9c\xff\x93\x87\xf3\x9d\xeb\x03\x02\x1d\xe7\x5d\x93\x26\xe4\xd8\
+\xa5\x27\xde\xe9\xc6\xc4\x82\x76\xb7\xc9\x7d\xc4\xd7\x07\x55\x10\
+\x09\xea\x70\x3a\x62\x1e\xf5\xda\x1a\x79\x9e\x5f\x73\xee\x04\x23\
+\xb8\xbd\xdd\xd2\x52\x91\x31\xa8\xea\x97\x64\x06\xac\x25\x2d\xb1\
+\x63\x63\x3b\xd6\x98\x51\xe5\xcc\xad\x1a\x90\x31\x0b\x42\x15\x37\
+\xfe\x67\x40\xa4\xcf\x9e\x17\x45\xba\xde\x52\xf7\xbc\xdd\x20\x98\
+\xd8\xd4\x98\xfe\x8d\xe0\x94\x8d\x33\x40\xd2\x49\x76\xc2\x7b\xa3\
+\xd3\x64\xe4\x3e\x84\xab\x14\x5d\xac\x94\x5d\x15\x2c\x65\x73\xb6\
+\x4a\xa4\x4d\x40\x9a\xe4\xdd\xd1\x38\xdd\x4b\xca\xde\x88\x62\x03\
+\xcd\x93\x19\x0f\xc5\x49\x7a\xca\x04\xdd\x44\xa3\x5d\x00\xda\x8d\
+\xae\xf6\xe6\xe8\x70\x94\xa4\x50\x75\x8e\x0f\xe4\xae\xd0\x83\x11\
+\x9f\x44\x02\x5e\xc5\xf4\x81\x0a\x08\xf5\x51\x30\xf4\x96\x83\x29\
+\x66\xc0\x0d\x0e\x19\x8c\x4b\x99\x77\x30\x63\x20\x26\x4d\xc2\x38\
+\x19\x80\x65\xd0\xdb\xf6\xb6\x32\x22\xa9\xe0\xc3\x5e\xcf\x40\x23\
+\xb5\x25\x33\x41\xd8\x92\x93\xea\x04\x9f\x4f\xcf\x60\x14\xd0\x1a\
+\x05\x5b\x53\x16\x02\xd9\x5e\x39\xce\xa0\xe1\xb0\x6d\xb5\x45\xff\
+\xba\x57\x01\x11\xc1\x87\x05\xd7\xf0\x6b\x6d\x2c\x43\x76\x78\x37\
+\xdb\xc9\xee\x22\xe9\x0f\x41\x03\xf9\x1e\x63\x77\x6a\x61\x17\x52\
+\x29\x3c\x43\x04\x23\x87\x35\xb3\x52\xf0\x09\x7c\xd9\x41\x73\x9c\
+\x39\xbe\xf2\xe2\xbc\xd4\xbc\xe2\x35\x69\xd1\x3e\xfa\x3c\x53\x59\
+\x84\xc6\x6c\x8d\x05\x6f\x5c\x60\x31\xda\xbf\x24\x9b\x70\x1e\x9f\
+\x71\xd9\xc9\x2a\x39\x43\xff\x33\x2e\x2d\x25\x38\x4f\x56\x63\x19\
+\x56\x6e\x2b\x9c\xdf\xae\x74\xf4\xa5\x13\x68\xea\x14\x9d\x7e\xe7\
+\xdb\x2b\xeb\x76\x9b\x62\xdd\x22\x99\xca\x9e\xca\x64\x7e\x7b\xbb\
+\x82\x0e\x73\x0a\x54\x81\x71\xde\xe6\x13\x58\xfe\x02\xba\x4c\xa3\
+\x18\x78\x86\x02\x7a\x4b\x41\x7c\x37\x63\x9c\xb6\x8f\xd1\x2c\xf1\
+\x5c\x2f\x31\x54\xa4\xa0\x16\x6c\x21\x83\x58\xe8\xa5\x7a\xb6\xcd\
+\x27\x21\x6e\xdc\x75\x37\xdd\x09\x17\xb2\x70\x34\x98\xb3\x02\x1f\
+\xbf\x8c\xe2\xaf\xbd\xfc\x95\x9b\xbf\xc2\xfc\x5d\x99\xbf\x80\xbe\
+\xf0\xb5\x92\x75\x77\x8e\xad\x50\xe7\xd1\x00\x06\x3d\xda\x96\x91\
+\xc1\x56\x6e\x81\x95\x2d\xa0\x22\xdc\xe2\xa8\x73\x67\xed\xcf\xb8\
+\x0b\x30\x43\x1b\x28\xe4\x7a\x4f\xc8\x97\x41\x27\xfc\x36\x19\xc5\
+\x90\xf0\xbd\x90\xaf\x83\x22\x98\xdc\x26\xbb\xa8\x23\x59\xab\x42\
+\x6b\x2c\xf4\x35\x14\x5a\xab\x42\x6b\x59\xe8\x19\xde\x85\x98\xbe\
+\xcc\xf6\x67\x2a\x9a\x1a\xac\xbc\xa0\xe1\xc2\xda\xc1\x5a\x72\x7c\
+\x4e\x14\x56\x12\xd8\x9b\x1e\x6d\xc0\x4e\x0a\x93\x98\xeb\x31\x0d\
+\xe9\x30\x8e\xf6\xe0\x40\x85\x18\x26\xb1\x57\x46\x50\x00\x43\x24\
+\xf6\x8a\x68\x67\x1e\x0d\x56\x11\xae\x10\xa7\x16\x91\xe7\x8a\x87\
+\x7b\x39\xae\x49\x17\x5a\x82\x43\xdb\x4d\xe6\x3b\x18\xd0\x05\x5f\
+\x76\x91\x1d\x51\x55\x96\x4d\x54\x47\xb1\x59\x22\x67\x81\x96\xdc\
+\xaa\x1e\xb6\x2e\x43\x3c\x88\x20\x35\x04\xf9\x39\x7a\xe8\x07\x5b\
+\xe6\xe9\x0b\x48\x87\xff\x77\x02\x3e\xa9\x14\xdb\xd2\x95\xd3\x12\
+\x86\xf5\x2c\x73\xd4\x65\xa7\x45\x16\x06\xaf\x38\x06\xb3\x43\x6a\
+\xd9\x01\x21\xb7\x03\xed\x9d\x5d\x00\xf1\x64\x9d\x25\x50\x2a\x48\
+\xc0\xc4\xb7\xfd\xb7\x20\x49\xfc\x5c\x89\x45\x5f\x94\x6f\x20\x97\
+\x58\x24\x9e\x62\x2c\x72\x46\xa3\x24\x8f\xdc\x0b\x90\x9a\x81\xf6\
+\x2e\x17\xe2\x62\x1d\xcf\x39\x53\xcf\x32\x1c\xf3\x4b\x24\x4c\xaf\
+\x34\xc1\x58\x71\x36\x5d\xe4\x25\x90\x16\x62\x63\x0f\x33\x55\xa0\
+\xa1\x74\x57\xe3\xd5\x7b\x87\x91\xf9\x17\x62\xa9\x4b\x2f\x38\xe9\
+\xd3\x5f\xcf\x2e\xf9\x3e\x4a\xd8\xca\xa6\x3e\x9e\xca\xf4\x17\xe8\
+\x66\x38\xc3\x23\xcc\xce\xca\xbf\x5e\xb6\x76\x38\xe3\x4c\xce\x27\
+\x5e\x42\x29\x9c\x76\x7c\xc5\xef\x2c\x0d\xba\xe4\x0d\xcf\x31\x44\
+\xf3\x4c\x61\x78\x38\x67\x27\x23\xf6\x35\xdb\x65\xcf\x4e\xd9\x14\
+\x90\xe3\x99\x45\x8e\xd3\xbd\xb3\xf1\x14\x4d\xa8\x4e\xa6\xa7\xa8\
+\xad\x9b\x71\x44\x03\xf8\xc5\x3c\xe3\xad\xaf\xc9\xd0\x8a\xda\x9f\
+\x27\x0b\xa4\x05\x64\x69\x36\x25\x7b\xde\xd0\x36\x18\x01\xf5\xc0\
+\x36\xf3\x04\x5b\x85\x53\x86\x2d\x01\x38\x21\x09\x29\x64\x07\xdb\
+\xf3\x49\xaa\x7f\xa1\x6c\xb8\x42\x9c\x93\xc2\x60\xe7\xf2\x46\xcd\
+\x0e\x63\x45\xf7\x96\x12\xad\xae\xf0\x02\xc5\xd4\xc3\x68\x87\x8f\
+\xae\xa7\x7f\x16\x78\x2b\x96\x64\x3a\x16\x65\x45\xc0\x00\xbc\xc9\
+\x1a\xe0\x01\x77\xec\x7d\xbe\x58\x5f\xc2\xce\x5c\xf2\x3b\x76\x0d\
+\x69\xcd\x67\x3f\x3c\x05\xdb\x47\x34\xc6\xca\x2e\x51\x0f\x9a\x56\
+\x1b\xde\x09\xf1\x2a\xe0\x9b\x8a\x6b\x86\xc8\xe6\xce\x3c\x4c\x48\
+\x51\x89\x4e\x7a\xa3\x67\x43\xd6\xfb\x6e\x78\xca\x4e\xf0\xd7\x77\
+\x14\x40\xed\x33\x0c\xe1\x28\xfe\xe6\xc9\xb7\xcf\x46\x4f\xbe\x65\
+\x47\x67\x07\xfb\xef\x0e\xf1\xfb\xe9\x37\xdf\x3e\xdd\xed\x3f\x19\
+\x7d\xbd\xfb\xf5\xd3\xd1\xb7\xdf\xd5\x9b\xda\x1d\x0e\x9f\x7c\xfb\
+\x74\xf8\xac\xff\xe4\xeb\x5d\xc8\xed\x8d\x9e\x7e\xfd\xdd\x37\x4f\
+\xbf\x1d\xf6\xbf\x7d\xf2\xdd\xb7\xbb\xd0\x43\xad\xc0\xe8\xd9\xb7\
+\xdf\x7c\xfd\xcd\xd3\x6f\xfa\xbb\x4f\x46\x4f\x9e\x01\x4d\x6b\x9b\
+\x85\x73\xf1\xf3\x7e\x7f\x30\xb2\x17\x62\x47\xe4\x4c\x0d\x0b\xb0\
+\x23\x74\x74\x06\x35\xd2\x01\x07\xdc\x65\x09\xdb\xa8\x97\x03\x6a\
+\x01\xb4\x53\xee\xc8\x44\x91\x61\xdc\xae\x54\x16\x81\x13\x17\xea\
+\xd6\xbf\xee\x65\x83\xdd\x68\x60\x6e\x99\xa0\x6a\x11\x0d\xc2\x51\
+\x17\x78\x8a\x12\x72\xa0\xc7\x1e\x97\x8d\x2c\xf2\xcb\xd0\x04\xf2\
+\x49\xd9\x08\x78\x8b\x61\x54\x0f\x82\x84\x9b\xb4\x23\x76\x10\xa7\
+\x6e\xda\x24\xa3\x45\x87\x69\xc1\xe4\x06\x6a\x28\xfa\xce\xfc\xa8\
+\x3e\xb5\xac\x7d\x6a\x94\xc4\xaf\x97\x21\x12\xa6\x81\x9d\x1d\x4c\
+\x6a\xb7\xb7\x2b\x87\x9c\xe2\x54\xe9\x61\xec\x21\xe0\xef\xfe\x68\
+\x3c\xdf\x1b\x3d\x05\xb1\x9b\xf7\xbe\xdd\x33\xe2\xf0\x2a\x1a\xcf\
+\xd1\xf9\xc2\x5d\xac\x14\x95\x1c\xee\xa2\x08\x5a\x14\xa1\x16\x25\
+\xed\x26\xab\x4d\xbd\xed\x88\xa8\x97\x8e\x3d\x48\x4c\x77\xf0\x3d\
+\xcf\xeb\x1d\x0e\xc3\xbc\xbb\x63\xef\x01\xd6\xde\xa2\x55\x7a\x15\
+\x5f\x73\x76\xc0\x8b\x29\xda\xb2\xc7\x9f\x39\x3b\x5e\xce\x79\x21\
+\x40\xa2\x36\x89\xbf\xdc\xb1\xb7\x5c\x46\x1a\x7d\xa3\x5e\x22\x0d\
+\x5e\xbf\x3f\xfe\x21\x7e\xf2\xe4\xbb\xa7\x81\x06\x1f\x44\x71\x50\
+\xdd\x44\x4c\xa1\x68\x1f\xf1\x0f\xe1\x27\x9e\xf4\x9f\x0e\xf4\x66\
+\xef\x7c\xe6\xfd\xa3\x88\xf5\x9f\xb2\x1e\x1c\xc4\xfe\x53\x60\xbf\
+\xd9\x79\x6b\xe3\x5f\x3f\xd9\xfd\xc6\x6b\xfc\xba\xa5\xf1\x11\x81\
+\xe6\x08\x80\x9e\x7e\xc8\xf6\x3e\xa8\xf6\x7e\x64\x37\x0f\x55\x07\
+\xf6\xb4\x07\xff\xc0\x92\xd6\x6e\x57\x7d\x4e\x0d\x37\x60\x97\x04\
+\xbb\x2f\xf5\xf8\x55\x6e\x31\x84\xce\x4a\x01\xf2\xdb\x77\xbb\x1b\
+\xdf\xa5\xd1\x9c\x28\xc0\x69\x4f\xa2\x14\xe4\x46\xe1\x4c\xf5\xe8\
+\x64\x8d\x1b\x4c\xa2\xe2\x4d\x23\x54\xba\xa2\x5c\x28\x1f\xdd\x8e\
+\xc6\x3f\xf6\x5f\x83\x14\x33\x4f\xde\x30\xf8\x05\x8b\x86\x1b\x92\
+\xbc\xe5\xfa\xeb\xd9\xd3\x6f\x93\xdf\xd5\xc7\x77\xc3\xe1\x77\xa3\
+\x27\xc9\x6f\xea\x13\x57\x37\x39\xc7\x92\xc7\x48\x18\x79\xf2\x41\
+\x9a\x51\x1f\xb4\x2a\x7f\x31\x30\x53\xec\x3d\x88\xc0\x9c\x0b\x09\
+\x72\x12\x60\x2d\x91\x41\xc9\x88\x65\xa3\x0b\x6d\x65\x4d\x74\x1d\
+\xfd\xfb\x03\xe1\x0f\x64\xee\x9b\xc2\xbc\x4a\x7d\x65\x1e\x9f\xc6\
+\x9f\x1f\xf2\xe7\x33\x8c\xa1\x6d\x8b\x6d\xba\xb6\xf3\x8c\x8d\xdd\
+\xfe\x37\xbf\xed\x65\xad\x5c\xfb\xaa\x50\xe8\x87\x23\xa3\x0b\xc8\
+\xca\x7f\xc2\x0f\x97\x4e\x7a\xcf\xee\xdb\x8b\x67\x29\x4b\xdf\xdf\
+\x85\x1b\x51\x5d\xc5\x50\xd7\xf3\x7a\x54\x4b\xf5\xc7\x32\x6b\x0d\
+\xda\xd9\xb6\xde\x71\xb6\xdf\xdb\x3a\x9b\x4e\x61\x26\x61\xed\x5a\
+\x2d\x94\xc8\xda\x45\x76\x37\xe6\x8e\x1b\x04\x2e\xb3\xeb\x4d\x98\
+\xb8\x06\xa2\xe6\x25\x17\xee\x7f\xcb\x22\xc8\x51\xa9\x70\xb3\xce\
+\xfb\xc1\xea\x15\x5b\x0c\xed\x97\x67\xde\x45\x0e\x7c\x4f\xe9\x51\
+\x74\x79\xdf\xe1\x4c\x8c\x93\xc5\x91\xd0\x96\x43\x52\x13\xab\xeb\
+\x3c\x77\x14\x57\xf5\x9b\x73\xde\x7a\xcd\xd8\x96\xda\xb8\x5f\x6f\
+\x36\x17\xfa\x61\x79\xd0\x0f\x07\x67\xa1\xde\xac\xc0\xe5\xc2\x24\
+\xa6\x5d\xdc\x70\xb3\xa2\xb6\xc0\x18\x4d\x3f\x3f\x72\xf6\xea\x9b\
+\xdd\x69\x3e\x06\xf0\x61\xce\x3b\x80\x18\x31\x7a\xd2\xac\x23\x99\
+\x76\x7c\xd2\x07\x9f\x04\x4a\x3b\xd4\x5e\x3f\xd0\x4e\x47\x08\x2b\
+\x6d\xaf\xb3\x9e\x08\xbc\x6b\xaf\xfb\x05\xa2\x77\xbf\x39\x86\xb4\
+\x49\x40\x73\xce\x29\x4a\x0a\x24\xe0\xa9\x33\x1f\x6e\x88\x19\xc7\
+\x70\xcc\x8e\x1b\x43\xf3\x79\x28\xa1\x39\xd3\x07\x87\xe8\x3c\x1b\
+\xae\x5e\xb2\xf5\x03\xa2\xa0\xbc\xd6\x6e\x1f\xd1\xb2\xd1\x1b\x32\
+\xfa\x0d\x4b\x81\xb0\xde\x28\xee\xb5\x77\x1c\xcd\x00\x99\x3f\x3c\
+\x57\x5b\x4d\x65\x34\xf8\x6a\x30\x40\x6b\x19\x95\xaf\xb2\xc8\x72\
+\x4d\x5e\xe3\x3a\x4b\xef\xc6\x6b\xd1\xc7\xaf\x05\x49\x6c\x6d\x55\
+\xe4\xdd\x19\x09\x7f\xe9\xee\x18\x4f\xa7\xf3\x36\x57\x7f\xa3\x7f\
+\xe9\xd4\xaa\x44\x3a\x80\xb1\xe7\xa7\x79\xc2\xfd\xc7\x7d\x1d\xb7\
+\xd0\xb2\x9d\x21\x4b\x90\xd3\x44\xe7\xbc\x09\xd2\xd2\x49\x15\xe3\
+\x9b\x89\x18\x98\x5c\xfb\xa8\xee\x71\x1b\xf1\xc1\x09\x61\x21\x4e\
+\x95\x15\x20\xde\xe7\xd3\x1b\x00\xbe\xfa\x55\xbe\x21\x58\xd5\x5d\
+\x1c\x00\x1d\x35\x72\xa4\x29\x6b\x64\x6e\xbb\x11\x19\x51\xf8\x4f\
+\x39\x6e\x8d\x90\x3d\x53\x0e\xea\x95\xec\xcb\x43\x15\x56\x13\x77\
+\xa7\x7d\x2c\x0e\xd8\xb6\x77\x40\x80\xeb\x01\x4c\xb3\xc4\xbd\xbd\
+\xd7\x53\x9b\xba\xf0\xd1\x00\x63\x5b\xf7\xf0\x8f\x63\xe9\xa6\x9f\
+\x41\x09\x6d\x58\x89\xcc\x6e\x74\x6d\x10\x91\xeb\xa9\x5d\x1f\x60\
+\x66\x42\x86\xb3\xca\xbe\x97\x98\xdb\x37\x78\xed\x33\xad\x15\x33\
+\xc9\xc8\xf1\xba\x85\xd5\x5b\xb9\xc2\x06\x1c\x75\x1f\x80\x1f\xbb\
+\x90\xa6\x6c\x87\x13\x01\x35\x71\x5a\xea\xf5\xdd\xd8\x87\x47\x65\
+\xa6\x9c\x54\x50\xca\x29\x54\x31\x6e\x1e\xf2\xf6\x96\xa1\xf1\xd2\
+\x8d\xe7\x43\x10\xb1\x7b\x1f\x00\xf6\x7d\x8d\x0f\xbc\x44\xe3\x0e\
+\xf4\xfd\xe6\x32\xa5\x2a\xd3\x52\x62\x63\xcf\xda\xfd\xa7\x65\xd2\
+\xf5\x9e\xf7\x36\x97\x69\xed\x59\x6d\x91\x8e\xb5\xf3\x85\x27\x07\
+\xfc\x7e\x23\x13\xc3\xeb\x32\x7a\xc1\x40\xd9\x04\x88\xc8\xdb\x12\
+\x7a\x0b\x2c\x22\xf5\x25\x9c\xfd\xcc\x6a\x2a\xf8\x5e\x36\xe6\x2d\
+\x27\x9d\x9f\x4a\x7e\x6a\x13\x3d\xd0\xb3\x7c\x2b\xfd\xa6\x36\x53\
+\x07\x73\x84\xa5\x2b\xba\x61\x94\x6c\x5f\x8f\x23\x40\x55\x1d\x17\
+\xea\x08\xc7\xf7\x0c\xc2\xe9\xd2\xa1\x56\x76\x0c\x75\xee\xd4\x29\
+\x76\x2f\x2d\x79\x18\xdd\x87\x41\xb6\xba\x3a\xa7\x37\x4a\xec\x13\
+\xb5\x2d\xe3\x6d\xd2\x04\x0a\x09\xd5\x74\x86\xf3\x1c\xb6\x34\xd9\
+\x08\x1d\x6e\xfd\xad\xf4\x5b\x93\xec\x96\xc8\x3e\xe5\x1f\x5b\x6f\
+\xbb\x61\xef\xe9\x4e\xc3\x09\xac\x43\x37\x29\x92\xae\x00\x33\x49\
+\xd7\x48\x25\x1b\x49\xe4\x24\x1a\x14\x28\xac\xb9\x92\xc3\x52\x91\
+\x2d\x1e\xde\x3b\xa1\x47\xe6\x02\xe3\xd9\x66\x35\x7a\xb4\x21\x9c\
+\x91\x33\x11\x03\x0f\x24\x00\xb6\x1b\xb1\xd7\xab\x78\x13\x8f\xfe\
+\x0f\x92\xd3\xd6\x48\x0f\x6d\xe0\x5e\x9d\xda\xc2\x2d\xf4\xe0\xe4\
+\x74\xbc\x61\x1f\x49\x95\x46\x76\xaf\x64\xe1\xa9\xc2\x64\x6d\xea\
+\x4e\x6e\x2f\x06\x12\x51\x25\x03\x1d\xc6\x50\x41\x56\x7c\x05\x3c\
+\xcc\x4b\x9e\x7c\xb1\xb8\xa3\xf5\x2c\xbb\x8d\x5a\x01\x42\x3e\x73\
+\x1f\xcb\x4d\x21\xe6\xff\x3d\x59\x00\x28\x6e\x0e\x1a\xf5\xa2\x32\
+\x49\x66\xb6\x19\x98\x69\x13\x97\x8d\x2c\xf6\xc6\xc3\xbe\x69\x44\
+\x61\xe3\xfc\xcb\xe8\x02\xfe\xea\x23\x9b\x26\x5b\x7e\x60\xd8\x4e\
+\xf7\xf7\x8f\xbc\xc9\x1b\xea\x38\x42\xb0\xf8\xc7\x68\x15\xfe\x98\
+\x5d\xa2\x82\x72\x93\xce\x0b\x8a\xee\x0a\x52\xf3\xe6\xc8\xf8\xba\
+\xa6\x5b\x36\xb0\x75\x5f\xa4\xbe\x03\xf3\x3d\x55\xb1\x68\x10\x39\
+\x4f\xdb\x37\x81\x12\x65\x96\xa3\x36\x8b\x57\x75\x46\xbc\x68\xd8\
+\xe6\xd0\x8f\x2b\x0d\x59\xbc\x6f\x1a\x9f\x38\xbf\xc3\x28\xe6\xde\
+\x9b\x2e\x56\x41\x0c\xb0\x79\xcc\xdb\xc3\x77\x2e\x57\xcb\xe7\xd9\
+\x74\x9e\x17\x31\x85\xb1\x67\xea\x85\x47\x37\xed\x31\x01\x3d\xa5\
+\xb3\xda\xfe\x74\x83\x41\x31\x4d\xc5\x96\x09\x03\x31\xa5\x70\x3c\
+\xa6\xe6\x31\x3d\xf0\xf8\xb8\xba\xf2\x31\x48\x65\x91\xd0\xda\x71\
+\x4b\x48\x71\x2c\xf1\x73\xb1\xd0\x2f\xc9\xca\x68\xc2\x72\x18\x14\
+\xef\xa5\x21\x4e\x0a\x59\x81\xe4\xc7\x92\xac\x54\x3a\xd8\x46\x47\
+\xad\x5d\x27\x2c\x39\xd2\x2a\xde\x99\xe5\xd3\x32\xea\x3b\x31\x18\
+\x40\x48\xb9\xf3\x82\x2b\xca\x21\x5e\x5d\x62\x7c\x89\xed\xed\x60\
+\xff\xe0\x07\x7a\x4a\xa8\x5f\xa5\x97\x18\xf3\x00\x18\x41\x12\x6c\
+\x7c\x52\x5a\xca\x31\x13\x20\xa3\x3f\x53\x25\x1f\x94\xf2\x92\x37\
+\x4f\x59\x73\xa9\x59\xc2\x4f\x44\x37\x40\x8f\x9d\xe0\x74\xdc\xa0\
+\x91\x18\x56\x3e\x4b\x4e\x32\x96\x9d\xea\x58\x05\xcf\x43\x0a\xcb\
+\xff\xdc\xac\xb3\x7c\xf5\x88\xab\x37\x38\x25\x60\xa0\x1d\x14\x2e\
+\x90\xfe\xca\xf1\x59\x24\xfb\xd4\x02\xdd\xfa\x02\xc0\xb6\x84\x75\
+\x90\xcf\x7d\xf6\x82\xae\xa0\x90\x8f\x00\xcc\xa6\xd0\xed\x6d\x80\
+\x9e\x87\xce\x1b\xaf\x50\xf8\x52\x64\xf4\xe6\x1a\x46\xfc\xd7\x4e\
+\x1e\x6e\x26\x3e\xd6\x86\x51\xff\x65\x2c\x2d\x96\x3b\xb5\xa5\xf3\
+\x48\x5e\xaf\xa7\xa2\x6f\xe5\xba\x8e\x05\xa2\xab\xcb\xda\x82\xaa\
+\xc7\x5d\x28\x50\xcb\xc6\xa8\x16\x57\x97\x18\xd3\xa2\x2c\xa6\x18\
+\x42\x56\x3a\x9d\x28\x60\x6b\x03\xe7\x2f\xb5\x47\xf6\x4e\xaa\x6e\
+\x70\x44\x8f\xf0\x42\x85\xe0\x54\x29\xfd\x9c\x4c\x4a\xd6\xdc\xe9\
+\x1f\x70\x8a\x79\xf3\x18\x2b\x58\x8d\xd5\xeb\xad\x3d\xfc\xee\x2f\
+\xb3\xcb\x80\xe1\x2f\xd3\xbc\x97\xdf\xdb\xbd\x96\x45\xe4\xbe\xba\
+\xd9\x32\xc5\x36\x80\xd0\x13\x9f\xec\x3e\x65\x5f\x8f\x4e\x99\xdd\
+\xf6\xf8\x64\xb4\x4b\x49\x1e\x16\x19\xb1\xde\x93\xaf\x1b\x78\x64\
+\xf4\x0d\xeb\xed\x3e\x3b\x55\x9d\xc9\x06\xbf\x1e\x61\xed\x07\x57\
+\xec\x0f\x00\xb5\xab\xf4\x92\xbf\x4f\xf1\xbd\xb5\xd0\xfd\x54\x07\
+\x6c\x06\x6c\xe3\x94\x9a\xc0\x44\x54\x4b\xf8\x96\xfe\x4e\x75\xb7\
+\x76\xd4\x3d\x76\x29\x94\x33\x0c\x8f\x42\x51\xa4\x79\xb7\x83\x26\
+\x46\x6f\xfa\xb7\xa8\x10\x25\x72\xa5\x97\x50\x29\x60\x9e\x4d\x13\
+\x8a\x84\xf2\x21\xe4\x73\x20\x18\x97\xe4\xdc\xd4\xa3\x91\xa1\xa5\
+\x6a\x3d\x67\x5f\x66\x68\x04\xe1\xb5\xa4\x43\x1c\xeb\x07\x05\x04\
+\x69\x49\xe4\xf3\x7a\x32\x26\x82\x89\xf4\xbb\x02\x50\x8a\x30\x8a\
+\x0f\xc6\x45\x5e\x2e\xd2\x29\x0f\x07\xff\x1b\x12\xff\x1d\x9e\x04\
+\xff\x38\x9d\x0c\x18\xba\x3d\x99\x1c\x07\x56\xfe\x8d\xb0\x40\x65\
+\xfe\x1d\x7d\x45\xc5\x90\xa4\xbc\xe6\x89\x78\x40\x54\xb2\xf6\xf8\
+\xd8\x16\x9a\xe4\x6b\x9b\xfa\xcd\x6e\x86\x58\xb2\x7f\x86\xdd\x2a\
+\x49\xd8\xbc\xb0\x65\x54\x17\x26\x85\x68\x69\x8a\xd7\xc6\x15\xe1\
+\x1c\x56\xcb\x47\xf5\xe9\x8d\x31\x90\x54\xb6\x53\x79\xf6\x4a\x9b\
+\x30\x33\x65\x11\x67\x72\xde\x17\x1c\x33\x99\x97\x68\x52\xf0\x55\
+\x49\x37\xf1\x75\x36\x53\x9a\x56\xf5\x96\x57\x18\xd5\x5e\xe4\x56\
+\x8b\x68\x06\x14\x18\x4e\xac\xb1\x0a\x8d\xa1\x5f\x5c\xfc\xff\x34\
+\x76\xf3\xb6\x17\x6b\xee\x81\x17\xb9\xdc\x26\xdf\x3f\xc3\xc6\xe3\
+\x5b\x7e\x78\x00\x5d\xb4\xf1\xbe\xa3\x32\x93\x23\x8d\xd7\x9f\xab\
+\xb2\xf2\x1f\x0a\x71\xb4\xf0\xce\x78\x90\xc4\x49\xef\xd4\xdc\x07\
+\x21\x37\x44\x19\x34\x74\xbc\xe4\x7c\x66\x22\x19\xb7\x97\x79\x0f\
+\xd0\x09\x5c\x1c\x2b\xd0\x54\x96\xcb\x99\xe2\xed\x67\xd6\x7c\x89\
+\x67\xee\x24\xea\x47\xbc\xd8\x2a\x39\x0c\x53\x32\x93\xb1\x66\xc4\
+\x73\xf2\xd4\x41\x77\xf9\x94\xec\x65\xbc\x1c\xf3\x1b\x43\x04\xae\
+\x6c\x0c\xff\x02\xd5\x74\x02\x88\xb0\xbd\x16\x5e\x49\x93\x1c\x56\
+\xf4\xaf\xa3\x9e\xfa\x88\x06\xa1\x6c\xf4\xda\xa4\xf4\x42\xa3\x81\
+\x5a\x49\xab\x1e\x53\x03\x3f\x64\x0d\xfc\x65\x52\x58\xbd\x8f\x35\
+\xd4\x58\xeb\x3e\xd6\xa6\x8f\xb5\x49\x69\xf4\x61\x6b\xe0\x87\xe9\
+\x63\x6d\x52\xa2\xfe\xd5\x0a\xc9\xc1\x62\x0d\xec\x01\xbd\xb9\x24\
+\x1f\x62\x11\xec\x46\x05\xad\x8f\xb7\x46\x77\xcd\xe3\xab\xed\x1c\
+\xe9\x49\x32\xd1\x92\x6f\x4c\x73\x75\x89\x4f\x66\xe3\x36\x35\x66\
+\x5f\x1a\x21\x9b\x54\x63\xaa\x0b\x23\xaa\xdb\xe5\x1a\x28\xec\x9f\
+\x0b\xe5\x7c\x8a\xfa\x7b\xe5\xbc\xa0\x0f\x62\xf3\x10\xe7\x8b\x99\
+\xe4\xc2\x7d\x68\x73\x98\x73\xff\xa4\x91\x7d\xce\x7b\xa4\xa2\x56\
+\x59\x52\xcb\xa8\x57\x69\xbc\xda\xdd\xb4\x06\x97\xcf\xf9\x48\xa4\
+\xb0\x11\x27\xd7\x8f\x80\x63\x94\x6a\x17\xe4\xbf\xb3\x44\xf7\x84\
+\xea\xa7\xe3\x8b\x37\xc6\x67\x92\x2d\x80\xa3\x0c\xe7\x4e\xe8\x73\
+\x97\x63\x0e\x6a\x8d\x48\x06\xf2\x3d\xc6\x33\x0a\xe0\x89\x9b\x2d\
+\x63\x45\x9e\xa9\xb7\x25\x73\x69\xc6\xa2\x7f\xd6\x37\xc2\x7c\x43\
+\x15\xf7\x6d\xf0\x2a\x6a\xb3\x75\x56\x68\xd2\x9b\x41\xdb\xe2\x78\
+\x8a\x2b\xdb\xc5\x86\xfd\xa2\x07\x91\xea\xf6\xbd\x15\x51\xd4\x8f\
+\x9e\xf2\xd1\x63\xef\xc8\x2e\xe6\x0f\x10\x20\xec\x25\x29\x06\x56\
+\xf8\xc8\xd7\xe7\x79\x5a\x50\x08\xf0\x4a\x06\xec\x09\x58\xba\xa8\
+\xf0\xcf\x97\x7d\x49\xf8\xe9\x6d\xaf\x21\xcb\x97\xe9\x54\x54\xeb\
+\x78\xc4\x0a\x51\xf2\xc3\xec\x47\xbc\xf8\xc6\xc0\xdf\xf4\x29\x4b\
+\xed\x3e\x1d\x32\x79\x2b\x2e\x87\x2d\x2f\xc5\xe5\xee\xd0\xf5\x71\
+\x60\x7f\x07\xed\x77\xe3\x23\x66\x4e\x1c\x7e\x28\xb0\x72\x7e\x2a\
+\x24\x1b\x9f\x40\x5f\x4f\x41\xe2\x74\xf1\x73\x3c\x1a\x6e\xf4\xc0\
+\x32\xf2\xa6\xa3\x69\xa5\x8d\xfe\x33\xac\xee\x09\xe0\xed\xdd\xc1\
+\x36\x93\xe8\xf2\xcc\x28\xb8\x71\xce\x7f\xb8\xef\xba\xb4\x5c\xe4\
+\xea\xf0\x9e\xf6\xc9\x11\x75\x12\xec\x5b\x29\x9e\x0f\x14\x4e\x87\
+\x04\x57\x95\xa0\x9d\x64\xef\x53\xba\x39\xef\x80\xba\x9f\xf6\xc5\
+\x50\x7d\xa9\xa6\x87\x6e\x39\x22\xed\xf6\x61\xea\xd4\x7c\x0e\x5d\
+\x60\xd5\x65\x36\xcd\x52\x87\x1a\x7a\xcc\x34\xd5\x1d\xbe\x33\x51\
+\x95\x24\x45\xfb\x50\xea\x44\xea\x4f\xb1\x6b\xd6\x80\x82\x9d\xc4\
+\xce\xfa\x00\x22\xe7\x9f\xe9\x9d\x6b\x37\xf5\x4e\xe9\xdc\xf0\x7c\
+\x6d\xe4\x2f\x24\x58\x90\xbe\xa8\x5e\xb2\x86\x82\x64\xc9\xba\x1e\
+\xdd\x00\x95\xbf\x5f\xae\xa6\x4a\xa9\xa8\xcc\x59\x8f\x05\x93\xf5\
+\x62\x6f\x08\x91\xa3\x5b\x7c\xe0\xe5\x44\x13\xbc\xc5\x29\xac\x35\
+\xf9\x16\x62\x94\x88\xf2\x90\x41\x03\x22\x0c\xea\xfa\x5e\x85\x8c\
+\x5b\xda\xbf\x34\x08\xef\x87\x5c\x43\x0e\x1c\x8a\x85\xd8\x5f\x12\
+\x2a\x27\xcf\x2d\xa7\xbb\x73\x0c\x52\x1a\xc1\x35\x6b\x1b\x29\xa7\
+\xb1\x21\x2c\xc9\xb8\x51\xd4\xb9\x68\x70\x54\x95\x92\x80\x34\x9f\
+\xa5\x74\xf6\x29\xd2\x2f\x3a\x6a\x87\x29\x7a\x65\x25\xb4\x37\xf5\
+\x66\x25\x36\x48\x2d\x5a\xdb\xe2\xc4\xb0\x21\xcf\xc3\xa0\xeb\xdc\
+\xb5\xea\x93\x35\x09\xcc\xdb\x57\x71\x80\xf1\x5b\x03\x8a\x30\x41\
+\xdb\xd0\x77\xf4\x5c\x76\x62\x68\x2a\xb8\x35\x1a\xdb\xcb\x3c\x39\
+\xdb\xb0\x39\x75\xef\x10\x66\x84\x0b\x64\xc8\x27\x32\xf8\x97\xb1\
+\x23\x54\x4a\xc4\xb4\x22\x8a\x6b\x45\x14\x15\x02\xe2\x01\x45\xe0\
+\x5f\x52\xc7\x90\x3c\x43\xcf\xe5\x55\x7d\x4d\x6b\x64\x5b\xe9\xb9\
+\x7c\x90\x21\x18\x1a\x7f\x1a\x02\x24\xb4\xc7\x73\x08\x8c\x79\xb0\
+\x25\xbc\x31\xcf\x86\xeb\xe8\x92\x8e\xb2\x95\xe9\x77\xc4\x63\x3d\
+\x11\x73\x70\xee\x4c\xf0\x6c\x77\x89\x14\x56\x51\x1b\x46\x1f\xa8\
+\xb6\x82\x65\xca\xcd\x32\xc9\x64\xb3\x50\x3e\x3a\xc2\xc2\x43\xa9\
+\x30\x9a\x62\x74\x6c\x7c\x96\x8b\x26\x1f\xd8\x60\xb8\x54\x54\x32\
+\x12\x92\x78\xee\x8d\xfc\xb8\x30\x87\x32\x19\x17\xdb\xde\x43\x92\
+\x09\x95\x1f\x2c\xd3\xdd\x4b\xe7\x6c\x69\x5a\x4e\xdb\x05\x23\x29\
+\x6b\x8d\x54\x7d\x4b\x6e\xdb\x1a\x54\xf3\x36\x17\xf3\x75\x10\xf5\
+\x8e\x79\xcb\xa6\xa0\x84\xf9\x1f\xef\x0a\x33\x4f\x9e\x38\xf3\xda\
+\x60\xc9\xd5\xb6\x00\x08\x2c\xa4\x2b\x65\xde\xce\x34\xb9\x69\xbd\
+\x8d\xa6\x3f\xbd\xdd\xde\x2e\xa9\xa6\xe4\xd9\x6d\xe1\x03\xe4\x31\
+\xf9\xe4\x8e\xd9\x86\x3d\xd1\x5d\x7c\xf2\xbb\xb0\x05\x24\x5a\x26\
+\x67\x8b\x8d\xe8\x9a\x35\x16\xc9\x89\x5b\xdd\x72\xc1\xb4\xe1\x2c\
+\x2b\x35\xa5\xee\xd1\xe9\xbe\x5b\x6d\x7e\x93\xad\xf1\x0c\x56\xbf\
+\xfd\x81\x66\x0f\xf1\xa9\x97\x21\x99\x7e\x29\xd2\x20\xc2\xb1\x87\
+\x08\x29\x28\x72\x0d\x60\x9b\xf8\xd8\xa7\x29\x16\x02\xe4\x01\x73\
+\x56\xdd\xe0\x48\xa7\x90\x3e\x73\x6d\x06\x85\x1e\xf0\xbc\xe6\x16\
+\xb7\x37\x98\x1f\x9f\xf3\xb1\x05\x9b\xfc\x53\x8d\x47\x32\x1a\x90\
+\x5a\x06\xe9\x97\x5e\x1b\xab\xaa\x76\x76\x2c\x24\x71\x07\xd6\x4a\
+\x61\x83\x07\x09\xae\x42\x26\x6d\x17\xf5\x75\xb4\xa2\xe8\x8f\x97\
+\x7c\x3f\x11\xd2\xad\x8f\x5d\xf0\xba\xba\x1f\xec\xaf\x1a\x60\x0f\
+\x7d\x6e\xba\x37\x73\x07\xea\x06\x73\xf7\xf0\x0c\x1d\x08\x89\x98\
+\x5a\x6e\x57\x5b\x1b\x19\xaa\x10\xff\xef\x1d\x6d\xf2\x23\xf8\x1c\
+\xe7\x25\x37\x53\x4f\xbf\xda\xee\xaa\xa0\xff\x4e\x53\x9e\xf2\x5a\
+\xeb\xde\x5f\xb4\x0b\x67\xf8\x06\xe9\x47\x92\xc5\xa6\xf9\x02\xfa\
+\x09\xfe\xeb\xc9\x93\x67\xcf\x2e\x2e\x02\xf6\x99\x2e\x1a\xe2\x27\
+\x8e\xe4\x85\x11\x02\x5e\xa6\xcb\x38\xa0\x73\x16\xd0\xf7\x4f\x70\
+\x2c\x4d\xc2\x2c\x2d\xe7\xd2\x11\x92\xac\x8f\xf1\x53\x31\x8e\xf4\
+\x7d\x21\x16\x0b\x14\xa5\xf0\xef\x4b\xea\xce\x24\x6b\xe0\xe8\xef\
+\xd2\xe7\xd1\x0a\x65\x41\x8c\x4c\x90\xe3\x55\x70\x4d\x6c\xdc\x64\
+\xd5\x6c\xec\x18\x5b\x10\x55\x01\xf3\xe6\x05\x6a\x71\x91\x3e\x1d\
+\xa9\x2f\x15\x80\xa6\x2e\x7e\xd5\x2b\x49\x82\x47\xea\x79\x5f\x68\
+\xc0\x67\x2f\xed\x97\x2e\x0c\x68\xc0\x96\xbd\xef\x61\x21\x5b\x45\
+\xd2\x10\xb7\x16\xa9\x47\x3f\x6f\xe4\x2e\x9d\x53\x67\x5b\x51\xce\
+\xd6\xfe\x38\xef\xbf\x7a\xae\x87\xd0\xd2\x8d\x39\x7c\x87\xdf\x3a\
+\xb5\xe4\x2e\x83\x79\x8d\x81\x40\x89\x82\xcf\x1d\x92\xfd\xaa\x73\
+\x3b\x31\x4f\xcb\xc3\xcf\xd9\x7b\xf5\x9c\xab\xba\xa0\x60\x81\x84\
+\x31\xfb\x8c\xab\xec\x41\x6b\x29\xf5\xf0\x1f\x73\x05\xee\x8c\xbb\
+\x3e\x6c\xb7\xba\xb7\x2c\x8f\xb8\x1e\x7f\xb8\x59\xac\x5d\x37\x55\
+\x7f\x48\x32\xc0\x1b\x15\x8d\x5c\x9a\x40\xa1\x1f\xd5\xf5\x43\xd2\
+\xc9\x78\xcb\x7e\xbc\x97\x46\xfb\x61\xcb\x86\xf8\x6f\x73\xcb\x15\
+\x1f\xec\xc6\xc3\xa8\x5b\x9b\x91\x45\x1f\xaa\x7d\xd4\xe9\x3c\xe7\
+\xc9\x8b\x16\xb4\x21\x4f\xf2\x90\xe1\xb3\x01\xab\xf2\x3f\xd6\x7b\
+\x68\x98\xa3\x56\x7c\x3a\x20\xd3\xfe\xc7\xc4\x60\x79\x9a\xfe\x53\
+\x31\xf8\x6f\x49\xed\x47\x72\x4d\x1e\x22\xa3\xee\xa4\xcd\x0a\xf8\
+\x83\xa5\x8e\xeb\xcd\xd5\x01\xd4\xae\x53\xf3\x8c\xab\x65\x22\xcf\
+\x0a\x2a\xa7\xbd\x32\xe4\x97\x5e\xb3\x17\xee\x45\xa2\x6e\xa8\xc5\
+\xce\xc5\x4c\x4e\x2b\xb3\x01\x24\x1b\x8e\x5c\x06\x8c\x29\xa2\xcb\
+\xe3\xa5\x58\x0f\xda\x35\x0a\x30\xcc\xc3\x26\x6b\x14\x77\x3a\x26\
+\x4e\xbb\xfc\xfc\x1d\xa3\x17\xe9\xdb\x16\xff\xe4\x90\x78\x79\x52\
+\x75\x31\x2a\x36\xd7\x41\xfa\x97\xd7\xb2\x93\x44\xfa\xf0\x39\xb3\
+\xb0\x17\x1d\x86\xff\x97\xe9\xa8\xb5\xcf\x36\x44\x1f\xdd\xc0\x1c\
+\xc9\x3b\x5e\x1b\x18\xa3\x76\x23\xdb\x8e\x73\x5f\x8a\x62\xaa\x91\
+\x2e\xc6\x67\xbf\x5a\xfa\x7c\x54\x0b\x44\xe8\x98\xef\x2e\xc6\xa2\
+\xe9\x49\xe6\x16\xfd\x5f\xcb\xd0\x9f\xb8\x8c\xe8\x2e\xef\x70\x68\
+\x83\xda\x1d\x84\x1a\x51\x1b\x68\x2d\xa2\x3d\x6f\xf1\xbb\xed\xcb\
+\xae\xb9\x91\x7d\x9e\x3c\x7f\xd0\x4e\x55\x3d\x9a\xdd\x30\xfb\x10\
+\xe4\x6d\x42\xde\x64\x9c\xdd\x28\x14\x24\x30\x64\xc4\x7d\xa8\x46\
+\x59\x94\x37\x8f\x60\xd4\xb4\x9e\x91\xeb\xdd\x91\xf9\x9d\x69\x9a\
+\xa1\x19\xcd\x39\xef\x40\x0b\x81\x96\x2e\xae\x8e\xee\xc7\x5a\x0f\
+\xa0\x01\x5b\xff\xef\x9f\x79\x55\xf5\x5e\x33\xad\x13\xef\x64\xd4\
+\xcf\x85\xf3\x69\x6c\x0c\xc9\xb0\x2b\x74\x0f\x6c\xe3\xde\xa2\xf5\
+\x4c\x54\x36\x56\xc7\xc3\xb5\x52\x7a\x10\x58\x49\x1c\x12\x61\xb5\
+\x62\x9f\x56\xc4\xe2\xbc\x60\x64\x3d\xab\x3d\x2a\x40\x7e\x7b\xab\
+\x5a\x52\x5a\xb1\x85\x13\x06\x78\x9a\x2c\x6c\x7c\xa3\xa2\x1c\x4f\
+\x0d\x44\x27\x49\xf2\xc6\x7c\x60\x9c\x05\xd7\xd5\xd6\x08\xa7\x72\
+\xf1\x07\x6f\xfa\x47\x03\xc4\x2f\x8b\xbe\x26\xd8\x27\xab\xae\x60\
+\xf3\x53\xc4\x2d\x6e\x62\x4f\x26\xe2\x0b\x13\x12\x5f\x38\xa6\x46\
+\xa8\xc7\x59\xf4\x8d\x3b\x6c\x98\x47\x34\x5c\xe5\xc4\x9a\x4e\x41\
+\x7c\x95\xb7\x95\xf8\x4b\xec\x54\x51\xcf\x78\xa2\xae\xe0\xcb\xfa\
+\xa5\x96\xf0\x15\x0d\x6c\x59\x9b\x8b\x5f\x94\x1b\xc1\x70\x95\xc7\
+\x45\x01\x1c\x17\x5a\x57\x14\xb7\xb7\x61\x91\x88\x81\x29\xe8\x4c\
+\x78\x67\x15\x79\xc8\x2e\xc9\xed\x96\x2f\x1a\x97\xc7\x35\x52\xae\
+\xbb\x99\x0c\xe3\xbc\x7f\xdd\x73\x96\xa3\x64\xf3\x5e\x71\x1a\xf5\
+\xaf\x7d\x98\x44\x83\xa6\x1e\xc5\x42\x08\xd3\x64\xea\xac\xc8\xd4\
+\x54\xf5\xa8\x85\x1d\xcb\x89\xb7\x2d\x6c\x78\x5a\x1b\xf6\xe2\xb1\
+\x94\xc7\x23\xc8\x12\x5a\x71\xe4\x2d\xb5\xd3\x08\x2f\x9e\x5b\xe9\
+\x95\xc2\x6f\x87\xed\x6c\x53\x79\x95\xe7\xd5\xfc\x4d\x8a\x4f\x01\
+\x81\x3c\x95\xe5\x2f\x17\x62\x89\x77\xc7\x8f\xe7\x9e\x0c\x3f\x54\
+\x86\x95\xcb\x99\x6c\xc6\x16\x72\x96\x2e\x2b\x75\x0f\x56\xf2\x9a\
+\xaf\x63\x26\x51\xbe\x6e\xa7\x3c\x5b\x5e\x4f\xca\x57\xe0\x4e\x07\
+\x6e\xb0\x2b\xb7\xc9\xdd\x1b\x03\xc6\x0c\x30\x86\x01\xc9\x83\x65\
+\x32\xe3\x70\x04\x86\x18\xb1\x40\xf1\xcb\x45\x65\x9e\x27\x2b\xf6\
+\xd2\x71\xd1\xed\x46\xba\xfa\xdc\x2d\x74\x52\x9c\xc2\xf1\x07\x49\
+\x35\x99\xeb\xf2\xab\xbd\xc5\x78\x85\x51\x13\xb0\xf0\x34\x29\x71\
+\x59\x93\x39\x1c\xcb\xd1\x29\x9c\x5e\xf8\x41\x01\x75\xc6\xd3\x3d\
+\x69\x4d\x38\x85\x51\x94\x8a\xfa\x18\x1b\x54\x54\xb3\xe6\x16\x4d\
+\x58\x1f\x60\x20\xfe\x2c\x97\xef\xab\xcb\x57\x15\x9d\xa5\xb1\xef\
+\xbb\x61\xb0\xd8\x06\x8d\x39\x58\x95\x55\x07\x1f\xd9\x23\x8c\xd9\
+\xa9\x72\x0c\x7c\xdc\x91\x22\x6c\x67\x05\x67\xfa\xb2\x63\x9a\x0d\
+\x23\xe5\xfb\x57\xc3\x7e\x9a\xe4\x42\x61\x0c\x0a\x87\x51\x61\x8c\
+\x4b\x16\xf4\x6e\xc2\x1f\xd1\x83\x61\x64\x9f\x9f\xc8\x17\x69\xf1\
+\x95\x1b\x7c\x81\x56\x74\x93\x14\x0d\xf1\x1d\x9a\x0e\xdf\xdd\xd1\
+\x69\x34\xd8\xc5\x26\xd0\x97\x45\x44\x75\xc1\xb3\x0d\xc9\xa7\x18\
+\x6f\x44\xbe\x56\x5c\xef\xe3\x22\xcc\xa9\x17\xd8\x58\xd9\x38\x13\
+\x7b\x21\xbe\x0f\x97\xe4\x6e\xc7\x18\x7a\x4f\xf5\x54\x24\x61\x86\
+\x9e\xf5\xfc\x7e\xc2\x72\x52\xc2\x09\x2d\x76\x42\xfc\x93\xe3\x91\
+\x2c\x31\x4e\x0a\x7e\xaf\xe1\x7b\x1d\x9d\x6e\xb2\x64\xf6\x26\x24\
+\xd9\x22\xe5\xbd\x52\x93\x34\x9c\xe8\xa4\x64\x46\x29\x6b\x28\xf3\
+\xb8\xe3\x79\xba\xa4\x9b\x35\xc5\x60\xa8\xc8\x43\xfa\xa4\x2a\x76\
+\x4b\x21\x81\xe6\x69\x3a\xdb\x70\x1e\xdd\xda\xd2\xda\xda\xe3\x66\
+\x9c\xd7\xcc\x3f\xf1\xc2\x43\x06\xde\xc0\x5a\xe6\xbb\xe4\x1e\xe2\
+\x2b\xa3\x89\xf7\xe9\x89\x3d\x08\x4f\x92\x1f\x74\x7a\xd9\xe0\x1d\
+\x78\x82\x27\x89\x22\xbb\xa8\xa7\x05\x9d\xa8\x4f\x39\x45\x7d\x02\
+\x6a\x8a\xcf\x55\xe3\x42\x51\xc4\xa6\xb6\x15\xc2\x02\x51\x14\x53\
+\xb9\xf6\x29\x62\x01\x13\xc8\xbc\x5d\xf6\xb0\x36\xea\xfb\x63\xe7\
+\x70\xd8\xc7\xb8\x55\x9d\xb7\x72\x92\xfe\x7a\x30\xa7\x06\xab\xef\
+\xa3\x28\x7f\x01\xfc\x4c\x97\xd7\x95\xfb\xa1\xd5\x24\xe9\xe7\xf7\
+\x5a\x80\xa8\x5a\x69\xc3\x63\x85\x99\x86\xa8\x22\x54\x88\x48\x68\
+\x36\x6a\x97\x55\x4e\x1a\x63\x20\xcb\x25\x43\x23\x85\xa5\x71\x4e\
+\x89\xf4\xba\x2f\xcd\x8e\xc8\x4b\xd3\x5f\x98\x06\x23\x6e\xe2\xd9\
+\x50\xbc\x20\x27\xe8\xe1\x2b\x8a\xe2\x64\xb1\x4e\x29\x21\x03\x5f\
+\x3f\x43\x68\x00\x10\x28\x08\x04\x72\xbb\xaf\x9b\xc4\x41\x02\x0d\
+\x43\x36\x73\xda\x6e\x75\xaa\xf2\xe8\x8e\x2f\x4a\xde\x91\x08\xc6\
+\xb6\xda\xbe\xa9\x18\x2b\x4c\xc6\x00\x3a\x93\x21\x65\x44\xed\xda\
+\xde\x13\x1e\x6b\x02\xd2\xd8\x04\xf9\x26\x92\xe2\x80\x8e\x5a\x39\
+\x2d\xd0\xe9\x6f\x4f\xa2\x8a\xcc\x63\xad\x9a\xc7\x94\x54\x3e\x72\
+\x9b\x74\xe0\x6c\x6c\xa6\xe5\xbc\x82\x60\x0c\xfd\xa8\xb8\xa2\x85\
+\x43\xc3\xeb\x52\x45\x4b\x0f\xe7\x86\x1e\x2a\x47\xdd\xdc\xa3\x0b\
+\x85\xe7\xa7\x0b\x48\x19\x3d\x75\x61\x11\x41\xa0\xcc\xd1\x43\x0d\
+\xfe\x41\x9c\xac\x9e\xf1\x46\x88\x2e\x4f\xd2\xd3\x04\xff\xb9\xbd\
+\x85\xc9\xe3\x0f\xb9\x09\x18\xd3\x0e\x8e\xf8\xc9\xe8\x14\x3d\x41\
+\xa9\xda\xf6\xb6\x00\x3e\x92\xf7\x76\x81\x93\x74\x0b\x02\x05\x61\
+\x18\xbf\x8e\xf0\x9c\x8a\xf2\xd4\xdc\x06\xfb\x4c\xba\x3b\x5d\xe1\
+\xcb\x54\x2e\xd3\xc4\x36\xb9\x23\x9e\xf0\xd3\x04\x83\x00\xc2\x5f\
+\xf9\x0a\xe6\xbd\x02\x79\x68\x4e\x9a\x82\x0d\x7b\x79\xee\x8d\xb5\
+\xa6\x83\x53\xf6\xd9\x7f\x53\x78\xc7\x80\x46\x46\x74\xdf\x24\x5f\
+\x3b\x5e\x99\x0d\xd1\xa6\x8e\x10\xc6\x96\xb3\xd0\x20\x88\x21\x0f\
+\x7d\x98\x34\xc6\x98\x55\x64\xa3\xcb\x69\x87\xce\xb2\x8d\xb1\xe2\
+\x7b\x25\xad\xa5\x3a\x62\x18\x51\x0a\xe8\xb0\xc7\x83\xa1\xab\x9b\
+\x13\x62\x0a\x0f\x21\xf0\x6c\x92\xc6\x87\xca\x62\x3b\x03\x08\xa2\
+\xd0\x7a\x29\x46\x9b\x4a\xf1\x10\xef\x25\x9a\x13\xd9\xd2\x81\xdb\
+\x64\xfc\xc6\x43\xde\xa7\x40\x5a\x89\x7a\x2f\xf2\x88\x27\x87\x9b\
+\xb5\x8d\x7f\x97\x01\x35\x8b\x62\x29\x9a\x61\x4d\xff\x6f\x71\x6c\
+\x14\xeb\xb1\xc6\xb5\x2d\x92\x95\xcb\xb5\x2d\x1a\x5c\x5b\x95\x94\
+\x49\x91\x20\x06\x10\xc9\x02\xb9\x2a\x60\x69\xe1\x90\xd0\x3b\xbd\
+\x2b\x64\xac\x32\xf8\x83\x27\x19\xa3\xc9\xed\xa0\x75\x6c\x06\x7f\
+\x29\xbe\x5c\x37\xc1\x90\xbd\x5d\xb4\x94\xdd\xc9\x31\x3c\x11\x06\
+\xf9\xed\xa2\x51\x2b\x7c\x96\xdd\xe4\xc9\x4e\xae\x29\xea\x3c\x41\
+\x6e\xaf\x9c\xac\x30\xbc\xf0\x49\x31\x28\x59\x3a\x28\x4f\xef\xe7\
+\xc0\xe6\xd1\xfd\x3c\x82\xe4\x0f\x0e\x3d\x47\x05\xbf\xb8\xaf\x66\
+\xa4\x00\x3c\x0a\xaf\xc9\x51\xe1\xa3\x24\x80\x64\x6a\x34\x47\xa6\
+\xf4\xf9\x5f\xab\x74\x01\x82\x31\x85\xd9\xc4\xa8\x01\x78\x8d\x86\
+\x14\x73\x33\x77\xe5\x8f\xc5\x16\xf2\xc7\xd1\xe0\x94\x9c\x08\xbe\
+\x92\x09\x3b\xf1\x3e\x4f\xff\x03\xee\x0b\x91\xe9\xa4\x9e\xd2\xe0\
+\xc1\x14\x1b\xf6\xb7\xa9\x58\x1d\x8b\x4a\xc5\x3f\xd3\xe1\xa6\x05\
+\x49\x94\x5a\xd5\xe9\x73\x0b\xf4\xe2\x94\xe6\x0e\x40\x0a\xfa\xbf\
+\x49\x10\x33\x1d\x47\xb4\x49\xf8\x72\xc0\x57\xb9\x24\x65\x97\x7a\
+\x69\xe5\x99\xc2\xe7\xaa\x89\x96\x99\xb7\x31\x5c\x74\x27\x29\xd4\
+\x7f\x8c\xc5\x19\x45\xa6\xbf\x47\x51\xea\xd1\x71\x73\xe6\x01\xfb\
+\xfe\xb7\xd0\x76\xbe\x49\x1e\xce\x41\x1e\xce\x15\xda\x2e\xa1\x10\
+\xe0\xec\x79\xa2\xa3\xf1\x28\xb4\x9d\x7b\x68\xbb\x44\x8e\x21\x29\
+\x09\x7d\x08\x19\x44\x50\xa0\xe0\x0c\x98\xe1\xfb\xaa\xbf\xde\x4a\
+\x32\xf9\x03\x19\xdd\x6b\x90\xd4\x00\x9f\x60\x9c\xf0\x1d\x8a\x60\
+\xc9\xc9\x42\x3e\x53\xbf\xba\x9c\xc2\x6c\xc2\xf4\x56\x86\x33\x5f\
+\xdd\xde\x36\x0e\xbc\x5d\x2a\xf7\x9c\xd1\x52\x2a\x8d\xc9\x3b\x9e\
+\xbc\x7c\x44\xe4\x82\x7b\xc2\x15\xd8\x57\x74\x5e\xa5\x55\x4a\x02\
+\x91\xfa\xbd\x69\x7b\x12\x15\xcd\xa4\xea\x5f\xf0\x14\xc6\xce\x89\
+\xf7\xcb\x25\x5f\x22\x79\xa9\xbc\x1e\xe2\x24\x04\x70\x43\xb6\x29\
+\xea\x5f\xf2\x9c\xde\xe7\xc2\xd8\xfa\x99\xfe\x5a\xe3\x6f\xdd\x1a\
+\xfe\x9e\xe6\x79\x31\x13\x19\x40\x50\x19\xd5\x46\x58\xf3\x7a\x97\
+\x0f\x22\xba\x27\x85\xd8\xe9\x3e\x50\xbf\x0a\x2f\x20\xb7\xf4\x4f\
+\x0b\x1b\xf2\xa1\x78\x0a\x23\x9c\xbc\x42\x9a\x5b\x9a\x26\x8b\x49\
+\x58\xe8\x81\x24\x7f\x91\x6c\x56\xe8\xa7\xa7\xd5\x03\x2f\x89\xb9\
+\xf3\xd3\xa2\xa9\xd6\xbe\x62\x68\x3c\xb4\x7a\x7b\x9d\x4e\xe7\x6f\
+\x64\x1b\x18\x0c\xd8\x4b\x80\xde\x0a\x6b\xf6\x22\x1d\xaf\x0b\xe3\
+\xed\x6c\xdb\x6a\xd3\x35\xd9\x38\x19\x12\x01\x36\x22\x14\x18\x35\
+\x30\xf1\x4d\xb1\x0d\x04\x23\xd5\xfe\x55\x6d\x26\x9e\x72\x0c\x9a\
+\x51\x77\xd4\xf5\xfb\xe9\xf5\x42\x45\x91\x8a\xda\xee\xcb\x84\xaf\
+\x17\xb0\x63\x6a\x0a\xe7\xf5\x7e\x84\x0e\x59\xa5\xe9\x8e\xce\xab\
+\x41\x6f\x65\xf4\xdb\x18\xf2\x41\xe7\xd5\x6f\x36\x44\x68\x00\x92\
+\x02\x09\x99\x5d\x11\x32\xd8\x94\xae\xd7\x79\xc5\x5b\x18\xc7\x24\
+\x50\x1b\xe4\x3c\x21\x5f\x19\xf0\x8c\x81\x2f\x4b\x8a\x49\xe1\xc2\
+\xa5\xb4\xc2\x98\x23\x5e\x5f\xa1\xb3\x2c\x52\x51\x45\xe4\x31\x54\
+\xc2\x42\xa6\x51\x85\x52\x53\xfe\xdb\xdb\x5f\x39\x21\xb4\x14\x00\
+\xb3\xf0\x38\x96\xf2\xb3\xa8\xa6\x73\x80\x3e\xec\x1a\x4e\x6c\x5a\
+\xf2\x80\x8e\x7e\x10\xab\x62\x7f\x62\x70\x50\xd2\x9d\x53\x3c\xc5\
+\x68\x4c\x65\x0e\xd0\xc7\x46\x15\xd4\x18\xaf\xb4\x0a\x2d\x8d\xee\
+\xa9\x16\x62\x34\x36\x97\xa8\x5c\xb7\x06\x0d\x79\x41\x27\x5f\x72\
+\x60\x4f\x64\xd3\x18\x90\xf6\xb8\x42\xe2\x10\xc4\xb6\x2f\x37\x55\
+\xd7\x4b\x7e\xc4\x68\xa6\x6e\x05\x58\x45\x39\x95\xc9\x10\x4d\x60\
+\x64\x7c\xe2\x43\x8e\x6f\x34\xaa\xd6\x55\xc4\x52\xb7\x69\x93\x54\
+\x6b\x57\xa7\xdb\x46\x47\xf1\xae\x6e\xf4\xc8\x6d\xf4\x07\xb5\x61\
+\xf8\xc0\xb3\x0c\x96\xe8\xae\x4a\xe1\x60\x9f\xfa\x02\x29\x45\x27\
+\x00\xc7\x8d\xd9\x75\xb7\x3c\x91\x47\xe8\x3a\x36\x80\x82\x01\x1d\
+\xd1\x30\x03\x32\x63\xb2\xda\x50\x1f\x77\x34\x9a\xed\x6d\xb5\xd0\
+\x53\xa3\x0f\xb5\xcb\xab\xce\x61\xdc\x60\x96\xf7\xb3\x4f\xa8\x21\
+\xe9\xc0\x3c\x7e\x3a\x3e\x7c\xa7\x42\x9a\xf5\x03\x37\x56\xf5\x9f\
+\x4e\x9c\x65\x7d\xf4\x26\x14\xb0\x3c\x92\x21\x8e\x39\x3a\xc8\x6c\
+\x6f\x67\xca\xb7\xa1\xdc\xcf\x30\x0c\xa6\x3e\xf5\x90\xe1\xc4\x3f\
+\xfe\xd5\x8d\x5a\xac\x02\xbd\x9e\xa0\x5c\x8b\x2c\x76\x75\xb2\x7b\
+\xea\x94\xfd\xb1\x2d\x54\x2f\xc2\xbf\x24\xa0\x46\xbc\x2c\x41\xc0\
+\x41\x3a\x09\x04\x72\x82\x75\xe8\x55\xf6\xde\x08\xc7\x17\x72\x3c\
+\x02\x11\xa5\xa1\xed\xad\xe2\x2a\x34\x00\xe6\xb6\xb3\x37\xbc\xa6\
+\x47\x6c\x5e\x68\x4e\x44\xfc\x0d\xb3\x01\x99\xd1\x90\x77\x72\x52\
+\xa8\xc8\xb6\x40\xeb\xe4\x8b\xe3\x95\xfe\x09\xd9\xf0\x13\x99\xf4\
+\xff\xaf\xba\x2f\xed\x6e\xdb\xc8\x12\xfd\xfe\x7e\x85\xc5\xe9\xd1\
+\x00\x16\x48\x93\x4a\xa7\xd3\x4d\x0a\xe1\xf3\x12\x27\x4e\xbc\xb5\
+\xed\xc4\xc9\xe8\xe8\xf8\x40\x14\x2c\x62\x4c\x01\x0c\x01\xda\x52\
+\x2c\xfd\xf7\x77\x97\x5a\x6e\x15\x0a\x24\xe5\x74\x9f\x39\xaf\xd3\
+\x89\x88\xda\xd7\xbb\xd5\x5d\x42\x45\x84\x27\xe7\x9f\xc5\x02\xeb\
+\x99\x6e\x9a\xa7\x0e\x18\x3f\xfd\x59\x4e\x16\x6a\x8f\x1f\xab\x84\
+\xd2\xdc\xb1\x3d\x34\xab\x47\xc3\x79\x96\xcf\x90\x68\x40\xcc\xfa\
+\x17\x77\xd6\x06\xa2\x4d\x15\x00\x57\x9f\x89\x3d\xa3\xc5\x4d\x3c\
+\xfe\x1d\x81\x9c\x6d\xe4\x77\xb1\xa7\x6d\xb0\x76\x7d\xad\xd3\xc4\
+\x25\x11\x40\x6f\xfc\xb9\xfb\x98\x7f\x46\x16\x50\x83\xc4\x1b\xc2\
+\xbd\xdf\xe7\xe9\xe7\xa6\x52\xe7\x35\x84\xb5\x7e\x61\x2a\x33\x51\
+\xcd\x32\xa8\x4a\x24\x20\x7d\x9c\x1b\xaf\x82\xd6\x54\x2e\xbe\x81\
+\x33\x6f\x81\xf6\x4f\xee\xc2\xe0\x49\x7d\xae\x70\xc8\x87\xdc\x78\
+\x11\xfc\x1e\x30\xd5\x13\xf7\xf3\xbe\xfb\xf9\xc2\x7e\x76\x0c\x9b\
+\x99\xaf\xbd\x16\x2f\x33\x09\xce\x07\x76\x9d\x61\x57\x6f\xdc\xeb\
+\xc5\x07\x12\x04\x3a\x73\xfc\xd9\x6b\x2e\x29\x00\x86\x0d\x13\x8c\
+\x91\x44\x33\x8d\x93\x57\x5f\x3c\x32\xe4\xff\x00\x9f\x84\x38\x25\
+\x20\x52\x5b\x3d\x63\xb4\x4a\xd5\xfb\x30\xb1\xce\x9c\x8a\xeb\x6b\
+\x72\x0b\x01\x95\xbc\x29\xe6\xee\x14\x35\x34\x76\xe6\x57\xf2\x24\
+\xfe\x70\x26\x61\x71\x93\x43\x2f\x98\xb0\x7d\xdb\x09\x07\x13\x9d\
+\xcf\xac\x08\x34\x60\xd0\xb2\x43\x26\xde\xf8\xe3\x96\xa8\xd1\x19\
+\x6b\x8e\xca\x49\x81\x25\x2e\x1d\xde\xf0\xbd\xa6\xe0\xe4\x97\xe9\
+\xba\x23\x99\xee\x10\x62\x78\xd9\x39\xf9\x1a\x91\x73\x95\x2b\x83\
+\xd0\x8f\x01\x4c\x08\x79\x61\x55\x0e\x35\xb1\x7d\xad\x74\xa4\x25\
+\xb1\x58\xec\x60\x54\x2c\x1e\x5a\x58\x4e\x15\x33\x57\x98\x51\xc7\
+\xe3\x30\x48\x88\x88\x06\x06\x02\x81\x41\x03\xd7\x53\xee\xa7\x6a\
+\xf4\xf0\xa9\x28\xf6\x78\xac\x9a\xc4\xc7\x3f\xec\xc1\x6c\x84\xc5\
+\x9f\xe3\x5a\xa1\xcf\xc0\x2c\x01\x84\xb9\x40\x47\xe4\x25\xba\x93\
+\x71\x7d\xa3\xb9\x9e\xdf\xf2\xf4\xa7\x3c\xf9\x35\xac\x9b\x6b\x15\
+\x6f\x95\x49\xa4\xa3\x06\x3b\x4a\x66\xab\xaa\xae\xf9\x01\x1e\x3f\
+\x73\x44\xbc\x2f\xd8\x1d\x30\xf9\xc3\xd0\x36\x94\xd0\x80\xf1\x52\
+\x02\xa9\x1b\x82\xc4\x19\xcd\xe6\xd5\xc2\x3c\x62\xa8\x87\x28\x3c\
+\xae\x5a\xbf\x26\xef\xd6\x98\x25\x27\x10\xc6\xd3\x01\x69\xdd\x63\
+\x8a\x16\xa4\x7a\x5a\xde\x9d\x06\x29\x5e\xf1\x2e\x7d\x7c\x6c\xfa\
+\x8b\x15\xf2\xb1\xb2\xee\x68\xa3\xdd\x0b\x15\x74\x55\x7e\xc3\x4a\
+\xbd\xab\x22\x50\x25\x38\x07\xc5\xe6\x6c\xb4\x36\xa1\x36\xfe\x94\
+\x66\x3e\x35\xb1\x59\x37\x7f\xa3\x57\x2a\xdd\xa0\x75\x40\xa8\xab\
+\x9b\xac\x5b\xe9\xe8\x92\xec\x7d\x1e\x58\xa4\xdd\x74\x71\xa9\xfa\
+\x3a\x58\x1d\x86\xd6\xe1\x7f\xa5\x7d\xa0\xd5\xaa\xc8\x66\xd8\xff\
+\x8d\x68\xcc\x7f\xa1\xf3\xdb\x33\x97\xc2\x86\x36\x93\xfa\xd8\x56\
+\x2d\xbc\xc3\x6c\x54\xc5\xbe\xb2\x66\xa3\x5c\xc9\x37\x1b\xe5\xd4\
+\x1b\x57\xb7\xd5\xb5\x73\x8d\xd8\x08\x06\xcd\x6a\x94\xc8\x47\x58\
+\xd8\xec\xe8\x1f\xce\x35\x07\xf2\x9d\xa8\x2a\x5b\x20\x3b\x9d\x1d\
+\xdf\xd3\x77\x31\x91\xc4\xc5\xd7\xd6\x39\xf8\xbb\xbd\x46\xda\xcc\
+\xcf\xec\xa3\x36\xf7\x33\x0a\x59\xd4\x88\x96\x24\x60\x89\x31\x3a\
+\xb4\x21\xc7\x46\x13\x00\x15\x85\x00\x10\x58\xb2\x4f\x22\x23\x63\
+\x25\xe7\xae\xa6\x5b\xde\xc4\x5f\x24\x73\x47\xef\x3e\x1b\x90\xaa\
+\x6a\x85\x33\x51\x2d\x00\x12\x72\x44\x02\xe4\xd8\x20\xcd\x28\xc5\
+\x04\x09\x55\xdf\xe8\x6c\x38\x5d\x5a\x57\xc3\xd4\x1c\x8c\x04\x92\
+\x7b\xdc\x06\x81\x77\x5d\xe4\x9d\x72\xfb\xfe\xa2\x24\x76\x4b\x95\
+\xa6\x22\x50\x7c\xcf\x1d\x8b\x45\x13\xfb\xfb\xbd\xde\x9e\xe7\x9d\
+\x54\x64\xa3\xd7\x0e\xf9\x9d\xee\xb5\x7c\x99\x8a\x5c\x74\xc5\xd3\
+\x95\xe7\xad\x15\x1f\x2c\x17\x12\xd9\x73\x65\x77\x2e\x2d\xf0\x26\
+\x02\x29\xca\x17\x52\x27\xc3\xfc\xc9\xae\x53\x36\x09\x09\xb7\x31\
+\x27\xd3\x0e\x64\x39\xb0\x3b\x5d\x99\x58\xb8\x62\x31\xf6\x66\x7c\
+\xb6\xad\xd5\x99\x7a\xbc\x97\x27\xbb\x6d\x76\x76\x51\x94\x93\x73\
+\x17\x29\xe5\xfc\x0a\xd9\x52\xf1\x97\x22\x7b\x2e\x59\x38\xfa\xc6\
+\x1b\x35\xa5\x95\x26\x02\xcc\xe5\x79\xb5\x6a\xe6\x6f\xf3\xba\x89\
+\x3c\xe5\xcb\xad\x35\x5f\x57\xeb\x66\xfe\x5d\x46\x35\xf9\xbd\x05\
+\x13\x81\x14\xc0\xd8\x68\x14\x2a\x19\xa7\x13\x27\xae\x1b\xb2\xbc\
+\xc3\x0d\x59\xae\xdc\x90\x6d\x32\xf2\xba\x70\x57\x26\x84\xb1\xba\
+\x0d\x0d\x1d\xba\x42\x06\x2d\x0a\x1d\x2f\x14\x3f\x75\xe5\xb9\xe0\
+\xbe\x65\xa3\xe8\x16\x27\x07\x1a\xce\x0d\x6b\x8d\x88\x4d\x08\xd4\
+\x8d\x9b\x04\x0c\xd9\x3c\x72\x6c\x62\xc2\x92\xc3\x81\xc6\x41\x9a\
+\x21\xb5\x70\x93\xc2\x46\xc8\x85\xfc\x98\xa7\xbf\x06\x28\x43\x74\
+\x3a\xb1\x84\x76\xd1\x04\x63\x51\x55\x4b\xf6\xa5\x91\x2f\xef\xd7\
+\x4b\x80\x33\xaf\xd0\xf7\x03\x26\x5d\xac\x01\x6e\x91\x7a\xe1\x46\
+\x08\xfb\xcb\x93\x47\xdf\xbd\xf8\x12\x18\x8b\x5a\xac\x55\x8f\xde\
+\x87\xfe\xbf\x02\xb4\xf9\x19\x1c\xb5\xac\x1b\xdc\x36\x32\xa4\x1d\
+\x5d\x10\x85\xc8\xea\x07\x57\x6f\x78\x65\xa2\x5e\x5d\xad\x57\x33\
+\x24\x34\x29\x04\x93\x8a\x9d\x67\x64\x71\x28\x34\x52\x9c\xc4\x71\
+\x75\x82\x3b\xaa\x55\x77\x70\xbb\x87\xa6\xe4\xb4\x1c\x1f\x13\xb4\
+\x3b\x21\xfd\x96\xcf\xe7\xf6\x50\x58\x5f\xe7\x58\xe5\xd8\xfc\x3c\
+\xf1\x01\xbc\xb7\xf3\x3b\x9a\x5f\x15\x7c\x0b\x12\x15\x21\xec\x71\
+\x41\x76\x58\x3a\x79\x60\x52\xd3\x1e\x3e\xbf\x13\x12\xd2\xc7\x2e\
+\xdd\x73\x07\xa0\xd3\xa1\x08\x9e\x46\x3f\x1b\xd3\x10\xac\xe0\x69\
+\xf4\xf3\x28\xd1\x78\x13\xe5\x28\x57\xf6\x18\x6a\xf1\x94\x96\x6a\
+\xae\xc8\x57\x9d\x5e\xf9\xc9\xca\x45\x13\x24\xb0\x72\x08\xf8\x15\
+\x06\xb6\x57\xac\xd6\x5f\x9c\xab\xb4\xe9\x42\x38\x47\x5e\x37\x3e\
+\x71\x3d\xa3\xed\x74\xc2\x43\xa1\x9c\xb7\x9f\xf0\xa6\xf3\x84\x37\
+\xad\x13\xde\xb8\x27\x5c\xcf\xf5\x9f\x1d\x0c\x25\xdb\x62\x1e\x0f\
+\x93\x6f\x4e\x1c\x96\x50\x79\xcd\x21\x1b\x54\x72\x8e\xb3\x5d\x21\
+\xd9\x5a\xe1\xd2\x6e\xa4\xc5\xae\x3e\x6c\x42\x71\x44\xf4\x13\x61\
+\xbe\xd2\x2a\x96\xd8\x3d\x60\x31\x40\x56\x11\xc5\x52\x78\x0f\xb7\
+\xd6\xae\xad\x41\x29\xa6\x1e\x86\x0b\x22\x57\xd8\x6f\x8a\x0b\x34\
+\xf9\x77\x9c\x26\xa8\xb4\x1d\x78\x3d\xd3\x5e\xcb\x7b\xca\x0e\x43\
+\x18\xa9\x4a\x8e\xc1\x61\xa7\xa3\x1c\xb7\xc1\x69\x14\x9e\x53\x60\
+\x1a\x29\xec\xa1\x9e\xe5\x32\x5a\x15\x4a\x70\xec\xaf\x64\x9c\x1c\
+\x0e\x87\x71\x3c\x5e\xb5\xda\xbd\xad\x41\x5b\xc0\xfe\x6e\xb3\xb1\
+\x9d\xa3\x64\xe5\x06\x00\x36\x1a\x55\xc6\xf3\x96\xb5\xf3\x44\xe5\
+\x19\x18\xe3\x26\x86\x61\xc6\xf9\x34\xac\x56\xd9\x96\xd7\x5d\x2e\
+\xe0\xfb\xa1\xd9\xdd\x4e\xd3\xac\x58\xc8\x8d\x4b\x7b\xa6\xa6\xb8\
+\x02\xa1\x1f\x8b\xba\x38\x2d\x16\xc8\x91\xa3\xa7\x94\xb3\xbc\xec\
+\x39\x9c\x95\x9a\x80\xa7\x64\x66\x4f\xfd\xa6\xe5\xdb\xd4\x57\x2f\
+\xb0\xc4\x3b\xf3\xa1\x5e\x30\x67\x9f\x21\x75\xb3\xff\x24\x67\x5a\
+\xd4\x2f\xe0\x02\x06\xb4\xb9\xf6\xc4\xe2\x5a\xea\xd6\x0d\x59\xf4\
+\x45\x32\x07\xef\x7e\x7f\x89\xdc\xa1\xd5\xc4\xbb\xe5\x2a\xc7\x90\
+\xe7\xee\x5c\xac\xfd\x5a\x21\x43\x84\x3f\xa3\x20\xea\x69\x81\x94\
+\x15\xa0\x54\x99\xf5\x30\x8f\xdd\xf8\x1e\xd6\xa5\x36\x8a\x3e\xb5\
+\x2f\xed\xf2\x64\x72\xba\xca\xb3\x0f\x37\xec\x08\x1a\x3b\x18\x18\
+\xb5\xb3\x58\xd1\x2b\x5a\x09\x8d\x94\x69\x38\x2a\xb2\x7d\x94\x68\
+\x6b\xb6\xfd\x4c\x9e\x20\x50\xa3\x0d\x23\x9a\x33\x44\x57\x5a\x6e\
+\x5c\x05\x1d\x44\xab\xa6\xf5\xc3\xc6\x8d\xb3\x46\x1a\x0b\x78\x57\
+\x2d\x37\x84\x7d\xe0\x66\x1b\xb5\x22\x75\x51\x3d\x35\x68\x4e\x7c\
+\x5e\x61\xdc\xcd\x34\xf0\x58\xee\x14\x9b\x3a\x5f\x91\x1c\x14\xa3\
+\x94\x78\xec\x94\x20\xc9\x76\xad\x5f\x78\xf5\x3b\x5c\xdc\x0c\x8a\
+\x12\xb6\xf6\x87\x37\xcf\x9e\xa6\x05\x2f\x1e\xee\xc9\xa4\xc1\xc3\
+\x47\x88\x02\xc7\x53\xc3\xc2\xc6\x8d\xeb\xba\x16\xc9\xc8\xba\xa1\
+\x0f\xf4\x1d\x2d\x51\x0b\x70\x82\x82\x65\x50\x03\xe0\x55\xc1\xe7\
+\xd0\xad\x31\xd2\xb5\x06\xe1\xc4\x01\x39\xb7\x31\xad\x45\x5f\x9c\
+\x2e\xdf\xc5\x1e\x2e\x64\x98\x19\x76\x17\x11\x85\x88\x99\xe9\xc7\
+\x36\x6e\x6a\xb4\x76\xd8\xb8\x80\x73\xc1\x66\x7d\x3a\xc2\x7c\x99\
+\x7a\xa5\x1f\x54\x4d\x53\x5d\xa4\x7d\x0c\x9f\x5b\xf9\x99\xec\x20\
+\x9b\x6c\x6a\xd8\x7f\x8b\x97\xff\x16\x39\xd0\x7b\x87\xf1\x41\x61\
+\x8c\xc6\x7c\xe8\x77\xca\xed\x97\x8a\x47\x0d\x96\x59\x60\x37\x95\
+\x71\x9a\x6d\x66\xdc\xbe\xf6\xec\x36\x1e\xfd\x79\x96\xe9\x3f\x03\
+\x64\xd4\x45\x76\x49\x63\x1a\x7f\x35\x04\x1e\xab\x28\xf9\xe3\x6b\
+\xf8\x9d\x5d\xfe\xc0\x5e\x33\x48\xa3\xc2\x38\x0f\x1c\x7a\xce\x03\
+\xdf\x54\x4b\x9c\xb4\x53\x4a\x65\xf1\x4a\xbd\x6a\x35\x62\xdd\x0e\
+\x26\x5f\x9f\x10\xaf\xf7\xa4\xfc\x05\x60\x33\xbd\x03\xa0\x99\xd5\
+\x83\x35\x54\x34\x7d\x51\x04\x5b\xf2\xea\x81\x3f\x80\x87\xad\x67\
+\xd9\x32\xff\x29\xbf\xe2\x34\xf9\x18\x00\x3c\x41\xf9\x22\xec\x66\
+\x6d\x80\x79\xd6\x2d\x9a\x06\x78\x6d\x3a\xef\x9f\x52\xdf\x8b\xb2\
+\x3d\xeb\x71\x75\xf6\x89\xc0\xc4\x46\x7b\x09\x3b\xef\x57\x31\xd4\
+\x1c\x52\xd2\xe0\x53\xfe\xdc\x5c\x95\x82\xa1\xcb\xe2\x12\xa2\x3e\
+\xc8\x35\x39\xa9\x9a\x82\xd1\xf6\x30\x80\x31\x2a\x54\xf7\x92\xfb\
+\xa8\x4f\x13\xa6\xce\xbc\x09\x71\x89\x0d\x73\xa2\x65\xfe\xc2\x49\
+\x05\xea\xde\x72\x56\xe8\xe8\xd0\x9f\xd6\x06\x74\xef\x4c\xce\x94\
+\xb3\xb3\xd3\x0f\xa9\x51\x58\xda\xa2\x8e\xd4\x43\xec\x6d\xda\x99\
+\x33\xb6\xe0\xc9\xc9\xa6\xe3\xa4\xca\x90\x56\xed\x40\x8f\xdc\x68\
+\xbb\x43\x29\x8f\x41\xb2\xe7\x9d\x6a\x28\x3f\xa4\x9a\xaa\xd0\x64\
+\x0e\xd1\x14\x5c\x7f\xa3\x21\x3e\x8e\x49\xb8\xa6\x55\xd4\x84\x60\
+\x39\x02\x10\xd8\xba\xc6\xa3\x6d\xea\x59\xc7\x02\x1a\xcc\x58\x37\
+\xea\x2a\x36\x40\x98\x8b\x23\xbf\x74\x50\xa0\x8b\x31\xd4\xb0\xf3\
+\xd3\x0a\x51\x88\xdb\x6a\x5f\xe1\x8e\xbe\xca\xec\x61\x8c\xf9\x16\
+\xb6\x0c\x56\xe9\xa1\xa3\xd9\x17\x05\x42\xe7\x27\x45\xd4\xaa\x13\
+\x27\x7f\xa0\xa3\x3c\x46\x4e\x97\x0d\x50\xc5\x6b\x3a\x48\xea\x10\
+\x36\xc5\xf2\x61\x70\x9e\x7d\xc8\xe9\x9b\x25\xc0\xf1\xd8\x1a\xad\
+\x82\xbd\x40\x6b\x2d\x4e\xd8\x80\x32\x0c\x2e\xdd\xc8\x33\xc1\xc9\
+\xd4\x6a\xa6\xe6\x86\xc9\xfd\x53\x4a\xef\x51\xf0\xe9\xf9\x2a\x7f\
+\x9f\xf6\xfe\x43\x5d\x29\x89\xcd\x7b\xfb\xff\x71\x38\xfa\x7a\xd2\
+\xc3\x89\x02\x5f\xae\xee\x0a\x37\x5f\x95\x0f\x6d\x07\x74\x32\x59\
+\x9b\xcf\x8a\x25\x3b\xce\x45\x90\x54\x51\x22\xd2\x49\xa1\x64\xa7\
+\xf8\x70\x3b\xf8\x34\x2f\x9a\xfc\xf5\x32\x03\x1a\xa9\x57\x56\xb8\
+\x7f\xbd\x89\x0a\x78\xa1\x90\x31\x61\x91\x44\x19\x97\xa2\x73\x6a\
+\x4f\x54\xaa\xb1\x0e\x12\x62\xc6\xe5\xb5\x5f\x46\x21\x23\x14\xd6\
+\x28\xc1\xed\xc1\x88\x91\xa2\x3b\x04\xfc\x56\x22\xdc\x1e\x0f\xa4\
+\x34\x03\x61\x14\xa6\xf1\xb4\xe8\x5e\x65\xd4\xde\x5d\xe8\xd7\xb3\
+\x15\xbe\x72\x9f\xf5\x26\x18\x48\xe3\xa8\x9c\x46\xa6\x71\xc6\xb7\
+\xec\x55\x1e\xd6\x73\xfc\x8e\x7f\xf8\x28\x9a\x06\xed\x5f\x28\xb9\
+\x2e\xff\x66\xc7\x71\x21\x3a\x68\x12\x20\x7a\x0a\x4d\xf4\x84\x7d\
+\xbc\x77\x78\x28\xc0\xd8\xef\xc9\xcc\xf5\x30\x67\xfd\x55\x8b\x91\
+\x2f\xb3\x12\x49\x2e\x09\xa7\x74\x1a\x9c\x29\xb2\x6c\x10\x64\x1f\
+\x1c\x35\x60\x3b\x6a\x7c\x40\x8e\xaa\xf6\x58\x7b\x1c\x61\x84\x09\
+\x0a\x00\x2c\xa3\x61\x7c\x7d\x3d\x6c\xc3\x2d\x67\xd7\x0f\x8a\x36\
+\xf1\xc6\x07\x33\xaa\xb4\x15\x62\x9b\x7a\x4b\xfa\x79\x3f\x48\xf1\
+\x61\x38\x78\x5c\xb1\xab\x36\xf3\x84\x9e\x0f\x1a\xc7\xa4\xc4\xc0\
+\x04\xde\x30\x8a\xe5\xed\x91\xad\x2e\x31\x84\xbe\xed\x37\x16\x50\
+\x74\xd6\xf5\x35\x45\xfa\xde\x58\x54\xd0\x5d\x54\x7c\xcd\x7e\xc2\
+\xf8\x61\x04\x5d\x46\xa0\xda\x25\x1a\xd2\x1c\xcc\x07\x97\xdf\xae\
+\x49\xeb\x7d\x91\x52\x4a\x1f\xbe\x30\x15\x55\xa6\x2f\xfb\x8b\x7e\
+\x36\xb8\x3c\x1a\xea\x6c\xfc\x22\xbb\xe4\x83\x1c\xca\x5c\x41\xcd\
+\x2b\xd4\x60\x48\x29\x05\x6a\x5e\x61\x2a\x1b\x2e\xcf\xa0\xec\x15\
+\xd5\xa4\x6c\xfc\x8a\x93\x68\x71\x7d\x3d\x23\x93\x53\x15\x92\x16\
+\x45\xad\x59\xa9\xbd\xa6\xb3\x1f\xfa\x63\x38\x5e\x27\xca\x69\xb9\
+\x0f\xc9\x02\xf2\x38\x82\x8e\x30\xab\xe7\x05\x5b\x0d\x6f\x20\x85\
+\xef\xdc\x77\xc8\x16\x7d\x32\x15\xe1\xe1\xf9\xbb\x9b\x6e\xca\x8c\
+\x62\x0e\xc7\xa4\xc3\xe5\x5e\xe4\xab\xf3\x5c\x29\x72\x46\x9f\x5b\
+\xa4\x01\x85\xd2\x4e\x64\x58\x5d\x43\x8b\xb6\x78\x6c\x4d\xae\x4a\
+\x22\xa9\xc1\xc7\x4c\xb6\x6f\x69\x00\x94\xc6\x03\x2b\x30\x22\x87\
+\x25\x05\x2e\xa9\x91\x6d\x19\x03\xd9\x40\x50\x33\x9a\x93\xf4\x15\
+\xec\x3a\x04\x1e\x18\x72\x5b\x65\x07\x9c\xde\x53\x05\x2d\x86\x12\
+\x81\x0c\x63\xe5\x22\xc1\x9f\x96\x13\x13\xdb\xf8\x83\xa5\x56\x68\
+\x56\xe2\xdb\xe9\x41\x05\x98\x75\xd4\x4b\xdc\xa0\x89\xb0\xa6\xcf\
+\x84\x62\x9b\x71\x7b\x1c\x36\x79\xf7\x56\x74\x8a\xc1\x22\x51\xd7\
+\x34\x72\xa6\x15\x1b\xee\x9f\xf9\x6c\x77\xc9\xf6\x0a\xf3\x8c\xa1\
+\x06\xc9\x5b\x52\x28\x14\x2b\x27\xe0\x6f\x92\xc8\xfa\x21\x2b\xcf\
+\x16\xf9\xaa\x06\xd6\x22\x3f\xd3\x2d\xc2\x70\x3f\xcf\x04\xb1\x69\
+\x8e\x08\x3a\x96\x07\xb2\xb2\xae\x4d\xcc\x10\x60\x7d\x5e\x62\x82\
+\x8e\x64\xee\x6d\x55\x62\x13\x29\x88\x07\x25\xde\x74\x8f\x20\xd5\
+\x04\xfa\x4d\xb2\x2e\x03\xab\xe8\x3b\x7c\xe3\xb5\x50\xa3\x46\xbf\
+\xb5\xff\x5b\xc3\x1e\x85\x0e\x0c\x73\x75\xc1\xfb\x15\x9e\x88\x14\
+\x44\x14\xf2\x38\x0e\xa4\x30\x4c\x5b\xf9\x18\x32\x92\x99\x01\xc9\
+\x52\xea\x53\x5c\x18\x21\x70\xe8\x42\x6c\x1a\x84\xea\x56\xc3\x34\
+\x6e\xa4\xa9\xce\xcf\x17\x1b\xae\x55\x7b\x53\x74\x3b\x30\xc4\x69\
+\xeb\x1a\x6b\x35\x07\x33\x72\x33\xda\xa2\x66\xa0\xb5\x51\x8c\x19\
+\x18\x2f\x4b\x3e\x23\x56\xef\xa2\x26\xb6\x4a\xb3\x03\xad\x38\xd7\
+\xc5\x8a\xb5\x77\x58\x3d\x44\x15\x81\xfd\x36\xd4\x14\x23\x66\xe0\
+\x33\x75\xc0\xf8\xce\xed\x27\x24\xe2\x0a\x32\x1f\x18\x9f\x83\x66\
+\xc1\xfc\xf6\x4c\x9c\x8b\x58\xf0\x89\x8e\x7c\x57\x75\x16\x7b\xfb\
+\xac\x20\x4d\x9a\x16\xdb\xb7\xa9\xb0\xbd\x20\x9a\x33\x17\x24\x80\
+\x12\xcd\x7a\x6a\x97\x55\xba\x22\xe1\x54\x7d\x0b\x9d\x8a\xa3\xaf\
+\x48\xd5\xbc\x22\x7d\x97\x6c\x41\x4c\x34\x3a\x19\x7f\x08\x5c\x80\
+\x1e\xb4\x3c\x32\xfa\x6d\x2e\x0f\x0b\x95\xf8\x05\x4e\xb9\x6e\xe5\
+\x00\x15\xf6\xb9\x6e\x78\x92\x9c\x01\xfa\xa7\xbe\xc7\x44\x03\xf4\
+\x12\xe0\xff\x2e\xa0\x18\x1c\x19\xb8\xd4\x75\x03\xe0\xe4\x0a\x7f\
+\x79\x3a\xa2\x5a\x87\x74\xf0\x8f\x2f\x92\xdb\xe0\x2c\xa4\xda\x9f\
+\x24\xa0\xac\x06\xa0\xa2\x4d\xd4\xe0\x95\x90\x46\x7d\x85\x85\x21\
+\x01\x59\xc8\x86\xda\x6c\x72\xf9\x67\x05\x35\xaa\x49\x2d\x6e\xf9\
+\xc2\xf1\x05\xab\xf3\x00\xff\x05\x22\x97\x3b\xa7\x8d\x76\xdc\x67\
+\x1c\x03\xeb\x7d\xde\x24\x2c\xb9\x9d\xdc\x43\xb9\x16\xde\x45\xf2\
+\x61\x79\x3d\x35\xe1\x5b\x4a\x36\x76\x8d\x21\x10\x10\x63\x74\xca\
+\x57\x9a\x4d\x7c\x79\x17\x67\x66\x9c\xab\x7b\x32\xf6\x40\x5c\xae\
+\x65\x9b\x07\x22\xd3\x7a\xcd\x58\x7a\x8c\x4a\x2e\x1f\x5c\x90\xad\
+\xc9\x37\xb1\x35\x68\x87\xe9\xf9\xff\xd6\x37\x9b\x42\x75\x49\x61\
+\xc0\xdc\x7c\x2b\xd6\x7b\xdd\x25\xc7\x5f\x04\xe4\xf8\xb3\x14\xce\
+\xec\x92\x4c\xcd\x80\x23\x4f\xb3\x7b\x87\xc9\x3c\x1e\xf7\x58\x56\
+\xee\x24\x0f\x81\x68\x2b\xd2\x1e\x33\xc3\x9c\x03\xc9\xe3\xde\x8a\
+\xbc\xf3\xd2\xf7\x70\xdc\x43\x01\xba\xca\x1c\x03\x67\x73\x54\x0d\
+\x2e\xa7\xd1\x2a\x55\xa5\xa8\x91\x55\xca\xa5\x92\xec\xe0\xf0\x6e\
+\x84\x7c\xd1\x02\xd8\x1f\x60\xbe\xee\x1d\xc2\x0e\xa7\xc2\x69\xe0\
+\x7d\x80\xce\x33\xb6\xd1\x46\x06\x71\xcd\x7f\x80\x18\x79\x57\x44\
+\xc2\xc7\xba\x3a\x74\x7d\xee\xa3\x2b\x97\xfa\xec\xca\xc4\x35\xe8\
+\xca\x3b\xd5\xcc\xf1\x2c\x98\xdd\x3b\x58\x51\x48\xae\x52\x1e\xb9\
+\xce\x67\x9a\x5b\x3c\xc8\x38\x0e\xea\x0b\x75\x0e\x3b\x55\xbd\x43\
+\x50\xd7\x68\x8c\x99\x23\x1a\x54\x49\xf8\xb7\xbb\xdc\x0f\xcc\xa4\
+\xf8\xd3\x3c\xa5\xe3\xfa\xdc\x87\x87\x8c\xea\xda\xbc\xa6\x53\xc9\
+\xe7\x36\x1d\x2e\x52\x95\xdc\x89\x8f\xcc\x2d\x1f\x99\xff\x19\x3e\
+\xd2\x67\xfd\x14\xa1\xdb\x1e\x8a\xc3\xfb\xdd\x82\x8d\x0b\x4d\xaa\
+\x6b\x4a\x3e\x23\xa7\xce\x7b\x27\x2b\xa7\xf2\x1d\x66\x4e\xd7\x51\
+\x2b\xe3\xb1\x73\x2a\x37\xcc\xd0\x21\xba\x51\xc3\x15\x21\x19\xac\
+\xb3\x1d\x5d\x39\x80\x01\x83\x38\xcd\xd5\x0b\x30\x01\x6a\xcd\x46\
+\x47\x2e\xab\xd6\x5a\x29\x8f\x40\x36\xb3\x8d\x36\x0f\xd7\xbc\xd1\
+\x38\x38\xd5\x9b\x84\xc3\x62\x75\x35\x15\xc2\x46\x93\x3d\x33\x5d\
+\xd5\x94\xcf\x02\xc3\xd5\x9d\xf6\x00\x01\x00\x0e\x25\xf1\x77\xfa\
+\xb9\xc5\x24\xaa\xbe\x7c\x36\x51\x25\xdf\x6c\x5b\xef\x29\x79\x2c\
+\xd5\xc1\xe7\xc4\xcd\x01\x9c\x67\x02\xaf\xb4\xb3\x13\x9d\xbb\x56\
+\x30\xd1\x19\x4b\xb8\x4f\xbe\xd5\x14\x9b\xc7\xea\xb3\xb5\x46\x1c\
+\x27\x48\x1f\x51\xd4\x65\x4b\x03\x89\x9e\xd5\x11\x3b\x2e\x4e\xa2\
+\xdc\xdb\x08\x8f\x0f\xa6\x98\x6b\x1d\xb0\xa0\xeb\x3c\x84\xb8\x5e\
+\x3d\x8f\x9d\xf8\x5e\x49\x77\x99\xaa\xb6\x98\xbf\x26\x6d\x8b\x21\
+\xdb\x9d\x00\xfb\xd6\x1e\xaa\x9d\x6b\x71\x1a\xad\x18\x47\x38\xdd\
+\x6a\x1a\xd5\x6e\x27\x76\xf9\xf3\xdb\x5e\x21\xdb\xa0\x60\xd3\xbf\
+\x7c\xc2\xef\xbe\x68\xc2\x9b\xcd\xad\x36\xcd\x99\xc5\x09\x9b\x60\
+\xf5\xe6\x59\xbb\x42\x05\x03\x29\x2c\xbf\x6a\x0e\x86\x10\x2c\xa8\
+\xb4\xb0\x68\xc1\xed\xd1\x15\x27\xa8\x8a\x5b\x05\x0a\xde\xb9\x0e\
+\x82\x6c\x2b\x54\xd8\x71\xcb\x95\x60\x21\xb4\x56\x9b\x45\x0b\xa1\
+\x5b\xd6\x5a\x9f\x62\x23\xf4\x98\x6a\xae\x7d\xcc\x0f\xd7\x9a\xe9\
+\xef\x1c\x0c\x39\x9e\xd5\x95\x26\x9b\x9a\xa6\x78\x82\x92\xd3\x17\
+\x20\x00\x6f\xf7\x85\x89\x44\xd2\x26\xf8\xdd\x8a\xae\xd5\xc9\xcc\
+\x29\xeb\x10\x8c\x85\x7d\x0b\xee\x70\xbe\x95\x87\xd0\xad\x89\x30\
+\xaa\xe5\x0d\x65\xd9\x19\x74\x9d\x03\x99\x8f\x0e\x93\xd1\xe1\x49\
+\x32\x6f\x2e\x28\x38\xcb\xe9\x39\x46\xa0\x22\xdd\x13\xa1\x28\x62\
+\x22\x83\x17\x1f\x29\xa6\x76\x0f\x20\x81\x09\xf6\x16\xe6\xa6\xf6\
+\xf7\x7b\x8f\x9e\xfc\xa2\x0c\xf2\x59\x6b\x7e\xda\x8c\xbb\x02\xd1\
+\x23\x67\x67\x66\xac\xfd\xdf\x68\x1b\xf9\x01\x0e\x4e\xd2\x30\xaa\
+\xda\x34\xca\xe8\x49\x3b\x77\xf4\xad\xb8\x78\x1c\x8f\x73\xf1\xfe\
+\xbb\x37\x42\xdf\x74\x94\x33\xe5\x3f\xa8\xf7\x5c\x0e\x68\xba\xb4\
+\x9b\xf7\x23\xf5\x85\xed\x29\xbd\x22\x13\xc3\x5c\x53\xb7\xa8\xc3\
+\x44\xa6\x30\xc0\x07\xa3\x3a\x13\xeb\x13\x59\xf7\x33\xb8\x1c\x64\
+\x50\x59\xe3\x73\x3a\xad\x14\x69\xc1\xc9\xb0\x6f\x81\x3b\x44\xe1\
+\xbf\x60\xc3\x60\xa7\x1e\xb1\x47\x8d\xf4\xbf\xd9\x25\x1e\x74\x19\
+\x52\xe5\x6e\x8a\x45\x4e\xdb\x77\xf8\xf5\xdf\x44\x84\x1e\x66\x51\
+\xde\xce\xf3\xf2\x09\x60\xbb\xf1\x55\x23\x52\x90\xfe\x47\x15\xa2\
+\xbd\xa1\x4a\x24\x50\xf8\x31\x5b\x8c\x0f\x87\x43\x6b\x2a\xcc\xa6\
+\x42\x7c\x00\xa0\x3c\x71\x0d\xa4\xda\x44\xbf\x94\xae\x31\x7c\x3e\
+\xcf\x10\x86\x3a\x89\x45\xd9\x4e\x2c\xab\xb7\xab\x0c\x7d\x5c\x2b\
+\x1d\x73\x1c\x38\x8b\xb7\x1c\x05\x74\xd4\xf0\x78\xb0\x7e\xff\x3e\
+\x5f\x8d\x0f\x3b\x94\xcf\x85\xea\x79\xb7\xf9\x31\x54\x34\xf7\xcf\
+\xe0\x99\x45\xfe\x31\x5f\xb0\x93\x28\xbe\x2e\x30\x06\xf1\x49\xfa\
+\xad\xa8\x5c\x12\x08\xb9\xd2\x11\x52\x88\x9e\x35\x71\x9a\x4f\x8b\
+\x8b\xa2\xd1\x82\x94\xee\x88\xa8\x4a\x83\xfb\xfe\x62\xf1\x06\xfb\
+\x8e\x44\xf8\x39\xa9\x4f\xaa\xcb\x79\x2d\xfb\xac\x1e\xbb\xc9\xb6\
+\x73\xc1\xe2\x29\xaf\xf7\x6d\xb4\x62\xa3\x2e\xb5\x58\x3a\xc9\xf7\
+\xd7\x4d\xa5\x6c\xf4\xb4\xba\x81\x1f\x91\x67\xbb\xd6\x6c\xd4\xa5\
+\x36\x1b\xee\xa2\x28\x7d\x65\x70\xaa\xb2\x8b\x82\xf6\x9f\x30\x93\
+\xee\xb4\x8c\xfe\x17\x9a\xcd\x16\xf5\xd3\x2a\x23\x0d\xbe\x4e\x85\
+\x7b\xce\xdf\x2d\xf0\x53\xd4\x71\xaa\xdc\xe3\xbb\x8b\x09\x32\x2a\
+\x78\x03\xed\x2a\x75\xbc\x0b\x76\xdd\x03\x4d\x40\xcb\x61\x93\x64\
+\xbc\x2d\x89\x6f\xbd\x4c\x89\x4a\x37\xcb\xbc\x60\x3d\x83\xef\xef\
+\xca\x33\x57\x53\x5c\xaf\x9c\x0b\xae\x0c\x6f\xc9\xb5\xbc\xcf\xb4\
+\x8c\xbc\x36\x93\x40\x5b\x1a\xa6\x19\x76\x74\x20\x38\x09\xae\x19\
+\x36\xd7\xd9\xae\xad\xce\x20\x1c\x57\x3a\xb0\x37\x1b\xd1\x1a\x13\
+\x50\x1a\x62\x87\xe5\x46\x26\xfa\x92\x2a\x36\x09\xb1\xee\x1f\x00\
+\x81\x5a\x5f\xd0\x5b\x8d\x26\x05\xcd\xfc\xa7\x0d\x27\x7d\x75\xda\
+\xcd\xc6\x93\xce\xe5\x76\x2e\x90\xf0\x74\xcc\x95\xad\x39\xce\x0c\
+\xb1\xf7\x2a\x2f\x81\x0a\xe8\x37\x51\x1f\x23\x02\xc0\xbf\xb1\xf2\
+\x00\x99\xfb\x7e\xae\x8a\x94\x4d\xeb\xc4\x70\x12\x4c\x31\x0f\xe6\
+\x62\xfa\x05\xf9\xf6\x6f\xa2\x32\x39\x40\x2f\x61\x45\xfd\x18\x31\
+\x45\x1e\x95\xad\x50\xd4\x6a\x5e\xe5\x01\x8e\xc0\x98\xf4\x78\x97\
+\x3a\xde\x64\xef\x6a\xd4\xda\xe9\xa6\xee\x15\x8d\x30\x81\x15\x92\
+\xb9\x00\x44\xd2\x76\xa4\x07\xe4\xbe\x0a\xc3\x48\x17\xf8\x62\x9b\
+\xa7\xca\x07\xa4\x35\x0d\xb0\x68\x8c\x0f\x91\xf5\x18\x4d\x89\x68\
+\x24\x00\xdc\xc6\x7a\xb5\x22\x52\x15\x4d\xf0\xd0\xea\x11\xa3\x18\
+\x58\xfd\xb2\x51\x12\x35\x7d\x9d\x15\xdf\x43\x6b\x21\x40\xe1\x51\
+\x3d\xc8\x17\x49\x05\xab\x7e\x34\x9a\x42\xf7\xc3\x31\xa4\x30\xbf\
+\x34\xc5\xf0\xdc\xe6\x62\xc3\xcc\x7f\x5f\xd3\x75\x88\x6a\x54\x60\
+\xe1\x32\xf8\x30\x1e\xdf\xe4\x26\xfa\x50\x59\xbd\x5c\xad\x4b\xc3\
+\xce\x2d\xf1\x43\x03\x2b\xdc\x14\x1d\x90\x1e\x6d\xa1\x1e\xaf\xd8\
+\xca\xcd\x4d\x48\x9f\x39\x86\x44\x6a\xc1\xb5\x82\x1e\xbd\xcf\xd9\
+\xa1\x8c\xb3\xc4\xa5\x01\x36\x5c\x0a\x03\x5f\x02\x4f\x0c\x86\xde\
+\x65\x23\x88\xcd\x6f\x1e\xe1\x33\x12\xdc\xe1\xee\x08\xbc\xde\x5d\
+\xd8\x64\x9a\x26\x9e\x3f\x88\xb0\xe9\x92\x44\x6b\xd2\xc0\x77\x05\
+\xab\x68\x39\x34\x81\xb0\x60\x41\x98\xbc\xda\x13\xc6\x84\x53\x9c\
+\xa7\xcf\xc9\x63\x99\x15\xaa\x70\xc6\x71\x7e\x02\x87\xc5\xdc\x5b\
+\xe3\x76\x39\x27\xcf\x8e\x51\xa0\xa8\x03\x3b\x0a\x56\xfa\xcf\x4e\
+\x6b\x38\x88\xa6\xe9\xaa\xfc\xd9\xce\x8d\x0c\x0c\x22\x43\x2b\xc9\
+\xb6\x7c\xdb\x38\x38\x53\xf7\xc9\xc6\x3f\x12\x4d\x31\x3d\xa6\x9b\
+\x72\xa2\xc7\xdb\xc6\x62\xad\x00\x29\x93\x9b\x13\x63\xa9\x00\xf7\
+\xd8\x70\x22\x70\x68\xa2\x56\x49\x20\x25\x63\x18\x51\xe0\xf8\xe0\
+\x16\x58\xfd\xd8\x0e\xa5\xdf\xb6\xe5\x5e\xd9\x5e\x2b\x48\x63\x3e\
+\x32\xad\x4c\x44\x9c\x4a\x46\x0e\x0a\x85\xe4\xb1\xa1\xc1\x4b\xc2\
+\x6e\x86\x46\xa9\xd9\x1d\xc2\x9b\x55\x56\xd6\xb0\xef\x17\x00\x18\
+\x2b\xf9\x8c\xc5\x5f\xb4\x9a\xd0\x4e\x16\xd1\x80\xc4\xd3\x94\x5d\
+\xe1\x87\x84\xef\x78\x85\xcb\xd8\x39\x1f\x69\xc9\xd7\x53\xec\x27\
+\xde\x4f\x67\x57\x38\x41\x34\x82\x09\x16\x4a\x74\xc1\x55\x47\xd3\
+\xb2\xed\xe6\x81\x7d\xa4\x97\xdf\x86\x8e\xfd\xf5\x75\x79\xe4\xa6\
+\x33\x93\x13\x87\x49\x2a\x6b\x04\xd4\xf8\x90\x37\xca\x1d\x98\xdb\
+\x9c\xc0\x72\xe7\xb8\x85\x80\xab\x14\xec\x9d\x04\x2b\x7e\x0e\xd4\
+\x34\xc0\x7a\x2f\x1f\x18\x4f\x47\x05\xb6\x44\x7e\x37\xcd\x61\xc7\
+\xf6\x5f\x66\x58\x34\x42\x7b\x18\xb4\xa8\x29\x06\x7f\xe0\xbf\xfd\
+\xaf\x63\x13\xd9\x8b\x8a\x3d\x54\xf7\xd2\x2f\x78\x70\x08\x20\x24\
+\x38\x30\x77\x50\x6a\x36\xb6\x51\x7d\xd1\x48\x9b\xc1\x04\xbe\x16\
+\x57\x2f\x8c\xe9\x37\xf5\x52\x9c\xa8\x09\x0e\xfe\x48\xc9\x29\x42\
+\xab\xaf\xc2\x06\x08\xd7\xbb\x22\x4f\x85\x09\x21\x10\xee\xc5\x1d\
+\x74\xe2\xd2\xb6\x5b\xda\x51\xd0\xcf\x87\x3e\x8d\x84\x3e\x2e\x88\
+\x51\x60\x12\xc5\x78\x21\x50\xd3\xe8\x50\x83\x1d\x74\x7b\x8b\x97\
+\x73\xf6\xdb\x7b\xaf\x4a\x94\x93\x37\x85\xd1\xdf\x2f\x2a\xdc\xd1\
+\x7b\x14\x52\x4c\xa4\x14\x98\xb2\x4a\x73\x20\x66\x32\xa5\xc1\x7b\
+\x50\x25\x07\x75\x3c\xc9\x60\xc9\x0f\x56\x13\x19\x43\x09\x07\xf0\
+\x50\xf9\x79\xfd\x29\xbf\x42\xef\xac\x6b\xe7\xa4\xce\x8d\xfb\xb6\
+\xf5\xfe\xfe\x5a\xd3\x05\x6b\x7d\xee\x91\x5a\xa0\x0c\x43\x6f\x88\
+\x2c\x00\x42\x47\x22\x8e\xaa\x38\xc8\xac\x29\xcd\x81\x14\xdd\xa3\
+\x1b\x98\xb3\xf5\x63\x79\x78\xb7\x01\x62\x10\xfe\x7b\x70\x68\x3c\
+\x60\xb3\x17\x81\xc3\xbb\xc5\xa4\x86\x9c\x02\x72\x84\xf3\x00\x9e\
+\x7e\x45\x5e\x92\x61\xf2\xf9\xc1\x88\x66\x9f\x75\xcc\x9e\xb4\x86\
+\xe5\xec\xb3\x93\xc9\x1c\xbd\xa1\xaa\x69\xcf\xe5\xb4\x29\xc3\x4c\
+\x7b\x2e\xa7\x0d\xfd\x60\x70\xa9\xe0\xd5\xc4\xa9\x43\x3e\x4d\x5e\
+\xfb\x8b\x21\xbb\xae\x80\xe4\x94\x15\x40\x8a\x72\x36\x47\xe9\xe9\
+\xfb\xc5\xd5\x9b\x4a\xbc\xbf\x92\x00\xc3\x81\x84\x06\x98\x07\xe0\
+\x63\x52\xb0\x83\x9a\xae\xb7\x61\xaf\x59\xf5\xdc\xab\x9f\x7f\xd1\
+\xdd\xe2\xa0\xac\x18\xb0\x73\x94\x95\xec\x62\xb9\xe9\x81\xd9\x93\
+\xe8\x19\xba\x83\xbc\xcd\x58\xa9\x11\xac\xd2\x91\x97\x34\xf5\xbe\
+\xc7\xb2\xae\x14\x43\xa1\x93\x62\x27\xe1\xa8\x99\x7a\x29\xe3\x86\
+\x79\x13\x6f\x85\x03\xd7\x89\xf1\x66\x81\xcc\x47\x98\x75\x52\xd8\
+\x64\x7f\xbf\xea\xc0\x32\x1d\xd5\x18\xd9\xa0\x9d\x44\x28\x7d\xca\
+\xb5\xb4\xad\xaa\x5e\x55\x54\x86\xf7\x22\x4d\xb6\xe4\x7a\xd0\xa4\
+\xe1\x7c\x34\x20\x99\x94\xe8\x36\xdc\xbe\xd9\x6a\xf8\x52\x69\x0b\
+\xf1\xd3\x6a\xd5\x28\xc1\x84\x3e\xa0\x32\xcd\x37\x4d\x27\x30\x26\
+\x02\x5e\xc3\x52\x7e\xbf\xc2\x30\x48\xd6\x79\x6d\xe5\x12\xb8\xf8\
+\x86\x60\xec\xd5\x1c\xea\xdf\xe1\x0f\xd2\xbd\xbd\x3c\xee\xa0\x4d\
+\x6a\xe5\x60\xbb\x9d\xe1\xbd\xda\x75\x13\xb0\x1d\x44\x8f\x47\x07\
+\x26\x1d\xfd\xb4\x14\x05\x24\xb9\xd8\x72\x2e\x95\x27\xda\xbd\x54\
+\x65\xd4\x03\x07\x17\xe8\x25\x73\xb9\xb8\x7a\x70\x85\xf1\x1f\x6d\
+\xe8\x4c\xd3\x04\x6a\x30\x3c\xcf\x3f\x49\x02\x8e\x22\xd0\x69\x02\
+\x6e\xf2\xb1\x99\xa2\x8b\x29\x62\xce\xd0\x21\xef\x47\xfd\x61\xdc\
+\x4c\xe1\x4e\x6c\x50\x4a\x21\xcb\x24\x11\xf7\x32\x91\x34\x08\x4a\
+\x1c\x0c\x3b\xae\x25\x15\x91\x7d\x81\x30\xac\x44\xe5\x4e\x9b\xc6\
+\xfb\xb6\x5a\x2d\xce\x1c\x47\x59\xba\x78\x8c\x16\x41\x2a\xed\x7c\
+\x51\x9d\x66\x84\xf0\x5e\x65\xa5\xf1\xac\xa2\x03\x1f\xbc\xa9\x4c\
+\x0e\x1c\x76\x7d\x14\xd0\x4e\xea\x57\xb8\xe7\xf8\xf7\x29\x1e\x51\
+\x57\x15\x84\x65\xcb\xfb\xfb\xc7\x12\x03\xda\x50\x93\xc3\xc4\xd4\
+\x3c\x1e\x9e\xa0\xef\xe2\xc1\xe5\x3d\x8c\x64\x90\x70\xbc\xcb\xbc\
+\x58\x74\x15\x1f\xd9\xe2\x57\xf1\x89\x18\xcd\x6f\x7a\x34\x59\x4b\
+\x51\x6f\xcb\x68\x4c\x3d\xf4\x47\x3d\xa4\xe6\xaf\x36\x8c\xc6\x16\
+\x1f\xc9\xe2\x30\x1a\xa2\xa9\x95\x08\xac\x43\xdf\x6f\x4f\x1c\x2c\
+\x86\xf0\x70\x99\x15\x7c\x95\x97\x53\x69\xea\xe0\xd2\x9f\xd1\x56\
+\x06\xfc\x1e\x7a\x5a\x42\xe4\x32\xcc\x6d\x74\x6a\xcc\xd1\x4c\x4e\
+\xfe\xa6\x62\xce\x53\xb0\x11\x63\xf1\x81\x21\x27\x5a\xd7\xc6\x3d\
+\x3a\x70\xd4\x0a\x1b\xfb\xd3\xcf\x55\xeb\x8b\x60\x51\x78\x30\x13\
+\x91\x55\xef\x96\x8e\x33\xf8\x27\x91\x08\x5f\x5a\x23\x7f\x83\xfa\
+\x66\xd2\xc4\x6f\xd3\xa4\x91\x9b\x30\xee\x7e\x7d\xd8\x2c\xe7\x68\
+\x79\xea\x54\xb9\xf8\x72\xfd\x31\x08\x40\xe9\x4d\xc8\x01\x2a\x81\
+\x3d\x41\x40\x5a\x6d\xb8\x34\x25\x2e\x85\xcb\xc3\xad\xd0\x31\x55\
+\xe6\xa2\x0d\xfb\xce\x82\xda\x85\x6a\x61\xc8\xa7\x23\x6a\xc2\xa1\
+\xb5\x54\x24\x63\xab\x66\x49\x3f\x3b\x51\xdc\xe0\x9b\x6a\x49\xf6\
+\x51\x11\xeb\xea\xa9\x3c\x8e\x46\x15\x19\x89\x5a\x45\xb1\x64\x2e\
+\x31\x18\x8f\x9b\x74\xe5\x25\x65\x97\xad\x52\x90\x74\x15\x07\xc2\
+\x31\xdf\x6f\x1a\x0c\x79\x9d\x9f\xa1\x87\x0a\xa4\xb1\xee\x64\x28\
+\x06\x7b\x4f\x15\xef\xb0\x37\xf5\x3b\x68\xa2\x82\xa8\xa5\x17\x1b\
+\x59\xd9\x3a\x28\x2b\x5b\x38\x34\xdd\x5a\x33\x20\x93\x05\xb3\x20\
+\xce\xb6\x20\x51\x67\x42\xb2\x30\xf9\xb8\x00\x66\x6a\x81\xe3\x74\
+\xd0\x2a\x37\xc4\x3c\x5c\xba\x37\x8a\xd1\x3b\xc7\xe8\xc8\xc8\x37\
+\xb4\x7d\x9c\xd9\x6e\x8b\x92\x98\xc0\x42\x4b\x5e\xc3\x69\xb2\x03\
+\x7f\xb5\x6c\x93\xd9\x51\xaa\xd6\x66\x32\x13\x54\xee\x3b\x55\xe0\
+\x72\xf2\x4e\x17\x80\x9f\x9a\xd8\x3d\x4b\x96\x8a\xdc\x7d\x97\xcc\
+\xe2\xc9\x12\xe6\xe6\x41\x72\xfe\x54\x81\x0c\x89\x41\x42\x65\xfb\
+\x28\x3a\x73\x59\xd3\x20\x65\xbc\x8c\x4f\xe2\xe9\x99\x9d\xef\x70\
+\xbc\x62\x67\x67\xcb\x98\x66\xbe\x1a\xd4\x40\x44\x44\x2e\x7a\x0e\
+\x05\x10\xaf\xe3\x7e\xe1\x7e\xdf\xc4\x09\x45\x26\xd6\xf1\x6a\x14\
+\x58\x53\xaf\x23\x66\xcd\xd5\x77\xba\xa7\xfc\x1e\xb1\x8e\xb6\x4a\
+\xed\xc5\xf6\x0c\x5c\xa4\x9e\x68\xfe\x91\xfa\x7c\xbc\xca\xce\x2f\
+\xd8\xfd\xce\xbb\x74\x08\x8b\xa8\xbb\xa4\x45\x54\xb4\xd0\x19\xaf\
+\xcc\xea\xf8\xdd\x49\x72\xa1\x89\x6d\x22\x18\x50\x20\x22\x85\x74\
+\x17\xe4\x6a\x0c\x39\x4c\xbb\xa2\x1b\xb5\x2d\x65\x08\x6a\x76\xd0\
+\xa2\x4f\xb4\x0b\x68\x3c\xbc\xa9\xca\x1a\x8c\x18\x61\x8c\x9e\x9c\
+\x4f\x02\xb2\x05\x97\xdf\xe6\xea\x6e\x5d\x5f\xef\x09\x5c\x85\xc1\
+\x7b\x54\xb9\x2b\x2c\x77\xa5\xca\x5d\xd9\x38\x43\x37\x26\x40\x91\
+\x1e\x1b\xbf\x05\xdb\xd8\x6d\x12\x46\xc9\x33\x61\x40\x94\x06\xb9\
+\x5e\xa0\x75\xd5\xce\x80\x7d\x2a\x2e\x6b\x0e\xbf\xf4\x21\xbf\xd2\
+\x55\x37\x68\xa9\x04\xba\xa1\x0c\xaa\xfd\xc6\xe4\xb2\x39\x9d\x53\
+\xfc\xf9\xa7\xd7\x1b\xb7\x20\xe9\x22\x79\x06\x35\xa2\x24\xc0\x22\
+\x39\xc2\xdc\x52\x19\xfd\xaa\xb9\x01\x66\xb6\x52\xb7\x12\x89\x3d\
+\xb4\xb6\x16\x82\x38\x4a\x3a\xf1\xc6\xb2\x05\xb1\xfa\xc3\x26\xb2\
+\x99\x83\xbf\x46\x18\xe9\x2c\x29\x30\xa2\x62\xf0\x0d\x8d\xc9\x0e\
+\xf2\x2a\x64\x0f\x97\xda\x76\xe3\xd0\x94\x74\x45\x72\x6f\x4c\xe8\
+\x0e\x24\xe8\xf6\xe3\xf2\xa0\x37\xee\x1d\x34\xa8\xdd\x40\x7f\xff\
+\xd0\x9b\x65\x97\x3b\xa8\xd9\x53\x2f\x17\x45\x13\x41\x9d\xd8\xc4\
+\x19\x3b\xa0\xd1\x1f\x38\xc3\xcf\x51\xf0\x50\x1c\x1f\x9e\xd0\x88\
+\xac\x84\x66\xe3\xea\x90\xf4\x04\x5f\x0c\x56\x05\x60\x5c\x14\xc0\
+\x38\x12\x16\x5d\x44\x42\x03\x4c\x5b\x93\xc3\x47\xb4\xd7\xc0\x0e\
+\xb0\x22\x3b\xd0\xd7\x26\x76\xed\x53\x74\x13\x6b\x93\x88\xd6\x98\
+\x5c\x97\x7e\xd8\xa2\x72\xfd\x59\x04\x0e\xd2\xc4\xf5\xa0\x5a\x74\
+\x78\x50\xd5\x3a\x24\xdb\x9d\xfb\x25\x45\x63\x54\xa2\x5a\x8f\x0a\
+\x17\x2d\xbf\x81\xc6\x3c\xa7\x42\x4a\xb5\x66\x10\xc0\x5d\xbf\xcd\
+\x4f\x3f\x14\x0d\xbe\xde\xbf\xcf\x66\xf9\x2f\x6d\x37\x65\x6c\xdf\
+\xee\xc3\xb0\xc4\x23\x81\xd4\x74\x5f\x56\x35\x47\xfe\x0d\xe3\x0a\
+\x4b\xb7\xd8\x07\xd4\xc8\x12\xd4\x66\xdd\x93\xa5\x40\xa7\xaf\xf2\
+\xec\x8c\xdf\x78\x12\xb8\xd7\x0a\xee\xea\x3d\x41\x6e\xd8\x6b\x50\
+\x81\xee\xa3\xc3\xfd\xfd\x67\x51\x57\x43\x09\xa9\x4d\x20\x77\x01\
+\xcc\x53\x25\x7d\x55\xf0\x93\x59\xfa\x39\x5f\x8c\x2b\x73\x3e\x12\
+\x85\xde\x38\xf2\xa4\x03\xec\xf5\x00\xec\x39\xc3\x53\xc6\x46\xd9\
+\xea\xa8\xd9\x76\x6e\x34\x5c\xa2\xb1\xb4\x3d\x84\xe9\x00\x0c\xa6\
+\x2d\x76\x2a\x9b\x7c\xa6\xbf\xe3\x22\xa1\xf6\x72\xd1\x5e\x27\x1c\
+\xe6\xf5\x9e\x78\xe2\xe5\x12\x43\x23\x46\xb9\x92\x4e\x89\xd7\x45\
+\xc1\x25\xb4\x7c\x11\xe6\x78\x55\x86\x71\xf2\x27\x1f\xe8\x50\x55\
+\xd8\xbc\x0c\x6a\xdb\x53\x21\x06\x00\xd8\x09\xa0\x6b\xa6\xfa\x73\
+\xdf\x4d\x78\xbc\xbd\xe0\x5a\xeb\x65\xce\xe5\x8d\xbe\x89\xad\x58\
+\x81\xda\x7f\x53\xa1\x20\x43\x44\x69\x36\x64\xc3\xc8\x27\x1b\xd0\
+\xc1\x69\x63\xe2\xf1\xb5\xd7\x44\x4f\xd2\x0e\x9e\x67\x38\x76\xbc\
+\x31\x86\xcb\x24\x87\x5f\x0f\xe3\x58\x30\x5b\xa8\x61\x17\x84\xbc\
+\x1a\xf1\xb4\xc1\x49\x4b\x6a\xc0\x54\x08\xcb\x17\xb0\x69\x7b\x99\
+\x02\x70\x54\xba\x6e\x20\xa6\x7a\x5a\x21\xe1\x20\xd9\xec\x78\xec\
+\x26\xfc\x46\x45\xae\x64\x0a\x16\xb9\xb2\x61\x56\x90\xa6\xc4\x17\
+\x05\x74\x81\xd7\xe6\x48\xba\xa0\xb9\x0b\x24\x1d\x16\x8d\xe3\x50\
+\xae\x4b\xbd\x0a\x85\x65\xf3\x38\x20\xa5\x93\x45\x1c\xb3\x64\x56\
+\x46\xc9\x88\xbd\x20\x38\xbb\xbf\xd3\x63\x81\x0d\xcd\x68\x1e\x3f\
+\xd4\xbb\xb8\x09\xc2\xa8\x89\x20\xad\x57\x59\x97\x69\x55\x06\x9c\
+\x83\xb5\x54\xe6\x46\x7f\x4f\x60\x8c\x67\xd5\x05\x32\x11\xe3\x5e\
+\x76\x3a\xeb\x71\xac\x0e\x1c\xa4\x0e\xd4\x01\x05\x5f\xb0\xb9\x27\
+\xdc\x92\x8b\x1a\xf5\xe5\x30\xed\x15\x6c\xf2\xaa\x26\x4b\xce\x33\
+\x40\x76\xb3\xe6\x55\x0e\x5c\x77\xd6\x8e\xfe\xb1\xc1\x61\xab\xba\
+\x9c\xe4\x65\x3a\x2a\x52\x13\x41\x11\xb8\x65\xd1\xe4\xfe\xfe\x1f\
+\x80\x22\x86\x47\x85\x95\x6c\x02\x9e\x35\xb2\x21\xf9\xa2\x60\x52\
+\xf1\x69\xa1\x18\x88\x71\xa2\xe7\x17\x3b\x95\x7e\x9f\x9d\x89\x63\
+\x6b\x40\x52\x8f\x9d\xcc\x83\x83\xc4\x74\xd5\xef\xc7\xb6\xa4\x75\
+\x6e\x33\xb4\x89\x70\xb1\xdb\xde\xfa\x06\x76\x59\xd9\x71\xb1\xf9\
+\x4c\xe5\x87\x26\x4b\xf0\xa1\xbe\x6a\x94\x2c\x12\x3d\x81\x49\xfa\
+\x80\x17\xa9\x2a\xe9\xf8\x12\xc2\x8d\x03\x51\x25\x5a\xb6\x01\xb8\
+\xaa\xc4\xe8\x1b\xa6\x9f\x43\xf8\x59\xff\x5d\xbc\xee\x85\xea\x96\
+\x75\xbb\x8c\x56\x58\x48\xa5\x48\xa0\xd9\x2e\xa5\x22\x8e\x6d\xa0\
+\x06\xc2\x8e\x9b\x78\x16\x12\xf3\xbd\x28\xf1\xf4\x33\xea\x23\x51\
+\xa2\x72\xf1\xa4\xb0\x8b\x5b\x54\x44\x11\xe0\xb2\x7f\x22\x84\x40\
+\xfe\xaf\x0a\x21\x90\x93\xd7\x7f\xb8\x1d\x39\x2a\x36\xdf\x6f\x60\
+\xff\x4f\xd7\x0d\xc0\xeb\x55\x05\x94\x57\x82\x2e\xcf\x6a\x58\x0f\
+\xf4\x79\x4d\x5a\xb6\xd6\x1b\xb4\x82\x31\xb0\x79\x44\x48\x1b\xfd\
+\x2b\x3f\x46\x88\x56\x44\xfa\xbc\x1a\xff\xd1\x4c\x7b\xff\xf7\xf0\
+\x12\x23\x43\x25\x9a\x38\x44\xb9\x92\x3e\x46\xd8\xd0\x25\x81\xc8\
+\x2b\x84\x82\xc9\x1f\xb6\x0c\x1e\xd0\xc7\xd5\x0a\x7b\x8b\x3d\x8f\
+\xa8\xbe\x34\x4e\x30\x7d\x86\xdd\x13\xaa\xe4\x1e\xaf\xc7\x0c\x5a\
+\xdf\x40\x61\xa3\x23\x76\x51\x13\x42\xbf\x4a\x0b\x98\xdd\x71\xaf\
+\x7f\xd5\x3b\xc1\x9f\xfa\x81\x1c\x43\x26\xcc\x3d\xdf\x50\x86\x3b\
+\xe2\x73\xe1\x9d\xb7\xa2\x99\xba\x78\x8c\xcf\x02\x11\x4c\xd0\xf0\
+\x10\x20\x7f\xa4\x3e\x4c\x33\x9e\x5f\xfc\xb6\x6c\xdc\xf1\x84\xaf\
+\x96\x1f\x5f\x24\x48\x22\x26\xb6\x13\xb6\xad\x17\xa3\x76\x36\xdf\
+\x62\xd8\x44\x74\xe5\x16\xa9\x10\x0a\xf2\x4e\x7a\x4a\xb8\x38\x0e\
+\x1d\x3b\x83\x34\xa8\x13\x77\x3b\xbe\x54\x31\x26\xa8\xe4\x69\xa1\
+\x1c\x8b\xf5\xfa\x68\x1d\x71\xd0\x2a\xc3\xd0\x8d\x47\x62\x0e\x4f\
+\x00\x17\x5a\xd5\x17\x60\x0c\x10\xad\xfe\xa7\xd3\x94\x00\x5f\x6e\
+\x3c\xec\x8e\x52\xc7\x05\x72\x9c\xf2\xed\x26\xe0\x96\x2a\xac\x8d\
+\xe0\xe1\x3d\xfd\x1c\xdf\x12\x51\xa2\x70\xc8\xe7\xc8\x90\x11\xd3\
+\x3b\x90\x89\x30\x25\xf8\x7b\x56\x5d\x2c\x91\x43\xa3\xa8\x22\xb8\
+\xab\x57\xa8\xf4\x5c\x74\x30\x6e\x71\x7c\x5b\x5e\x10\x45\xb2\x6a\
+\x51\x32\x00\xeb\x05\xe9\xcc\xb4\x0e\x56\x82\x1c\x50\x29\xc3\x11\
+\xdb\x4e\x1c\x3f\x01\x9b\x89\x74\x47\xa7\x2f\xda\x83\x49\xe5\x1d\
+\xa7\xd8\x08\x54\xee\xb8\xdd\x9a\xc6\x9d\x08\xc8\xd8\xba\x13\xd3\
+\x75\xe5\xa2\x19\x24\x8c\x6a\x4e\xa2\x20\x85\x59\x99\xd6\x96\xea\
+\x50\xd1\x37\xdf\x5e\xd4\x2f\x33\x20\xc5\x81\xfc\xa8\xf3\xd5\xc7\
+\x62\x96\x8f\x7b\x6f\x9f\xbd\xee\x25\xab\xfc\xf7\x75\x5e\x37\x18\
+\xaa\xac\x79\x96\x2d\x7b\x09\xfb\x10\x26\x18\x47\x46\x0a\xf8\x0b\
+\x9f\xb8\x32\x28\x43\x2e\xed\xef\xfd\xcf\x32\x3f\x07\x74\x88\x6f\
+\x5f\x4b\x56\x3b\x00\x5a\x03\x8f\x7d\x81\xae\x27\x46\x03\xf8\x87\
+\x9c\x86\x2a\x72\x07\x00\x19\x9b\x0a\xac\xd1\x21\x21\x46\x2e\xdd\
+\x99\x18\x51\xfe\xef\x38\x1e\x24\x26\xfb\xb3\x89\x5d\xa5\xc7\x22\
+\xb6\xba\x8f\xaa\x7f\xc4\x36\xc8\xb8\x15\xc8\xe3\xa8\xe0\x73\x9b\
+\x49\x9c\xe9\xe1\x78\xa4\x9f\x52\x5d\x4a\x54\x33\xea\xf5\xe0\xf2\
+\x2e\x30\x87\x9a\x3f\xaf\x07\x57\x77\xd5\x73\xe9\x27\x3d\xb0\x34\
+\xef\x76\x76\x0f\x0b\xe2\xa3\xbb\x1a\xe5\x6d\xf2\xe5\x4d\x91\xd4\
+\x17\xf5\x2f\xbc\xae\xec\xc7\xed\x31\xdc\x22\x45\xdc\x9b\x9e\x06\
+\x6a\xe5\xb5\x98\x61\x34\xf8\xea\x28\xf5\xab\x4f\x7b\xd0\x28\x20\
+\xae\x1a\xfe\x3b\x71\xeb\x03\x58\x48\xcd\xb8\xe0\x46\x9e\xe5\x49\
+\x5d\x6e\xf4\xf9\xb1\x19\x57\x6e\x14\x57\x99\x8e\x92\x32\x7d\x11\
+\xe5\xe6\xf1\xa6\xa0\xf8\x8d\xf2\x1b\xe9\x74\x92\xac\x01\x79\x07\
+\xbb\x81\xf1\x5d\x2f\x31\x70\x79\x70\x7a\xfa\xcd\x0a\x57\x36\x4d\
+\x4f\xf3\xe9\x71\x85\x6e\x84\x01\x13\xc3\xde\xa0\xcf\xb5\x93\xf1\
+\x31\x7e\x55\xfc\x85\xa9\x27\xf1\xe0\x7f\x2a\xc0\xd9\x40\x24\xa0\
+\x93\x38\x67\xca\x76\x7a\xce\xbc\x35\x7c\xcd\x0e\xde\x79\x7b\x90\
+\x64\xbe\xa2\xb9\x3a\xe9\xb1\xa7\x15\x6a\x32\xa6\xbd\xfd\x07\x0f\
+\x5e\xfc\x9a\xc2\x9e\xec\x9f\x9e\x56\x97\x69\x2f\x3e\x60\x13\x05\
+\x75\x4d\x83\x14\xe5\xdc\xef\xb7\x89\x3b\xe8\x46\x80\x17\x30\x25\
+\xb8\xe1\x69\x56\x26\xab\x12\xab\xa4\xc1\x26\x11\x7a\x64\x0a\x7a\
+\xb0\xa2\x4f\xd8\x9a\x68\xa9\xbc\x0b\x0f\x80\x2d\x06\xda\x6a\x85\
+\xd2\xf8\xf1\x70\xbb\x1d\x4e\x72\xe1\x18\xa8\xa8\x60\xec\xf2\xe3\
+\xfa\xfa\xf3\x4d\xa7\xb5\x4e\x5b\x15\x37\x6c\xbf\xd3\x0e\xac\xe1\
+\x56\xef\x0c\xb3\x71\x2b\xb5\x5a\xcf\x78\x22\x31\x7c\x82\x72\xd5\
+\xed\xe4\xbf\x04\xf4\xad\xb8\xfb\x70\x2c\x40\xae\x8d\x9e\x79\xb7\
+\x54\x57\xe9\x67\x00\xa7\x57\xd5\x95\x98\xfc\x76\xbb\x8d\x96\x59\
+\x86\x34\xc9\xa8\x88\x71\xf2\xec\x31\xb8\x77\x2a\x26\x8d\x34\xb0\
+\x64\xcb\x48\x63\xab\x81\x44\x45\x9e\x29\x8d\x7d\x84\xf8\x0e\xc0\
+\x45\xee\x59\xe8\x5e\xb8\x2a\x45\x4c\xe9\xb9\x75\x3b\xab\x1a\x72\
+\x7a\x8b\x92\x93\x7d\xdc\x0d\xeb\x72\xb8\xe2\xcc\x96\x26\x47\x21\
+\x8e\x1f\xca\x37\x03\x5e\x2c\x7d\x7d\x08\xf5\x0c\x2d\xd4\x3d\x06\
+\x5f\xbb\x34\xe2\x52\xfb\xae\xac\x45\x4d\xf3\xcc\xcd\xcd\xf3\xc2\
+\x14\xc6\x53\x8c\x5b\x06\x32\x9c\xa7\xec\x0c\x5f\xff\x6c\x87\xfd\
+\x9c\xdf\x67\x4b\xfe\x53\x89\xc2\x2b\xa3\x46\xe2\xdd\x9f\x0c\x23\
+\x5a\x07\xfc\x9d\x66\xc1\x18\x66\x01\x29\x8a\x7b\x69\x3a\x76\x4c\
+\x6f\xb8\x58\x54\x09\x2a\x62\xf9\x81\xb4\xa5\x0d\xb6\x69\x8f\xe8\
+\x36\x95\xcd\x8e\x96\xf4\xe2\x09\x37\x2e\x78\x03\xbf\xb0\x35\xa1\
+\x3d\xd1\x8e\x0b\x12\xb0\xe9\x51\x7b\x9e\x14\xa1\xc3\xb2\xb3\x3d\
+\xb0\xb3\xc9\x8d\x50\x0d\xe2\xea\x2a\x24\x25\x4b\xd2\xf2\x84\x5c\
+\x37\xb8\x95\x46\x07\x87\x77\x45\x3d\x63\x56\x48\xdb\x92\x6e\xba\
+\x55\xac\x3b\xde\xbe\x60\xe8\x88\x64\x5d\xa6\x73\x4b\x91\x6e\x00\
+\x59\xf3\x72\x47\x1f\x58\xcd\x40\x1a\xa5\x19\x60\x83\x0f\xe5\x2f\
+\x57\x40\x43\x23\xa0\x63\x78\x23\x93\xda\x70\x63\x59\xd5\xcd\x12\
+\x38\x92\x9f\xed\x86\xa7\x28\xcb\x6f\x61\xa3\xf9\x06\x92\xc8\xc0\
+\x67\xc2\xbf\x37\x1b\xcc\x4b\x7c\x8f\xd0\x6c\x52\xd2\x25\xc3\x99\
+\x65\xe5\xc7\x0c\x95\x15\xd8\x1f\xb5\x79\xe7\xb1\xa2\xa8\x67\x98\
+\x84\x7a\x3e\x0a\x4f\x08\xc7\xd5\x77\xce\x4e\x17\xfc\x83\xea\x9d\
+\x55\x9f\x4a\xfe\xb5\x5e\xde\x71\x5c\x78\xeb\xb6\x84\x53\xeb\x44\
+\x74\x08\xcc\xbe\x2e\x33\x27\xff\x18\xd4\xe7\x8b\x75\xe3\xa0\xa6\
+\x59\x73\xc9\xde\x70\x1f\x72\xd3\x51\xef\xf0\x8c\x9e\x88\x7c\x9c\
+\x25\x57\x43\xbf\x1b\x30\xe5\xf2\x8a\x19\x11\x8f\xf7\x83\x86\x83\
+\x76\xb0\xaf\x03\x69\x6e\x45\x6b\xf7\xd9\x75\x9d\xad\x44\x37\x70\
+\x0c\x82\xb7\x9d\x47\xfa\x40\x5d\x23\x6b\x61\xbb\x0d\x0a\x4c\x64\
+\xf5\x48\x04\xf4\xe8\x70\x0c\x6d\xc3\x78\x74\x28\x67\xf1\x4d\x06\
+\x9a\xc8\x39\x97\xaa\x51\xe7\x64\xa6\xb2\x82\x01\x2f\x16\x7e\xe7\
+\x8e\x17\xe3\x32\x55\xfc\xcf\x47\x0a\xa3\xc7\x71\x1e\xb5\xa3\xf0\
+\xf2\x6e\x4e\x56\x02\x8a\xed\xc1\x4f\x34\x18\x08\x06\x81\x2c\x06\
+\xc1\x20\x90\xc9\x1f\x46\x7f\x1f\x76\x96\xdf\x32\xa2\xc3\xe4\x50\
+\x9c\xa3\x01\x31\x96\x0b\x5c\xb7\x3e\x4b\xfb\x2f\x13\xf5\xe3\xca\
+\x79\xe7\xd1\xe1\x51\x82\x08\x68\xee\xf1\xf3\x90\xdd\xbe\xb0\x81\
+\x6d\x17\xce\x3e\x03\x90\x61\xd4\xa6\xd0\x22\xf3\x16\x8c\x9f\x9d\
+\x54\xcd\xa3\xac\x9e\xdf\x5f\xad\x32\x7a\x7c\x63\x3e\x29\x72\x8e\
+\x0b\x60\xc0\xf8\x84\xdc\x2b\x01\xcf\x04\x40\xe1\x33\xa5\x8f\x9b\
+\x04\x80\xdc\xc7\xb1\x05\x30\x4f\xb3\xba\x49\x4a\xb8\x62\xc4\x53\
+\xdf\x4c\xdc\x1c\x33\x7c\x9d\x30\xc0\xa2\x69\x21\x41\x14\x26\xeb\
+\x28\x3c\x94\xf0\x18\xc3\xd2\xa4\xde\xb7\x56\xc8\xd5\x35\xf8\xb9\
+\xb7\x63\x8e\x4a\x88\xf0\x8a\xcf\x77\x63\xe5\x34\xad\xf2\x5a\x0f\
+\x80\x67\x49\x9a\x82\x38\x42\x52\xf6\xc3\x99\x4e\xf2\x69\x4e\x3f\
+\xd2\xd2\x9b\x74\x5a\x26\xe5\xb4\xe4\xf9\xe4\x63\x7f\xf4\xb9\xb9\
+\xfd\xba\x69\xd7\xba\x42\x2c\x72\xd2\x39\x66\xbb\xad\x81\x39\x32\
+\xfa\x7a\x25\x20\x00\x39\x3f\x11\x84\x03\x7e\x78\x54\x4e\x67\x27\
+\xed\x88\xda\x5d\xa7\x65\x5b\x4b\xa6\xac\xd3\x5a\x28\x76\x91\x95\
+\x30\x9c\xe9\x3a\x9e\xb1\x6d\xbb\x80\x7a\x19\xb9\x77\x9c\xdc\x39\
+\x39\xb8\xd7\x1d\xc9\x92\xa2\x58\x19\x1b\xc0\xe3\x0a\xb8\xf9\xa2\
+\x7e\x9e\x61\x48\x78\x25\xeb\x9a\xa8\x60\x97\x18\xea\xc8\xf4\xf3\
+\xce\x74\x94\x96\x14\xdd\xf2\x4e\x30\x2f\x30\x30\x3a\x62\x62\x49\
+\x02\x6b\x29\xcd\xe0\x3b\x76\xaf\x8d\x7f\xd2\x40\xda\xf5\xf5\x33\
+\x07\x55\x69\xcb\xd2\x24\xd0\x6c\xfb\xb4\x4f\x1a\xab\x8e\x49\x82\
+\xfc\xc8\x4e\xe7\x53\xce\xee\xe4\x87\xf1\xc1\xc8\x19\x8d\xc2\x31\
+\xed\xa4\xeb\x6b\x22\xdf\x02\x85\x35\x81\x25\xba\x23\xa8\x69\x5f\
+\x3f\x8b\xa4\x38\x89\xe3\x5d\xab\x66\x97\xac\xc4\xc9\xb5\xf8\x4e\
+\xfb\x6e\x07\x42\x0b\x28\xf0\xa2\xec\x43\x78\x24\x10\x1d\xe3\x00\
+\xdf\x99\x17\xdc\x40\x3e\x8c\xe2\x1d\x3f\xe3\x1a\x1c\x81\x31\x1c\
+\x23\x97\xe8\x0a\xad\x9d\x12\xf7\x53\xf1\x00\x9e\x0d\xac\xed\xa4\
+\x98\x6a\x6d\x5c\x85\x0f\x2d\x56\xa2\x66\x5e\x91\x6c\x4a\x21\x25\
+\xfe\x7b\x95\xd0\x9b\x38\x2a\xc9\x69\x5f\x78\x84\xd9\xb2\x8f\x6e\
+\x7d\x7c\x3b\x31\xcc\xce\x28\x19\xc2\x3f\xf4\xdf\x70\x1f\x98\xed\
+\x61\x6a\xc6\xb0\xad\x54\x46\xb0\xb2\x15\x40\x76\x4d\xb5\xca\x19\
+\x31\xf9\x1b\x66\x88\x8c\xd0\xf4\x5b\xc3\xd7\x06\x86\xa1\x05\x39\
+\xcd\xcf\xd1\x3a\xab\x99\x47\x6e\xe7\x33\x74\x77\xca\x2b\xa4\x74\
+\x09\x13\x65\x5c\xe8\x4e\x15\xdd\x5b\xc9\x4d\x64\x55\x4d\x2b\xcf\
+\xf5\x11\xd2\x04\x20\x48\xca\xf0\x3f\x86\x43\xc6\xde\x8e\x12\x92\
+\xb3\x3b\x17\x4c\x9e\x61\xf2\x16\x56\xa3\xbe\x14\x6a\xb7\x51\x9e\
+\x85\xf1\x86\x2c\x33\xbd\x8f\x42\xab\x28\xbc\x7a\x2e\xae\x3c\xd9\
+\x80\x91\xf9\xab\x26\x94\xb4\x40\x47\xf6\x40\x3c\xb7\xcc\x56\x4d\
+\x0d\x0c\xb8\x56\x1d\x35\xf6\x62\xd0\x09\x3e\x50\x64\x0c\x82\xe7\
+\xce\x7a\xe6\x00\x60\xf3\xa3\x6c\x92\x23\x64\xc5\xec\x32\x1d\x02\
+\xd4\x5d\xa1\x59\xb3\x02\xba\xe5\x51\x35\x29\x21\xbb\xa6\xd4\xe3\
+\xf2\x24\x99\x1f\x97\xd3\xde\x02\x0e\xc5\x9b\xaa\x37\xee\xb1\x57\
+\xab\xde\x49\xa4\xe4\x9d\x31\x6a\xc6\xcd\x95\x33\x6c\xea\xe5\x86\
+\xc7\x81\xa1\x7b\x5f\x03\x8d\xfe\x21\x8f\xe6\x89\xb2\xda\x54\xf1\
+\xf8\x8a\xd5\x2c\xf4\xcc\xe2\x84\x9a\x53\x33\xc7\x27\x4c\x80\xb2\
+\x17\x4b\xb4\x54\xe7\xe7\x4a\xa4\xa1\x60\x03\xac\xd4\x17\x48\xf9\
+\xd2\x3e\xdd\xcb\x68\x6e\x70\x0e\xb3\xb3\x62\x0d\x84\xd9\x08\xfe\
+\xbf\x97\x46\x55\x1a\x6d\x2c\xf8\x1b\x96\x04\x50\x18\xdf\x2b\x59\
+\x71\x49\x1f\x58\x45\x52\x8e\x48\x87\x2b\x77\x17\x75\x90\xad\x66\
+\xda\xd0\xf5\x5e\x05\x73\x18\x26\x87\x77\xa9\xf5\x97\x4f\x92\x3d\
+\xee\xb9\xda\xdf\xcf\xed\xde\x27\xad\x25\xca\x13\x56\x22\xb5\x49\
+\x41\x71\x51\x61\xac\xd9\xd0\x37\xf4\x62\x41\xb2\x31\x7e\xba\xbd\
+\xbf\x58\xce\xb3\x94\x93\x8d\x22\xd4\x80\xdb\x03\x9a\x40\xe5\x3c\
+\xac\x16\xd5\x0a\x5f\x90\x66\xf8\x43\x15\x88\x38\xef\xd5\x1a\x1d\
+\xa1\xf4\x72\x60\x8e\xab\x33\x12\x61\xa2\x33\x2a\x1c\xcb\xfe\x3e\
+\x2a\x46\xe7\x0a\xad\xb0\x3a\x5f\xde\x3c\x85\x33\x81\x54\x82\xf6\
+\x43\xaa\x3e\x23\x33\x48\x7c\x6f\x6d\x63\xdd\xeb\xeb\xe3\x13\xa4\
+\x69\xdc\x61\x57\x66\xc8\x78\xd4\xde\x2a\xaa\x9f\x3b\x24\xc5\x45\
+\x1c\x87\x9e\x89\x1e\x3c\x16\x7d\x98\x2d\xd1\x41\x07\xff\x52\x69\
+\x3f\x56\x64\x09\xad\x7f\x9a\xfa\x91\x89\x54\xe2\x87\x27\x11\xe4\
+\x8a\x63\xd5\x2d\xbd\xab\x49\xc7\xb4\x56\xfc\x66\x01\x49\x35\xa9\
+\xd2\x8a\x01\x09\x9c\xd3\x8a\x21\x49\x1c\x76\x31\x58\x18\x58\x5b\
+\x73\x8b\x74\xde\x22\x15\x1c\x8a\x1d\x97\x01\x75\x05\xdb\x61\xa2\
+\xab\xed\xe9\xc4\x58\x7a\x20\xc5\xfe\xcf\xcf\xd1\xd9\x20\xf2\xeb\
+\x68\x37\xc8\x51\x3e\xe3\x78\x82\x50\xf6\x71\x61\xe9\x11\x64\x6f\
+\x68\x2a\x11\x59\x9c\xa9\xb5\x30\xbc\x7e\x80\xc2\xb0\xea\x03\x9a\
+\x6c\xc7\x2e\xa9\x47\xb8\x9b\xe8\xdf\x86\x2c\xf5\x64\xa6\xcb\x57\
+\xb2\xaf\xd0\x1d\x56\xb3\x25\x09\xf8\x01\x15\xb6\xe9\xe8\xe3\x30\
+\x5d\x11\x41\xe7\xe3\xd0\x1c\x2b\xe5\xec\xe9\x96\x34\x76\xdf\x6d\
+\x10\xd8\x8b\xfd\xe8\x05\x96\xa8\x40\xa3\x3c\x2b\xab\x30\x43\x14\
+\x5d\x48\x92\xe4\xc2\x0c\xfa\xcd\x1c\x18\xc4\x66\x41\x21\x2f\xbc\
+\xb1\x53\x7e\x1b\xd6\xef\x75\x36\x21\x2c\x0b\x11\x36\x6e\x3c\x72\
+\xf9\x96\x23\x97\xfb\x47\xae\x88\xc9\x35\x4d\x1e\x4f\x4a\xf3\xe2\
+\x2e\xa7\x67\x28\x2b\x77\xf5\x49\xe3\x56\xfa\xfe\xbc\xfd\xda\x96\
+\x62\x6d\x3f\x8a\x30\xe6\xee\xe2\xc6\xa1\x64\x7d\xf6\x45\x6b\xed\
+\x42\x27\x36\x46\x78\x70\x5f\x86\x89\xa3\x72\xd2\xb6\x64\x0b\x6e\
+\xe6\x8d\x12\x4d\x7d\x75\x48\x92\x16\x33\x82\xd6\x93\xbd\xb8\x0d\
+\x58\xe8\xd1\x8b\x67\x3c\xd2\x02\xed\x51\x0b\xba\xc3\xfc\xea\x1f\
+\x76\x98\xe6\xf9\x88\x64\xbe\x73\x42\x2a\x2a\x8a\x50\x41\x1d\x77\
+\xe2\x66\xc9\x91\x4d\xc4\x2c\x2e\x6c\x24\xf0\xb8\xcc\x97\x8f\x0b\
+\x87\x63\x67\x5e\x16\xdd\x3a\x72\x49\x8f\xed\x0f\xf2\xf6\x65\xac\
+\xfe\xda\x33\x2e\x58\xe6\x30\xf3\x18\x8b\x49\xb9\x1e\xda\x76\x98\
+\x53\xa4\x27\x45\x90\x50\xcf\x24\x9e\xea\xd9\x8d\xf3\x96\x14\x22\
+\xcd\xcd\x94\x68\x98\x8a\x8d\xf7\x26\xee\x8b\x24\x54\x85\x96\xa4\
+\x62\xc3\xac\xa4\x9a\xc4\x42\xea\xcd\xbe\x6e\xa6\xc8\x37\xad\x31\
+\x8d\x25\x27\x64\x41\x55\xa6\xf2\x4c\xad\xae\x5a\xbe\xba\xca\xec\
+\x22\xaf\x31\x20\x1e\x79\xc3\x8d\x7a\x8b\x8f\x17\x8b\x5e\xd2\x83\
+\x32\xe3\x7a\x36\xcf\x2f\xb2\xba\x7f\x51\xa0\x4a\x5a\xf5\xbe\xe9\
+\xcf\xd0\xf4\x1c\xf2\xe3\x24\xa0\xb9\xdb\x25\xe5\x3d\xc2\x26\xd1\
+\x86\xe2\xe0\xbf\xee\x90\xd3\xa0\x94\x3b\xf9\xf6\xbf\x60\x3a\xb3\
+\xac\x99\xcd\x45\x23\xb7\x69\x97\x9b\xbc\xbc\x58\x94\xd0\x64\x70\
+\xc0\x03\x3d\xe0\x76\xc7\x37\x68\xf3\x54\xa6\x9f\x77\x76\x95\x14\
+\xf0\x6c\x03\x8d\x89\xc0\x8f\xe1\xa7\x90\x0d\x08\x69\xab\x68\x33\
+\x2c\x0a\x0c\x8a\xe2\x8c\xd8\xc9\x8e\x77\x56\x46\xbd\x7a\x9e\x2d\
+\xd1\x40\x63\x86\xd2\x4e\x67\xdc\x94\xb3\xd5\xa9\x53\xa1\x54\xa1\
+\x50\xfd\xb5\x37\xba\x33\xea\x91\x3c\x08\x3a\xa7\xd6\xf1\x07\xea\
+\x8c\xbb\x4f\xca\x5c\xc0\x7d\x06\x23\x7a\xc9\xa2\x57\x57\x24\xd8\
+\x21\x79\x6b\x4f\x69\xe2\x6d\x89\x17\x61\x3a\x69\xc2\xf8\xa6\x09\
+\xfb\x79\x2e\x76\x91\xe2\xd9\xbe\x59\x6f\xab\xe9\x74\xa1\xec\x2b\
+\x75\xc9\x39\x6e\x90\x8a\x99\x9e\x98\x30\x24\x21\x15\x11\xdf\x04\
+\x9e\xd4\x7c\xc8\x8c\x5e\x8c\xa5\x52\x64\x24\x20\x83\xbd\x52\xfd\
+\x4e\x2a\xa2\x9d\x55\x1a\xb7\xa0\xb2\x30\xc6\x05\x79\xad\xd7\xbd\
+\xf0\xd9\xa0\x9f\xa4\x11\xec\x2f\x64\xa1\xe8\x5d\x80\x83\xfc\x43\
+\xcb\xbc\x89\xde\x85\x54\xa6\x7b\x0b\xe3\x46\xb2\x34\x64\x73\x69\
+\x25\x58\x00\x30\xf1\x37\xd3\xca\xe7\x91\xc8\x89\xa7\xe2\x43\xa9\
+\xa9\xdc\xe9\x01\xdc\x12\xa9\xab\x7c\xb9\x00\xb0\x14\xdd\x8b\xee\
+\xdc\x4d\xee\xdc\x8d\xef\x9d\x27\x54\x46\x36\x4a\x31\x3c\x61\xe0\
+\x33\x20\xbd\x4b\x4d\x7a\x9b\x9a\x3d\x8c\x8a\x0a\xd7\xf5\xfd\x22\
+\x6b\xe8\x98\x62\x47\x24\xb5\x57\x85\x91\x24\x8f\x09\x43\x55\x4e\
+\x20\x73\xda\x67\xbd\x54\xec\xbc\x9e\x57\x74\x0a\xa8\x21\xe7\x85\
+\xc4\x4f\x5a\x46\xfc\xd1\x5e\x44\x72\xc8\xab\x57\x4b\xf0\x3b\x7a\
+\xe9\x72\xb1\x74\x82\x51\x8a\x09\xb7\xb8\xa3\xc9\x69\x34\xd4\x1f\
+\x8d\x65\x2b\xfb\x6a\x38\x53\xe3\xf9\x2a\x4f\xc3\xcc\x68\x19\x4c\
+\xff\x0d\xd8\x32\x19\xd4\x02\xb9\x4b\x64\x7d\x34\xf7\x3b\xed\x3d\
+\x1b\xde\x19\x02\x0b\x7e\xff\x29\x00\x10\x32\xea\x4a\xf0\xef\x15\
+\xc5\xfc\xcd\xe9\xab\x84\xdf\xc0\x7d\x7e\xf5\xf5\x3f\x0e\xff\x36\
+\x1c\xf6\x94\x4b\x09\xef\x9e\x91\x32\x1c\x83\x8b\xc1\xc7\xb4\xd8\
+\x44\x87\xa0\x9b\x56\xf9\x16\xb6\x01\xbd\xaf\xfd\xa2\x37\xc9\x59\
+\x99\x7e\xd7\x4c\x67\xe5\xf8\xc7\x64\xf9\x6f\x78\xaa\xc5\xa7\x61\
+\x36\x58\xe3\x45\xe3\x97\xfa\xd7\x98\x42\x8f\xb4\x3b\xa3\x98\x33\
+\xbc\x96\x1f\xcf\x0d\x19\x2a\x1c\x4e\x3a\x7a\x96\xb4\xbb\xf9\xaa\
+\x9f\xd3\x98\x60\xbd\xcb\xaa\xb4\xf4\xed\xaa\xaa\x9a\xef\x61\x4f\
+\x97\xd4\x5e\xa8\xb5\xb6\x0a\x90\xa9\xb3\xed\x4d\xf3\xcf\xbd\x55\
+\xba\xc9\xa6\x53\x37\x19\x56\x00\x85\x71\x46\xe5\x81\x16\xb2\x4b\
+\x25\x66\x93\x06\x02\x12\xc1\xff\xba\x97\x46\x94\x6b\x3b\x8f\x8d\
+\x71\x40\x81\xc1\x73\x6e\xa9\xe7\x62\x02\xbc\xf0\xe7\x00\x08\xbb\
+\x6c\x51\x33\x8f\xec\xe4\xa4\x45\x4b\xd3\x9f\xc4\xa2\x08\xe8\x2e\
+\xe3\x56\x1e\x0b\x47\x7b\x24\x7c\x24\x93\xbe\x5c\xbf\x69\xfa\x25\
+\x51\x9d\xe0\x41\x05\x40\xfc\x58\xbf\x39\x36\xae\xf0\xf2\xc4\xc2\
+\xe1\x2f\x24\x3d\x88\x2e\x38\x33\x74\xc1\xa4\x69\x93\x15\xa4\xb9\
+\x56\x24\x81\x9c\x4e\xec\xed\x92\x2e\x21\x7e\xee\xcb\x49\x0c\xef\
+\x18\x6a\xf1\x41\x58\x03\xcf\x14\xeb\x20\x77\x3a\xa2\x49\xa8\xfc\
+\x6e\x5a\x63\x55\xc8\x46\x3a\x23\x34\xe8\x22\xdb\x89\x8c\xf6\x34\
+\x3b\xde\xf0\x76\x21\x4b\xb0\x53\xf9\x72\x46\xd2\x8c\xdc\x12\x16\
+\xbe\xba\x39\x13\x15\x1a\xf9\x21\xd6\x0d\x15\xe8\x2b\xec\xd7\xb3\
+\x88\xb0\xb3\xa8\x3a\xff\x5a\x06\xd7\x59\x0e\x31\xfa\x0c\x15\xbc\
+\x8d\x10\x6e\x63\x51\x3c\xed\xba\x2c\x11\x02\xf0\x5b\x92\x2e\xc1\
+\x8a\x58\x20\xc3\x02\x3d\x59\x1a\x89\x12\xe5\xce\x6e\x43\x0d\xdd\
+\x01\x5b\x47\x6c\xea\x81\x9d\x4c\xf6\x9c\xf2\xdb\xfa\x50\x75\xc8\
+\xc5\x4c\x78\x4b\x34\x92\xc8\x15\x29\xe3\x97\x23\x42\x26\x09\x49\
+\x67\xdb\xeb\x88\x65\xe4\x1e\x4a\x12\x26\x5c\x78\xb5\x5e\xe4\xba\
+\x64\x4b\xbe\xdb\x1a\x33\x8f\x45\x8d\x78\xe3\x0b\x85\x4f\xa6\xfc\
+\x25\x32\x6f\x12\x45\x7c\x0b\x5a\x29\xc9\x77\x90\xdc\x97\x69\x2f\
+\xd3\x14\xce\x4e\xf2\xfb\x1c\x83\x01\x0e\xef\x8c\x92\xe1\x9d\x1e\
+\x13\xf1\x3e\x0d\xf5\x0c\x5a\x02\x08\xdc\xc7\x92\x8a\x8a\x2a\x0f\
+\x0e\xef\x62\x1f\x50\x87\x7e\xf7\xd5\x47\x8b\x24\xab\xb6\x93\x55\
+\xee\xb2\x9e\xf5\xd8\x9e\x68\x0b\x99\xa5\x01\xd6\x66\x0a\x8b\x4b\
+\x49\x81\xc4\x85\x64\xdb\xff\xbb\xb9\xbe\xfe\x8e\x85\x12\x4b\x2b\
+\x94\xf8\xae\xd9\xdf\x5f\x96\x26\x6c\xd7\xbb\xd2\x0d\x70\x0d\x90\
+\xee\x15\x80\xd6\x7c\xe5\x48\x27\xf5\x5e\x45\xd2\x7d\xd7\x4a\x95\
+\xd3\x40\x5b\x29\x38\xeb\xea\xe2\x0d\x1a\x83\x2e\x68\xd1\x70\x57\
+\x6d\xfd\x6d\x11\xb2\x4e\x31\x2a\xfd\x28\x7c\x30\xad\xc7\xae\x23\
+\x0a\x13\x7e\xab\xd0\x1d\x99\x38\x67\xc8\x4e\xb1\x29\x94\x1c\x5e\
+\x4b\x97\x81\xdd\x82\x5c\x51\x58\x08\x94\xba\x6b\xe7\x79\xf8\xdb\
+\x1a\xe0\x4a\x19\xf3\x52\x34\x47\xd6\x40\x8e\x5f\x41\x63\x86\x19\
+\x1c\x3e\x87\x5a\x6d\x6c\x98\x64\xaf\xad\x54\x8d\xda\xad\xb6\x35\
+\x0a\xc0\x72\x95\xbf\xcf\x57\x0f\x49\xad\x6f\x7f\x9f\xe4\x53\xd7\
+\xd7\x74\x2a\xb4\xc5\xf0\xfb\x32\x7d\x65\x95\xef\x3b\x4d\x64\x5e\
+\xc9\x58\xa1\xb6\x94\xb4\x56\x10\x84\x98\x8e\x06\x43\x2a\x0f\x05\
+\x1b\xad\x6e\xf1\xa9\x62\xa2\xc4\x68\x57\x2a\xed\x96\xe8\x06\xb8\
+\xa9\x81\xe6\x8e\x81\x28\x7c\x8e\xa5\x89\x18\xac\xd6\xcd\xfc\x2d\
+\x50\xcf\x84\x67\xd1\x9d\x5d\xb5\x0a\x24\x7c\x97\xd9\x04\xaa\xc2\
+\x09\x27\xb8\x48\x70\x39\x78\xd1\x81\x92\x02\x66\x65\x40\xc0\x09\
+\x46\x80\x77\x3c\xfd\x4b\xf2\x1c\x79\x91\xea\x22\x6f\x56\x57\xea\
+\xe5\x22\x7d\x94\x63\xea\x4c\x99\xa2\xf0\x48\xd3\xb7\x81\xc4\x3a\
+\xfd\x81\x52\x6d\x0c\x4f\xcc\x4d\x1f\x8b\xc4\xda\xa4\xfe\x9c\x73\
+\x5f\xcd\x63\x18\xcc\x7a\x95\xa7\xbf\x50\x42\x56\xeb\xef\xdf\xf3\
+\xa4\x15\xc2\xfe\xb4\x62\x73\x6f\x0c\x5c\x4f\xdb\x7d\x5e\xa6\xc5\
+\x96\xed\x16\x22\xb2\x76\x40\x47\x47\xec\x21\xce\x2a\x53\x26\x65\
+\x5e\x0f\xc4\xbd\x91\x2e\x19\x81\x67\x40\xa3\x62\x12\xac\xa7\x43\
+\x72\x23\x02\xa4\xac\x63\xe8\xac\xb8\x1c\x6d\xc0\x00\x17\xf6\x87\
+\xaa\xfa\xe0\x70\x82\x7f\x04\x5e\x16\x8c\xb6\xa9\xa7\xa5\xfa\x08\
+\x92\x74\x5b\x8c\xa8\x5b\xcd\xb5\xf9\xa4\xdd\x9a\xc3\xc6\x1c\x65\
+\x5d\xd7\xbe\x16\x73\x2d\xd7\x16\x64\xd6\x08\x04\xba\xa4\x23\x26\
+\x69\xc5\x42\x5a\xad\x90\xda\x4b\x60\x25\x6d\x9f\xf4\x12\xc1\xea\
+\x27\x8f\xf0\xde\xaf\xf2\xb3\x57\xc1\xd6\xac\xab\xb7\x56\x8b\xf8\
+\x7c\x83\x0d\xe8\x37\x90\x8e\x62\x71\xf7\xde\x8a\xc7\x43\x5c\x33\
+\x1f\xb0\xee\x35\x83\x7a\x5e\xbc\x6f\x7e\xca\xaf\xae\xaf\x47\xf4\
+\x74\xf9\x69\x5e\xcc\xe6\xfb\xfb\xfc\x81\x32\xa2\xaa\xb4\x10\x56\
+\x6d\x50\x78\x52\x51\x7b\x1c\x90\xf4\x2b\x5e\xe6\xcb\xc2\x64\x92\
+\x28\x80\x5e\xb6\x76\x8c\x8e\x45\xfa\xc8\x5a\xcc\x9d\x7c\x16\xda\
+\xcb\xe3\xe7\x45\x62\xd4\xa2\xc7\xce\x01\x21\xad\x68\xa5\xf0\xec\
+\xe6\xfc\xbc\x4c\x3e\xe4\x57\x78\xa6\x4c\x3a\xcc\x1e\x17\xe7\x46\
+\x9f\xa8\xce\xe7\x56\xb1\xbd\x06\x13\xaa\xcd\x1e\x1a\x98\x7b\x19\
+\x90\x85\x93\xd5\xd1\x29\x32\x98\x2d\x51\xc0\xa6\xf7\x39\x32\x76\
+\x9f\x67\x85\x7d\x7a\xc3\xc5\x62\xce\x13\x5a\x33\x92\x15\x1b\x61\
+\x60\x79\x9b\x85\x9d\x58\xd7\x1f\x4f\x22\x51\xbf\xb5\x53\x31\x69\
+\x6a\x1a\x7e\x7e\x62\x0c\x41\x60\x10\xac\x08\x15\xdb\xe9\x87\x35\
+\x82\xfd\x6c\x4f\x33\x98\x1e\xea\xca\xa2\x9e\xb7\xef\x19\x2d\x30\
+\xbb\x75\x32\x8d\x50\xb8\xde\x5d\x96\x2d\x4e\x7e\xc4\xf3\xf7\x09\
+\xcf\xdf\xeb\xff\xa5\x63\xf4\x73\x20\xb0\xdc\xa4\xf3\xb2\x99\x83\
+\xc5\xeb\x61\xed\x96\xd4\x32\xdc\xf6\x0a\x6a\x50\x10\xf0\x42\x63\
+\x0b\xa9\x27\xd3\x21\xca\x71\xd8\xa7\x98\x3d\x42\x6d\x8b\x13\x8a\
+\x1f\xd7\x3e\x23\x3b\x56\xa1\x23\x16\xbb\x07\x5a\x11\x24\xe4\xcf\
+\x45\x9e\x6e\x40\x8c\xbd\x44\x23\x4e\x45\xb4\x14\x37\xb1\xd2\x89\
+\x50\x0b\xee\xac\xee\xe1\x37\xa4\x95\x01\x7b\xf3\xb0\x3a\xcb\xed\
+\x33\x34\xaf\xa5\x0a\xf6\x4b\xb2\x88\xa2\x41\x14\x14\xf5\x10\xb5\
+\x71\xe8\x4f\xb8\xb0\xaa\xab\x5e\x72\xce\xb4\xb7\x8b\xc1\xcf\xaa\
+\xf5\xe9\x22\x27\xb5\x14\x17\x93\x7f\x74\x30\x79\x08\x59\xda\xd9\
+\x22\xae\xd5\xd6\x19\x16\xad\x3d\xb2\x4d\x6f\xc1\x93\xa2\x25\x34\
+\x1e\xdc\xa9\x29\x37\x75\xab\xf7\x56\xd7\x0b\xab\x74\x5e\xf0\x28\
+\x5f\x34\x99\xf0\x5b\xac\x62\x16\x1a\x2c\x32\xcd\xfb\xe5\x38\x3f\
+\x28\x27\x22\x56\xb8\x6d\xc1\x5b\x3f\xe6\xf2\x95\xfb\xea\xb1\xf9\
+\xb8\xaf\xb9\x45\xf7\x18\x21\x43\xb7\x6d\xfb\xbc\x0e\x7a\xc9\xc7\
+\xe0\x36\x2a\xcd\x18\x0c\x74\x87\xcd\x03\xd9\x35\xde\xab\x1b\xfd\
+\xfb\x51\x3e\xcb\xd1\xc4\x15\x4b\x8f\xbf\xfa\xeb\xd0\x14\x7a\x96\
+\x5d\xbe\x5e\xe6\x40\x6c\x60\xe0\xa1\x3c\xab\x73\xd4\xa5\xca\x56\
+\x18\xdd\x67\x70\x98\x7c\x42\x27\xc7\x0f\xab\xe5\xd5\x8f\xeb\x0b\
+\x0a\x67\x07\xdc\x2f\x1f\xd9\x5f\x8a\x7a\x86\xd1\x01\xaf\xc6\xfa\
+\xbc\x5c\x6d\x3d\x2f\x24\xa2\xb5\x4a\x76\xac\x3b\x44\x91\xa6\xed\
+\x56\x79\xb9\x74\x73\xb3\x1c\xb9\x4f\xc8\x65\x9a\x2f\x60\xbe\x6a\
+\xca\xe3\x49\xa4\xb5\xa0\x4b\x6c\xc0\xd8\x23\x48\x61\xe9\x3c\xe6\
+\x39\xc9\x94\x22\xcd\x42\x31\x11\xcd\x42\x5d\x43\x55\xd9\x01\x2a\
+\x46\x61\x82\x3d\x9e\x2f\x57\x39\x56\xa3\xe8\x75\xba\x9e\xd5\x88\
+\x96\x8b\x28\x15\x09\x76\x68\x11\xbd\x1c\xda\x06\xa1\xa0\x81\x20\
+\xf2\xe1\x41\x87\x05\xc3\x42\x9f\xe6\x79\x49\x1e\x17\xa2\x60\x89\
+\x58\x60\x67\x12\x91\x07\x70\xcd\xf9\x2a\x3b\xbd\x63\xc3\xc2\xaf\
+\x67\xf3\x3e\x0d\xae\xbd\x18\x79\x89\x7f\x22\x8b\xa9\x39\x5e\x64\
+\x8d\x2a\xf5\x9c\xd4\x00\x7c\xc6\xcf\xce\xab\xff\x6e\x97\xd1\xf4\
+\x04\x72\xec\x2a\xb7\x71\xa0\x67\x45\xcd\x23\xdd\x46\x5b\x9b\x2a\
+\x1a\xcc\xda\x36\x34\xdd\xcd\xba\x67\x5f\xda\x02\x45\xbb\x93\x47\
+\xb2\x5b\x91\x9b\x7c\x30\x23\x3e\xaa\x6c\x84\x6d\xe9\x4f\xc7\x5c\
+\x46\xa9\x95\xd7\xca\x34\x37\x75\xca\x8c\x6b\x77\x49\x13\xde\x83\
+\x24\x8b\x74\x98\xd3\x17\xa2\x82\x65\x23\xbd\x58\xaf\x2e\xdf\xeb\
+\x58\x02\xf7\x47\x72\xe4\x9b\x5a\x10\x7c\xb1\xdf\x02\x29\xaa\xd8\
+\x56\x0c\xd1\x66\x30\xee\x47\x3d\x47\x19\xe8\x4b\xb8\xd4\xda\x65\
+\x79\xa0\xb5\x71\x7b\xfe\xec\xff\x47\x61\x70\x3c\x00\x8a\x38\x55\
+\x29\x06\xd4\xd0\x73\xb3\x7d\xce\x20\xd8\x2a\x2d\xaf\xba\xee\x45\
+\x6c\x0e\x43\x48\x63\x69\xd2\x1e\xb8\x6d\x5b\x1f\x93\x05\xac\x19\
+\x92\x41\xc2\xc7\x61\x2e\xb2\x5e\x56\x75\xda\x3a\x88\xd9\x69\x0d\
+\xe9\xc2\x22\x4a\x67\x40\x13\x90\xe1\xdf\x67\xb6\x73\x11\xbe\x23\
+\x61\xf0\xda\xf6\x45\x97\x45\xf7\x7f\x3a\x60\x2c\x52\x3d\x6d\xf2\
+\x5e\x59\x7a\xca\xb5\xeb\xb1\x36\x9a\x5b\xb9\xa5\x1e\x3b\x19\x1d\
+\xf9\x03\x62\x9d\xf1\xfd\xfd\xaf\x87\x47\x4d\x5f\x8c\xea\x78\x78\
+\x32\x89\xfd\xc2\x84\xc9\x23\x77\xf4\x2a\xad\xcb\xcc\xda\x8b\x23\
+\x10\xf4\xb6\x1e\x3b\xb6\xcd\xfa\x6c\x0b\xed\xd2\xe3\x61\x32\x3c\
+\x91\x8e\x3c\x8b\x8c\xe3\x06\xb0\x84\x9f\x1d\xb6\x29\xf7\x86\xb1\
+\xf5\x43\x88\x25\x58\x0d\xd9\xe9\xbf\x15\x76\x40\x3c\x47\x0e\x2e\
+\x61\x22\x74\x0b\xd6\x35\x1d\xdc\x0e\xff\x6d\xfd\xa8\xe9\x17\xf1\
+\x5d\xef\xd6\xd0\x22\x48\x1c\x16\x72\xa3\xe4\xd5\xd1\x30\x47\x5c\
+\x16\x72\x11\xd5\x71\xa2\x7c\x47\x8e\xa2\x80\xa2\xb7\x6b\xbb\x9c\
+\xa2\x4d\xb4\x45\x39\x52\xf6\x29\xec\xf7\x39\x15\x03\x51\x93\x25\
+\xaf\x8e\xaa\x10\x85\xbf\xbc\x52\x55\xae\xd8\x05\x74\xb8\xca\x95\
+\xb6\x77\xa1\x2a\x97\xdf\x16\xec\x42\x7a\x6b\x2f\xe4\x67\x9a\x7a\
+\x51\x55\xb6\xf7\xc2\x2e\xa7\x5b\x58\x49\xad\x4d\x7b\xcd\xf4\x92\
+\x30\xe0\x53\xac\x81\x20\x09\xba\x4e\xaa\x3d\x3a\x49\xe1\x68\x7a\
+\xa0\xd3\x42\x0d\x14\xda\x07\x31\x29\x3b\xb7\xed\x12\x08\xe3\xa8\
+\xec\x17\x07\x79\xfc\x9f\xcd\x41\xd1\xcf\x93\x1a\xbe\x0f\xf8\xbb\
+\x8f\xdf\x2b\xeb\xd5\xab\x82\x54\xeb\xfe\xbd\x86\xaf\x69\x35\xae\
+\x7d\x8a\x4f\x43\x9f\xce\x3e\x67\x8b\xaa\xb4\x44\x45\x60\x4c\xe9\
+\xca\x40\x4d\xe7\xda\xba\xe6\x1c\x14\x5f\x29\x4b\xe6\xc9\x3a\x59\
+\x08\x0a\x73\x96\x2e\x8c\x96\xd5\xbb\x74\x6f\xa6\x21\xaa\x06\x86\
+\x0c\x1e\xb4\x6b\xdd\xc9\x42\x40\x2b\x26\xbc\x80\x16\x99\x2e\x04\
+\x48\xc3\x54\x63\x29\xe5\x81\x41\x03\x92\xed\xe1\x56\x30\xd9\xbf\
+\x10\x06\x5a\xb1\xdf\x20\x6b\x4b\xcb\xc0\xdd\x83\x71\xf1\xbd\x51\
+\xfe\x15\x6c\xdb\x6c\xe0\xd0\xec\xb8\x39\x18\x41\x42\x46\x5e\xb9\
+\x87\x01\x55\x84\xb7\x79\x06\x4a\x7a\xdb\x10\x55\x9a\x25\xd0\xcc\
+\x40\xd2\x76\xb0\xb1\xba\x57\x63\x60\xa8\xd5\x3d\x5b\x5a\xf2\x14\
+\x77\x81\x27\x89\xd6\x69\xe6\x20\xee\x39\x9c\x3a\xe3\x77\x01\x1d\
+\xb5\xaf\x07\x40\x84\xac\x61\xfd\xdf\x2d\xf0\x76\xf0\xe1\x8b\x60\
+\x7b\x42\xb4\xc8\x33\xa9\x1c\xbd\xc0\x37\x1d\x68\x73\x9d\x7c\x3e\
+\x5b\x2b\x36\x66\xee\xf1\x2b\x65\x52\x56\x28\xdc\x60\xaa\x0a\xf8\
+\x20\xe5\x12\x87\x58\x5a\x60\xb0\xc7\xad\x4d\xdb\x81\xf9\x52\x6c\
+\x55\x2f\xb9\x0a\x71\x5d\xc0\x92\x9f\x56\xd9\xea\x0c\x7b\xd3\xbf\
+\x81\x49\x21\x8e\x72\xfc\x77\xcd\x19\x5d\x3a\x9c\x91\x62\xe3\xeb\
+\xf1\xe7\x45\xfe\xbe\x19\x1f\x7f\xf5\xcd\x49\xb2\x42\xc1\x11\xfc\
+\xfc\xc7\x49\x42\xe2\x97\xe3\xbf\x0e\x4f\x92\xf5\x12\x52\xfe\x7e\
+\x42\x7e\x6b\x9e\x40\xda\xe8\xef\xdf\x24\xa3\xe1\x37\xc9\xdf\x46\
+\xc9\xe8\x9b\x11\xa7\xa3\x49\x02\x64\xfc\x03\x32\xfe\x91\x7c\xfd\
+\x57\xc8\xf8\xea\xa4\xd3\x83\x91\xb9\x03\x32\x22\xa2\x1e\xae\x78\
+\x3e\xf3\x67\xe2\xc5\x28\xf2\x8b\x1b\x1e\xba\x43\xa6\xee\xa3\x52\
+\xa9\xde\x39\x68\xb2\x53\x8a\xf5\x78\x94\x0e\x09\x8a\xea\xef\xb4\
+\x37\xec\x29\xaf\x0d\x40\x02\xcc\xd6\xb5\xe1\xcf\x1e\xe3\x57\x72\
+\xba\x58\xaf\x4c\xd2\x03\xf8\x48\x8c\x5c\xdd\x15\x6a\x09\xf1\x95\
+\x24\x03\x81\x4d\x94\xcd\xea\x71\xcb\x76\x05\xc3\x62\xe4\x5f\x1b\
+\xe5\x17\x22\x33\x12\x3a\x52\x1e\xc3\xf2\x6f\x99\xce\xfb\xf7\x5f\
+\x36\x9f\xb0\x20\x3d\xe4\xb9\x81\x5a\x67\x19\xb1\x75\xef\x71\x5a\
+\x9d\x01\x7e\xb3\xdf\xfa\x87\x52\xd9\x26\x35\x92\x7a\xb6\xaa\x16\
+\x8b\x37\xd5\x12\x0d\x10\xcc\x87\x8a\x38\x80\x5f\x18\x7f\xc5\xe6\
+\xe1\x57\x12\x5a\xb8\x01\x8d\x80\x04\x9f\x25\xac\x8b\x69\x2a\x2a\
+\xd1\x77\x2b\x4d\x85\xd6\xb2\xbd\x2f\x6a\xe8\x56\xa0\x6d\x49\x52\
+\xca\xea\x71\x6d\x5c\xf6\x0d\x95\x47\xad\xca\xb8\xb6\x56\xd1\x51\
+\xdd\xfa\xa0\x69\x97\x7d\xc0\xfd\x29\xbf\xaa\xd3\xcf\x37\x1a\x19\
+\x6b\x60\x90\xb0\x39\x24\x1a\xa0\xbf\x6f\x7c\x83\xc8\xe2\x98\xd3\
+\x8f\xcb\x93\x93\xf4\xb8\x3f\xba\xdb\x00\x04\x9f\x58\x23\xca\x7c\
+\x40\xf0\x23\x54\x8d\x32\xb8\x5e\xab\x12\x1e\xae\x50\x1d\x4c\xe7\
+\x2a\xb0\x5e\x6e\x95\xf5\x32\x54\x61\xbd\xd4\xc5\x71\x6c\x27\x36\
+\x98\xd8\xf6\x15\x41\xd8\xb1\x6d\x49\x18\xfe\x85\x3a\xe6\x1c\xea\
+\xbc\x71\xc6\xa9\x40\x63\x57\x1d\xc8\xa2\x4a\x7d\xa5\x26\x16\x7a\
+\x06\x34\x62\xf5\x9e\x92\x89\x5b\x91\x8b\x92\xd1\x9a\x3b\xd4\xfd\
+\xf8\x77\x8b\x46\xc2\xa2\x5f\x0a\x33\xd4\xa0\x4b\x60\x7a\xce\x6a\
+\x06\xb3\x66\xb5\x50\x3f\x2f\xf2\x26\x83\x9f\xb1\xf5\xe8\x6b\x64\
+\xc4\xd2\x90\x10\x4d\x72\x45\x70\x38\x75\x06\xe3\x92\x7e\xa2\xef\
+\xb2\xfd\x7d\xfb\x1b\xa9\xc3\x97\xab\xea\x7c\x95\xd7\xb5\xb0\xa0\
+\x53\x95\xc8\x78\xcf\xc8\x45\x89\x05\xbd\x8f\xf2\x6d\x81\xf4\xbf\
+\x8a\xc9\x2e\x86\x90\x35\x59\xfd\x04\x84\x15\x94\xff\xa4\xac\x91\
+\x8d\x62\x4e\x26\x50\x2c\xe6\xd0\x40\x77\xdc\xd1\xeb\xf3\x02\xc3\
+\xd7\x62\xd6\xd2\x8a\x76\x0f\x22\x21\xb5\xfd\x6a\x3c\xd2\x8c\x8e\
+\xae\x45\x61\x8f\x29\xe0\x10\xb4\x7a\xf8\x0d\x1a\x96\x5e\x5f\xef\
+\xe1\xec\xab\x25\x2a\x03\x9a\x9f\x42\x5b\xb1\xaa\xd1\xeb\x6f\x3d\
+\xcb\x96\x39\x2e\xb6\xf1\xfc\xc0\x66\xc7\x58\x18\x98\xc8\xe7\x05\
+\x47\x87\xdd\x42\x4d\x68\xc4\xda\x4b\x2e\x43\xd4\x04\x43\xb4\xb7\
+\xf3\x3c\x5f\x28\x51\x7c\xf2\x09\x3f\x1e\xe5\xa8\x95\x30\xa3\x67\
+\x8f\xf1\x5f\x55\xe2\xcb\xcb\x97\xf9\x0a\x8b\x71\x00\xe1\xbf\x69\
+\x62\xe3\xd3\x56\x31\xec\x1f\x5d\x92\x34\x6a\xd7\x9e\x50\x1a\xc8\
+\x6b\x1a\x93\x2b\x0b\xc5\x5b\x9d\x0e\xb7\x3f\x7a\xdf\xb6\x7d\xba\
+\x05\x22\x35\x20\xd3\x7f\x5b\x48\xaf\x9b\x52\x2e\xd2\x5a\xa9\x89\
+\x18\xed\x81\xf1\x0e\x83\xf4\x34\x61\x3c\xcb\x80\x6c\x7f\xac\x55\
+\xe4\x0f\xd2\x95\xd8\xb2\x55\xe1\xd5\x29\x56\xf4\xa2\xc3\x54\x18\
+\xe1\x53\xde\x8f\x74\x5e\xdf\xab\x85\x8f\x53\x93\xc0\x63\x38\x12\
+\xf9\x2b\x29\xad\x58\x85\x5e\xba\x96\xf9\x0a\x3d\x2f\x98\xb0\x56\
+\x70\xd9\xe2\x84\x0f\x62\x22\x33\x37\x90\x62\x14\x1d\xd1\x3e\x8c\
+\x84\x96\x15\xaf\xce\xeb\x12\xad\x70\x87\x93\x46\xcb\x22\x9d\x50\
+\x1c\xb4\xc0\xf7\xa2\xbf\xde\xed\xd8\x13\xf7\xa0\xa2\xf5\xf2\x5f\
+\xd9\x44\x7d\x51\x9d\x47\x87\xf7\xa2\xd1\x01\x7d\xe5\x97\xcb\xc8\
+\x86\x46\x2f\x63\xf8\xdf\x3d\xfa\x7c\xfa\xfc\x10\xd8\x9a\x7c\x6a\
+\x03\x06\x56\xc0\xd2\xdc\xc5\x60\x23\xa4\x2d\x42\xac\x04\xc7\xa4\
+\x3b\x88\x86\x47\x62\x50\xd3\x7a\xdc\x07\x38\xd2\x2f\x26\xce\xc1\
+\xf5\xb7\x93\x65\x7c\x68\x73\x2a\x1e\x78\x2c\x79\xeb\xdd\xca\x69\
+\x63\x20\x4f\x71\xb0\xc2\xe0\x10\xde\x13\x4f\xeb\x98\x25\x58\x6e\
+\x3b\xab\xe1\xf5\xd3\x4b\x3e\x85\x60\x44\x03\xcc\x3f\xd2\x31\xd9\
+\xf2\x8d\xf1\x59\x3a\xfa\x5a\xdd\xfd\x97\x5f\x7e\xf7\x49\x7a\xae\
+\x62\xb9\xe8\x0b\x7a\x1b\x05\x97\xdb\xb6\xa7\x3e\x7d\x64\x07\x0c\
+\x00\x56\xc4\xa8\x75\xf0\xf5\xca\x33\x21\xa7\x47\x30\x24\xe3\x46\
+\x47\xa6\xa0\x0e\x99\xe6\xc8\xe0\x45\xe1\x11\x07\x1f\x0c\x5c\xb3\
+\x79\xb5\x38\xd3\xda\x26\x5a\xcf\x4e\xb7\x8a\xf1\x9b\xf0\xd5\xb0\
+\x21\x5d\xec\x89\x38\x31\x16\x6e\x28\xe1\x0d\x47\x19\x29\xd0\xff\
+\x07\x9c\x9e\x5f\x13\xfd\xeb\x37\x54\xbc\x6d\xb2\x73\xd6\x82\xef\
+\x65\x78\xaa\x4c\x02\xf4\xf3\xb4\xfa\x84\x9a\x73\x75\x8e\xde\x25\
+\x66\x1c\xcf\x40\x3d\x65\x78\xea\xee\x62\xa0\x2e\x20\x68\x11\xab\
+\x45\xfd\x26\x5b\x52\x24\x36\x11\xfe\xc5\x59\x0c\xbd\x17\x3f\xdb\
+\x27\x85\xba\x00\xfc\x8d\x76\x96\x1f\xd9\x47\x9f\x74\xa5\x47\x1a\
+\xb5\x0c\x5d\x46\xf9\x57\x1d\x35\x84\x46\x53\xe1\x69\xb6\xd0\x72\
+\x7a\x3a\x08\xe8\xdb\x8f\x56\x59\x3c\xba\xfd\xbc\xd4\x2c\x09\x1d\
+\x8d\x90\x7a\x41\x92\x87\x60\xa5\xdc\x44\x57\x1b\xe2\xd6\x5d\xfb\
+\x07\x6d\x7f\x1f\x3d\xbb\x0d\x66\x73\x8c\x4a\x70\xf6\x86\x0f\x06\
+\x19\x08\xb3\x5e\xaa\x9b\x81\x42\x19\x75\x5c\x62\xb4\x78\xdf\x75\
+\xe7\xdf\x6d\xda\xf9\xd0\x42\xaf\x97\xb4\xcc\xa1\x0d\x0f\xef\x27\
+\xbf\xa4\xb3\x6e\xb4\x2d\xdf\xf9\x7e\xa5\x84\x6c\x42\x62\xe4\x9e\
+\xfe\xf8\x28\x80\x26\x24\x3c\x32\xa1\x5a\x83\xca\xd7\xf6\x82\x4d\
+\x76\xbd\x46\xdd\x6b\xc1\x2f\x0a\x1c\xbf\x58\x66\x07\x3d\x98\xf8\
+\x66\xc5\xdc\xce\x33\x83\xf9\xd1\x2f\x65\x6e\xfb\x21\x7e\x51\x43\
+\x00\x91\x6c\x80\x10\xeb\xa9\xda\xfa\xd0\x17\xa4\x22\xd1\x46\x0c\
+\x6a\x32\x4a\x88\xa7\xcd\xf3\xf2\x57\xf3\xeb\xb7\x24\x30\xc3\x04\
+\xee\xa5\xf9\xff\x30\x61\xfb\x43\xd3\x33\x6c\xc4\x12\x6d\xa6\xb9\
+\x0f\x76\x9c\xbf\x77\x0a\x1c\xf3\x53\x0c\x71\x36\x83\x1f\x1b\xd1\
+\x4a\x83\x06\x12\x2f\x83\xa8\x04\x77\x82\x28\x84\x53\x0e\x96\x96\
+\x30\xf1\x74\x9f\xd0\x19\xc9\xaf\x6b\xab\x0e\xf2\x74\x2b\x6e\xd9\
+\xfa\xae\xcc\x2f\xb4\x48\x51\x28\xd1\xce\xce\x98\x83\xee\x98\x32\
+\xaf\xdb\x88\x8f\x76\x7c\x25\x56\x63\xb8\x15\xf6\x6a\x8f\xc1\x49\
+\xec\x72\x38\x60\xd8\xb0\x3d\x73\xf6\xaf\xaf\x0f\xd9\xa3\x8a\x83\
+\xc1\xd0\x54\xd4\xb7\x18\xb7\xec\x0b\x87\x01\x45\x8f\x05\x9b\x48\
+\x55\x71\xbb\x28\x1a\xe1\x6e\x85\x47\x27\xae\x57\x5c\xd6\x64\x2c\
+\xc5\xeb\xd2\x3b\xf9\xe8\x25\xc0\x81\xd2\x3d\x2e\x37\x6b\x47\x89\
+\x56\xe3\x44\xd3\x58\x18\xfa\xc4\x82\x0f\x7d\x14\xed\x93\x69\x51\
+\xaa\x85\xdd\xd6\x47\xa1\x22\x55\x3a\x83\x8c\x9d\x61\x3e\x2a\xd0\
+\x07\x85\x04\x69\xb9\x93\x4f\x11\x98\x04\x1f\xe9\xe9\xbc\x26\xce\
+\x36\xe0\xd5\x2f\xcd\xab\xbc\x23\x29\x30\x28\xc7\x3b\x35\xae\x3f\
+\x5b\xaf\xbc\xa3\xcd\x41\xc5\xad\x3a\x07\x11\x40\xe2\xa4\xb5\xa0\
+\xaa\x24\x99\xf6\xf7\x0f\xd3\xf6\xb1\xd2\x58\x41\x8d\x3e\xac\x1c\
+\xb5\xf3\x99\x2a\x77\x2d\x8c\x67\x8a\x84\x4c\x76\xcd\xcb\xf8\x9e\
+\xb7\x27\x13\xe3\x6d\x8c\x7c\x2d\xb3\x3a\x26\x7a\xbb\x62\xfd\x29\
+\x7f\x8b\xe2\x64\xcf\xbe\xb1\xb7\x61\x95\x39\x3b\xd8\xd8\x11\x35\
+\xf6\x8c\x03\x69\x21\x6e\xac\x8e\x46\xf2\x3e\x7d\xcb\xf9\x1c\xfb\
+\x06\xf3\x47\x47\x55\xec\xb4\x80\x11\xbf\x2d\x6f\x61\xd3\x63\x7b\
+\x86\x1d\x45\x30\x73\x86\x85\x13\x35\xc7\xcb\xb4\xb8\x31\xc9\x28\
+\x4d\x2b\x45\xb2\x92\x93\x48\xda\x15\xe0\x72\x48\x72\x8b\x5e\xcc\
+\xe5\x61\x86\xaa\xee\x5b\x91\xbc\x50\xb8\x86\xd8\xda\xfe\x3e\x5a\
+\x80\xd4\xf8\x7e\xc9\x3f\x8c\xac\xc2\x19\x8a\x0c\xda\x5a\x78\x2e\
+\xd8\xfd\x3b\x27\xce\xbd\xeb\x7c\x5d\xa4\xdf\x88\xab\x42\x31\x6f\
+\xe8\x27\x35\x12\x21\x36\x1c\x79\x97\x49\x04\x57\x44\x58\xa7\x5d\
+\x24\x13\x8a\x59\xa5\x4b\xdd\x40\x52\x38\x10\x49\xf4\x98\x7c\xa6\
+\x61\x22\x13\x44\x0c\x17\x46\x5e\xd1\x4f\xec\xa2\xc5\xf4\x59\xa4\
+\x42\x7b\x61\x97\xaf\x58\x3e\x93\x88\x1b\xd6\xa9\x94\xeb\x5c\x97\
+\x69\xe4\xdd\xfd\x51\x70\xf8\x0e\xe5\xb9\x0b\x18\x68\x97\xdf\x04\
+\x06\xc2\x6c\x39\x47\x29\x80\xcf\xa9\x40\x62\xea\xcd\x4b\x9c\x59\
+\x67\x05\xa9\x4c\xf0\x54\x27\x7b\x21\x35\x19\xcd\xfe\x6b\xd5\x18\
+\xaa\x4f\x3a\xb6\x1c\xc1\xfb\x36\x3d\x18\xfd\x1a\xbb\x98\x5b\x99\
+\x62\x73\xa9\x7a\xc9\x53\xa6\x61\x1e\xb0\x36\x6b\x7a\x5e\xe2\xd7\
+\x23\x57\x39\x32\xfd\xc8\xa9\xab\xec\x3c\xbd\xa2\x9f\x3f\x29\x91\
+\x5b\x7a\x49\x9f\xaf\x5d\x26\x3b\xfd\x44\xa9\x40\x13\xa7\x2f\xf9\
+\x97\xee\x2f\x7d\x8a\xbe\xdb\x54\x20\x9a\xb4\x37\x1a\x7c\x33\x20\
+\x5f\x28\x08\xf0\xa0\x89\xf4\x57\xb4\x69\x9e\xa9\x8f\xdf\xf0\xe3\
+\xc1\xaa\xfa\x54\xc3\x0d\x7b\x80\x3a\x0b\x04\x1e\xe1\xbc\x7f\x07\
+\xbf\x9f\x15\x97\x45\x99\x92\xe6\xe2\xcf\x4d\xb1\x48\x1f\x62\x33\
+\xe4\x9d\xe6\x35\xfc\x52\x73\x05\xe2\x0a\x3e\x98\xbc\x4a\xe7\xf0\
+\xf3\x14\x88\xc8\x74\x49\xfe\xe3\xb2\x8b\x65\x7a\x91\x90\xa0\x41\
+\x11\x6f\xe9\x0c\x3e\x1f\x55\x17\xd4\x4d\xfa\x7b\xc1\x5f\xd4\xfa\
+\x33\xfc\x00\x82\xda\x9c\x8e\xf4\x7b\xca\x36\x1a\x95\x19\x76\x84\
+\xaf\xa6\x54\xfc\x7d\x4e\xc5\x17\x57\xf4\x75\xc5\x5f\x88\xfe\x3f\
+\xc0\x2f\xd6\xbc\xbf\x8f\x93\x63\x07\xa4\x4f\x70\x60\xfc\xf3\x05\
+\xfc\x34\xee\x3f\xb9\xa3\xdf\x21\xa9\x71\x93\xbe\xc7\xf6\x18\xc8\
+\xe0\xe7\x4b\xea\x9b\x11\xfa\x23\xf4\x98\xc7\x3f\xff\xc7\xa4\xaa\
+\x7e\x5e\x99\x3c\x95\xf0\x1c\xd7\xec\xd5\xeb\xf4\x07\xf8\xfb\x7d\
+\x5e\xfd\xf8\xfa\xc5\xf3\xf4\x79\x4e\x06\x55\xfc\xf1\x93\xfe\xa8\
+\xa1\x9b\xdf\xb8\x1b\xb4\x95\x7a\x66\x7e\xb2\x83\x84\x3f\x72\x6a\
+\xda\x7c\x07\xd5\x64\x90\x17\x01\xba\x87\x22\xc8\x40\x71\x65\x00\
+\xc5\x15\x1e\x62\x03\xef\x65\x4a\x67\x13\x0f\x6d\x13\x4f\x30\xcc\
+\xd4\x0b\xb6\x5c\x4a\x7f\xc5\x26\x0a\x99\xe2\xbb\xf1\x12\x8d\xfc\
+\x9a\xab\x44\x6c\xe6\x17\x40\x09\x95\xae\xf4\x23\x36\xf3\x51\xa6\
+\x6c\x68\xe6\x47\xd9\xcc\xeb\x5f\xbe\xd7\x55\xfe\x82\x8d\xd4\x1f\
+\xcf\x77\x68\xe2\x2f\xb2\x89\x47\xc5\x47\x5d\xe5\x9f\x7c\x68\x96\
+\xb0\x14\x4d\x49\xa7\x66\xb9\x69\x55\x9a\xd2\xac\xca\x9b\xaa\xc2\
+\x87\x83\x34\xc7\x6a\x8d\xfa\xe8\xac\x98\xdb\x8a\x4f\xe0\xe6\xa5\
+\xaf\x69\x19\xf1\x57\xc0\xe6\x0f\x2b\x50\x88\x26\x35\x58\xaa\x51\
+\x62\x3f\x67\xea\xa3\xa3\x52\x59\xaa\x4a\xcf\xb2\xd5\x07\x38\x40\
+\x1f\xc8\xc1\x02\xff\xee\x1c\xda\x07\xbb\xd3\x18\x66\x89\x8f\x5e\
+\x4d\xb3\x32\x9f\x2b\xfc\xfc\x7e\x55\x28\x1f\x73\x15\x7e\x9e\x9b\
+\xcf\x8e\xd1\x54\x7a\x34\xb0\x65\xe9\xb2\xe4\xbd\x4a\x2f\xf0\x87\
+\xb6\xd1\x4c\xe7\xf8\xc5\x26\x98\xe9\x1a\x7f\x73\x94\x85\x74\x81\
+\xbf\xc9\x8a\xf0\x01\xce\x81\x0d\xa2\xd5\xac\xee\x63\xca\x4c\xa6\
+\x74\xce\xed\xbe\x9d\x1b\x37\x91\x3e\xb1\x95\x37\x9d\x97\x27\xf2\
+\xbc\x20\x88\x41\xc3\xfb\xf4\x45\x4e\x47\x44\x7d\x75\xf6\xfa\xc2\
+\xf6\x8a\x55\xcf\x2b\x34\x23\x55\x35\xcf\x9d\xdd\xf3\x2a\xbe\xb2\
+\x15\xd1\xef\x70\x56\x9e\xe3\x28\x4b\x72\xb4\x60\x3e\xbb\x2a\xbf\
+\xb7\x47\xec\x19\xe0\x84\x9f\x28\x60\x40\xb6\xe1\x4c\xfe\x54\x88\
+\x38\x53\xa7\x65\xaa\xde\xa6\x9f\x4e\x9a\x41\x89\xc4\xf1\x7b\xc0\
+\x4c\x4d\xda\x16\xb5\xe8\x72\xe9\x29\x4b\x44\x6f\x12\x93\x82\xa1\
+\xae\xff\xcf\xff\x03\x65\x13\x4b\x83\
+\x00\x00\x02\x6a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x29\x00\x00\x00\x29\x08\x04\x00\x00\x00\x02\x69\xc8\x7d\
+\x00\x00\x02\x31\x49\x44\x41\x54\x78\x01\xed\xd2\x85\x8e\xe3\x40\
+\x10\x04\xd0\x0a\x33\xfd\xff\x7f\x1d\x33\x33\x86\x0d\x73\xad\xd2\
+\x94\xac\x96\xdd\xc7\xe2\x9d\xda\x70\xfc\x54\xdb\x9d\x7e\xc2\xff\
+\x4e\x1f\xff\xfd\xdc\x90\x37\x64\xc7\xe9\xfd\xf2\xfc\x11\xa9\x0b\
+\x7e\xfd\xad\x5f\x92\xfa\xaa\x9e\xb4\x13\xb1\x22\x63\x50\x5c\xbf\
+\x09\x08\x0a\xf6\x57\x88\x8c\x41\x71\xc6\x34\x9c\x5e\x09\xf6\x57\
+\x85\x24\x41\x71\x03\x1f\xbe\x43\x96\x51\xdb\x5f\xce\x52\xe0\x00\
+\x43\x66\x64\x37\x26\xa3\x64\xd5\x9a\xdf\x0e\x48\xcd\x9e\x5f\x10\
+\x69\xdc\x38\xc7\x48\xc1\x6e\xb6\xa4\xbb\x49\xb9\x9e\x9b\x30\x62\
+\x47\xec\x69\x28\x23\x54\x21\x19\x1d\x92\x46\x31\x84\x09\x32\x1a\
+\x80\x6f\xc9\x01\x44\x24\x47\x9f\xc1\x29\xa6\xbc\x17\xc9\xb8\x9e\
+\x9a\x2a\xa2\x96\x9c\x09\x2f\x19\x93\x9a\x65\x74\xd4\x80\x5a\x98\
+\x50\xb5\x8d\x48\x75\x1c\x91\x9b\x91\xd4\x72\x08\x8a\x65\x04\xc6\
+\xeb\x51\xc7\x0c\xce\x2d\x13\x88\x1b\x8b\xca\x98\x22\x90\xb7\x7e\
+\xb8\x98\x89\x61\x4b\x2c\xc0\x7f\x59\xbd\x94\x76\x47\x25\x9a\xe5\
+\x00\xe3\x0c\xce\xd4\x51\x88\xa8\xa6\xa7\xfa\xe9\x74\x90\xdc\xf4\
+\x0c\x2b\xcb\x9c\x53\x64\x2b\x5e\xec\x51\xed\xb9\x2f\x30\x26\x07\
+\x98\x1a\xb7\xb1\xdb\xcc\x4d\x4d\xdd\x3c\xe8\x38\xa4\xee\xf5\x0c\
+\xb1\xc4\x0e\x6b\xcc\xb8\x0e\x81\xad\x08\x24\xa4\x00\xa9\x4d\xc2\
+\x98\x0d\xb6\x98\x63\xac\x2e\x8c\x20\x75\x24\x47\xa6\x16\xc7\x1b\
+\x3a\x49\xce\x71\xaa\x7d\xb6\xda\x69\x82\x44\x5c\xc8\xb7\xc9\x44\
+\x74\xac\x7e\x8a\x40\xad\x83\xdd\x6a\x4b\x65\xa9\xc1\x57\xc1\x7a\
+\x52\x42\x89\x02\x70\xbf\x38\xb1\x7c\x8f\x5c\xc5\x94\x16\x82\x24\
+\x89\x7a\x52\xa7\xc0\x11\x25\x29\x8b\x43\x39\xbd\x8c\x15\xb8\x66\
+\x52\x28\x1b\x45\xe4\x01\x57\x40\xa0\xe3\xea\x8c\x5d\x2c\x57\x4b\
+\x21\x94\x9f\x85\x1b\x17\xc9\x7e\xee\xa7\x52\x1a\x74\xc2\xd1\x72\
+\xc2\x99\xa8\x48\x81\x41\xcb\x84\xb3\xa1\xa5\x50\xad\xc3\x80\xb3\
+\x61\x7b\xcb\x41\x64\x1b\x24\xd9\xb1\xa0\x2b\x0e\x28\x0c\x52\x80\
+\x12\x67\xa3\xbe\x5a\xbe\x89\x64\x47\x0f\x22\x20\x01\x5c\xb1\xd7\
+\x34\xd9\xef\x62\xc8\x27\x7c\xb4\x7c\x26\x79\x24\xa8\x29\x3a\x30\
+\x22\x0b\xec\x71\x21\x99\x50\xe0\x3b\x3e\xe0\x8d\xe5\xbd\x81\x5f\
+\xd9\x90\x33\xb4\xb4\xc1\x88\x4c\x35\x4e\xf8\xce\x0b\x0f\x06\x3d\
+\xc7\x53\xbc\x20\xb8\x07\xe7\xc7\x18\xc5\x40\x60\x44\xea\x9c\x0d\
+\xf8\x68\xcc\x13\xdc\xc7\x63\xbc\xc6\xa7\xcc\x15\xc4\xc4\xa1\x61\
+\x7f\x4d\x5e\xf1\x16\x0f\x71\xdb\xc0\x97\xf8\x82\x23\xb8\x08\x52\
+\x10\xc5\x74\x9c\x1f\x5f\xd3\x33\xed\x38\x92\x40\x62\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xeb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x34\x00\x00\x00\x34\x08\x04\x00\x00\x00\x6f\x71\xd3\x60\
+\x00\x00\x04\xb2\x49\x44\x41\x54\x78\x01\x62\xf8\x4f\x27\x48\x86\
+\x96\x4a\xd6\x4a\x56\x3a\x58\x34\xc3\x76\x57\x3f\xa0\xf6\xb2\x80\
+\x6d\x1b\x8d\xa3\x78\x8e\x99\x99\x04\xc7\xcc\x0c\x62\x4d\xb4\x89\
+\xb1\x82\xe3\x3b\xd1\xe1\x3f\xe5\x8e\x99\xcb\xa1\x72\x25\x67\x98\
+\x75\x50\x70\x99\xe9\xec\x31\x6f\x49\xca\x30\x66\x8a\xda\x77\xff\
+\x95\xfd\xf5\x73\x31\xd3\x13\xda\x0f\x42\xbf\xd8\x2e\x5c\x6b\xff\
+\xee\x96\x0e\xad\x78\x76\x53\xe4\x51\x47\x77\x52\x77\xd2\x51\xc7\
+\xa6\xc8\x15\xcf\xde\x92\xa1\xc8\xdb\xd2\x42\xea\x92\x79\x64\x48\
+\x75\xc9\x69\x21\x91\xb7\x05\x79\x28\xf1\x83\x1d\xcb\xda\x6d\x5c\
+\x6f\x50\xbb\x6d\xc7\xb2\xc4\x0f\x82\x36\x34\xff\x21\xf7\xdf\xfb\
+\xf9\x03\x93\x6b\xbf\xc3\xfd\xf7\xfc\x87\x82\x30\xe4\x9a\x59\x9e\
+\x20\x96\x8b\x2a\x4f\x70\xcd\x9c\xd6\x50\xec\x2b\x39\xf3\xfd\xc2\
+\x7b\x91\xcb\xef\xc8\x99\x1f\xfb\xca\x54\x86\x98\x96\xac\xdf\x74\
+\xbb\xbc\x56\x2e\xdd\x9e\xf5\x1b\x13\x36\xb9\x21\xdb\x77\xea\xda\
+\xae\x64\x59\x5d\x97\xa3\x79\x67\xf3\xce\x2e\x87\xf4\x5c\xb2\xba\
+\xd6\x66\x42\x98\x94\x96\x8d\x51\x7d\xb4\x48\xd4\x96\xeb\xbb\xe0\
+\x85\x17\xbe\x0b\x6d\xb9\x52\x07\x13\xb6\x31\x4a\x46\x98\x84\x96\
+\x5a\x9b\xbc\xa2\x33\xd3\xef\xf3\x62\x58\x7e\x5f\x67\xa6\xdc\x59\
+\x6b\x13\x09\x13\x86\x12\x3e\xdc\xbe\xbc\x5d\x3e\x63\x6b\xa9\xf5\
+\xdd\xf0\xc2\x28\xdf\x8d\x96\xda\x6e\xa9\xbf\xdd\xb6\x7d\x79\xc2\
+\x87\xb2\x21\xa6\x45\xf9\x67\x9f\x53\x16\xe2\x98\xc7\x7f\xda\x0b\
+\xb9\xfc\xa7\xdb\x3d\xf2\xd4\x3e\xa7\xf2\x0f\x13\x66\x1c\x72\xce\
+\x2a\x4b\x34\xf9\xc0\x52\x9b\x0e\x8a\xe5\xa2\x9a\x0e\x76\xa6\xca\
+\xd3\x65\x89\xce\x59\x83\x43\x4c\xcb\x96\x05\x66\xb4\xb4\x96\xf8\
+\xae\x0a\xb5\x52\xf9\xae\xb6\x96\x98\x11\xb6\x65\xc1\x4d\xc2\x2c\
+\x99\xbf\x6b\x26\x23\x1d\x6e\x7f\x87\xbc\x56\x2e\x7f\x47\x87\x5b\
+\xde\xa4\x39\x32\x7f\xb7\x44\xec\xcb\x53\xe4\xb4\x78\x7b\xbc\x98\
+\xa4\x7a\xe4\x84\xe5\x29\x11\xfb\x2c\x04\xba\xb6\xa4\xf8\x40\xaa\
+\x84\x96\x29\x49\x24\xec\x40\xea\x92\x62\xba\x46\xb0\x84\xce\xa0\
+\xe3\x84\xd0\xd6\x34\x4f\x97\x48\xcb\xe4\x25\x10\xd6\x95\x94\xe6\
+\x09\x6d\x25\xd0\xf1\xd0\x19\x16\x58\xe6\xdd\x4b\xf3\x79\x13\xd1\
+\x8d\xe5\xd9\x22\x2d\x93\x92\x40\x58\x79\x76\x74\x23\x81\x9b\xe7\
+\xcf\xbb\x77\xe8\xe7\xfd\xef\xeb\x54\x4c\x08\xef\x49\xc7\x61\x04\
+\x61\x88\x5b\xd2\xb9\x8d\x40\xc5\xff\xbe\x6e\xe0\xa8\xe1\x09\x2d\
+\xc5\xd3\x1b\x0d\xc2\x02\xe4\x4d\x7b\x26\x8f\x5b\x08\xd1\xf0\xf4\
+\x6a\x29\x0d\x4f\x0c\x0f\xdd\xa6\xff\xa8\x9f\xd4\xa1\xa3\x1e\x76\
+\x58\x59\xf1\xd0\xa6\x3c\xa2\x71\xda\xca\xb2\x73\x9b\xce\xe2\xe6\
+\x1f\x71\x1b\x0f\xed\x7e\x47\xaf\xd2\x31\xac\x42\x2c\xea\x7b\x35\
+\x0a\x8e\x4d\x76\x84\x13\x0a\x27\x89\x1b\x0a\xa1\x8f\x54\xd5\xee\
+\x77\x2c\xab\x4a\x1a\x2f\x1b\x0e\x42\x83\x1b\x11\x20\x2c\x45\xe9\
+\xa4\x66\x4a\x39\x41\x9c\x74\x73\x83\xb1\xb1\xf1\xf2\xaa\x12\xe6\
+\xc8\xda\xb6\xa1\x41\x87\x51\xd5\x88\x03\x21\x14\x0e\xec\x9b\xd0\
+\xc8\x3e\x76\x86\x82\x10\xc7\x49\xb1\x6b\x43\x83\xb5\x6d\x88\xa3\
+\x39\xf5\x95\xed\xa2\x21\x17\x73\xc1\x67\xb0\x79\xdc\x99\xcd\xec\
+\x22\x76\xe7\x8e\x1a\xa9\x6c\x9f\x53\x2f\x72\x74\x29\xb9\x5c\x0b\
+\x18\x6d\xff\x21\x1d\x61\x20\xac\x42\x8d\xe9\x48\x0d\x9f\x25\x76\
+\xa5\xb3\xdb\x98\xd6\x02\xc9\xe5\x74\x49\xca\xd1\x9c\x6b\xa3\x5f\
+\x53\x19\x56\xf6\x7d\xf2\x19\x12\xc2\x0e\xf3\xd1\x08\x10\x3b\xca\
+\x30\xfa\xf3\x98\x13\x90\x70\xa4\x3e\xae\xba\x32\x7b\xa3\x60\x45\
+\x1c\x6a\x47\x85\x3c\x10\x09\x33\xd0\x22\xfa\xb9\x21\x8e\x9b\xa2\
+\x90\x09\xd5\xa3\xbe\x34\x62\x48\xfd\x41\x3d\xa9\x42\x45\x2e\x62\
+\x41\x88\x84\x22\xfc\x6e\x04\xc2\x44\x5a\x0c\xd2\xa0\x70\x03\x71\
+\x53\x2e\x37\xb2\x2e\xaa\xa4\xde\xc9\x43\xea\xdb\x6a\x85\x8a\x61\
+\x6d\xc4\x3c\x81\x04\x91\x30\x37\x2b\x7a\x4c\xcf\x3c\x6e\x51\x47\
+\x6a\x8f\xfa\xb5\x65\xa1\xba\xe3\x8c\xe1\x20\x0a\xe0\x42\x38\x42\
+\x61\x47\x03\xe4\x84\xc9\x69\x69\xe0\x44\x28\x27\x5d\xdc\x60\x6c\
+\xcc\xbb\xbc\xac\xcc\x42\x01\x3a\x6d\xab\x56\x61\xd4\x36\xac\x00\
+\x21\x06\x9b\x21\x23\x4c\x46\xcb\x66\x76\x13\x56\x70\x52\xec\x4a\
+\x6f\xb4\xb6\x32\x47\xd4\xc7\x51\xc4\xee\x4d\xc7\x45\x83\x32\x10\
+\xad\x80\x3e\x8e\x2a\x06\x5e\x96\x32\x6a\x24\xa7\x3d\xa6\x8f\x23\
+\xba\xc9\x11\xf5\x73\x74\x63\x59\x59\xde\x65\xa3\x2d\x1f\x49\x08\
+\xed\x63\x44\x33\x1d\xd1\xfa\x58\x0b\x65\x67\xbe\x30\x52\x10\x58\
+\x3b\xc0\x11\x0d\x73\x44\x7d\x1c\x59\x5b\xd3\x1b\xc5\xd7\xe4\xc1\
+\x12\x91\x7a\xf1\xdf\x83\x1d\x1e\x88\x39\x65\x6f\xd8\x11\x02\xb7\
+\x1a\x38\xea\x13\x85\x50\x17\x7f\x00\xf5\x39\xed\x62\x28\x13\x02\
+\x61\x22\x2d\x82\x76\x9c\x99\x5f\x49\xbd\xdc\x16\x62\x72\x4b\x4c\
+\x8f\x50\x12\xf5\xd0\xa5\xb5\xe5\x05\x01\x43\x54\x20\x4c\xa0\x45\
+\x90\xad\x8a\x4e\x73\x4b\x12\x3d\x32\xe6\xd3\x04\x7d\x46\x3a\x21\
+\xec\x88\xb2\x77\x38\x2a\x12\x66\x42\x0b\x6b\xd3\xf1\x88\xdd\x04\
+\x6e\xf8\x6c\x02\x8f\x2d\x74\x07\xfd\x49\xe7\xa9\x77\x7e\xa5\x19\
+\x61\xe6\xb4\xd0\x0d\x4e\xfe\x49\x77\x4c\xf8\x41\x8c\x9e\xa3\xf5\
+\x04\x26\xac\x4a\x46\x98\x39\x2d\x9c\x7a\x6e\xd2\xcf\xb0\xe6\x84\
+\x99\xd3\x32\xc5\x87\x65\x73\xc2\xcc\x68\x99\xe2\x90\x39\x61\x72\
+\x5a\xa6\x3e\x24\x27\x4c\x4a\x4b\x50\x86\x44\xc2\x44\x5a\x82\x36\
+\x24\x12\x26\xd0\x12\xbc\x21\x91\x30\x0a\x08\xb4\x04\x6d\x48\x24\
+\xcc\x94\x16\x73\xfd\x0f\xb2\xd1\xc7\x71\xf1\x1d\x43\xe5\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x09\xa0\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x32\x00\x00\x00\x52\x08\x03\x00\x00\x00\x21\x15\x77\xd9\
+\x00\x00\x02\xf7\x50\x4c\x54\x45\x4c\x69\x71\x33\x79\xa9\x36\x7f\
+\xb2\x38\x83\xb8\x37\x83\xb7\x2e\x6b\x98\x33\x78\xa8\x3c\x84\x9a\
+\x37\x82\xb6\x38\x83\xb7\x37\x82\xb5\x34\x80\xb2\x36\x7e\xb1\x34\
+\x75\xa0\x2e\x6c\x97\x36\x81\xb4\x30\x77\xa4\x33\x78\xa9\x36\x80\
+\xb3\x2d\x77\x9b\x31\x74\xa2\x2e\x6b\x98\x35\x7e\xb0\x36\x7f\xb2\
+\x32\x75\xa3\x34\x7b\xac\x36\x7e\xae\x35\x7c\xad\x35\x7a\xaa\x37\
+\x82\xb8\x2e\x6c\x98\x2d\x6b\x97\x31\x74\xa2\x35\x7f\xb0\x32\x75\
+\xa4\x32\x75\xa3\x31\x73\xa1\x2e\x6c\x98\x2f\x6c\x99\x30\x71\x9e\
+\x2e\x6d\x99\x30\x70\x9c\x2e\x6d\x98\x2e\x6c\x97\x32\x76\xa5\x32\
+\x74\xa2\x31\x6a\x98\x2e\x6c\x97\x2d\x6c\x97\x2e\x6d\x97\x2e\x6c\
+\x97\x2f\x6c\x96\x2e\x6c\x97\x2f\x6d\x99\x2e\x6c\x97\x2d\x6c\x97\
+\x2d\x6d\x97\x2e\x6c\x98\x36\x7f\xb0\x2e\x6c\x97\x2b\x6d\x97\x2e\
+\x6c\x97\x2e\x6c\x97\x2e\x6b\x98\x37\x82\xb6\x34\x7e\xaf\x2e\x6c\
+\x97\x2e\x6c\x97\x44\x91\xd1\x30\x86\xcc\x3a\x8b\xcf\x2f\x86\xcc\
+\x2e\x85\xcb\x2e\x84\xcb\x41\x8c\xc8\x2d\x84\xcb\x2b\x83\xcb\x2b\
+\x82\xcb\x3a\x8a\xcf\x2a\x81\xcb\x3c\x8b\xd0\x3d\x88\xc6\x2d\x83\
+\xcb\x29\x81\xca\x28\x80\xca\x3b\x85\xc3\x27\x80\xca\x27\x7f\xca\
+\x25\x7e\xca\x38\x82\xbf\x24\x7d\xc9\x39\x88\xcf\x23\x7c\xc9\x38\
+\x88\xcf\x21\x7b\xc9\x35\x7e\xba\x3b\x8a\xd0\x20\x7a\xc9\x36\x86\
+\xcf\x1e\x79\xc8\x33\x7c\xb7\x28\x7e\xcb\x1d\x78\xc8\x34\x85\xce\
+\x1c\x77\xc8\x36\x85\xcb\x31\x78\xb4\x1b\x76\xc8\x19\x75\xc8\x31\
+\x78\xb2\x26\x7d\xcb\x33\x84\xcd\x2f\x75\xae\x31\x81\xc9\x33\x84\
+\xce\x31\x83\xce\x30\x7f\xc6\x31\x82\xce\x2e\x74\xab\x2f\x7d\xc4\
+\x2e\x72\xa8\x54\x9d\xd4\x4e\x99\xd3\x35\x7c\xad\x30\x71\x9f\x2f\
+\x6f\x9c\x34\x7a\xaa\x50\x9b\xd3\x33\x78\xa8\x57\xa0\xd5\x5c\xa5\
+\xd6\x32\x74\xa3\x56\x9f\xd5\x59\xa2\xd5\x4a\x96\xd2\x45\x8e\xc2\
+\x30\x70\x9d\x51\x9a\xcf\x4e\x96\xc9\x4b\x9a\xd1\xff\xff\xff\x3e\
+\x91\xcf\x5e\xa5\xd6\x33\x77\xa7\x5b\xa3\xd5\x47\x90\xc3\x36\x7f\
+\xb1\x47\x98\xd0\x42\x94\xcf\x32\x76\xa5\x5c\xa4\xd6\x3d\x86\xba\
+\x37\x80\xb3\x3d\x84\xb7\x33\x79\xa9\x50\x99\xcc\x37\x7d\xae\x3a\
+\x7f\xb0\x3c\x80\xb3\x31\x73\xa2\x37\x79\xa8\x32\x73\xa1\x48\x95\
+\xd2\x4c\x97\xd2\x52\x9c\xd4\x52\x9e\xd3\x4d\x97\xd2\x4f\x9c\xd2\
+\x45\x8b\xbe\x54\x9c\xcf\x59\xa1\xd5\x4a\x92\xc8\x3c\x90\xce\x39\
+\x8d\xcd\x3d\x7b\xa6\x47\x96\xd1\x41\x93\xcf\x37\x81\xb4\x41\x87\
+\xba\x43\x93\xd1\x30\x71\xa0\x73\x9f\xbf\x38\x83\xb7\x4a\x91\xc6\
+\x36\x8b\xcd\x4e\x9b\xd3\x3b\x8f\xce\x4b\x95\xcf\x35\x8a\xcd\x3d\
+\x83\xb4\x38\x82\xb6\x3f\x8f\xd0\x34\x7a\xac\x4a\x99\xd1\x45\x96\
+\xd0\x44\x8d\xc5\xdf\xe9\xf1\x48\x99\xd0\x42\x88\xbc\x49\x97\xd1\
+\x46\x94\xd1\x41\x8b\xbf\x32\x88\xcc\x55\x9d\xd1\x2f\x6e\x9a\x3a\
+\x8e\xce\xf8\xfa\xfc\x7e\xa6\xc3\xcf\xdf\xea\x3f\x92\xce\x47\x91\
+\xca\x46\x98\xd0\xa3\xc1\xd6\x42\x90\xd0\xcc\xdd\xe8\x58\xa0\xd2\
+\x44\x96\xcf\xa5\xc4\xd9\x31\x87\xcc\x47\x92\xcd\x3e\x8d\xd0\xb5\
+\xcd\xde\x4b\x83\xaa\xfe\xfe\xff\xc7\xda\xe7\xf3\xf7\xfa\x37\x8c\
+\xcd\xed\xf3\xf7\x9d\xbd\xd3\x3f\x93\xcf\x53\x87\xad\x4e\x88\xb0\
+\x52\x8d\xb6\x64\x95\xb6\x93\xb7\xd0\x5f\xa6\xd7\x63\x98\xbd\x40\
+\x89\xc0\x47\x8f\xc8\x46\x93\xd1\x40\x80\xad\x5d\x90\xb3\x53\x8c\
+\xb4\x5e\x92\xb7\x42\x95\xcf\xe4\xed\xf3\x34\x89\xcc\xb4\xcb\xdb\
+\x60\xa7\xd7\x38\x8d\xcd\x8d\xb4\xcf\x43\x95\xcf\x33\x89\xcc\x5e\
+\x5d\x99\xf7\x00\x00\x00\x43\x74\x52\x4e\x53\x00\x1c\x37\x53\x6f\
+\x8c\x8f\x03\xe2\xed\x9c\x44\x26\x0b\x82\xf6\x12\x61\xea\x07\xb5\
+\xc0\xd1\xdd\x2c\xaf\x8e\xfc\xc7\x8f\xd8\x77\x98\xb5\xcc\xe7\xf2\
+\x3e\x47\xf5\xb0\xb5\x6a\xe0\xd8\x77\x16\xf8\xf1\xa2\x94\x36\xfd\
+\x24\xcd\xb8\x5c\xd4\xc0\x52\x30\xc4\xa6\x9e\x8c\x82\xe9\x20\x11\
+\x15\xf7\x00\x00\x06\x15\x49\x44\x41\x54\x78\x5e\xac\xd4\xd7\x72\
+\x14\x47\x18\x05\xe0\x5e\xa1\x02\x21\x44\x09\x0b\x95\x10\xc6\xae\
+\x12\x20\x63\x70\x49\x2f\xc0\x95\x78\xac\xee\xc9\x71\x73\xce\x39\
+\x27\xe5\x9c\x73\xce\xe4\x9c\x83\x73\xce\xf1\xc2\xb3\xbb\xbd\x09\
+\x90\xed\x0b\x7f\x17\x53\x53\xff\xe9\x33\xdb\xd3\xbb\xb5\xe0\x7f\
+\xa2\xaa\x39\x54\xdb\xf5\x7e\xed\xa1\x1a\xd5\x11\xf0\x5f\xd4\x74\
+\xd5\x8d\x97\x1c\xad\x3f\xf6\x6f\x2d\x55\x57\xdd\xbc\x62\xdc\xbd\
+\x65\xb5\x6e\xb9\xc7\x73\xf7\x47\xeb\x1b\xc0\xc1\x8e\x5f\x69\x54\
+\x0a\x5b\x3a\xcb\x6f\x98\xcb\xaf\x56\x06\x8d\x5d\x27\xc0\x01\xde\
+\xa9\x1b\x1a\x72\xeb\x2c\x5f\xe6\x98\x78\xde\x94\xbf\xe1\xfd\xee\
+\xa1\xa1\xa6\xda\xb7\x6e\xef\x64\xbd\xc7\x33\xaf\x33\x29\xa4\x64\
+\x5a\xbf\xa6\xd0\xeb\x93\xdd\x26\x85\x6e\xde\xe3\x39\x7b\x1c\xbc\
+\xe1\xc4\x65\x8f\x47\x6d\x31\x99\x2c\x49\xfd\x5a\xa5\x74\x6e\x66\
+\xf5\x78\x5a\x54\xe0\x35\x0d\xa7\x6c\x36\x1d\xcf\xbb\x92\xf6\x37\
+\xa4\x2d\x3c\xef\xf7\xd8\x9a\x6a\x40\x15\x55\x93\x6d\x28\xcb\xf3\
+\xe2\xda\xcd\xb7\x58\x4b\xf2\x7c\x76\xde\xd6\xd8\x5a\x75\x54\x2d\
+\xb6\xf9\xbb\x2e\x57\xfa\xe6\x01\xa6\x5c\xae\xbb\x5e\xdb\xa9\xca\
+\x83\x3b\x1d\x08\x66\x5d\xd2\xd2\xf2\x81\x96\x24\xd7\x8e\x27\x70\
+\xb9\x7c\x6e\x57\x08\x42\x67\x91\xec\xf7\xfe\x81\x5d\xb2\xf8\x09\
+\xe2\x5d\x80\x35\x9c\x21\xac\x92\xa4\xff\xb3\x92\x5d\xaf\xb7\x57\
+\x0d\x96\x24\xc9\x4a\x9c\x69\x28\x6e\x8b\x98\x93\xa4\xf4\x4f\x25\
+\xf7\xd2\x49\x4e\x52\x74\xc3\xf4\x72\x79\xaa\x97\x24\x2f\x71\x16\
+\xff\x0e\x17\x17\x75\xdd\xd0\x51\xb2\xc1\x75\x2b\xb2\xda\xdc\x95\
+\x5b\x2a\xcf\x93\xdd\xfe\xc5\xc5\x63\x20\xe7\x3d\xda\xcb\x71\x03\
+\x83\x98\x63\x8a\xe3\xb2\x19\x6f\x80\xa6\x89\xb9\x8c\x9f\xe3\x18\
+\x47\x31\x59\xe6\x38\x37\xdd\x92\xff\x10\x9a\xd6\x72\xcc\xc7\x98\
+\x03\x72\xdc\x04\x41\x2b\xf2\x17\xb5\xc8\x89\xcb\xc5\x6c\x8a\xd3\
+\xd2\x74\x4d\xee\xb8\x7c\x73\xa2\xe8\x28\x8d\xc5\x1d\xaf\xcf\xf7\
+\xd9\xab\x67\xcf\xf7\xaf\xdd\xff\xca\xe7\x0b\x69\xc5\x44\xe9\x71\
+\xa2\x38\xe7\x3b\xac\x54\x3a\x58\xb5\x98\xbe\x8e\x0d\x28\x53\xd6\
+\xf7\xc7\xbe\x21\xef\xe9\xfd\x00\x1b\xd8\x11\x97\x8a\x69\x5a\xb4\
+\xb2\x1d\x00\xb4\xb2\xac\x16\xda\x8d\x05\xd7\x93\xd0\xca\xd2\xcf\
+\x0c\x25\xab\xdf\xb1\xeb\x10\x0e\xe2\xd8\x0e\xb5\x2c\xdb\x0a\x3a\
+\xcd\x41\x08\x8d\xbd\x05\x1b\x50\x4b\x9b\xbf\x30\x54\x78\x6c\x36\
+\xeb\x20\xc2\xb1\x11\xc2\xa0\xb9\x13\x1c\x36\xbb\x21\xd3\x8b\x21\
+\x38\x6c\xfe\x01\xef\x0a\x1b\x33\x87\x60\xa2\x98\x4f\x29\x79\x1b\
+\x38\xed\xcc\x40\x34\x8d\x25\x60\xd0\x79\xcb\x50\xe5\x8e\x93\x85\
+\xd0\x88\x73\x04\x33\xce\x66\x70\xce\xa9\x86\x1b\x78\x62\x84\x09\
+\xb3\xf3\x5a\x75\xe5\xb9\xd3\xe9\x87\x0e\x5c\xd9\x80\x6a\xe7\x39\
+\x70\x5e\x98\x48\x6c\xee\x15\x0c\x26\x74\x82\x73\xdf\x50\xed\x53\
+\xc1\x9a\x18\xc0\x0b\x36\x13\x13\xc2\x79\xd0\x2e\xf4\x30\x23\x7d\
+\x05\x23\xcc\x84\xd0\x6f\x78\xcd\x8f\x42\x86\xd9\x28\x2d\xe8\x11\
+\xda\x41\x47\x58\xcd\x6c\xfe\x5e\x60\x64\xb4\xe1\xf0\x6a\x75\xe3\
+\x69\x24\xdc\xc3\x0c\xe2\x05\xcb\x8c\x3a\xdc\x01\x9a\xa3\xeb\x4c\
+\xec\x45\x41\x1f\xc3\x44\xa2\x8f\xab\x2b\xab\xd1\xa8\x96\xe9\xc5\
+\x0b\x62\xcc\x7a\xb4\x19\xb4\x8d\x7a\x51\xfc\x05\x16\x47\xa1\xd1\
+\xab\xd5\x95\x5b\xa3\x11\x84\x8a\xb9\x8c\xbc\xa3\x6d\xa0\x93\x0c\
+\x28\xa3\xc9\x82\x4d\xa4\x26\xa3\x77\x2a\x1b\x3f\xf7\x93\xc3\x48\
+\x9e\xc4\x10\x0a\x90\x9d\xe0\x03\x92\x9c\x41\xbd\xb3\x05\x7b\x08\
+\x05\xc9\x27\xfb\x15\x6f\xf2\x39\x19\x49\xa1\x05\x1c\x4f\xa3\x14\
+\x49\x5e\x00\x47\xda\xc9\x15\x34\x32\x8b\x8d\xa0\x19\x81\xfc\xbe\
+\x74\x02\x2f\xc7\x48\xb2\x07\xc5\xca\xe9\x0a\xf9\xe1\x49\x00\x2e\
+\x6a\x42\xa9\xd8\x2f\xd8\x6c\x2c\xa5\x26\x35\xd1\x57\x2f\xf3\xdf\
+\xe2\xaf\xfd\x1a\xcd\x70\x2a\x3e\x59\x4c\xe5\x54\x48\x73\x29\xf7\
+\xe7\x4d\x09\xf1\x78\xdf\x5f\x58\x5f\x3c\x7e\x23\x42\x51\xd4\x93\
+\xb1\xab\x9f\x68\x28\x4a\x58\x89\xc7\x7b\x2b\x32\x81\xfa\x48\xa9\
+\xa8\x28\x6a\x45\xbe\xbd\x5d\xb4\x27\xcb\xb2\x97\xa4\xf2\x34\xa1\
+\x19\x59\x5e\x28\x45\x23\xf2\x0a\x45\xa9\x80\xe2\xd2\x6e\x40\x8e\
+\x6d\x3f\x28\xda\xbe\xad\x94\x6e\x7c\x1d\x0a\xae\x7f\xa3\xb4\xbf\
+\x9d\x2d\x07\xb2\x4c\xec\x5e\x04\x39\x17\x76\x77\x1f\xca\xd3\x0f\
+\xca\x1e\xc5\x64\x2c\xf6\xa8\x62\xbc\x20\x3f\xfc\xbb\x92\xba\xf7\
+\x49\x23\x00\xe3\x38\xfe\x38\x18\x26\x8d\x89\x31\x71\xd2\x09\x43\
+\x24\x11\x2a\x08\x36\xbe\x25\xfd\x1d\xd7\x62\xf5\x40\x5b\xdb\xd2\
+\xeb\x29\x1e\xc2\x55\x51\x04\x11\x75\xa8\x8d\x49\x17\x37\x27\xd3\
+\x34\x31\x35\xe1\x6f\x60\x6c\x72\x4d\xba\x18\xc3\x7a\xdb\x4d\xdd\
+\x9b\xdb\x3a\xf7\x4e\xa8\x20\xf7\x26\x9f\xfd\x97\xef\xf0\x24\x4f\
+\xbd\x3e\x46\x06\x8f\x1f\xdf\xaa\x4c\xac\xdd\x2d\xab\x32\x8c\xcc\
+\xfe\x8d\xb5\xd3\xaa\xdf\x31\x42\x0d\xa3\xa8\x55\xab\x3f\x9e\xbb\
+\xf8\x5d\xd5\xce\x31\x4e\x0d\x13\x01\xfc\xb9\x91\x5f\xb8\x50\x6e\
+\xbe\x22\xd8\x47\x4d\x4f\x70\xa1\x69\xb1\xb8\xa3\x5b\x4d\xfb\x82\
+\x49\xfa\x2f\x04\x2c\x6a\xec\x4b\x47\xaa\xf6\x0b\xe1\x29\xba\x17\
+\xc1\x95\xc6\xc4\x97\x1c\xc4\x34\xed\x33\xa2\xd4\x32\xad\x67\x18\
+\xd6\x69\xa2\x32\x8b\x80\x97\x5a\x3c\x4f\x71\xc5\x30\xf1\x65\x5b\
+\x31\x86\x39\xc3\x10\xb5\x9b\x31\x32\x5c\xc2\x56\x92\x59\x69\x46\
+\x5a\x22\xf8\xa9\x28\xab\xaf\x6c\xc4\x14\xe5\x12\x51\x7a\x68\x0c\
+\x58\x51\xb8\xd7\x36\x58\x65\x0d\x98\xa5\x0e\x73\x38\x53\x94\xa5\
+\x37\x96\xe2\x46\xc4\x47\x9d\xbc\x77\x99\xb7\x96\x8c\x48\x78\x98\
+\x4c\xa2\xb8\x90\xe5\xe5\x77\x16\x56\x65\xf9\x1a\xf3\x64\x16\x02\
+\xd6\x64\xce\x6a\xc2\xca\x29\xe3\xf0\x16\x7c\xb8\x54\xd5\xc4\x7b\
+\x93\x55\x55\xbd\xc6\x02\x59\x19\x0e\x23\xa5\xf2\xe6\x09\xa7\xa6\
+\x10\x98\x22\x4b\xf3\xb8\xd6\x33\x1f\x3a\x2c\xab\x6a\x0d\x93\x64\
+\x6d\x4a\xcf\x24\x85\xf5\x0e\x7c\x72\x03\x81\x1e\xb2\xb1\x80\x5a\
+\x32\x99\x78\xb8\x48\x24\xd9\x4f\xe8\x25\x3b\x3d\x01\xa4\xd2\xc2\
+\x66\xbb\x75\x3e\xbd\x81\xe0\x04\xd9\x9a\x44\x8d\x4b\x27\xda\x27\
+\x89\x34\x77\x8a\x7e\xb2\x37\x11\xc0\x06\x27\x66\x5a\x36\x05\x6e\
+\x0b\xc1\x01\x72\xd0\x8b\x73\x9e\xcf\xe6\xee\x65\x79\xde\x88\x38\
+\x19\x08\x62\x4b\x90\x32\xb9\xa6\x8c\x28\x6c\xe1\x59\x1f\x39\xea\
+\xc7\xa9\x20\x64\x3f\x36\x65\x85\xed\x3a\x46\xc9\x59\xdf\x33\x23\
+\x93\x6b\x2c\x72\xa2\xb0\x63\x44\x5c\x8c\xa2\xbe\x2d\x66\xf3\x77\
+\xb2\xa2\x1e\x19\x27\x72\xcf\xec\x88\x52\x7e\x57\x97\x97\xc4\x3d\
+\xf8\x07\xc9\xd5\xb8\x91\x29\x18\x93\x66\xc4\xdd\xa0\x1f\x7b\xd2\
+\xbe\x9e\xc9\xef\x4b\x45\xf8\x3d\x44\x8f\xca\x94\x24\x3d\x53\x90\
+\x4a\xc0\x34\x3d\x86\x67\x04\xc5\x83\xf2\xee\x6e\xf9\xa0\x88\x11\
+\xb7\x48\xeb\xdd\x96\xca\x85\x42\xb9\x04\xcc\x90\x8b\xd6\xbb\x2d\
+\x96\x75\x45\x44\xe8\xb1\x66\x80\xc3\x4a\xe5\xd0\x14\x71\x12\xc1\
+\x51\xa5\x72\xe4\x1c\x31\xbf\xdb\xe3\x63\x60\x8c\xba\x30\x87\x93\
+\x13\x0c\x51\x37\xbc\xd0\x79\xa9\x2b\x51\x20\x4a\xdd\x09\x01\x21\
+\xea\x92\xcf\x47\xdd\x9a\x9d\x25\x1b\xff\x00\x08\x86\x57\x40\x68\
+\x33\x29\x1a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\xba\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x19\x00\x00\x00\x29\x08\x06\x00\x00\x00\xc0\x93\x82\xce\
+\x00\x00\x05\x81\x49\x44\x41\x54\x78\x01\xad\x57\x03\x90\x63\x59\
+\x14\xcd\xda\x85\xb5\xed\xdd\xd8\x69\x9b\x6b\xdb\xde\xb6\x1d\x4c\
+\xdb\x0c\xda\x63\xb3\x35\xb6\xe2\x64\x6d\xdb\xca\x78\xee\xfe\xf3\
+\xab\xf6\xd7\x66\xda\xe9\xfe\x55\xa7\x5e\xbd\xf7\xee\x3d\xe7\x3c\
+\x27\xbc\xe4\xd7\x32\xa6\x04\x85\x76\xe8\x02\xa5\x6e\x58\xa0\x30\
+\x0c\x45\xa2\x0c\xa9\x18\xba\x68\xaa\xb9\x13\x76\x2a\x0d\x03\xb7\
+\xa8\x0c\x23\x55\x6a\xc3\xf0\xd7\x2a\xfd\x10\x69\xca\x47\x7c\xa1\
+\x95\x1b\xfe\x46\x89\xba\xda\x30\xf2\xbd\x5a\x3f\xd2\x08\xd1\x69\
+\x8b\x28\xb2\x2c\x27\x2b\xf5\xc3\xf9\x2a\xc3\xd0\xa1\xd8\xc6\x1d\
+\x07\xef\xb5\xd8\xe9\xf1\x79\xef\xd0\x33\x0b\xdf\xe3\xf0\xe4\xfc\
+\xb7\xe9\xfe\x2e\x27\xc5\x35\xed\x3a\x84\x38\xa5\x6e\x40\x8f\xbc\
+\x29\x89\xc8\xb5\x03\xd7\xab\x74\x03\x76\x38\x7e\xb8\xc7\xc3\x92\
+\x3f\xd8\xf7\x16\xdd\xdb\xed\xa5\xa4\x4e\x0f\xc5\x9b\xdd\x6c\x89\
+\x3a\xda\xd1\xff\x68\x9f\x9b\x10\xaf\xd2\x0d\x7a\x31\xfa\x09\x45\
+\x14\xa5\xab\xe3\x14\xda\xb5\x07\xe3\x9a\x76\x1c\x66\x9d\xf6\xbc\
+\x45\xf1\x26\x37\xc5\x4d\x02\xc4\x21\x3e\xa1\x79\xe7\x11\xe4\x33\
+\x3c\xf7\x8d\x29\x82\x85\x65\x3a\x7f\xbf\xd7\x64\xa3\x47\xfb\xdf\
+\xa1\x04\xb3\x87\x62\x8c\xee\x29\x03\xf1\xc8\xc3\xd4\x2a\x4a\xd7\
+\xfc\xad\x2e\x5a\x77\xc5\x68\x91\x92\xd5\x03\xd1\xb5\x9b\x0e\x3e\
+\xda\xf7\x36\xc5\xb4\xbb\x28\x7a\x34\xd0\x8e\x91\x4d\xd8\xcf\xe6\
+\xd7\x6d\x3d\xc8\xf0\x6d\xf1\x13\x91\x17\x2d\x7b\x42\x5d\xb6\xea\
+\xc0\x23\xbd\xcc\xf4\x18\x3d\x14\xd9\xe6\xf2\x03\x5c\x3e\xd4\xfb\
+\x0e\xeb\x14\x31\x28\x51\x47\xfb\x89\xb1\xc8\x47\x8c\xba\x6c\xb5\
+\x4f\x5e\xbc\xfc\x25\x56\x44\xaa\x5d\x77\xb6\xbc\x70\xb9\xef\xee\
+\x0e\x2b\xdd\xdd\xf9\x16\x45\xb4\xba\xfc\x80\x36\x6c\x80\xf8\xba\
+\x4d\x14\xa4\x5d\x4d\xf2\xa2\xe5\x6c\x19\x57\xb3\x81\x1e\xec\x72\
+\xd3\x7d\x5d\x63\xe7\x80\x0f\xbc\xe0\xe7\x49\xf3\x96\x06\xab\x4a\
+\x56\xf8\xe0\x2c\xac\xc5\xe5\x87\x44\x93\x97\xb0\x46\x41\xa5\x2b\
+\x48\xb7\xdc\x4a\x1f\x7d\xf7\x3b\x1d\x3e\x7a\x8c\x3e\xff\xe9\x4f\
+\xaa\x1f\x70\xb1\xed\x20\x4b\x36\x7b\x47\xe5\x82\x0f\xbc\xe0\xe7\
+\xc9\xf2\x17\x65\x84\x55\x0c\xfa\xa0\x1e\xd2\xec\xe4\x00\x47\x0f\
+\x76\x33\x2e\xe7\xac\xa5\xbe\xed\xef\xd1\x58\xdf\x80\xe3\x33\x0a\
+\xd5\xad\xc4\xee\xc2\x54\xf9\xe5\x83\x0f\xbc\xe0\x67\x46\xb2\x78\
+\x55\x74\xdd\x36\x76\x2e\x83\x9b\x9c\x1c\xb0\x63\x12\x9b\x77\xd3\
+\xbd\x35\x03\x74\xec\xf8\x71\x1a\xef\x7b\xba\x75\x3d\xc5\x35\x6c\
+\x1f\x95\x8f\x3a\x78\xc1\xcf\x93\xe6\x2e\xfa\x2e\xa9\xcd\x4a\x51\
+\xad\x6e\xd2\x34\x38\x39\x24\x74\x78\x29\xaa\x66\x33\x95\xaf\xd8\
+\x4f\x13\x7d\xc6\xf5\x1e\x8a\xaa\x1c\xc1\xd4\xfa\xe5\x83\x0f\xbc\
+\xe0\xe7\x89\xb3\xe7\xfd\x81\x4a\x78\xb3\x8b\xd4\xf5\x0e\x0e\x10\
+\x41\x72\xd3\xa0\x63\x42\x91\xbe\xad\x6f\x53\x54\xf9\x00\x25\x1a\
+\xbd\x7e\xf9\xe0\x03\xaf\x38\x67\xfe\xef\x10\xd9\x86\x61\x41\x59\
+\x59\xe7\xe0\x80\x3a\xda\x9f\x6e\x19\x9a\x50\x24\xb5\x7b\x33\x45\
+\x56\x6d\xa2\x98\x36\xcf\x98\xf9\xe0\xe7\x09\xb3\xfa\x0c\x21\xfa\
+\x81\xc3\x71\xed\x1e\x52\xd4\x3a\x38\x60\xc8\xc9\x1d\x2e\x52\x15\
+\x2c\xa0\xed\xef\x7c\x39\xa6\x80\xe7\xb3\x1f\x49\x99\x37\x9f\x71\
+\xec\xc0\x62\xfb\xe5\x83\x2f\x58\x3f\x78\x48\x94\xdd\xab\xe5\x89\
+\xd3\xba\xef\x56\xe4\x2d\xfc\x1b\xc3\x95\xd5\xd8\xff\x0f\xce\x8d\
+\x32\x77\x2e\x2d\xdb\xfd\x1e\xbb\x7d\xf1\x61\x23\x8c\x38\x3f\x21\
+\x4d\xfe\x02\xac\x1b\x46\x31\x2a\x17\x7c\xf2\xdc\x85\x7f\x89\xd2\
+\xbb\x92\x78\xfc\x37\x2d\x97\x8a\xd2\x3b\x8f\x25\xb6\x33\xae\x19\
+\x07\xd2\x2a\x3b\x07\x79\x35\xeb\x88\x62\x1a\xf6\xb0\x84\xe2\x8c\
+\x2e\x4a\xd0\x2f\x25\x69\x66\x0f\x2b\x1c\x55\xbb\x13\x6b\x87\x38\
+\xbf\x3c\xf0\x80\x4f\x94\xd6\x75\x14\xfc\xec\xb5\x22\x4c\xeb\xde\
+\x1f\x5a\xbe\x91\xc2\x9b\xdc\x24\xae\xb4\xfb\x41\xc2\x20\xb4\xc1\
+\xcd\x92\xc5\x35\xdb\x40\xcc\x96\xa8\x87\x37\xba\xd1\x3f\x2a\x07\
+\x3c\xa1\xe5\x9b\x8e\x83\x97\xbb\xbb\x04\x29\xa6\x87\xc4\x99\xfd\
+\xbe\xf8\x36\x2f\x9b\x24\xaa\x18\x1b\x8a\x6a\x27\x05\xd5\xb9\x50\
+\x8e\x1b\x87\x76\xf0\x88\x32\xfa\x7c\xc2\x14\xd3\x7d\x9c\xc8\xed\
+\x19\x5d\xa7\x0b\x52\xcc\xbf\x85\xd7\xec\x24\x75\x9d\x93\x04\xe5\
+\xb6\x80\x81\x7c\xf0\xf0\x53\xcc\x3f\xe0\xa5\xe4\x44\x00\xc1\x1b\
+\xc6\x72\x5c\x68\x91\xcd\x1e\xba\x73\x8e\x2d\x20\x40\x24\xba\x85\
+\xd9\x04\x79\x8b\x7d\x0c\x5f\xf6\xa8\xf7\x04\x0b\xc4\x4c\xdb\xc1\
+\xf0\x9a\xbd\xec\x74\xdc\xa1\xb7\x4d\x1b\xc8\x0b\xad\xda\x4d\xe0\
+\xb9\xf5\x8d\xb6\x0b\x4e\x10\xe1\x46\x53\x07\x17\x58\xd0\xdb\x74\
+\xd6\xe9\x80\x11\xb1\x12\xf2\xa4\x39\x0b\x31\x8a\xf2\x71\xdf\x78\
+\xa8\xc3\x45\x70\xe5\x2e\x92\x55\x3a\xe9\x56\xad\x75\xca\xc0\x36\
+\x46\x9e\xe0\x4d\xf3\xdf\x92\xd7\x3a\xce\x1b\x57\x04\x10\xbe\x69\
+\xd4\x4b\xb2\x17\xfa\xb0\x6d\x91\x7c\x73\xd9\xe4\x40\x1c\xe2\xc5\
+\x59\xf3\x7c\x82\x37\x4d\x05\x93\xfe\x24\x82\x0b\xb8\xd1\x94\xef\
+\x20\x49\xb9\x83\x6e\x2a\xb5\x4e\x0a\x8c\x1a\xf1\xfc\x14\xd3\x1f\
+\xc8\x9f\x54\x04\x80\x1b\xb8\x0a\xae\x75\xb1\x24\x37\x14\xef\x1f\
+\x17\xe8\x47\x1c\xce\x19\xb7\xa3\xa6\x22\x72\xfb\x0b\x5d\x67\xe1\
+\xdc\x28\x75\x5b\x49\x3c\xc7\x49\xd7\x17\xed\x1f\x17\x18\x2d\xe2\
+\x98\x73\xf1\x0b\xf2\xa6\x2c\x02\x08\x52\x8c\xa9\x70\xa7\xa9\x71\
+\x31\x8e\xad\x74\x6d\xe1\xfe\x51\x40\x3b\xfa\x71\xba\x99\xd1\xbf\
+\x3e\xed\x1f\xdc\xb8\x05\x70\x6a\xe5\xda\xcd\x24\x34\xd8\xe9\x9a\
+\x82\x7d\xa3\x80\x76\xf4\x23\x0e\xf1\xd3\x13\xe1\x0e\x68\xc7\xcb\
+\xa2\xb4\x5e\x9f\xaa\xca\xc9\x3a\xbf\x2a\x9f\x03\x5b\x47\x3b\xfa\
+\x85\x29\xc6\xe7\x03\xfe\xeb\x80\xbb\x87\xd9\x69\xdf\x48\x4a\x36\
+\xd2\x9d\x5a\x3b\x5d\x91\xbb\x8f\x03\x5f\x67\x27\xb4\xf3\xdf\x34\
+\x7f\x89\xb8\x00\x45\xb8\x5b\xe0\x09\x61\x6a\xf7\x01\x79\xb9\x93\
+\x1d\xc1\x65\xd9\xfb\xd8\x12\x75\xb4\xa3\x1f\x71\x33\x12\x81\x4b\
+\xc6\xed\x27\xe2\xa2\x11\xba\xbd\xcc\x0e\x11\xb6\x14\x17\x0e\x13\
+\xda\xd1\x3f\x53\x11\xee\xbd\x81\x6b\xa9\xc1\xce\xae\x05\x4a\x61\
+\xaa\xe5\xe0\x7f\xef\xc5\xac\x88\xf0\x78\x74\x12\xe3\xfa\x5d\xb8\
+\xc7\xb9\x11\x15\x0c\x1d\x47\x7d\xc6\xff\x19\x47\xdf\x02\xc6\x44\
+\xb8\x17\x69\xf7\x11\x4a\xd4\x67\x5d\x04\x60\xdc\x3b\x05\x69\xbd\
+\xc7\x51\xa2\x3e\xcb\x22\xdc\x68\x22\x19\x10\xca\x59\x16\x19\x7d\
+\x79\x4e\x37\xe7\x5f\x35\xb3\x3e\x1a\x02\x30\x61\xdc\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\xb8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x1a\x00\x00\x00\x1a\x08\x04\x00\x00\x00\x03\x43\x84\x45\
+\x00\x00\x02\x7f\x49\x44\x41\x54\x78\x01\x8d\x54\x33\x78\x24\x01\
+\x14\xde\x3d\xdb\xdd\xa1\x3c\x57\x29\xcf\xaa\x4e\x5d\xda\x53\x95\
+\x3a\x6f\x62\x9b\x93\x3d\xc6\xb6\xad\xd9\xc3\xac\xe2\x2c\x63\x4f\
+\xce\xb6\x31\xef\xde\x3a\x4e\xbe\xbf\x79\xef\xd7\x78\x24\x38\x0f\
+\x7c\xa4\x3e\xd2\xf9\xb4\x79\xe8\xe2\x7d\x1d\xfe\x1d\xfe\xc5\xfb\
+\x96\x1c\x62\xd7\xf3\x57\x27\xee\xbd\x22\x4c\xdc\xe3\xaf\xb2\xeb\
+\x97\x10\xaa\x3e\xd9\x1b\x4d\x01\x07\x7a\xa3\xab\x4f\x2e\x18\xca\
+\xdd\xd5\x0a\x2f\xc8\x38\x1d\x2f\xee\xb5\x42\xee\xae\x39\x43\x71\
+\xab\xe4\xae\xa3\xb7\xed\xc6\x97\x99\xc2\xa0\x30\xf8\x32\xd3\xbe\
+\x8f\xde\x96\xbb\xc6\xad\x9a\x11\xaa\x70\xd1\x87\x39\xbb\x9f\xf0\
+\xe3\x3f\xc7\x70\x0c\xc7\x7f\x3e\xe1\x9d\xac\x3e\xac\xc2\xc5\x11\
+\x4a\xd9\xa1\x76\x7b\x92\x68\x97\x9e\x97\x4c\xbc\xa0\x80\x03\x13\
+\x2f\x9e\x97\x38\xca\x12\xd5\x6e\x29\x3b\x28\xd4\x70\x61\x90\x75\
+\x9c\x54\xea\xa4\x61\xec\x1f\x59\xa7\xe3\xdf\xa4\xe1\x65\xaa\xdd\
+\x33\xc8\x36\x5c\x90\xf8\xb5\xb6\xd9\x88\xa7\x4d\xe3\x5f\xc8\x32\
+\x27\xc6\xbf\x3c\x6d\xb2\xba\xda\x52\xfd\x5a\x25\xee\x97\x99\x21\
+\xb6\x5c\x28\x10\x04\x12\x17\x84\x20\x08\x05\x6c\x39\x33\xe4\x7e\
+\x99\xae\x49\xb6\x85\x55\x86\x89\x72\xa2\x17\x86\x1c\xc3\x44\x56\
+\x29\xdb\x42\xd7\xa4\x3b\xa9\xed\xd7\xe2\x23\x8c\xc6\xbb\xa8\x9f\
+\x37\xa0\x27\x35\x9a\x5c\x5a\xd4\xf6\xeb\x4e\x4a\xc2\xd4\x9a\xb7\
+\x34\x62\x37\x96\x62\x30\x96\xe0\xf0\xcc\x00\x31\x25\xa4\x94\x92\
+\x43\x4b\xd0\xbc\x0d\x53\x9b\xaf\xc9\x94\xa9\xea\x16\xcd\x44\x1b\
+\x26\x62\x14\x2a\xa7\x45\x94\xc4\x24\x92\x62\x29\x16\x33\x55\x8c\
+\xc9\x72\x4d\x91\x9b\xa3\xf8\x88\x7f\x9c\x99\x26\x34\x63\x38\xa6\
+\x61\xaf\x25\xd0\x4b\x53\x38\x31\x56\x85\xc3\x08\x31\x5a\x9d\xb0\
+\x8d\xae\x89\x3b\xca\x99\x38\xac\x20\x31\xc9\xde\x87\x79\x18\x82\
+\xd5\x84\x10\x9a\xac\x27\xd5\x46\x6a\x38\xb9\x38\xe4\x86\xb8\x73\
+\x92\x20\x55\xed\x2b\x1a\xa9\x2f\x93\xce\xbc\xcc\xd6\xaa\x46\x19\
+\x41\x6d\xdb\xca\x48\xc9\x24\x07\x47\xa8\x7b\x17\xa2\x92\xc0\x65\
+\xa6\xf7\xb6\xb2\xf9\x9f\x99\xa8\xc7\x04\x8c\x45\x9e\x6c\x4e\xf0\
+\xc4\x24\x90\xc2\x99\x21\x26\xaa\x19\x03\x98\xaf\x09\xd6\x43\x8c\
+\x97\xa9\xb8\x9f\x48\x42\x31\x86\x52\x6b\x97\x25\xd0\x45\x53\x28\
+\x31\x56\xa5\x6c\xc4\x5b\x0b\x31\xb0\xde\xf1\x96\xc3\x61\x50\x86\
+\x2b\x1b\x3e\x5b\x4f\x34\x99\xac\x75\x84\x50\x9a\xac\x27\xd5\xf8\
+\x2d\x4a\x01\x3c\x1c\x9e\xf1\x3d\x81\x14\x6e\x30\xfd\xa9\xad\xd6\
+\xd6\x1a\x8c\x26\xd4\xa0\x75\xcb\xec\xf0\x30\xc1\x0d\x90\xce\xf9\
+\xe5\xc2\x76\xc8\xf0\xed\xaa\x14\xc8\xe8\x40\xf5\x33\xff\x36\xc8\
+\x80\xed\x0b\xfe\x23\xe0\x18\xa3\x8d\xe3\x9b\x7e\x5a\x4e\xf4\x8f\
+\x4c\xc1\x74\xc2\xb1\x25\xfc\x8d\x60\x05\x78\x7a\xf4\xe5\x6a\x0b\
+\x4c\x9e\x46\xf0\x84\x15\x4b\xfe\xef\xc1\x1e\xa8\x86\x2a\xd8\x33\
+\xb7\xfa\x1f\x36\x29\xa2\x07\xd2\xdd\x1d\x8e\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x1b\x4e\
+\x2f\
+\x2f\x20\x41\x66\x66\x69\x63\x68\x61\x67\x65\x20\x73\x75\x72\x20\
+\x6c\x61\x20\x63\x61\x72\x74\x65\x20\x4c\x65\x61\x66\x6c\x65\x74\
+\x20\x64\x65\x73\x20\x6d\x69\x73\x73\x69\x6f\x6e\x73\x20\x63\x61\
+\x6c\x63\x75\x6c\xc3\xa9\x65\x73\x20\x63\xc3\xb4\x74\xc3\xa9\x20\
+\x50\x79\x74\x68\x6f\x6e\x20\x28\x42\x72\x69\x64\x67\x65\x29\x2e\
+\x0a\x2f\x2f\x20\x4c\x65\x73\x20\x77\x61\x79\x70\x6f\x69\x6e\x74\
+\x73\x20\x61\x72\x72\x69\x76\x65\x6e\x74\x20\x70\x61\x72\x20\x6c\
+\x65\x20\x51\x57\x65\x62\x43\x68\x61\x6e\x6e\x65\x6c\x20\x73\x6f\
+\x75\x73\x20\x66\x6f\x72\x6d\x65\x20\x62\x69\x6e\x61\x69\x72\x65\
+\x20\x3a\x20\x66\x6c\x6f\x74\x74\x61\x6e\x74\x73\x20\x36\x34\x20\
+\x62\x69\x74\x73\x0a\x2f\x2f\x20\x6c\x69\x74\x74\x6c\x65\x2d\x65\
+\x6e\x64\x69\x61\x6e\x20\x5b\x6c\x61\x74\x30\x2c\x20\x6c\x6f\x6e\
+\x30\x2c\x20\x6c\x61\x74\x31\x2c\x20\x6c\x6f\x6e\x31\x2c\x20\x2e\
+\x2e\x2e\x5d\x20\x65\x6e\x63\x6f\x64\xc3\xa9\x73\x20\x65\x6e\x20\
+\x62\x61\x73\x65\x36\x34\x20\x28\x6d\x69\x73\x73\x69\x6f\x6e\x5f\
+\x63\x6f\x72\x65\x2e\x70\x61\x63\x6b\x5f\x63\x6f\x6f\x72\x64\x69\
+\x6e\x61\x74\x65\x73\x29\x2e\x0a\x2f\x2f\x0a\x2f\x2f\x20\x4c\x61\
+\x20\x6d\x69\x73\x73\x69\x6f\x6e\x20\x65\x73\x74\x20\x64\x65\x73\
+\x73\x69\x6e\xc3\xa9\x65\x20\x73\x75\x72\x20\x75\x6e\x20\x75\x6e\
+\x69\x71\x75\x65\x20\x63\x61\x6e\x76\x61\x73\x20\x28\x4d\x69\x73\
+\x73\x69\x6f\x6e\x4c\x61\x79\x65\x72\x29\x20\x65\x74\x20\x6e\x6f\
+\x6e\x20\x61\x76\x65\x63\x20\x75\x6e\x20\x6d\x61\x72\x71\x75\x65\
+\x75\x72\x20\x4c\x65\x61\x66\x6c\x65\x74\x0a\x2f\x2f\x20\x70\x61\
+\x72\x20\x77\x61\x79\x70\x6f\x69\x6e\x74\x20\x3a\x20\xc3\xa0\x20\
+\x63\x68\x61\x71\x75\x65\x20\x64\xc3\xa9\x70\x6c\x61\x63\x65\x6d\
+\x65\x6e\x74\x20\x64\x65\x20\x6c\x61\x20\x63\x61\x72\x74\x65\x2c\
+\x20\x73\x65\x75\x6c\x73\x20\x6c\x65\x73\x20\x70\x6f\x69\x6e\x74\
+\x73\x20\x76\x69\x73\x69\x62\x6c\x65\x73\x20\x73\x6f\x6e\x74\x20\
+\x64\x65\x73\x73\x69\x6e\xc3\xa9\x73\x2c\x20\x61\x75\x0a\x2f\x2f\
+\x20\x70\x6c\x75\x73\x20\x75\x6e\x20\x70\x61\x72\x20\x63\x65\x6c\
+\x6c\x75\x6c\x65\x20\x64\x65\x20\x6c\x61\x20\x74\x61\x69\x6c\x6c\
+\x65\x20\x64\x27\x75\x6e\x20\x70\x6f\x69\x6e\x74\x20\x28\x64\xc3\
+\xa9\x63\x69\x6d\x61\x74\x69\x6f\x6e\x20\x73\x65\x6c\x6f\x6e\x20\
+\x6c\x65\x20\x7a\x6f\x6f\x6d\x29\x2c\x20\x65\x74\x20\x6c\x61\x20\
+\x74\x72\x61\x6a\x65\x63\x74\x6f\x69\x72\x65\x0a\x2f\x2f\x20\x6e\
+\x27\x65\x73\x74\x20\x74\x72\x61\x63\xc3\xa9\x65\x20\x71\x75\x27\
+\x65\x6e\x74\x72\x65\x20\x70\x6f\x69\x6e\x74\x73\x20\x64\x69\x73\
+\x74\x61\x6e\x74\x73\x20\x64\x27\x61\x75\x20\x6d\x6f\x69\x6e\x73\
+\x20\x75\x6e\x20\x70\x69\x78\x65\x6c\x2e\x20\x4c\x65\x73\x20\x70\
+\x6f\x70\x75\x70\x73\x20\x6e\x65\x20\x73\x6f\x6e\x74\x20\x63\x72\
+\xc3\xa9\xc3\xa9\x65\x73\x20\x71\x75\x27\x61\x75\x0a\x2f\x2f\x20\
+\x63\x6c\x69\x63\x2c\x20\x70\x6f\x75\x72\x20\x6c\x65\x20\x77\x61\
+\x79\x70\x6f\x69\x6e\x74\x20\x6c\x65\x20\x70\x6c\x75\x73\x20\x70\
+\x72\x6f\x63\x68\x65\x2e\x0a\x0a\x66\x75\x6e\x63\x74\x69\x6f\x6e\
+\x20\x64\x65\x63\x6f\x64\x65\x57\x61\x79\x70\x6f\x69\x6e\x74\x73\
+\x28\x64\x61\x74\x61\x29\x20\x7b\x0a\x20\x20\x20\x20\x76\x61\x72\
+\x20\x62\x69\x6e\x61\x72\x79\x20\x3d\x20\x61\x74\x6f\x62\x28\x64\
+\x61\x74\x61\x29\x3b\x0a\x20\x20\x20\x20\x76\x61\x72\x20\x62\x79\
+\x74\x65\x73\x20\x3d\x20\x6e\x65\x77\x20\x55\x69\x6e\x74\x38\x41\
+\x72\x72\x61\x79\x28\x62\x69\x6e\x61\x72\x79\x2e\x6c\x65\x6e\x67\
+\x74\x68\x29\x3b\x0a\x20\x20\x20\x20\x66\x6f\x72\x20\x28\x76\x61\
+\x72\x20\x69\x20\x3d\x20\x30\x3b\x20\x69\x20\x3c\x20\x62\x69\x6e\
+\x61\x72\x79\x2e\x6c\x65\x6e\x67\x74\x68\x3b\x20\x69\x2b\x2b\x29\
+\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x62\x79\x74\x65\x73\
+\x5b\x69\x5d\x20\x3d\x20\x62\x69\x6e\x61\x72\x79\x2e\x63\x68\x61\
+\x72\x43\x6f\x64\x65\x41\x74\x28\x69\x29\x3b\x0a\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x72\x65\x74\x75\x72\x6e\x20\x6e\x65\x77\
+\x20\x46\x6c\x6f\x61\x74\x36\x34\x41\x72\x72\x61\x79\x28\x62\x79\
+\x74\x65\x73\x2e\x62\x75\x66\x66\x65\x72\x29\x3b\x0a\x7d\x0a\x0a\
+\x76\x61\x72\x20\x4d\x69\x73\x73\x69\x6f\x6e\x4c\x61\x79\x65\x72\
+\x20\x3d\x20\x4c\x2e\x4c\x61\x79\x65\x72\x2e\x65\x78\x74\x65\x6e\
+\x64\x28\x7b\x0a\x20\x20\x20\x20\x6f\x70\x74\x69\x6f\x6e\x73\x3a\
+\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x27\x72\x65\x64\x27\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x72\x61\x64\x69\x75\x73\x3a\x20\x33\x2c\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x77\x65\x69\x67\x68\x74\x3a\x20\x32\x2c\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x64\x61\x73\x68\x41\x72\x72\x61\x79\
+\x3a\x20\x5b\x35\x2c\x20\x35\x5d\x2c\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x63\x6c\x69\x63\x6b\x54\x6f\x6c\x65\x72\x61\x6e\x63\x65\
+\x3a\x20\x36\x0a\x20\x20\x20\x20\x7d\x2c\x0a\x0a\x20\x20\x20\x20\
+\x69\x6e\x69\x74\x69\x61\x6c\x69\x7a\x65\x3a\x20\x66\x75\x6e\x63\
+\x74\x69\x6f\x6e\x20\x28\x63\x6f\x6f\x72\x64\x73\x2c\x20\x6f\x70\
+\x74\x69\x6f\x6e\x73\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x4c\x2e\x73\x65\x74\x4f\x70\x74\x69\x6f\x6e\x73\x28\x74\x68\
+\x69\x73\x2c\x20\x6f\x70\x74\x69\x6f\x6e\x73\x29\x3b\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x74\x68\x69\x73\x2e\x5f\x63\x6f\x6f\x72\
+\x64\x73\x20\x3d\x20\x63\x6f\x6f\x72\x64\x73\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x74\x68\x69\x73\x2e\x5f\x63\x6f\x75\x6e\x74\
+\x20\x3d\x20\x63\x6f\x6f\x72\x64\x73\x2e\x6c\x65\x6e\x67\x74\x68\
+\x20\x2f\x20\x32\x3b\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x2f\
+\x2f\x20\x50\x72\x6f\x6a\x65\x63\x74\x69\x6f\x6e\x20\x4d\x65\x72\
+\x63\x61\x74\x6f\x72\x20\x6e\x6f\x72\x6d\x61\x6c\x69\x73\xc3\xa9\
+\x65\x20\x5b\x30\x2c\x20\x31\x5d\x2c\x20\x63\x61\x6c\x63\x75\x6c\
+\xc3\xa9\x65\x20\x75\x6e\x65\x20\x73\x65\x75\x6c\x65\x20\x66\x6f\
+\x69\x73\x20\x70\x61\x72\x20\x6d\x69\x73\x73\x69\x6f\x6e\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x74\x68\x69\x73\x2e\x5f\x78\x20\x3d\
+\x20\x6e\x65\x77\x20\x46\x6c\x6f\x61\x74\x36\x34\x41\x72\x72\x61\
+\x79\x28\x74\x68\x69\x73\x2e\x5f\x63\x6f\x75\x6e\x74\x29\x3b\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x74\x68\x69\x73\x2e\x5f\x79\x20\
+\x3d\x20\x6e\x65\x77\x20\x46\x6c\x6f\x61\x74\x36\x34\x41\x72\x72\
+\x61\x79\x28\x74\x68\x69\x73\x2e\x5f\x63\x6f\x75\x6e\x74\x29\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x72\x20\x28\x76\x61\
+\x72\x20\x69\x20\x3d\x20\x30\x3b\x20\x69\x20\x3c\x20\x74\x68\x69\
+\x73\x2e\x5f\x63\x6f\x75\x6e\x74\x3b\x20\x69\x2b\x2b\x29\x20\x7b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x76\x61\x72\
+\x20\x6c\x61\x74\x20\x3d\x20\x4d\x61\x74\x68\x2e\x6d\x61\x78\x28\
+\x4d\x61\x74\x68\x2e\x6d\x69\x6e\x28\x63\x6f\x6f\x72\x64\x73\x5b\
+\x32\x20\x2a\x20\x69\x5d\x2c\x20\x38\x35\x2e\x30\x35\x31\x31\x32\
+\x38\x37\x37\x39\x38\x29\x2c\x20\x2d\x38\x35\x2e\x30\x35\x31\x31\
+\x32\x38\x37\x37\x39\x38\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x76\x61\x72\x20\x73\x69\x6e\x20\x3d\x20\x4d\
+\x61\x74\x68\x2e\x73\x69\x6e\x28\x6c\x61\x74\x20\x2a\x20\x4d\x61\
+\x74\x68\x2e\x50\x49\x20\x2f\x20\x31\x38\x30\x29\x3b\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x74\x68\x69\x73\x2e\x5f\
+\x78\x5b\x69\x5d\x20\x3d\x20\x28\x63\x6f\x6f\x72\x64\x73\x5b\x32\
+\x20\x2a\x20\x69\x20\x2b\x20\x31\x5d\x20\x2b\x20\x31\x38\x30\x29\
+\x20\x2f\x20\x33\x36\x30\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x74\x68\x69\x73\x2e\x5f\x79\x5b\x69\x5d\x20\x3d\
+\x20\x30\x2e\x35\x20\x2d\x20\x4d\x61\x74\x68\x2e\x6c\x6f\x67\x28\
+\x28\x31\x20\x2b\x20\x73\x69\x6e\x29\x20\x2f\x20\x28\x31\x20\x2d\
+\x20\x73\x69\x6e\x29\x29\x20\x2f\x20\x28\x34\x20\x2a\x20\x4d\x61\
+\x74\x68\x2e\x50\x49\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x7d\x2c\x0a\x0a\x20\x20\x20\x20\x6f\x6e\
+\x41\x64\x64\x3a\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x28\x6d\
+\x61\x70\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x68\
+\x69\x73\x2e\x5f\x63\x61\x6e\x76\x61\x73\x20\x3d\x20\x4c\x2e\x44\
+\x6f\x6d\x55\x74\x69\x6c\x2e\x63\x72\x65\x61\x74\x65\x28\x27\x63\
+\x61\x6e\x76\x61\x73\x27\x2c\x20\x27\x6c\x65\x61\x66\x6c\x65\x74\
+\x2d\x7a\x6f\x6f\x6d\x2d\x68\x69\x64\x65\x27\x29\x3b\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x74\x68\x69\x73\x2e\x5f\x63\x61\x6e\x76\
+\x61\x73\x2e\x73\x74\x79\x6c\x65\x2e\x70\x6f\x69\x6e\x74\x65\x72\
+\x45\x76\x65\x6e\x74\x73\x20\x3d\x20\x27\x6e\x6f\x6e\x65\x27\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x68\x69\x73\x2e\x67\x65\
+\x74\x50\x61\x6e\x65\x28\x29\x2e\x61\x70\x70\x65\x6e\x64\x43\x68\
+\x69\x6c\x64\x28\x74\x68\x69\x73\x2e\x5f\x63\x61\x6e\x76\x61\x73\
+\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x68\x69\x73\x2e\
+\x5f\x72\x65\x73\x65\x74\x28\x29\x3b\x0a\x20\x20\x20\x20\x7d\x2c\
+\x0a\x0a\x20\x20\x20\x20\x6f\x6e\x52\x65\x6d\x6f\x76\x65\x3a\x20\
+\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x28\x29\x20\x7b\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x4c\x2e\x44\x6f\x6d\x55\x74\x69\x6c\x2e\
+\x72\x65\x6d\x6f\x76\x65\x28\x74\x68\x69\x73\x2e\x5f\x63\x61\x6e\
+\x76\x61\x73\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x74\x68\
+\x69\x73\x2e\x5f\x63\x61\x6e\x76\x61\x73\x20\x3d\x20\x6e\x75\x6c\
+\x6c\x3b\x0a\x20\x20\x20\x20\x7d\x2c\x0a\x0a\x20\x20\x20\x20\x67\
+\x65\x74\x45\x76\x65\x6e\x74\x73\x3a\x20\x66\x75\x6e\x63\x74\x69\
+\x6f\x6e\x20\x28\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x72\x65\x74\x75\x72\x6e\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x6d\x6f\x76\x65\x65\x6e\x64\x3a\x20\x74\x68\
+\x69\x73\x2e\x5f\x72\x65\x73\x65\x74\x2c\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x72\x65\x73\x69\x7a\x65\x3a\x20\x74\
+\x68\x69\x73\x2e\x5f\x72\x65\x73\x65\x74\x2c\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6c\x69\x63\x6b\x3a\x20\x74\
+\x68\x69\x73\x2e\x5f\x6f\x6e\x43\x6c\x69\x63\x6b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x7d\x3b\x0a\x20\x20\x20\x20\x7d\x2c\x0a\x0a\
+\x20\x20\x20\x20\x2f\x2f\x20\x54\x72\x61\x6e\x73\x66\x6f\x72\x6d\
+\x61\x74\x69\x6f\x6e\x20\x4d\x65\x72\x63\x61\x74\x6f\x72\x20\x6e\
+\x6f\x72\x6d\x61\x6c\x69\x73\xc3\xa9\x20\x2d\x3e\x20\x70\x69\x78\
+\x65\x6c\x73\x20\x64\x75\x20\x63\x6f\x6e\x74\x65\x6e\x65\x75\x72\
+\x20\x61\x75\x20\x7a\x6f\x6f\x6d\x20\x63\x6f\x75\x72\x61\x6e\x74\
+\x0a\x20\x20\x20\x20\x5f\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3a\
+\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x28\x29\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x76\x61\x72\x20\x6d\x61\x70\x20\x3d\
+\x20\x74\x68\x69\x73\x2e\x5f\x6d\x61\x70\x3b\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x76\x61\x72\x20\x73\x63\x61\x6c\x65\x20\x3d\x20\
+\x6d\x61\x70\x2e\x6f\x70\x74\x69\x6f\x6e\x73\x2e\x63\x72\x73\x2e\
+\x73\x63\x61\x6c\x65\x28\x6d\x61\x70\x2e\x67\x65\x74\x5a\x6f\x6f\
+\x6d\x28\x29\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x76\x61\
+\x72\x20\x72\x65\x66\x20\x3d\x20\x6d\x61\x70\x2e\x6c\x61\x74\x4c\
+\x6e\x67\x54\x6f\x43\x6f\x6e\x74\x61\x69\x6e\x65\x72\x50\x6f\x69\
+\x6e\x74\x28\x5b\x74\x68\x69\x73\x2e\x5f\x63\x6f\x6f\x72\x64\x73\
+\x5b\x30\x5d\x2c\x20\x74\x68\x69\x73\x2e\x5f\x63\x6f\x6f\x72\x64\
+\x73\x5b\x31\x5d\x5d\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x72\x65\x74\x75\x72\x6e\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x73\x63\x61\x6c\x65\x3a\x20\x73\x63\x61\x6c\
+\x65\x2c\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\
+\x78\x3a\x20\x72\x65\x66\x2e\x78\x20\x2d\x20\x74\x68\x69\x73\x2e\
+\x5f\x78\x5b\x30\x5d\x20\x2a\x20\x73\x63\x61\x6c\x65\x2c\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x64\x79\x3a\x20\x72\
+\x65\x66\x2e\x79\x20\x2d\x20\x74\x68\x69\x73\x2e\x5f\x79\x5b\x30\
+\x5d\x20\x2a\x20\x73\x63\x61\x6c\x65\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x7d\x3b\x0a\x20\x20\x20\x20\x7d\x2c\x0a\x0a\x20\x20\x20\
+\x20\x2f\x2f\x20\x50\x6f\x73\x69\x74\x69\x6f\x6e\x20\x64\x27\x75\
+\x6e\x20\x70\x6f\x69\x6e\x74\x20\x70\x61\x72\x20\x72\x61\x70\x70\
+\x6f\x72\x74\x20\xc3\xa0\x20\x6c\x27\xc3\xa9\x63\x72\x61\x6e\x20\
+\x28\x43\x6f\x68\x65\x6e\x2d\x53\x75\x74\x68\x65\x72\x6c\x61\x6e\
+\x64\x29\x20\x3a\x20\x30\x20\x73\x69\x20\x76\x69\x73\x69\x62\x6c\
+\x65\x0a\x20\x20\x20\x20\x5f\x6f\x75\x74\x63\x6f\x64\x65\x3a\x20\
+\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x28\x78\x2c\x20\x79\x2c\x20\
+\x73\x69\x7a\x65\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x72\x65\x74\x75\x72\x6e\x20\x28\x78\x20\x3c\x20\x30\x20\x3f\x20\
+\x31\x20\x3a\x20\x30\x29\x20\x7c\x20\x28\x78\x20\x3e\x20\x73\x69\
+\x7a\x65\x2e\x78\x20\x3f\x20\x32\x20\x3a\x20\x30\x29\x20\x7c\x20\
+\x28\x79\x20\x3c\x20\x30\x20\x3f\x20\x34\x20\x3a\x20\x30\x29\x20\
+\x7c\x20\x28\x79\x20\x3e\x20\x73\x69\x7a\x65\x2e\x79\x20\x3f\x20\
+\x38\x20\x3a\x20\x30\x29\x3b\x0a\x20\x20\x20\x20\x7d\x2c\x0a\x0a\
+\x20\x20\x20\x20\x5f\x72\x65\x73\x65\x74\x3a\x20\x66\x75\x6e\x63\
+\x74\x69\x6f\x6e\x20\x28\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x76\x61\x72\x20\x6d\x61\x70\x20\x3d\x20\x74\x68\x69\x73\
+\x2e\x5f\x6d\x61\x70\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x76\
+\x61\x72\x20\x73\x69\x7a\x65\x20\x3d\x20\x6d\x61\x70\x2e\x67\x65\
+\x74\x53\x69\x7a\x65\x28\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x76\x61\x72\x20\x72\x61\x74\x69\x6f\x20\x3d\x20\x77\x69\x6e\
+\x64\x6f\x77\x2e\x64\x65\x76\x69\x63\x65\x50\x69\x78\x65\x6c\x52\
+\x61\x74\x69\x6f\x20\x7c\x7c\x20\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x76\x61\x72\x20\x63\x61\x6e\x76\x61\x73\x20\x3d\x20\
+\x74\x68\x69\x73\x2e\x5f\x63\x61\x6e\x76\x61\x73\x3b\x0a\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x4c\x2e\x44\x6f\x6d\x55\x74\x69\x6c\
+\x2e\x73\x65\x74\x50\x6f\x73\x69\x74\x69\x6f\x6e\x28\x63\x61\x6e\
+\x76\x61\x73\x2c\x20\x6d\x61\x70\x2e\x63\x6f\x6e\x74\x61\x69\x6e\
+\x65\x72\x50\x6f\x69\x6e\x74\x54\x6f\x4c\x61\x79\x65\x72\x50\x6f\
+\x69\x6e\x74\x28\x5b\x30\x2c\x20\x30\x5d\x29\x29\x3b\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x61\x6e\x76\x61\x73\x2e\x77\x69\x64\
+\x74\x68\x20\x3d\x20\x73\x69\x7a\x65\x2e\x78\x20\x2a\x20\x72\x61\
+\x74\x69\x6f\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\x61\x6e\
+\x76\x61\x73\x2e\x68\x65\x69\x67\x68\x74\x20\x3d\x20\x73\x69\x7a\
+\x65\x2e\x79\x20\x2a\x20\x72\x61\x74\x69\x6f\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x63\x61\x6e\x76\x61\x73\x2e\x73\x74\x79\x6c\
+\x65\x2e\x77\x69\x64\x74\x68\x20\x3d\x20\x73\x69\x7a\x65\x2e\x78\
+\x20\x2b\x20\x27\x70\x78\x27\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x63\x61\x6e\x76\x61\x73\x2e\x73\x74\x79\x6c\x65\x2e\x68\x65\
+\x69\x67\x68\x74\x20\x3d\x20\x73\x69\x7a\x65\x2e\x79\x20\x2b\x20\
+\x27\x70\x78\x27\x3b\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x76\
+\x61\x72\x20\x63\x74\x78\x20\x3d\x20\x63\x61\x6e\x76\x61\x73\x2e\
+\x67\x65\x74\x43\x6f\x6e\x74\x65\x78\x74\x28\x27\x32\x64\x27\x29\
+\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\x74\x78\x2e\x73\x65\
+\x74\x54\x72\x61\x6e\x73\x66\x6f\x72\x6d\x28\x72\x61\x74\x69\x6f\
+\x2c\x20\x30\x2c\x20\x30\x2c\x20\x72\x61\x74\x69\x6f\x2c\x20\x30\
+\x2c\x20\x30\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\x74\
+\x78\x2e\x63\x6c\x65\x61\x72\x52\x65\x63\x74\x28\x30\x2c\x20\x30\
+\x2c\x20\x73\x69\x7a\x65\x2e\x78\x2c\x20\x73\x69\x7a\x65\x2e\x79\
+\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x66\x20\x28\x74\
+\x68\x69\x73\x2e\x5f\x63\x6f\x75\x6e\x74\x20\x3d\x3d\x3d\x20\x30\
+\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x72\x65\x74\x75\x72\x6e\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x76\x61\x72\x20\x74\x20\
+\x3d\x20\x74\x68\x69\x73\x2e\x5f\x74\x72\x61\x6e\x73\x66\x6f\x72\
+\x6d\x28\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x76\x61\x72\
+\x20\x6f\x20\x3d\x20\x74\x68\x69\x73\x2e\x6f\x70\x74\x69\x6f\x6e\
+\x73\x3b\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x2f\x2f\x20\x54\
+\x72\x61\x6a\x65\x63\x74\x6f\x69\x72\x65\x20\x3a\x20\x75\x6e\x20\
+\x73\x6f\x6d\x6d\x65\x74\x20\x6e\x27\x65\x73\x74\x20\x74\x72\x61\
+\x63\xc3\xa9\x20\x71\x75\x65\x20\x73\x27\x69\x6c\x20\x73\x27\xc3\
+\xa9\x63\x61\x72\x74\x65\x20\x64\x27\x61\x75\x20\x6d\x6f\x69\x6e\
+\x73\x20\x31\x20\x70\x78\x20\x64\x75\x20\x70\x72\xc3\xa9\x63\xc3\
+\xa9\x64\x65\x6e\x74\x20\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x2f\x2f\x20\x6c\x65\x73\x20\x73\x65\x67\x6d\x65\x6e\x74\x73\x20\
+\x65\x6e\x74\x69\xc3\xa8\x72\x65\x6d\x65\x6e\x74\x20\x64\x27\x75\
+\x6e\x20\x6d\xc3\xaa\x6d\x65\x20\x63\xc3\xb4\x74\xc3\xa9\x20\x68\
+\x6f\x72\x73\x20\x64\x65\x20\x6c\x27\xc3\xa9\x63\x72\x61\x6e\x20\
+\x73\x6f\x6e\x74\x20\x73\x61\x75\x74\xc3\xa9\x73\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x63\x74\x78\x2e\x62\x65\x67\x69\x6e\x50\x61\
+\x74\x68\x28\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x76\x61\
+\x72\x20\x6c\x61\x73\x74\x58\x20\x3d\x20\x74\x68\x69\x73\x2e\x5f\
+\x78\x5b\x30\x5d\x20\x2a\x20\x74\x2e\x73\x63\x61\x6c\x65\x20\x2b\
+\x20\x74\x2e\x64\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x76\
+\x61\x72\x20\x6c\x61\x73\x74\x59\x20\x3d\x20\x74\x68\x69\x73\x2e\
+\x5f\x79\x5b\x30\x5d\x20\x2a\x20\x74\x2e\x73\x63\x61\x6c\x65\x20\
+\x2b\x20\x74\x2e\x64\x79\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x76\x61\x72\x20\x6c\x61\x73\x74\x43\x6f\x64\x65\x20\x3d\x20\x74\
+\x68\x69\x73\x2e\x5f\x6f\x75\x74\x63\x6f\x64\x65\x28\x6c\x61\x73\
+\x74\x58\x2c\x20\x6c\x61\x73\x74\x59\x2c\x20\x73\x69\x7a\x65\x29\
+\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\x74\x78\x2e\x6d\x6f\
+\x76\x65\x54\x6f\x28\x6c\x61\x73\x74\x58\x2c\x20\x6c\x61\x73\x74\
+\x59\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x72\x20\
+\x28\x76\x61\x72\x20\x69\x20\x3d\x20\x31\x3b\x20\x69\x20\x3c\x20\
+\x74\x68\x69\x73\x2e\x5f\x63\x6f\x75\x6e\x74\x3b\x20\x69\x2b\x2b\
+\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x76\x61\x72\x20\x70\x78\x20\x3d\x20\x74\x68\x69\x73\x2e\x5f\x78\
+\x5b\x69\x5d\x20\x2a\x20\x74\x2e\x73\x63\x61\x6c\x65\x20\x2b\x20\
+\x74\x2e\x64\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x76\x61\x72\x20\x70\x79\x20\x3d\x20\x74\x68\x69\x73\x2e\
+\x5f\x79\x5b\x69\x5d\x20\x2a\x20\x74\x2e\x73\x63\x61\x6c\x65\x20\
+\x2b\x20\x74\x2e\x64\x79\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x69\x66\x20\x28\x4d\x61\x74\x68\x2e\x61\x62\x73\
+\x28\x70\x78\x20\x2d\x20\x6c\x61\x73\x74\x58\x29\x20\x3c\x20\x31\
+\x20\x26\x26\x20\x4d\x61\x74\x68\x2e\x61\x62\x73\x28\x70\x79\x20\
+\x2d\x20\x6c\x61\x73\x74\x59\x29\x20\x3c\x20\x31\x20\x26\x26\x20\
+\x69\x20\x21\x3d\x3d\x20\x74\x68\x69\x73\x2e\x5f\x63\x6f\x75\x6e\
+\x74\x20\x2d\x20\x31\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6e\x74\x69\x6e\x75\
+\x65\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7d\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x76\x61\x72\
+\x20\x63\x6f\x64\x65\x20\x3d\x20\x74\x68\x69\x73\x2e\x5f\x6f\x75\
+\x74\x63\x6f\x64\x65\x28\x70\x78\x2c\x20\x70\x79\x2c\x20\x73\x69\
+\x7a\x65\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x69\x66\x20\x28\x63\x6f\x64\x65\x20\x26\x20\x6c\x61\x73\x74\
+\x43\x6f\x64\x65\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x63\x74\x78\x2e\x6d\x6f\x76\x65\
+\x54\x6f\x28\x70\x78\x2c\x20\x70\x79\x29\x3b\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x20\x65\x6c\x73\x65\x20\x7b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x63\x74\x78\x2e\x6c\x69\x6e\x65\x54\x6f\x28\x70\x78\x2c\x20\
+\x70\x79\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x6c\
+\x61\x73\x74\x58\x20\x3d\x20\x70\x78\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x6c\x61\x73\x74\x59\x20\x3d\x20\x70\
+\x79\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x6c\
+\x61\x73\x74\x43\x6f\x64\x65\x20\x3d\x20\x63\x6f\x64\x65\x3b\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x63\x74\x78\x2e\x73\x74\x72\x6f\x6b\x65\x53\x74\x79\x6c\
+\x65\x20\x3d\x20\x6f\x2e\x63\x6f\x6c\x6f\x72\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x63\x74\x78\x2e\x6c\x69\x6e\x65\x57\x69\x64\
+\x74\x68\x20\x3d\x20\x6f\x2e\x77\x65\x69\x67\x68\x74\x3b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x63\x74\x78\x2e\x73\x65\x74\x4c\x69\
+\x6e\x65\x44\x61\x73\x68\x28\x6f\x2e\x64\x61\x73\x68\x41\x72\x72\
+\x61\x79\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\x74\x78\
+\x2e\x73\x74\x72\x6f\x6b\x65\x28\x29\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x63\x74\x78\x2e\x73\x65\x74\x4c\x69\x6e\x65\x44\x61\
+\x73\x68\x28\x5b\x5d\x29\x3b\x0a\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x2f\x2f\x20\x57\x61\x79\x70\x6f\x69\x6e\x74\x73\x20\x76\x69\
+\x73\x69\x62\x6c\x65\x73\x2c\x20\x61\x75\x20\x70\x6c\x75\x73\x20\
+\x75\x6e\x20\x70\x61\x72\x20\x63\x65\x6c\x6c\x75\x6c\x65\x20\x64\
+\x65\x20\x6c\x61\x20\x74\x61\x69\x6c\x6c\x65\x20\x64\x27\x75\x6e\
+\x20\x70\x6f\x69\x6e\x74\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x76\
+\x61\x72\x20\x63\x65\x6c\x6c\x20\x3d\x20\x32\x20\x2a\x20\x6f\x2e\
+\x72\x61\x64\x69\x75\x73\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x76\x61\x72\x20\x63\x6f\x6c\x73\x20\x3d\x20\x4d\x61\x74\x68\x2e\
+\x63\x65\x69\x6c\x28\x73\x69\x7a\x65\x2e\x78\x20\x2f\x20\x63\x65\
+\x6c\x6c\x29\x20\x2b\x20\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x76\x61\x72\x20\x72\x6f\x77\x73\x20\x3d\x20\x4d\x61\x74\x68\
+\x2e\x63\x65\x69\x6c\x28\x73\x69\x7a\x65\x2e\x79\x20\x2f\x20\x63\
+\x65\x6c\x6c\x29\x20\x2b\x20\x31\x3b\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x76\x61\x72\x20\x6f\x63\x63\x75\x70\x69\x65\x64\x20\x3d\
+\x20\x6e\x65\x77\x20\x55\x69\x6e\x74\x38\x41\x72\x72\x61\x79\x28\
+\x63\x6f\x6c\x73\x20\x2a\x20\x72\x6f\x77\x73\x29\x3b\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x74\x78\x2e\x62\x65\x67\x69\x6e\x50\
+\x61\x74\x68\x28\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x66\
+\x6f\x72\x20\x28\x76\x61\x72\x20\x6a\x20\x3d\x20\x30\x3b\x20\x6a\
+\x20\x3c\x20\x74\x68\x69\x73\x2e\x5f\x63\x6f\x75\x6e\x74\x3b\x20\
+\x6a\x2b\x2b\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x76\x61\x72\x20\x78\x20\x3d\x20\x74\x68\x69\x73\x2e\
+\x5f\x78\x5b\x6a\x5d\x20\x2a\x20\x74\x2e\x73\x63\x61\x6c\x65\x20\
+\x2b\x20\x74\x2e\x64\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x76\x61\x72\x20\x79\x20\x3d\x20\x74\x68\x69\x73\
+\x2e\x5f\x79\x5b\x6a\x5d\x20\x2a\x20\x74\x2e\x73\x63\x61\x6c\x65\
+\x20\x2b\x20\x74\x2e\x64\x79\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x69\x66\x20\x28\x78\x20\x3c\x20\x2d\x6f\x2e\
+\x72\x61\x64\x69\x75\x73\x20\x7c\x7c\x20\x79\x20\x3c\x20\x2d\x6f\
+\x2e\x72\x61\x64\x69\x75\x73\x20\x7c\x7c\x20\x78\x20\x3e\x20\x73\
+\x69\x7a\x65\x2e\x78\x20\x2b\x20\x6f\x2e\x72\x61\x64\x69\x75\x73\
+\x20\x7c\x7c\x20\x79\x20\x3e\x20\x73\x69\x7a\x65\x2e\x79\x20\x2b\
+\x20\x6f\x2e\x72\x61\x64\x69\x75\x73\x29\x20\x7b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x63\x6f\x6e\
+\x74\x69\x6e\x75\x65\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x76\x61\x72\x20\x6b\x20\x3d\x20\x4d\x61\x74\x68\x2e\x66\x6c\
+\x6f\x6f\x72\x28\x28\x79\x20\x2b\x20\x6f\x2e\x72\x61\x64\x69\x75\
+\x73\x29\x20\x2f\x20\x63\x65\x6c\x6c\x29\x20\x2a\x20\x63\x6f\x6c\
+\x73\x20\x2b\x20\x4d\x61\x74\x68\x2e\x66\x6c\x6f\x6f\x72\x28\x28\
+\x78\x20\x2b\x20\x6f\x2e\x72\x61\x64\x69\x75\x73\x29\x20\x2f\x20\
+\x63\x65\x6c\x6c\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x69\x66\x20\x28\x6f\x63\x63\x75\x70\x69\x65\x64\x5b\
+\x6b\x5d\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x63\x6f\x6e\x74\x69\x6e\x75\x65\x3b\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x6f\x63\x63\x75\x70\x69\
+\x65\x64\x5b\x6b\x5d\x20\x3d\x20\x31\x3b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x63\x74\x78\x2e\x6d\x6f\x76\x65\x54\
+\x6f\x28\x78\x20\x2b\x20\x6f\x2e\x72\x61\x64\x69\x75\x73\x2c\x20\
+\x79\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x63\x74\x78\x2e\x61\x72\x63\x28\x78\x2c\x20\x79\x2c\x20\x6f\x2e\
+\x72\x61\x64\x69\x75\x73\x2c\x20\x30\x2c\x20\x32\x20\x2a\x20\x4d\
+\x61\x74\x68\x2e\x50\x49\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\x74\x78\x2e\x66\
+\x69\x6c\x6c\x53\x74\x79\x6c\x65\x20\x3d\x20\x6f\x2e\x63\x6f\x6c\
+\x6f\x72\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\x74\x78\x2e\
+\x67\x6c\x6f\x62\x61\x6c\x41\x6c\x70\x68\x61\x20\x3d\x20\x30\x2e\
+\x38\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\x74\x78\x2e\x66\
+\x69\x6c\x6c\x28\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x63\
+\x74\x78\x2e\x67\x6c\x6f\x62\x61\x6c\x41\x6c\x70\x68\x61\x20\x3d\
+\x20\x31\x3b\x0a\x20\x20\x20\x20\x7d\x2c\x0a\x0a\x20\x20\x20\x20\
+\x2f\x2f\x20\x50\x6f\x70\x75\x70\x20\x63\x72\xc3\xa9\xc3\xa9\x65\
+\x20\xc3\xa0\x20\x6c\x61\x20\x64\x65\x6d\x61\x6e\x64\x65\x20\x70\
+\x6f\x75\x72\x20\x6c\x65\x20\x77\x61\x79\x70\x6f\x69\x6e\x74\x20\
+\x6c\x65\x20\x70\x6c\x75\x73\x20\x70\x72\x6f\x63\x68\x65\x20\x64\
+\x75\x20\x63\x6c\x69\x63\x0a\x20\x20\x20\x20\x5f\x6f\x6e\x43\x6c\
+\x69\x63\x6b\x3a\x20\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x28\x65\
+\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x69\x66\x20\x28\
+\x74\x68\x69\x73\x2e\x5f\x63\x6f\x75\x6e\x74\x20\x3d\x3d\x3d\x20\
+\x30\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x72\x65\x74\x75\x72\x6e\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x76\x61\x72\x20\x74\
+\x20\x3d\x20\x74\x68\x69\x73\x2e\x5f\x74\x72\x61\x6e\x73\x66\x6f\
+\x72\x6d\x28\x29\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x76\x61\
+\x72\x20\x62\x65\x73\x74\x20\x3d\x20\x2d\x31\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x76\x61\x72\x20\x62\x65\x73\x74\x44\x69\x73\
+\x74\x20\x3d\x20\x74\x68\x69\x73\x2e\x6f\x70\x74\x69\x6f\x6e\x73\
+\x2e\x63\x6c\x69\x63\x6b\x54\x6f\x6c\x65\x72\x61\x6e\x63\x65\x20\
+\x2a\x20\x74\x68\x69\x73\x2e\x6f\x70\x74\x69\x6f\x6e\x73\x2e\x63\
+\x6c\x69\x63\x6b\x54\x6f\x6c\x65\x72\x61\x6e\x63\x65\x3b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x66\x6f\x72\x20\x28\x76\x61\x72\x20\
+\x69\x20\x3d\x20\x30\x3b\x20\x69\x20\x3c\x20\x74\x68\x69\x73\x2e\
+\x5f\x63\x6f\x75\x6e\x74\x3b\x20\x69\x2b\x2b\x29\x20\x7b\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x76\x61\x72\x20\x64\
+\x78\x20\x3d\x20\x74\x68\x69\x73\x2e\x5f\x78\x5b\x69\x5d\x20\x2a\
+\x20\x74\x2e\x73\x63\x61\x6c\x65\x20\x2b\x20\x74\x2e\x64\x78\x20\
+\x2d\x20\x65\x2e\x63\x6f\x6e\x74\x61\x69\x6e\x65\x72\x50\x6f\x69\
+\x6e\x74\x2e\x78\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x76\x61\x72\x20\x64\x79\x20\x3d\x20\x74\x68\x69\x73\x2e\
+\x5f\x79\x5b\x69\x5d\x20\x2a\x20\x74\x2e\x73\x63\x61\x6c\x65\x20\
+\x2b\x20\x74\x2e\x64\x79\x20\x2d\x20\x65\x2e\x63\x6f\x6e\x74\x61\
+\x69\x6e\x65\x72\x50\x6f\x69\x6e\x74\x2e\x79\x3b\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x76\x61\x72\x20\x64\x69\x73\
+\x74\x20\x3d\x20\x64\x78\x20\x2a\x20\x64\x78\x20\x2b\x20\x64\x79\
+\x20\x2a\x20\x64\x79\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x69\x66\x20\x28\x64\x69\x73\x74\x20\x3c\x3d\x20\x62\
+\x65\x73\x74\x44\x69\x73\x74\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x62\x65\x73\x74\x20\
+\x3d\x20\x69\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x62\x65\x73\x74\x44\x69\x73\x74\x20\x3d\x20\
+\x64\x69\x73\x74\x3b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x7d\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x69\x66\x20\x28\x62\x65\x73\x74\x20\x3e\
+\x3d\x20\x30\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x4c\x2e\x70\x6f\x70\x75\x70\x28\x29\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x73\x65\
+\x74\x4c\x61\x74\x4c\x6e\x67\x28\x5b\x74\x68\x69\x73\x2e\x5f\x63\
+\x6f\x6f\x72\x64\x73\x5b\x32\x20\x2a\x20\x62\x65\x73\x74\x5d\x2c\
+\x20\x74\x68\x69\x73\x2e\x5f\x63\x6f\x6f\x72\x64\x73\x5b\x32\x20\
+\x2a\x20\x62\x65\x73\x74\x20\x2b\x20\x31\x5d\x5d\x29\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x73\
+\x65\x74\x43\x6f\x6e\x74\x65\x6e\x74\x28\x27\x57\x50\x27\x20\x2b\
+\x20\x28\x62\x65\x73\x74\x20\x2b\x20\x31\x29\x29\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x2e\x6f\x70\
+\x65\x6e\x4f\x6e\x28\x74\x68\x69\x73\x2e\x5f\x6d\x61\x70\x29\x3b\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x7d\x0a\x20\x20\x20\x20\x7d\
+\x0a\x7d\x29\x3b\x0a\x0a\x76\x61\x72\x20\x6d\x69\x73\x73\x69\x6f\
+\x6e\x4c\x61\x79\x65\x72\x20\x3d\x20\x6e\x75\x6c\x6c\x3b\x0a\x0a\
+\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x63\x6c\x65\x61\x72\x4d\x69\
+\x73\x73\x69\x6f\x6e\x28\x6d\x61\x70\x29\x20\x7b\x0a\x20\x20\x20\
+\x20\x69\x66\x20\x28\x6d\x69\x73\x73\x69\x6f\x6e\x4c\x61\x79\x65\
+\x72\x29\x20\x7b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x6d\x61\x70\
+\x2e\x72\x65\x6d\x6f\x76\x65\x4c\x61\x79\x65\x72\x28\x6d\x69\x73\
+\x73\x69\x6f\x6e\x4c\x61\x79\x65\x72\x29\x3b\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x6d\x69\x73\x73\x69\x6f\x6e\x4c\x61\x79\x65\x72\
+\x20\x3d\x20\x6e\x75\x6c\x6c\x3b\x0a\x20\x20\x20\x20\x7d\x0a\x7d\
+\x0a\x0a\x66\x75\x6e\x63\x74\x69\x6f\x6e\x20\x73\x68\x6f\x77\x4d\
+\x69\x73\x73\x69\x6f\x6e\x28\x6d\x61\x70\x2c\x20\x64\x61\x74\x61\
+\x29\x20\x7b\x0a\x20\x20\x20\x20\x2f\x2f\x20\x52\x65\x6d\x70\x6c\
+\x61\x63\x65\x72\x20\x6c\x61\x20\x6d\x69\x73\x73\x69\x6f\x6e\x20\
+\x70\x72\xc3\xa9\x63\xc3\xa9\x64\x65\x6e\x74\x65\x0a\x20\x20\x20\
+\x20\x63\x6c\x65\x61\x72\x4d\x69\x73\x73\x69\x6f\x6e\x28\x6d\x61\
+\x70\x29\x3b\x0a\x20\x20\x20\x20\x6d\x69\x73\x73\x69\x6f\x6e\x4c\
+\x61\x79\x65\x72\x20\x3d\x20\x6e\x65\x77\x20\x4d\x69\x73\x73\x69\
+\x6f\x6e\x4c\x61\x79\x65\x72\x28\x64\x65\x63\x6f\x64\x65\x57\x61\
+\x79\x70\x6f\x69\x6e\x74\x73\x28\x64\x61\x74\x61\x29\x29\x2e\x61\
+\x64\x64\x54\x6f\x28\x6d\x61\x70\x29\x3b\x0a\x7d\x0a\
+"
+
+qt_resource_name = b"\
+\x00\x04\
+\x00\x07\x17\xbc\
+\x00\x6b\
+\x00\x61\x00\x65\x00\x6c\
+\x00\x07\
+\x02\xb7\xd2\x24\
+\x00\x6c\
+\x00\x65\x00\x61\x00\x66\x00\x6c\x00\x65\x00\x74\
+\x00\x07\
+\x00\xd7\xa3\xd5\
+\x00\x4c\
+\x00\x49\x00\x43\x00\x45\x00\x4e\x00\x53\x00\x45\
+\x00\x0b\
+\x02\x22\x25\x03\
+\x00\x6c\
+\x00\x65\x00\x61\x00\x66\x00\x6c\x00\x65\x00\x74\x00\x2e\x00\x63\x00\x73\x00\x73\
+\x00\x06\
+\x07\x03\x7d\xc3\
+\x00\x69\
+\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
+\x00\x0a\
+\x0d\x22\x23\xf3\
+\x00\x6c\
+\x00\x65\x00\x61\x00\x66\x00\x6c\x00\x65\x00\x74\x00\x2e\x00\x6a\x00\x73\
+\x00\x11\
+\x02\x11\x4f\xc7\
+\x00\x6d\
+\x00\x61\x00\x72\x00\x6b\x00\x65\x00\x72\x00\x2d\x00\x73\x00\x68\x00\x61\x00\x64\x00\x6f\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\
+\x00\x0d\
+\x05\x84\xc4\xc7\
+\x00\x6c\
+\x00\x61\x00\x79\x00\x65\x00\x72\x00\x73\x00\x2d\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x12\
+\x06\x06\xc4\x47\
+\x00\x6d\
+\x00\x61\x00\x72\x00\x6b\x00\x65\x00\x72\x00\x2d\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2d\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\
+\x00\x67\
+\x00\x0f\
+\x0c\x98\x3e\x87\
+\x00\x6d\
+\x00\x61\x00\x72\x00\x6b\x00\x65\x00\x72\x00\x2d\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0c\x9c\x06\xa7\
+\x00\x6c\
+\x00\x61\x00\x79\x00\x65\x00\x72\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x07\x6c\x2c\x93\
+\x00\x6d\
+\x00\x69\x00\x73\x00\x73\x00\x69\x00\x6f\x00\x6e\x00\x5f\x00\x6d\x00\x61\x00\x70\x00\x2e\x00\x6a\x00\x73\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0c\
+\x00\x00\x00\x0e\x00\x02\x00\x00\x00\x04\x00\x00\x00\x03\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x36\x00\x01\x00\x00\x00\x01\x00\x00\x05\x55\
+\x00\x00\x00\x52\x00\x02\x00\x00\x00\x05\x00\x00\x00\x07\
+\x00\x00\x00\x64\x00\x01\x00\x00\x00\x01\x00\x00\x12\x35\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\xb2\x43\
+\x00\x00\x00\xa6\x00\x00\x00\x00\x00\x01\x00\x00\xb4\xb1\
+\x00\x00\x00\xc6\x00\x00\x00\x00\x00\x01\x00\x00\xb9\xa0\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\xc3\x44\
+\x00\x00\x01\x14\x00\x00\x00\x00\x00\x01\x00\x00\xc9\x02\
+\x00\x00\x01\x2e\x00\x00\x00\x00\x00\x01\x00\x00\xcb\xbe\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0c\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x0e\x00\x02\x00\x00\x00\x04\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1\x48\x1b\x09\x99\
+\x00\x00\x00\x36\x00\x01\x00\x00\x00\x01\x00\x00\x05\x55\
+\x00\x00\x01\xa1\x47\xe6\xaf\x77\
+\x00\x00\x00\x52\x00\x02\x00\x00\x00\x05\x00\x00\x00\x07\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x64\x00\x01\x00\x00\x00\x01\x00\x00\x12\x35\
+\x00\x00\x01\xa1\x48\x1b\x09\x8b\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\xb2\x43\
+\x00\x00\x01\xa1\x47\xe6\xaf\x7f\
+\x00\x00\x00\xa6\x00\x00\x00\x00\x00\x01\x00\x00\xb4\xb1\
+\x00\x00\x01\xa1\x47\xe6\xaf\x79\
+\x00\x00\x00\xc6\x00\x00\x00\x00\x00\x01\x00\x00\xb9\xa0\
+\x00\x00\x01\xa1\x47\xe6\xaf\x7f\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\xc3\x44\
+\x00\x00\x01\xa1\x47\xe6\xaf\x7f\
+\x00\x00\x01\x14\x00\x00\x00\x00\x00\x01\x00\x00\xc9\x02\
+\x00\x00\x01\xa1\x47\xe6\xaf\x7f\
+\x00\x00\x01\x2e\x00\x00\x00\x00\x00\x01\x00\x00\xcb\xbe\
+\x00\x00\x01\xa1\x47\xe9\x18\xc1\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
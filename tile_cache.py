@@ -0,0 +1,253 @@
+"""
+Cache local des tuiles de carte au format MBTiles (SQLite).
+
+Les tuiles OpenStreetMap déjà affichées sont conservées sur disque et resservies sans réseau ;
+la taille du cache est bornée, les tuiles les moins récemment utilisées étant supprimées en
+premier (LRU). La commande prefetch télécharge à l'avance une zone de mission sur une plage
+de niveaux de zoom, pour travailler ensuite hors ligne sur le terrain.
+
+Usage :
+    python tile_cache.py prefetch --bbox 44.80 -0.61 44.82 -0.59 --zoom 12 18
+    python tile_cache.py prefetch --parcels parcelles.geojson --zoom 14 19
+    python tile_cache.py info
+"""
+import os
+import math
+import time
+import sqlite3
+import argparse
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from geocoding import RateLimiter
+
+DEFAULT_TILE_CACHE = os.environ.get(
+    "KAEL_TILE_CACHE", os.path.join(os.path.expanduser("~"), ".kael_tiles.mbtiles")
+)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+TILE_URL = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+USER_AGENT = "Projet_Kael/1.0 (mission drone)"
+
+# ---------------------------
+# Conversions lat/lon <-> tuiles
+# ---------------------------
+def latlon_to_tile(lat, lon, zoom):
+    """Tuile (x, y) contenant le point au niveau de zoom donné (schéma XYZ de Leaflet)"""
+    n = 2 ** zoom
+    lat = max(min(lat, 85.05112878), -85.05112878)
+    x = int((lon + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+def tiles_in_bbox(min_lat, min_lon, max_lat, max_lon, min_zoom, max_zoom):
+    """Énumère les tuiles (z, x, y) couvrant la zone pour chaque niveau de zoom"""
+    for z in range(min_zoom, max_zoom + 1):
+        x0, y0 = latlon_to_tile(max_lat, min_lon, z)
+        x1, y1 = latlon_to_tile(min_lat, max_lon, z)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                yield z, x, y
+
+# ---------------------------
+# Cache MBTiles
+# ---------------------------
+class TileCache:
+    """
+    Cache de tuiles MBTiles avec éviction LRU.
+
+    path : fichier .mbtiles
+    max_bytes : taille maximale des tuiles stockées
+    offline : ne jamais télécharger, servir uniquement depuis le cache
+    tile_url : modèle d'URL du serveur de tuiles
+    """
+
+    # Nombre d'accès mémorisés avant d'écrire les dates d'utilisation dans la base
+    _TOUCH_FLUSH = 256
+
+    def __init__(self, path=DEFAULT_TILE_CACHE, max_bytes=DEFAULT_MAX_BYTES, offline=False,
+                 tile_url=TILE_URL, timeout=10):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.tile_url = tile_url
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._touched = {}
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS tiles (
+                zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB,
+                size INTEGER NOT NULL, last_access REAL NOT NULL,
+                PRIMARY KEY (zoom_level, tile_column, tile_row));
+            CREATE INDEX IF NOT EXISTS tiles_last_access ON tiles (last_access);
+            INSERT OR IGNORE INTO metadata VALUES ('name', 'OpenStreetMap');
+            INSERT OR IGNORE INTO metadata VALUES ('format', 'png');
+            INSERT OR IGNORE INTO metadata VALUES ('type', 'baselayer');
+            INSERT OR IGNORE INTO metadata VALUES ('version', '1');
+        """)
+        self._db.commit()
+        self.total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM tiles").fetchone()[0]
+
+    @staticmethod
+    def _key(z, x, y):
+        # MBTiles stocke les lignes en schéma TMS (axe y inversé)
+        return z, x, (2 ** z - 1) - y
+
+    def lookup(self, z, x, y):
+        """Retourne les octets de la tuile si elle est en cache, sinon None"""
+        key = self._key(z, x, y)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+            if len(self._touched) >= self._TOUCH_FLUSH:
+                self._flush_touched()
+                # Valide tout de suite : une transaction ouverte bloquerait les autres processus
+                self._db.commit()
+        return row[0]
+
+    def store(self, z, x, y, data):
+        key = self._key(z, x, y)
+        with self._lock:
+            old = self._db.execute(
+                "SELECT size FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?", key
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, data, len(data), time.time()),
+            )
+            self.total_bytes += len(data) - (old[0] if old else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+            self._db.commit()
+
+    def download(self, z, x, y):
+        """Télécharge une tuile depuis le serveur (sans passer par le cache)"""
+        url = self.tile_url.format(z=z, x=x, y=y)
+        request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return response.read()
+
+    def get_tile(self, z, x, y):
+        """Tuile depuis le cache, ou téléchargée puis mise en cache. None si indisponible."""
+        data = self.lookup(z, x, y)
+        if data is not None or self.offline:
+            return data
+        try:
+            data = self.download(z, x, y)
+        except OSError as e:
+            print(f"Tuile {z}/{x}/{y} indisponible ({e})")
+            return None
+        self.store(z, x, y, data)
+        return data
+
+    def _flush_touched(self):
+        self._db.executemany(
+            "UPDATE tiles SET last_access = ? WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+            [(t, *key) for key, t in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def _evict(self):
+        """Supprime les tuiles les moins récemment utilisées jusqu'à 90 % de la taille maximale"""
+        self._flush_touched()
+        target = self.max_bytes * 0.9
+        rows = self._db.execute("SELECT rowid, size FROM tiles ORDER BY last_access")
+        evicted = []
+        for rowid, size in rows:
+            if self.total_bytes <= target:
+                break
+            evicted.append((rowid,))
+            self.total_bytes -= size
+        self._db.executemany("DELETE FROM tiles WHERE rowid = ?", evicted)
+
+    def prefetch(self, min_lat, min_lon, max_lat, max_lon, min_zoom, max_zoom,
+                 max_workers=2, rate_limit=10, progress=None):
+        """
+        Télécharge les tuiles manquantes de la zone pour les niveaux min_zoom..max_zoom.
+        Le débit reste limité (politique d'usage des serveurs OpenStreetMap).
+        progress(fait, total) est appelé après chaque tuile. Retourne le nombre de tuiles
+        téléchargées.
+        """
+        tiles = list(tiles_in_bbox(min_lat, min_lon, max_lat, max_lon, min_zoom, max_zoom))
+        missing = [t for t in tiles if self.lookup(*t) is None]
+        limiter = RateLimiter(rate_limit)
+        done = [len(tiles) - len(missing)]
+        fetched = [0]
+
+        def fetch(tile):
+            limiter.wait()
+            try:
+                self.store(*tile, self.download(*tile))
+                fetched[0] += 1
+            except OSError as e:
+                print(f"Tuile {tile[0]}/{tile[1]}/{tile[2]} indisponible ({e})")
+            done[0] += 1
+            if progress:
+                progress(done[0], len(tiles))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(fetch, missing))
+        return fetched[0]
+
+    def close(self):
+        with self._lock:
+            self._flush_touched()
+            self._db.commit()
+        self._db.close()
+
+# ---------------------------
+# Ligne de commande
+# ---------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cache local des tuiles de carte (MBTiles)")
+    parser.add_argument("--cache", default=DEFAULT_TILE_CACHE, help="fichier .mbtiles")
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        help="taille maximale du cache en Mo")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    prefetch = commands.add_parser("prefetch", help="télécharger une zone à l'avance")
+    area = prefetch.add_mutually_exclusive_group(required=True)
+    area.add_argument("--bbox", nargs=4, type=float,
+                      metavar=("MIN_LAT", "MIN_LON", "MAX_LAT", "MAX_LON"))
+    area.add_argument("--parcels", help="fichier GeoJSON ou CSV de parcelles (voir batch_missions.py)")
+    prefetch.add_argument("--zoom", nargs=2, type=int, default=(12, 18), metavar=("MIN", "MAX"))
+    prefetch.add_argument("--margin", type=float, default=0.002,
+                          help="marge autour de la zone, en degrés")
+    commands.add_parser("info", help="afficher le contenu du cache")
+    args = parser.parse_args(argv)
+
+    cache = TileCache(args.cache, max_bytes=int(args.max_mb * 1024 * 1024))
+    if args.command == "prefetch":
+        if args.bbox:
+            min_lat, min_lon, max_lat, max_lon = args.bbox
+        else:
+            from batch_missions import read_parcels
+            points = [p for _, polygon in read_parcels(args.parcels) for p in polygon]
+            min_lat, max_lat = min(p[0] for p in points), max(p[0] for p in points)
+            min_lon, max_lon = min(p[1] for p in points), max(p[1] for p in points)
+
+        def progress(done, total):
+            print(f"\r{done}/{total} tuiles", end="", flush=True)
+
+        fetched = cache.prefetch(min_lat - args.margin, min_lon - args.margin,
+                                 max_lat + args.margin, max_lon + args.margin,
+                                 args.zoom[0], args.zoom[1], progress=progress)
+        print(f"\n{fetched} tuiles téléchargées")
+
+    count = cache._db.execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+    print(f"{args.cache} : {count} tuiles, {cache.total_bytes / 1024 / 1024:.1f} Mo "
+          f"(max {cache.max_bytes / 1024 / 1024:.0f} Mo)")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
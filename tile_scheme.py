@@ -0,0 +1,97 @@
+"""
+Service des tuiles du cache MBTiles (tile_cache.py) à la carte QWebEngineView, via un schéma
+d'URL personnalisé : Leaflet charge kaeltiles:{z}/{x}/{y}.png au lieu de tile.openstreetmap.org.
+
+Les tuiles en cache sont servies immédiatement ; les tuiles manquantes sont téléchargées dans
+un thread de fond puis mises en cache, sans bloquer l'interface.
+
+Utilisation :
+    register_tile_scheme()              # avant la création de QApplication
+    app = QApplication(sys.argv)
+    ...
+    install_tile_cache(view)            # une fois la QWebEngineView créée
+"""
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QBuffer, QByteArray, pyqtSignal
+from PyQt5.QtWebEngineCore import (
+    QWebEngineUrlRequestJob,
+    QWebEngineUrlScheme,
+    QWebEngineUrlSchemeHandler,
+)
+
+from tile_cache import TileCache
+
+TILE_SCHEME = b"kaeltiles"
+TILE_URL_TEMPLATE = "kaeltiles:{z}/{x}/{y}.png"
+
+_TILE_PATH = re.compile(r"^/?(\d+)/(\d+)/(\d+)\.png$")
+
+
+def register_tile_scheme():
+    """Déclare le schéma kaeltiles auprès de QtWebEngine (obligatoire avant QApplication)"""
+    scheme = QWebEngineUrlScheme(TILE_SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Path)
+    scheme.setFlags(QWebEngineUrlScheme.SecureScheme
+                    | QWebEngineUrlScheme.LocalAccessAllowed
+                    | QWebEngineUrlScheme.CorsEnabled)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+class TileSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Répond aux requêtes kaeltiles:{z}/{x}/{y}.png depuis le TileCache"""
+
+    # Réponse d'un téléchargement de fond, renvoyée vers le thread de l'interface
+    _downloaded = pyqtSignal(object, object)
+
+    def __init__(self, cache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self._pending = set()
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._downloaded.connect(self._on_downloaded)
+
+    def requestStarted(self, job):
+        match = _TILE_PATH.match(job.requestUrl().path())
+        if not match:
+            job.fail(QWebEngineUrlRequestJob.UrlInvalid)
+            return
+        z, x, y = (int(v) for v in match.groups())
+
+        data = self.cache.lookup(z, x, y)
+        if data is not None or self.cache.offline:
+            self._reply(job, data)
+            return
+
+        # Tuile absente : téléchargement hors du thread de l'interface
+        self._pending.add(job)
+        job.destroyed.connect(lambda _=None, job=job: self._pending.discard(job))
+        self._executor.submit(self._download, job, z, x, y)
+
+    def _download(self, job, z, x, y):
+        self._downloaded.emit(job, self.cache.get_tile(z, x, y))
+
+    def _on_downloaded(self, job, data):
+        # La requête a pu être annulée (carte déplacée) pendant le téléchargement
+        if job not in self._pending:
+            return
+        self._pending.discard(job)
+        self._reply(job, data)
+
+    def _reply(self, job, data):
+        if data is None:
+            job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+            return
+        buffer = QBuffer(parent=job)
+        buffer.setData(QByteArray(data))
+        job.reply(b"image/png", buffer)
+
+
+def install_tile_cache(view, cache=None):
+    """Installe le gestionnaire de tuiles sur le profil de la vue et retourne le TileCache"""
+    if cache is None:
+        cache = TileCache()
+    handler = TileSchemeHandler(cache, view)
+    view.page().profile().installUrlSchemeHandler(TILE_SCHEME, handler)
+    return cache
@@ -0,0 +1,197 @@
+// Affichage sur la carte Leaflet des missions calculées côté Python (Bridge).
+// Les waypoints arrivent par le QWebChannel sous forme binaire : flottants 64 bits
+// little-endian [lat0, lon0, lat1, lon1, ...] encodés en base64 (mission_core.pack_coordinates).
+//
+// La mission est dessinée sur un unique canvas (MissionLayer) et non avec un marqueur Leaflet
+// par waypoint : à chaque déplacement de la carte, seuls les points visibles sont dessinés, au
+// plus un par cellule de la taille d'un point (décimation selon le zoom), et la trajectoire
+// n'est tracée qu'entre points distants d'au moins un pixel. Les popups ne sont créées qu'au
+// clic, pour le waypoint le plus proche.
+
+function decodeWaypoints(data) {
+    var binary = atob(data);
+    var bytes = new Uint8Array(binary.length);
+    for (var i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return new Float64Array(bytes.buffer);
+}
+
+var MissionLayer = L.Layer.extend({
+    options: {
+        color: 'red',
+        radius: 3,
+        weight: 2,
+        dashArray: [5, 5],
+        clickTolerance: 6
+    },
+
+    initialize: function (coords, options) {
+        L.setOptions(this, options);
+        this._coords = coords;
+        this._count = coords.length / 2;
+
+        // Projection Mercator normalisée [0, 1], calculée une seule fois par mission
+        this._x = new Float64Array(this._count);
+        this._y = new Float64Array(this._count);
+        for (var i = 0; i < this._count; i++) {
+            var lat = Math.max(Math.min(coords[2 * i], 85.0511287798), -85.0511287798);
+            var sin = Math.sin(lat * Math.PI / 180);
+            this._x[i] = (coords[2 * i + 1] + 180) / 360;
+            this._y[i] = 0.5 - Math.log((1 + sin) / (1 - sin)) / (4 * Math.PI);
+        }
+    },
+
+    onAdd: function (map) {
+        this._canvas = L.DomUtil.create('canvas', 'leaflet-zoom-hide');
+        this._canvas.style.pointerEvents = 'none';
+        this.getPane().appendChild(this._canvas);
+        this._reset();
+    },
+
+    onRemove: function () {
+        L.DomUtil.remove(this._canvas);
+        this._canvas = null;
+    },
+
+    getEvents: function () {
+        return {
+            moveend: this._reset,
+            resize: this._reset,
+            click: this._onClick
+        };
+    },
+
+    // Transformation Mercator normalisé -> pixels du conteneur au zoom courant
+    _transform: function () {
+        var map = this._map;
+        var scale = map.options.crs.scale(map.getZoom());
+        var ref = map.latLngToContainerPoint([this._coords[0], this._coords[1]]);
+        return {
+            scale: scale,
+            dx: ref.x - this._x[0] * scale,
+            dy: ref.y - this._y[0] * scale
+        };
+    },
+
+    // Position d'un point par rapport à l'écran (Cohen-Sutherland) : 0 si visible
+    _outcode: function (x, y, size) {
+        return (x < 0 ? 1 : 0) | (x > size.x ? 2 : 0) | (y < 0 ? 4 : 0) | (y > size.y ? 8 : 0);
+    },
+
+    _reset: function () {
+        var map = this._map;
+        var size = map.getSize();
+        var ratio = window.devicePixelRatio || 1;
+        var canvas = this._canvas;
+
+        L.DomUtil.setPosition(canvas, map.containerPointToLayerPoint([0, 0]));
+        canvas.width = size.x * ratio;
+        canvas.height = size.y * ratio;
+        canvas.style.width = size.x + 'px';
+        canvas.style.height = size.y + 'px';
+
+        var ctx = canvas.getContext('2d');
+        ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+        ctx.clearRect(0, 0, size.x, size.y);
+        if (this._count === 0) {
+            return;
+        }
+        var t = this._transform();
+        var o = this.options;
+
+        // Trajectoire : un sommet n'est tracé que s'il s'écarte d'au moins 1 px du précédent ;
+        // les segments entièrement d'un même côté hors de l'écran sont sautés
+        ctx.beginPath();
+        var lastX = this._x[0] * t.scale + t.dx;
+        var lastY = this._y[0] * t.scale + t.dy;
+        var lastCode = this._outcode(lastX, lastY, size);
+        ctx.moveTo(lastX, lastY);
+        for (var i = 1; i < this._count; i++) {
+            var px = this._x[i] * t.scale + t.dx;
+            var py = this._y[i] * t.scale + t.dy;
+            if (Math.abs(px - lastX) < 1 && Math.abs(py - lastY) < 1 && i !== this._count - 1) {
+                continue;
+            }
+            var code = this._outcode(px, py, size);
+            if (code & lastCode) {
+                ctx.moveTo(px, py);
+            } else {
+                ctx.lineTo(px, py);
+            }
+            lastX = px;
+            lastY = py;
+            lastCode = code;
+        }
+        ctx.strokeStyle = o.color;
+        ctx.lineWidth = o.weight;
+        ctx.setLineDash(o.dashArray);
+        ctx.stroke();
+        ctx.setLineDash([]);
+
+        // Waypoints visibles, au plus un par cellule de la taille d'un point
+        var cell = 2 * o.radius;
+        var cols = Math.ceil(size.x / cell) + 1;
+        var rows = Math.ceil(size.y / cell) + 1;
+        var occupied = new Uint8Array(cols * rows);
+        ctx.beginPath();
+        for (var j = 0; j < this._count; j++) {
+            var x = this._x[j] * t.scale + t.dx;
+            var y = this._y[j] * t.scale + t.dy;
+            if (x < -o.radius || y < -o.radius || x > size.x + o.radius || y > size.y + o.radius) {
+                continue;
+            }
+            var k = Math.floor((y + o.radius) / cell) * cols + Math.floor((x + o.radius) / cell);
+            if (occupied[k]) {
+                continue;
+            }
+            occupied[k] = 1;
+            ctx.moveTo(x + o.radius, y);
+            ctx.arc(x, y, o.radius, 0, 2 * Math.PI);
+        }
+        ctx.fillStyle = o.color;
+        ctx.globalAlpha = 0.8;
+        ctx.fill();
+        ctx.globalAlpha = 1;
+    },
+
+    // Popup créée à la demande pour le waypoint le plus proche du clic
+    _onClick: function (e) {
+        if (this._count === 0) {
+            return;
+        }
+        var t = this._transform();
+        var best = -1;
+        var bestDist = this.options.clickTolerance * this.options.clickTolerance;
+        for (var i = 0; i < this._count; i++) {
+            var dx = this._x[i] * t.scale + t.dx - e.containerPoint.x;
+            var dy = this._y[i] * t.scale + t.dy - e.containerPoint.y;
+            var dist = dx * dx + dy * dy;
+            if (dist <= bestDist) {
+                best = i;
+                bestDist = dist;
+            }
+        }
+        if (best >= 0) {
+            L.popup()
+                .setLatLng([this._coords[2 * best], this._coords[2 * best + 1]])
+                .setContent('WP' + (best + 1))
+                .openOn(this._map);
+        }
+    }
+});
+
+var missionLayer = null;
+
+function clearMission(map) {
+    if (missionLayer) {
+        map.removeLayer(missionLayer);
+        missionLayer = null;
+    }
+}
+
+function showMission(map, data) {
+    // Remplacer la mission précédente
+    clearMission(map);
+    missionLayer = new MissionLayer(decodeWaypoints(data)).addTo(map);
+}